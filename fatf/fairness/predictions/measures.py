@@ -16,12 +16,146 @@ from fatf.exceptions import IncorrectShapeError
 import fatf.transparency.predictions.counterfactuals as ftpc
 import fatf.utils.array.validation as fuav
 
-__all__ = ['counterfactual_fairness', 'counterfactual_fairness_check']
+__all__ = ['CounterfactualFairnessAuditor',
+           'counterfactual_fairness',
+           'counterfactual_fairness_check']  # yapf: disable
 
 FeatureRange = Union[Tuple[float, float], List[Union[float, str]]]
 Index = Union[int, str]  # Possible types of column indices
 
 
+class CounterfactualFairnessAuditor(object):
+    """
+    Checks counterfactual fairness of many predictions given a model.
+
+    .. versionadded:: 0.1.1
+
+    This is a reusable version of the
+    :func:`fatf.fairness.predictions.measures.counterfactual_fairness`
+    function. The underlying :obj:`fatf.transparency.predictions.\
+counterfactuals.CounterfactualExplainer` object -- including the input
+    validation, the feature ranges and the distance functions -- is created
+    only once, when the auditor is initialised, hence auditing every
+    instance only requires the counterfactual search. Since all of the audits
+    use the same explainer, they also share its ``prediction_cache`` (if
+    given).
+
+    For all the errors, warnings and exceptions please see the documentation
+    of :obj:`fatf.transparency.predictions.counterfactuals.\
+CounterfactualExplainer` object and its methods.
+
+    Parameters
+    ----------
+    protected_feature_indices, model, predictive_function, dataset, \
+categorical_indices, numerical_indices, max_counterfactual_length, \
+feature_ranges, distance_functions, step_sizes, default_numerical_step_size, \
+and prediction_cache
+        For the description of these parameters please see the documentation
+        of the :func:`fatf.fairness.predictions.measures.\
+counterfactual_fairness` function.
+
+    Attributes
+    ----------
+    explainer : fatf.transparency.predictions.counterfactuals.\
+CounterfactualExplainer
+        The counterfactual explainer used to audit the predictions.
+    """
+
+    # pylint: disable=useless-object-inheritance,too-few-public-methods
+
+    def __init__(
+            self,
+            protected_feature_indices: List[Index],
+            model: Optional[object] = None,
+            predictive_function: Optional[Callable] = None,
+            dataset: Optional[np.ndarray] = None,
+            categorical_indices: Optional[List[Index]] = None,
+            numerical_indices: Optional[List[Index]] = None,
+            max_counterfactual_length: int = 2,
+            feature_ranges: Optional[Dict[Index, FeatureRange]] = None,
+            distance_functions: Optional[Dict[Index, Callable]] = None,
+            step_sizes: Optional[Dict[Index, float]] = None,
+            default_numerical_step_size: float = 1.0,
+            prediction_cache: Optional[ftpc.PredictionCache] = None) -> None:
+        """
+        Initialises the counterfactual fairness auditor.
+        """
+        # pylint: disable=too-many-arguments
+        self.explainer = ftpc.CounterfactualExplainer(
+            model=model,
+            predictive_function=predictive_function,
+            dataset=dataset,
+            categorical_indices=categorical_indices,
+            numerical_indices=numerical_indices,
+            counterfactual_feature_indices=protected_feature_indices,
+            max_counterfactual_length=max_counterfactual_length,
+            feature_ranges=feature_ranges,
+            distance_functions=distance_functions,
+            step_sizes=step_sizes,
+            default_numerical_step_size=default_numerical_step_size,
+            prediction_cache=prediction_cache)
+
+    def audit(self,
+              instance: Union[np.ndarray, np.void],
+              counterfactual_class: Optional[Union[int, str]] = None,
+              normalise_distance: bool = False
+              ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Checks counterfactual fairness of the prediction of one instance.
+
+        For the description of the parameters please see the documentation of
+        :func:`fatf.transparency.predictions.counterfactuals.\
+CounterfactualExplainer.explain_instance` method.
+
+        Returns
+        -------
+        counterfactuals : numpy.ndarray
+            A 2-dimensional numpy array with counterfactually unfair data
+            points.
+        distances : numpy.ndarray
+            A 1-dimensional numpy array with distances from the input
+            ``instance`` to every counterfactual data point.
+        predictions : numpy.ndarray
+            A 1-dimensional numpy array with predictions for every
+            counterfactual data point.
+        """
+        counterfactuals, distances, predictions = (
+            self.explainer.explain_instance(instance, counterfactual_class,
+                                            normalise_distance))
+        return counterfactuals, distances, predictions
+
+    def audit_many(self,
+                   X: np.ndarray,
+                   counterfactual_class: Optional[Union[int, str]] = None,
+                   normalise_distance: bool = False,
+                   batch_size: int = 1000,
+                   n_jobs: int = 1
+                   ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Checks counterfactual fairness of the predictions of many instances.
+
+        The predictions of the counterfactual candidates of all the instances
+        are computed together -- for the description of the parameters please
+        see the documentation of :func:`fatf.transparency.predictions.\
+counterfactuals.CounterfactualExplainer.explain_instances` method.
+
+        Returns
+        -------
+        audits : List[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]
+            A list with a triplet of counterfactually unfair data points,
+            their distances and their predictions -- cf. the ``audit`` method
+            -- for every row of ``X``.
+        """
+        # pylint: disable=invalid-name,too-many-arguments
+        audits = self.explainer.explain_instances(
+            X,
+            counterfactual_class=counterfactual_class,
+            normalise_distance=normalise_distance,
+            batch_size=batch_size,
+            n_jobs=n_jobs)
+        return audits
+
+
 def counterfactual_fairness(
         instance: Union[np.ndarray, np.void],
         protected_feature_indices: List[Index],
@@ -39,7 +173,9 @@ def counterfactual_fairness(
         step_sizes: Optional[Dict[Index, float]] = None,
         default_numerical_step_size: float = 1.0,
         #
-        normalise_distance: bool = False
+        normalise_distance: bool = False,
+        #
+        prediction_cache: Optional[ftpc.PredictionCache] = None
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Checks counterfactual fairness of a prediction given a model.
@@ -51,9 +187,12 @@ def counterfactual_fairness(
 
     The counterfactual fairness function is based on the  object.
     It is based on the :obj:`fatf.transparency.predictions.counterfactuals.\
-CounterfactualExplainer` object. For all the errors, warnings and
-    exceptions please see the documentation of :obj:`fatf.transparency.\
-predictions.counterfactuals.CounterfactualExplainer` object and its methods.
+CounterfactualExplainer` object. To audit many instances please use the
+    :class:`fatf.fairness.predictions.measures.CounterfactualFairnessAuditor`
+    class, which only creates the explainer once. For all the errors,
+    warnings and exceptions please see the documentation of
+    :obj:`fatf.transparency.predictions.counterfactuals.\
+CounterfactualExplainer` object and its methods.
 
     Parameters
     ----------
@@ -69,6 +208,13 @@ feature_ranges, distance_functions, step_sizes, and default_numerical_step_size
 CounterfactualExplainer` object. The only difference is that the
         `counterfactual_feature_indices` parameter is renamed to
         `protected_feature_indices` and is required by this function.
+    prediction_cache : fatf.transparency.predictions.counterfactuals.\
+PredictionCache, optional (default=None)
+        A prediction cache that -- when shared between calls of this function
+        -- allows to avoid predicting the same data points repeatedly, e.g.,
+        when auditing similar instances.
+
+        .. versionadded:: 0.1.1
 
     Returns
     -------
@@ -82,20 +228,21 @@ CounterfactualExplainer` object. The only difference is that the
         data point.
     """
     # pylint: disable=too-many-arguments,too-many-locals
-    cfex = ftpc.CounterfactualExplainer(
+    auditor = CounterfactualFairnessAuditor(
+        protected_feature_indices,
         model=model,
         predictive_function=predictive_function,
         dataset=dataset,
         categorical_indices=categorical_indices,
         numerical_indices=numerical_indices,
-        counterfactual_feature_indices=protected_feature_indices,
         max_counterfactual_length=max_counterfactual_length,
         feature_ranges=feature_ranges,
         distance_functions=distance_functions,
         step_sizes=step_sizes,
-        default_numerical_step_size=default_numerical_step_size)
+        default_numerical_step_size=default_numerical_step_size,
+        prediction_cache=prediction_cache)
 
-    counterfactuals, distances, predictions = cfex.explain_instance(
+    counterfactuals, distances, predictions = auditor.audit(
         instance, counterfactual_class, normalise_distance)
 
     return counterfactuals, distances, predictions
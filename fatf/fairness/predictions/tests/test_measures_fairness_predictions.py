@@ -11,6 +11,7 @@ import numpy as np
 from fatf.exceptions import IncorrectShapeError
 
 import fatf.fairness.predictions.measures as ffpm
+import fatf.transparency.predictions.counterfactuals as ftpc
 import fatf.utils.models as fum
 
 
@@ -51,6 +52,68 @@ def test_counterfactual_fairness():
     assert np.allclose(cfs_dist, t_dist)
     assert np.array_equal(cfs_pred, t_pred)
 
+    # Repeated audits with a shared prediction cache
+    cache = ftpc.PredictionCache()
+    for _ in range(2):
+        cfs, cfs_dist, cfs_pred = ffpm.counterfactual_fairness(
+            dataset_struct[2], ['q', 'postcode'],
+            model=knn_struct,
+            dataset=dataset_struct,
+            prediction_cache=cache)
+        assert np.array_equal(cfs, t_cfs)
+        assert np.allclose(cfs_dist, t_dist)
+        assert np.array_equal(cfs_pred, t_pred)
+    assert cache.hits == cache.misses
+
+
+def test_counterfactual_fairness_auditor():
+    """
+    Tests :class:`fatf.fairness.predictions.measures.\
+CounterfactualFairnessAuditor`.
+    """
+    dataset = np.array([[0, 8, 35.70, 3], [1, 4, 22.22, 3],
+                        [2, 0, 11.11, 3], [3, 13, 41.27, 3],
+                        [4, 1, 12.57, 12], [5, 15, 5.33, 12],
+                        [6, 6, 17.29, 12]])  # yapf: disable
+    target = np.array(
+        ['good', 'good', 'bad', 'mediocre', 'bad', 'mediocre', 'good'])
+    knn = fum.KNN(k=1)
+    knn.fit(dataset, target)
+
+    calls = []
+
+    def predict(data):
+        calls.append(data.shape[0])
+        return knn.predict(data)
+
+    auditor = ffpm.CounterfactualFairnessAuditor([1, 3],
+                                                 predictive_function=predict,
+                                                 dataset=dataset,
+                                                 categorical_indices=[3])
+    assert isinstance(auditor.explainer, ftpc.CounterfactualExplainer)
+    assert auditor.explainer.cf_feature_indices == set([1, 3])
+
+    audits = [auditor.audit(i, normalise_distance=True) for i in dataset]
+    calls_number = len(calls)
+    for i, audit in zip(dataset, audits):
+        audit_ = ffpm.counterfactual_fairness(
+            i, [1, 3],
+            model=knn,
+            dataset=dataset,
+            categorical_indices=[3],
+            normalise_distance=True)
+        for array, array_ in zip(audit, audit_):
+            assert np.array_equal(array, array_)
+
+    calls = []
+    audits_ = auditor.audit_many(
+        dataset, normalise_distance=True, batch_size=50, n_jobs=2)
+    assert len(calls) < calls_number
+    assert len(audits_) == len(audits)
+    for audit, audit_ in zip(audits, audits_):
+        for array, array_ in zip(audit, audit_):
+            assert np.array_equal(array, array_)
+
 
 def test_counterfactual_fairness_check():
     """
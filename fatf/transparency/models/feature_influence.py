@@ -9,14 +9,19 @@ Expectation (ICE) -- model agnostic feature influence measurements.
 #         Kacper Sokol <k.sokol@bristol.ac.uk>
 # License: new BSD
 
-from typing import List, Optional, Tuple, Union
+# pylint: disable=too-many-lines
 
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Tuple,
+                    Union)
+
+import multiprocessing.pool
 import warnings
 
 import numpy as np
 
 import fatf.utils.array.tools as fuat
 import fatf.utils.array.validation as fuav
+import fatf.utils.distances as fud
 import fatf.utils.models.validation as fumv
 
 from fatf.exceptions import IncompatibleModelError, IncorrectShapeError
@@ -24,14 +29,23 @@ from fatf.exceptions import IncompatibleModelError, IncorrectShapeError
 __all__ = ['individual_conditional_expectation',
            'merge_ice_arrays',
            'partial_dependence_ice',
-           'partial_dependence']  # yapf: disable
+           'partial_dependence',
+           'partial_dependence_features']  # yapf: disable
+
+Index = Union[int, str]  # Column index
+Grid = Tuple[Tuple[Index, ...], Tuple[np.ndarray, ...]]
+
+_GRID_STRATEGIES = ('uniform', 'quantile', 'unique')
 
 
 def _input_is_valid(dataset: np.ndarray,
                     model: object,
                     feature_index: Union[int, str],
                     treat_as_categorical: Optional[bool],
-                    steps_number: Optional[int]) -> bool:  # yapf: disable
+                    steps_number: Optional[int],
+                    batch_size: Optional[int] = None,
+                    n_jobs: int = 1,
+                    grid_strategy: str = 'uniform') -> bool:  # yapf: disable
     """
     Validates input parameters of Individual Conditional Expectation function.
 
@@ -44,6 +58,7 @@ individual_conditional_expectation` function.
     is_input_ok : boolean
         ``True`` if the input is valid, ``False`` otherwise.
     """
+    # pylint: disable=too-many-arguments,too-many-branches
     is_input_ok = False
 
     if not fuav.is_2d_array(dataset):
@@ -77,6 +92,23 @@ individual_conditional_expectation` function.
         raise TypeError('treat_as_categorical has to either be None or a '
                         'boolean.')
 
+    if batch_size is not None:
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool):
+            raise TypeError('The batch_size parameter has to either be None '
+                            'or an integer.')
+        if batch_size < 1:
+            raise ValueError('The batch_size parameter has to be a positive '
+                             'integer.')
+
+    # pylint: disable=protected-access
+    assert fud._validate_n_jobs(n_jobs), 'Invalid n_jobs parameter.'
+
+    if not isinstance(grid_strategy, str):
+        raise TypeError('The grid_strategy parameter has to be a string.')
+    if grid_strategy not in _GRID_STRATEGIES:
+        raise ValueError('The grid_strategy parameter has to be one of: '
+                         '{}.'.format(', '.join(_GRID_STRATEGIES)))
+
     is_input_ok = True
     return is_input_ok
 
@@ -100,6 +132,11 @@ def _interpolate_array(
     to consecutive values of the interpolated array (the same value for the
     whole copy of the dataset).
 
+    .. note:: This function materialises the whole interpolated dataset. To
+       process it in chunks of bounded size please see the
+       :func:`fatf.transparency.models.feature_influence.\
+_interpolate_chunks` function.
+
     Parameters
     ----------
     dataset : numpy.ndarray
@@ -129,11 +166,70 @@ def _interpolate_array(
         minimum and the maximum value of that column. For categorical (textual)
         columns it will hold all the unique values from that column.
     """
+    dataset, interpolated_values = _get_interpolated_values(
+        dataset, feature_index, treat_as_categorical, steps_number)
+    is_structured = fuav.is_structured_array(dataset)
+    steps_number = interpolated_values.shape[0]
+
+    interpolated_data = np.repeat(dataset[:, np.newaxis], steps_number, axis=1)
+    assert len(interpolated_values) == steps_number, 'Required for broadcast.'
+    if is_structured:
+        for idx in range(steps_number):
+            # Broadcast the new value.
+            interpolated_data[:, idx][feature_index] = interpolated_values[idx]
+    else:
+        # Broadcast the new vector.
+        interpolated_data[:, :, feature_index] = interpolated_values
+
+    return interpolated_data, interpolated_values
+
+
+def _get_interpolated_values(
+        dataset: np.ndarray,
+        feature_index: Union[int, str],  # yapf: disable
+        treat_as_categorical: bool,
+        steps_number: Union[int, None],
+        grid_strategy: str = 'uniform') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the interpolated values of the selected feature.
+
+    .. versionadded:: 0.1.1
+
+    For the description of the parameters and the interpolated values please
+    see the documentation of the :func:`fatf.transparency.models.\
+feature_influence._interpolate_array` function.
+
+    The values of a numerical feature are placed according to the
+    ``grid_strategy``:
+
+    ``'uniform'``
+        ``steps_number`` evenly spaced values between the minimum and the
+        maximum of the feature.
+    ``'quantile'``
+        ``steps_number`` evenly spaced quantiles of the feature -- the grid is
+        densest where most of the data are. Repeated quantiles are merged,
+        hence the grid may have fewer than ``steps_number`` values.
+    ``'unique'``
+        All of the unique values of the feature if there are at most
+        ``steps_number`` of them, otherwise ``steps_number`` of them chosen
+        evenly from the sorted unique values.
+
+    Returns
+    -------
+    dataset : numpy.ndarray
+        The input ``dataset`` -- if needed, with the type of the selected
+        feature generalised to accommodate the interpolated values.
+    interpolated_values : numpy.ndarray
+        A 1-dimensional array of shape (steps_number, ) holding the
+        interpolated values.
+    """
+    # pylint: disable=too-many-branches
     assert isinstance(dataset, np.ndarray), 'Dataset -> numpy array.'
     assert isinstance(feature_index, (int, str)), 'Feature index -> str/ int.'
     assert isinstance(treat_as_categorical, bool), 'As categorical -> bool.'
     assert steps_number is None or isinstance(steps_number, int), \
         'Steps number -> None/ int.'
+    assert grid_strategy in _GRID_STRATEGIES, 'Invalid grid strategy.'
 
     is_structured = fuav.is_structured_array(dataset)
 
@@ -149,8 +245,19 @@ def _interpolate_array(
         steps_number = interpolated_values.shape[0]
     else:
         assert isinstance(steps_number, int), 'Steps number must be an int.'
-        interpolated_values = np.linspace(column.min(), column.max(),
-                                          steps_number)
+        if grid_strategy == 'quantile':
+            interpolated_values = np.unique(
+                np.percentile(column, np.linspace(0, 100, steps_number)))
+        elif grid_strategy == 'unique':
+            interpolated_values = np.unique(column)
+            if interpolated_values.shape[0] > steps_number:
+                unique_indices = np.linspace(
+                    0, interpolated_values.shape[0] - 1, steps_number)
+                interpolated_values = interpolated_values[np.round(
+                    unique_indices).astype(int)]
+        else:
+            interpolated_values = np.linspace(column.min(), column.max(),
+                                              steps_number)
 
         # Give float type to this column if it is a structured array
         if (is_structured
@@ -169,17 +276,322 @@ def _interpolate_array(
                                           dataset.dtype)
             dataset = dataset.astype(dtype)
 
-    interpolated_data = np.repeat(dataset[:, np.newaxis], steps_number, axis=1)
-    assert len(interpolated_values) == steps_number, 'Required for broadcast.'
-    if is_structured:
-        for idx in range(steps_number):
-            # Broadcast the new value.
-            interpolated_data[:, idx][feature_index] = interpolated_values[idx]
-    else:
-        # Broadcast the new vector.
-        interpolated_data[:, :, feature_index] = interpolated_values
+    return dataset, interpolated_values
+
+
+def _interpolate_chunks(dataset: np.ndarray,
+                        feature_index: Union[int, str],
+                        interpolated_values: np.ndarray,
+                        batch_size: int,
+                        start: int = 0,
+                        stop: Optional[int] = None) -> Iterator[np.ndarray]:
+    """
+    Lazily generates chunks of the interpolated data.
+
+    .. versionadded:: 0.1.1
+
+    The interpolated data -- c.f. the :func:`fatf.transparency.models.\
+feature_influence._interpolate_array` function -- is flattened into an array
+    of (n_samples * steps_number) data points, in which the interpolation
+    steps of every row are consecutive. This generator yields chunks of (at
+    most) ``batch_size`` consecutive data points of this array without ever
+    materialising it: every chunk is written into the same, preallocated
+    buffer, hence it is only valid until the next chunk is requested. The
+    memory used by this function is therefore bounded by ``batch_size``
+    regardless of the number of interpolation steps.
+
+    Parameters
+    ----------
+    dataset : numpy.ndarray
+        A dataset based on which interpolation will be done; its dtype has to
+        accommodate the ``interpolated_values`` (c.f. the
+        :func:`fatf.transparency.models.feature_influence.\
+_get_interpolated_values` function).
+    feature_index : Union[integer, string]
+        An index of the interpolated feature column in the input dataset.
+    interpolated_values : numpy.ndarray
+        A 1-dimensional array with the interpolated values.
+    batch_size : integer
+        The maximum number of data points in a chunk.
+    start : integer, optional (default=0)
+        The index of the first data point (in the flattened interpolated data)
+        to be generated.
+    stop : integer, optional (default=None)
+        The index of the data point (in the flattened interpolated data)
+        before which the generation stops. If ``None``, all of the data
+        points after ``start`` are generated.
+
+    Yields
+    ------
+    chunk : numpy.ndarray
+        A chunk of (at most) ``batch_size`` interpolated data points.
+    """
+    # pylint: disable=too-many-arguments
+    grids = [((feature_index, ), (interpolated_values, ))]  # type: List[Grid]
+    yield from _interpolate_grids_chunks(dataset, grids, batch_size, start,
+                                         stop)
+
+
+def _get_grid_size(dataset: np.ndarray, grid: Grid) -> int:
+    """
+    Computes the number of data points in an interpolation grid.
+
+    .. versionadded:: 0.1.1
+
+    Parameters
+    ----------
+    dataset : numpy.ndarray
+        A dataset based on which interpolation will be done.
+    grid : Tuple[Tuple[Union[integer, string], ...], \
+Tuple[numpy.ndarray, ...]]
+        A pair of the interpolated feature indices and their interpolated
+        values.
+
+    Returns
+    -------
+    grid_size : integer
+        The number of rows in the ``dataset`` times the number of all the
+        combinations of the interpolated values.
+    """
+    grid_size = dataset.shape[0]
+    for interpolated_values in grid[1]:
+        grid_size *= interpolated_values.shape[0]
+    return grid_size
 
-    return interpolated_data, interpolated_values
+
+def _interpolate_grids_chunks(
+        dataset: np.ndarray,
+        grids: List[Grid],
+        batch_size: int,
+        start: int = 0,
+        stop: Optional[int] = None) -> Iterator[np.ndarray]:
+    """
+    Lazily generates chunks of data interpolated on (multi-feature) grids.
+
+    .. versionadded:: 0.1.1
+
+    Every grid is a pair of a tuple of feature indices and a tuple of their
+    interpolated values. For every row of the ``dataset`` a grid generates a
+    data point for every combination of the interpolated values (the values
+    of the last feature change the fastest). The data points of all the grids
+    are concatenated -- in order -- into a flat array, whose chunks of (at
+    most) ``batch_size`` consecutive data points are generated. A chunk may
+    span more than one grid. Every chunk is written into the same,
+    preallocated buffer, hence it is only valid until the next chunk is
+    requested.
+
+    For the description of the parameters please see the documentation of the
+    :func:`fatf.transparency.models.feature_influence._interpolate_chunks`
+    function. The ``dataset`` dtype has to accommodate the interpolated
+    values of all the grids.
+
+    Yields
+    ------
+    chunk : numpy.ndarray
+        A chunk of (at most) ``batch_size`` interpolated data points.
+    """
+    # pylint: disable=too-many-locals
+    is_structured = fuav.is_structured_array(dataset)
+    rows_number = dataset.shape[0]
+
+    offsets = [0]
+    for grid in grids:
+        offsets.append(offsets[-1] + _get_grid_size(dataset, grid))
+    if stop is None:
+        stop = offsets[-1]
+
+    buffer_rows = min(batch_size, max(stop - start, 0))
+    buffer = np.empty((buffer_rows, ) + dataset.shape[1:], dtype=dataset.dtype)
+    for chunk_start in range(start, stop, batch_size):
+        chunk_stop = min(chunk_start + batch_size, stop)
+        chunk = buffer[:chunk_stop - chunk_start]
+
+        for grid_i, (feature_indices, interpolated_values) in enumerate(grids):
+            part_start = max(chunk_start, offsets[grid_i])
+            part_stop = min(chunk_stop, offsets[grid_i + 1])
+            if part_start >= part_stop:
+                continue
+            part = chunk[part_start - chunk_start:part_stop - chunk_start]
+
+            grid_shape = (rows_number, ) + tuple(
+                values.shape[0] for values in interpolated_values)
+            coordinates = np.unravel_index(
+                np.arange(part_start, part_stop) - offsets[grid_i], grid_shape)
+            np.take(dataset, coordinates[0], axis=0, out=part)
+            for feature_index, values, steps in zip(
+                    feature_indices, interpolated_values, coordinates[1:]):
+                if is_structured:
+                    part[feature_index] = values[steps]
+                else:
+                    part[:, feature_index] = values[steps]
+
+        yield chunk
+
+
+def _predict_proba_batched(model: object, dataset: np.ndarray,
+                           grids: List[Grid], batch_size: int,
+                           n_jobs: int) -> np.ndarray:
+    """
+    Predicts probabilities of interpolated data in chunks of data points.
+
+    The interpolated data are lazily generated in chunks of ``batch_size``
+    data points -- see the :func:`fatf.transparency.models.\
+feature_influence._interpolate_grids_chunks` function. The chunks are
+    predicted with the model -- in parallel threads, each with its own chunk
+    buffer, if ``n_jobs`` is larger than 1.
+
+    .. versionchanged:: 0.1.1
+       The interpolated data are generated lazily for any number of grids.
+
+    Parameters
+    ----------
+    model : object
+        A fitted model with a ``predict_proba`` method.
+    dataset, grids and batch_size
+        See the :func:`fatf.transparency.models.feature_influence.\
+_interpolate_grids_chunks` function.
+    n_jobs : integer
+        The number of threads used to predict the chunks (-1 uses all of the
+        available CPUs).
+
+    Returns
+    -------
+    predictions : numpy.ndarray
+        An array of shape (n_points, n_classes) with the predicted
+        probabilities of all the (flattened) interpolated data points.
+    """
+    # pylint: disable=too-many-arguments
+    points_number = sum(_get_grid_size(dataset, grid) for grid in grids)
+
+    def predict(bounds: Tuple[int, int]) -> List[np.ndarray]:
+        chunks = _interpolate_grids_chunks(dataset, grids, batch_size,
+                                           bounds[0], bounds[1])
+        return [model.predict_proba(chunk) for chunk in chunks]  # type: ignore
+
+    predictions = [
+        prediction
+        for part in _map_parts(predict, points_number, batch_size, n_jobs)
+        for prediction in part
+    ]
+    return np.concatenate(predictions, axis=0)
+
+
+def _accumulate_proba_batched(
+        model: object, dataset: np.ndarray, grids: List[Grid], batch_size: int,
+        n_jobs: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Accumulates predicted probabilities of interpolated data for every grid.
+
+    .. versionadded:: 0.1.1
+
+    The interpolated data points are predicted in chunks exactly as in the
+    :func:`fatf.transparency.models.feature_influence._predict_proba_batched`
+    function, however the predictions of every chunk are only added to
+    running sums (and sums of squares) of every grid point, and then
+    discarded. The memory used by this function is therefore bounded by
+    ``batch_size`` and the size of the grids -- regardless of the number of
+    rows in the ``dataset``.
+
+    For the description of the parameters please see the documentation of the
+    :func:`fatf.transparency.models.feature_influence._predict_proba_batched`
+    function.
+
+    Returns
+    -------
+    accumulators : List[Tuple[numpy.ndarray, numpy.ndarray]]
+        A pair of arrays for every grid, holding the sum and the sum of
+        squares of the predicted probabilities over all the rows of the
+        ``dataset``. Each array is of (steps_number_1, ..., n_classes) shape.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    offsets = [0]
+    for grid in grids:
+        offsets.append(offsets[-1] + _get_grid_size(dataset, grid))
+    grid_shapes = [
+        tuple(values.shape[0] for values in grid[1]) for grid in grids
+    ]
+
+    def accumulate(bounds: Tuple[int, int]) -> List[Optional[np.ndarray]]:
+        sums = [None] * len(grids)  # type: List[Optional[np.ndarray]]
+        chunk_start = bounds[0]
+        for chunk in _interpolate_grids_chunks(dataset, grids, batch_size,
+                                               bounds[0], bounds[1]):
+            predictions = model.predict_proba(chunk)  # type: ignore
+            chunk_stop = chunk_start + chunk.shape[0]
+            for grid_i, grid_shape in enumerate(grid_shapes):
+                part_start = max(chunk_start, offsets[grid_i])
+                part_stop = min(chunk_stop, offsets[grid_i + 1])
+                if part_start >= part_stop:
+                    continue
+                grid_size = int(np.prod(grid_shape))
+                part = predictions[slice(part_start - chunk_start,
+                                         part_stop - chunk_start)]
+                # The steps of every row are consecutive
+                steps = np.arange(part_start, part_stop) - offsets[grid_i]
+                steps %= grid_size
+                part_sums = sums[grid_i]
+                if part_sums is None:
+                    part_sums = np.zeros((2, grid_size, part.shape[1]),
+                                         dtype=np.float64)
+                    sums[grid_i] = part_sums
+                np.add.at(part_sums[0], steps, part)
+                np.add.at(part_sums[1], steps, np.square(part))
+            chunk_start = chunk_stop
+        return sums
+
+    accumulators = []
+    parts_sums = _map_parts(accumulate, offsets[-1], batch_size, n_jobs)
+    for grid_i, grid_shape in enumerate(grid_shapes):
+        grid_sums = [sums[grid_i] for sums in parts_sums]
+        grid_sum = sum(sums for sums in grid_sums if sums is not None)
+        assert isinstance(grid_sum, np.ndarray), 'Every grid is predicted.'
+        grid_sum = grid_sum.reshape((2, ) + grid_shape + (-1, ))
+        accumulators.append((grid_sum[0], grid_sum[1]))
+    return accumulators
+
+
+def _map_parts(function: Callable[[Tuple[int, int]], Any], points_number: int,
+               batch_size: int, n_jobs: int) -> List[Any]:
+    """
+    Maps a function over contiguous parts of the interpolated data points.
+
+    .. versionadded:: 0.1.1
+
+    The (flattened) interpolated data points are split into as many
+    contiguous parts -- aligned with the chunks of ``batch_size`` data
+    points -- as there are threads, and the function is applied to each of
+    them in a separate thread. With one thread the function is applied to all
+    of the data points.
+
+    Parameters
+    ----------
+    function : Callable[[Tuple[integer, integer]], Any]
+        A function that processes the data points between the two indices
+        (the second one is exclusive).
+    points_number : integer
+        The number of interpolated data points.
+    batch_size : integer
+        The number of data points in a chunk.
+    n_jobs : integer
+        The number of threads (-1 uses all of the available CPUs).
+
+    Returns
+    -------
+    results : List[Any]
+        The results of the function for every part -- in order.
+    """
+    chunks_number = -(-points_number // batch_size)
+    # pylint: disable=protected-access
+    processes_number = min(fud._get_processes_number(n_jobs), chunks_number)
+    if processes_number > 1:
+        part_size = -(-chunks_number // processes_number) * batch_size
+        parts = [(i, min(i + part_size, points_number))
+                 for i in range(0, points_number, part_size)]
+        with multiprocessing.pool.ThreadPool(processes_number) as pool:
+            results = pool.map(function, parts)
+    else:
+        results = [function((0, points_number))]
+    return results
 
 
 def _filter_rows(include_rows: Union[None, int, List[int]],
@@ -273,8 +685,10 @@ def individual_conditional_expectation(
         treat_as_categorical: Optional[bool] = None,
         steps_number: Optional[int] = None,
         include_rows: Optional[Union[int, List[int]]] = None,
-        exclude_rows: Optional[Union[int, List[int]]] = None
-) -> Tuple[np.ndarray, np.ndarray]:
+        exclude_rows: Optional[Union[int, List[int]]] = None,
+        batch_size: Optional[int] = None,
+        n_jobs: int = 1,
+        grid_strategy: str = 'uniform') -> Tuple[np.ndarray, np.ndarray]:
     """
     Calculates Individual Conditional Expectation for a selected feature.
 
@@ -295,6 +709,20 @@ def individual_conditional_expectation(
     be computed for the set difference. Finally, if only the exclude parameter
     is specified, these rows will be subtracted from the whole dataset.
 
+    By default the model is queried once for every selected row of the
+    dataset. When the ``batch_size`` parameter is given, all of the
+    interpolated data points are instead predicted in chunks of that size --
+    optionally in parallel threads with the ``n_jobs`` parameter -- which
+    considerably reduces the number of model calls for large datasets.
+
+    Instead of evenly spaced values, the interpolation grid of a numerical
+    feature can be placed at its quantiles or at its unique values with the
+    ``grid_strategy`` parameter.
+
+    .. versionchanged:: 0.1.1
+       Added the ``batch_size``, ``n_jobs`` and ``grid_strategy``
+       parameters.
+
     This approach is an implementation of a method introduced by
     [GOLDSTEIN2015PEEKING]_. It is intended to be used with probabilistic
     models, therefore the input model must have a ``predict_proba`` method.
@@ -334,6 +762,23 @@ def individual_conditional_expectation(
         parameters are specified, the rows included in the ICE calculation will
         be a set difference of the two. This parameter can either be a *list*
         of indices or a single index (integer).
+    batch_size : integer, optional (default=None)
+        The number of (interpolated) data points predicted in a single call of
+        the model. If ``None``, the model is called once for every selected
+        row of the dataset.
+    n_jobs : integer, optional (default=1)
+        The number of threads used to predict the chunks of ``batch_size``
+        data points (-1 uses all of the available CPUs). This parameter is
+        ignored when ``batch_size`` is ``None``. The model's ``predict_proba``
+        method has to be thread-safe for values other than 1.
+    grid_strategy : string, optional (default='uniform')
+        How to place the ``steps_number`` interpolated values of a numerical
+        feature: ``'uniform'`` -- evenly between the minimum and the maximum
+        of the feature; ``'quantile'`` -- at evenly spaced quantiles of the
+        feature (repeated quantiles are merged); or ``'unique'`` -- at the
+        unique values of the feature, choosing ``steps_number`` of them
+        evenly if there are more. (This parameter applies only to numerical
+        features.)
 
     Warns
     -----
@@ -357,11 +802,17 @@ def individual_conditional_expectation(
         ``treat_as_categorical`` is not ``None`` or boolean. The
         ``steps_number`` parameter is not ``None`` or integer. Either
         ``include_rows`` or ``exclude_rows`` parameter is not ``None``, an
-        integer or a list of integers.
+        integer or a list of integers. The ``batch_size`` parameter is not
+        ``None`` or an integer. The ``n_jobs`` parameter is not an integer.
+        The ``grid_strategy`` parameter is not a string.
     ValueError
         The input dataset must only contain base types (textual and numerical
         values). One of the ``include_rows`` or ``exclude_rows`` indices is not
         valid for the input dataset. The ``steps_number`` is smaller than 2.
+        The ``batch_size`` parameter is not a positive integer. The ``n_jobs``
+        parameter is neither a positive integer nor -1. The ``grid_strategy``
+        parameter is not one of ``'uniform'``, ``'quantile'`` or
+        ``'unique'``.
 
     Returns
     -------
@@ -382,8 +833,147 @@ def individual_conditional_expectation(
     """
     # pylint: disable=too-many-arguments,too-many-locals
     assert _input_is_valid(dataset, model, feature_index, treat_as_categorical,
-                           steps_number), 'Input must be valid.'
+                           steps_number, batch_size, n_jobs,
+                           grid_strategy), 'Input must be valid.'
+
+    filtered_dataset, feature_linespace = _get_feature_grid(
+        dataset, feature_index, treat_as_categorical, steps_number,
+        include_rows, exclude_rows, grid_strategy)
+
+    # By default the model is called once for every row
+    if batch_size is None:
+        batch_size = feature_linespace.shape[0]
+        n_jobs = 1
+    grids = [((feature_index, ), (feature_linespace, ))]  # type: List[Grid]
+    ice = _predict_proba_batched(model, filtered_dataset, grids, batch_size,
+                                 n_jobs)
+    ice = ice.reshape(filtered_dataset.shape[0], feature_linespace.shape[0],
+                      -1)
+
+    return ice, feature_linespace
+
+
+def _get_feature_grid(
+        dataset: np.ndarray,
+        feature_index: Index,
+        treat_as_categorical: Optional[bool],
+        steps_number: Optional[int],
+        include_rows: Optional[Union[int, List[int]]],
+        exclude_rows: Optional[Union[int, List[int]]],
+        grid_strategy: str = 'uniform') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Filters the rows and interpolates the values of the selected feature.
+
+    .. versionadded:: 0.1.1
+
+    For the description of the parameters and the warnings please see the
+    documentation of the :func:`fatf.transparency.models.feature_influence.\
+individual_conditional_expectation` function.
+
+    Returns
+    -------
+    filtered_dataset : numpy.ndarray
+        The selected rows of the ``dataset`` -- if needed, with the type of the
+        selected feature generalised to accommodate the interpolated values.
+    feature_linespace : numpy.ndarray
+        A one-dimensional array -- (steps_number, ) -- with the interpolated
+        values of the selected feature.
+    """
+    # pylint: disable=too-many-arguments
+    treat_as_categorical, steps_number = _get_feature_type(
+        dataset, feature_index, treat_as_categorical, steps_number)
+
+    rows_number = dataset.shape[0]
+    include_r = _filter_rows(include_rows, exclude_rows, rows_number)
+    filtered_dataset = dataset[include_r]
+
+    filtered_dataset, feature_linespace = _get_interpolated_values(
+        filtered_dataset, feature_index, treat_as_categorical, steps_number,
+        grid_strategy)
 
+    return filtered_dataset, feature_linespace
+
+
+def _stratified_subsample(
+        dataset: np.ndarray, model: object, subsample_size: int,
+        batch_size: Optional[int]) -> List[Tuple[np.ndarray, int]]:
+    """
+    Draws a stratified sample of the rows of a dataset.
+
+    .. versionadded:: 0.1.1
+
+    The rows are stratified by the class predicted for them by the ``model``
+    and the sample size is allocated to every stratum proportionally to its
+    size. Every stratum of more than one row gets at least two rows, so that
+    its sample variance -- used to estimate the standard error of Partial
+    Dependence -- is defined. The rows of every stratum are sampled without
+    replacement.
+
+    Parameters
+    ----------
+    dataset : numpy.ndarray
+        A dataset to be subsampled.
+    model : object
+        A fitted model used to stratify the rows.
+    subsample_size : integer
+        The (approximate) number of rows to be sampled.
+    batch_size : Union[integer, None]
+        The number of rows predicted in a single call of the model. If
+        ``None``, all of the rows are predicted at once.
+
+    Returns
+    -------
+    strata : List[Tuple[numpy.ndarray, integer]]
+        A list with the indices of the rows sampled from every stratum and the
+        number of all the rows in that stratum.
+    """
+    assert isinstance(subsample_size, int), 'Subsample size -> int.'
+    rows_number = dataset.shape[0]
+    if batch_size is None:
+        batch_size = max(rows_number, 1)
+
+    predictions = [
+        model.predict_proba(dataset[i:i + batch_size]).argmax(  # type: ignore
+            axis=1) for i in range(0, rows_number, batch_size)
+    ]
+    labels = np.concatenate(predictions) if predictions else np.array([])
+
+    strata = []
+    for label in np.unique(labels):
+        stratum = np.where(labels == label)[0]
+        stratum_size = max(
+            min(2, stratum.shape[0]),
+            int(round(subsample_size * stratum.shape[0] / rows_number)))
+        if stratum_size < stratum.shape[0]:
+            stratum_sample = np.sort(
+                np.random.choice(stratum, size=stratum_size, replace=False))
+        else:
+            stratum_sample = stratum
+        strata.append((stratum_sample, stratum.shape[0]))
+    return strata
+
+
+def _get_feature_type(
+        dataset: np.ndarray, feature_index: Index,
+        treat_as_categorical: Optional[bool],
+        steps_number: Optional[int]) -> Tuple[bool, Optional[int]]:
+    """
+    Decides whether to treat a feature as categorical and its steps number.
+
+    .. versionadded:: 0.1.1
+
+    For the description of the parameters and the warnings please see the
+    documentation of the :func:`fatf.transparency.models.feature_influence.\
+individual_conditional_expectation` function.
+
+    Returns
+    -------
+    treat_as_categorical : boolean
+        Whether to treat the selected feature as categorical.
+    steps_number : Union[integer, None]
+        The number of interpolation steps for a numerical feature (100 by
+        default).
+    """
     is_structured = fuav.is_structured_array(dataset)
 
     if is_structured:
@@ -421,20 +1011,7 @@ def individual_conditional_expectation(
     if not treat_as_categorical and steps_number is None:
         steps_number = 100
 
-    rows_number = dataset.shape[0]
-    include_r = _filter_rows(include_rows, exclude_rows, rows_number)
-    filtered_dataset = dataset[include_r]
-
-    sampled_data, feature_linespace = _interpolate_array(
-        filtered_dataset, feature_index, treat_as_categorical, steps_number)
-
-    ice = [
-        model.predict_proba(data_slice)  # type: ignore
-        for data_slice in sampled_data
-    ]
-    ice = np.stack(ice, axis=0)
-
-    return ice, feature_linespace
+    return treat_as_categorical, steps_number
 
 
 def merge_ice_arrays(ice_arrays_list: List[np.ndarray]) -> np.ndarray:
@@ -575,8 +1152,14 @@ def partial_dependence(dataset: np.ndarray,
                        treat_as_categorical: Optional[bool] = None,
                        steps_number: Optional[int] = None,
                        include_rows: Optional[Union[int, List[int]]] = None,
-                       exclude_rows: Optional[Union[int, List[int]]] = None
-                       ) -> Tuple[np.ndarray, np.ndarray]:
+                       exclude_rows: Optional[Union[int, List[int]]] = None,
+                       batch_size: Optional[int] = None,
+                       n_jobs: int = 1,
+                       streaming: bool = False,
+                       return_variance: bool = False,
+                       grid_strategy: str = 'uniform',
+                       subsample_size: Optional[int] = None,
+                       return_error: bool = False) -> Tuple[np.ndarray, ...]:
     """
     Calculates Partial Dependence for a selected feature.
 
@@ -595,10 +1178,61 @@ individual_conditional_expectation` and :func:`fatf.transparency.models.\
 feature_influence.partial_dependence_ice` functions to minimise the
        computational cost.
 
+    With the ``streaming`` parameter set to ``True`` the predictions are only
+    accumulated into running sums -- one chunk of ``batch_size`` data points
+    at a time -- and the ICE array is never stored, therefore Partial
+    Dependence of very large datasets can be computed in constant memory.
+
+    Partial Dependence of a large dataset can also be estimated from a sample
+    of its rows with the ``subsample_size`` parameter. The rows are
+    stratified by the class predicted for them by the model, sampled (without
+    replacement) proportionally to the size of every stratum, and the
+    estimate of Partial Dependence is a weighted mean of the per-stratum
+    means. Its standard error -- including the finite population correction
+    -- can be returned with the ``return_error`` parameter. Stratifying the
+    sample requires one additional prediction per selected row, which is a
+    fraction of the steps_number predictions per row needed by Partial
+    Dependence.
+
+    .. versionchanged:: 0.1.1
+       Added the ``batch_size``, ``n_jobs``, ``streaming``,
+       ``return_variance``, ``grid_strategy``, ``subsample_size`` and
+       ``return_error`` parameters.
+
     .. [FRIEDMAN2001GREEDY] J. H. Friedman. Greedy function approximation: A
        gradient boosting machine. The Annals of Statistics, 29:1189–1232, 2001.
        URL https://projecteuclid.org/euclid.aos/1013203451. [p421, 428]
 
+    Parameters
+    ----------
+    streaming : boolean, optional (default=False)
+        Whether to accumulate the predictions into running sums instead of
+        computing the ICE array.
+    return_variance : boolean, optional (default=False)
+        Whether to additionally return the variance of the Individual
+        Conditional Expectations (predicted probabilities) of every step and
+        class.
+    subsample_size : integer, optional (default=None)
+        The number of selected rows used to estimate Partial Dependence. If
+        ``None`` or at least the number of selected rows, all of them are
+        used. Subsampling always uses the ``streaming`` mode.
+    return_error : boolean, optional (default=False)
+        Whether to additionally return the standard error of the Partial
+        Dependence estimate (all zeros when all of the rows are used).
+
+    For the description of the other parameters please see the documentation
+    of the :func:`fatf.transparency.models.feature_influence.\
+individual_conditional_expectation` function.
+
+    Raises
+    ------
+    TypeError
+        The ``streaming``, ``return_variance`` or ``return_error`` parameter
+        is not a boolean. The ``subsample_size`` parameter is neither
+        ``None`` nor an integer.
+    ValueError
+        The ``subsample_size`` parameter is not a positive integer.
+
     Returns
     -------
     partial_dependence_array : numpy.ndarray
@@ -609,17 +1243,278 @@ feature_influence.partial_dependence_ice` functions to minimise the
         A one-dimensional array -- (steps_number, ) -- with the values for
         which the selected feature was substituted when the dataset was
         evaluated with the specified model.
+    variance_array : numpy.ndarray
+        A 2-dimensional array of (steps_number, n_classes) shape with the
+        variance of the Individual Conditional Expectations of the selected
+        rows. Only returned when ``return_variance`` is ``True``.
+    error_array : numpy.ndarray
+        A 2-dimensional array of (steps_number, n_classes) shape with the
+        standard error of the Partial Dependence estimate. Only returned when
+        ``return_error`` is ``True``.
     """
-    # pylint: disable=too-many-arguments
-    ice_array, feature_linespace = individual_conditional_expectation(
-        dataset,
-        model,
-        feature_index,
-        treat_as_categorical=treat_as_categorical,
-        steps_number=steps_number,
-        include_rows=include_rows,
-        exclude_rows=exclude_rows)
-
-    partial_dependence_array = partial_dependence_ice(ice_array)
-
-    return partial_dependence_array, feature_linespace
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+    # pylint: disable=too-many-statements
+    if not isinstance(streaming, bool):
+        raise TypeError('The streaming parameter has to be a boolean.')
+    if not isinstance(return_variance, bool):
+        raise TypeError('The return_variance parameter has to be a boolean.')
+    if not isinstance(return_error, bool):
+        raise TypeError('The return_error parameter has to be a boolean.')
+    if subsample_size is not None:
+        if (not isinstance(subsample_size, int)
+                or isinstance(subsample_size, bool)):
+            raise TypeError('The subsample_size parameter has to either be '
+                            'None or an integer.')
+        if subsample_size < 1:
+            raise ValueError('The subsample_size parameter has to be a '
+                             'positive integer.')
+
+    if streaming or subsample_size is not None:
+        assert _input_is_valid(dataset, model, feature_index,
+                               treat_as_categorical, steps_number, batch_size,
+                               n_jobs, grid_strategy), 'Input must be valid.'
+        filtered_dataset, feature_linespace = _get_feature_grid(
+            dataset, feature_index, treat_as_categorical, steps_number,
+            include_rows, exclude_rows, grid_strategy)
+        rows_number = filtered_dataset.shape[0]
+
+        if subsample_size is None or subsample_size >= rows_number:
+            strata = [(np.arange(rows_number), rows_number)]
+        else:
+            strata = _stratified_subsample(filtered_dataset, model,
+                                           subsample_size, batch_size)
+
+        if batch_size is None:
+            batch_size = feature_linespace.shape[0]
+            n_jobs = 1
+        grids = [((feature_index, ),
+                  (feature_linespace, ))]  # type: List[Grid]
+
+        partial_dependence_array = 0
+        second_moment_array = 0
+        squared_error_array = 0
+        for stratum_sample, stratum_size in strata:
+            sums, squared_sums = _accumulate_proba_batched(
+                model, filtered_dataset[stratum_sample], grids, batch_size,
+                n_jobs)[0]
+            sample_size = stratum_sample.shape[0]
+            weight = stratum_size / rows_number
+
+            stratum_mean = sums / sample_size
+            stratum_second_moment = squared_sums / sample_size
+            partial_dependence_array += weight * stratum_mean
+            second_moment_array += weight * stratum_second_moment
+
+            if sample_size < stratum_size:
+                stratum_variance = np.clip(
+                    stratum_second_moment - np.square(stratum_mean), 0,
+                    None) * sample_size / (sample_size - 1)
+                # With the finite population correction
+                stratum_error = stratum_variance / sample_size
+                stratum_error *= 1 - sample_size / stratum_size
+                squared_error_array += np.square(weight) * stratum_error
+        variance_array = np.clip(
+            second_moment_array - np.square(partial_dependence_array), 0, None)
+        squared_error_array += np.zeros_like(partial_dependence_array)
+        error_array = np.sqrt(squared_error_array)
+    else:
+        ice_array, feature_linespace = individual_conditional_expectation(
+            dataset,
+            model,
+            feature_index,
+            treat_as_categorical=treat_as_categorical,
+            steps_number=steps_number,
+            include_rows=include_rows,
+            exclude_rows=exclude_rows,
+            batch_size=batch_size,
+            n_jobs=n_jobs,
+            grid_strategy=grid_strategy)
+
+        partial_dependence_array = partial_dependence_ice(ice_array)
+        variance_array = ice_array.var(axis=0)
+        error_array = np.zeros_like(partial_dependence_array)
+
+    partial_dependence_list = [partial_dependence_array, feature_linespace]
+    if return_variance:
+        partial_dependence_list.append(variance_array)
+    if return_error:
+        partial_dependence_list.append(error_array)
+    return tuple(partial_dependence_list)
+
+
+def partial_dependence_features(
+        dataset: np.ndarray,
+        model: object,
+        features: List[Union[Index, Tuple[Index, Index]]],
+        categorical_indices: Optional[List[Index]] = None,
+        steps_number: Optional[int] = None,
+        include_rows: Optional[Union[int, List[int]]] = None,
+        exclude_rows: Optional[Union[int, List[int]]] = None,
+        batch_size: int = 10000,
+        n_jobs: int = 1,
+        grid_strategy: str = 'uniform'
+) -> Dict[Union[Index, Tuple[Index, Index]],
+          Tuple[np.ndarray, Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]]]:
+    """
+    Calculates Partial Dependence for many features and pairs of features.
+
+    .. versionadded:: 0.1.1
+
+    This function computes Partial Dependence (c.f. :func:`fatf.transparency.\
+models.feature_influence.partial_dependence`) of every selected feature and
+    two-dimensional Partial Dependence of every selected pair of features in
+    one pass. The input is validated and the rows are filtered only once, and
+    the interpolated data points of all the features (and pairs of features)
+    are predicted together in chunks of ``batch_size`` data points --
+    optionally in parallel threads with the ``n_jobs`` parameter. The
+    predictions are accumulated into running sums, hence the memory use does
+    not depend on the number of rows in the ``dataset``.
+
+    For a pair of features the model is evaluated on every combination of
+    their interpolated values, i.e., a grid of
+    (steps_number_1, steps_number_2) data points per row.
+
+    Parameters
+    ----------
+    dataset : numpy.ndarray
+        A dataset based on which PD will be computed.
+    model : object
+        A fitted model which predictions will be used to calculate PD. (Please
+        see :class:`fatf.utils.models.models.Model` class documentation for the
+        expected model object specification.)
+    features : List[Union[column index, Tuple[column index, column index]]]
+        A list of feature (column) indices and/or pairs (2-tuples) of feature
+        indices for which PD will be computed.
+    categorical_indices : List[column index], optional (default=None)
+        Indices of the features to be treated as categorical. The type of all
+        the other features is inferred -- textual features are always treated
+        as categorical.
+    steps_number : integer, optional (default=None, i.e. 100)
+        The number of evenly spaced samples between the minimum and the maximum
+        value of every numerical feature for which the model's prediction will
+        be evaluated.
+    include_rows, exclude_rows
+        See the documentation of the :func:`fatf.transparency.models.\
+feature_influence.individual_conditional_expectation` function.
+    batch_size : integer, optional (default=10000)
+        The number of (interpolated) data points predicted in a single call of
+        the model.
+    n_jobs : integer, optional (default=1)
+        The number of threads used to predict the chunks of ``batch_size``
+        data points (-1 uses all of the available CPUs). The model's
+        ``predict_proba`` method has to be thread-safe for values other than
+        1.
+    grid_strategy : string, optional (default='uniform')
+        How to place the interpolated values of every numerical feature. See
+        the documentation of the :func:`fatf.transparency.models.\
+feature_influence.individual_conditional_expectation` function.
+
+    Raises
+    ------
+    IncompatibleModelError
+        The model does not have required functionality -- it needs to be able
+        to output probabilities via ``predict_proba`` method.
+    IncorrectShapeError
+        The input dataset is not a 2-dimensional numpy array.
+    IndexError
+        Some of the feature (column) indices are invalid for the input
+        dataset.
+    TypeError
+        The ``features`` parameter is not a list of feature indices and/or
+        pairs of feature indices. The ``categorical_indices`` parameter is
+        neither ``None`` nor a list.
+
+    For the other exceptions please see the documentation of the
+    :func:`fatf.transparency.models.feature_influence.\
+individual_conditional_expectation` function.
+
+    Returns
+    -------
+    partial_dependence_dict : Dictionary[Union[column index, \
+Tuple[column index, column index]], Tuple[numpy.ndarray, \
+Union[numpy.ndarray, Tuple[numpy.ndarray, numpy.ndarray]]]]
+        A dictionary with an entry for every element of the ``features`` list.
+        For a single feature it is a pair of the Partial Dependence array of
+        (steps_number, n_classes) shape and the feature linespace -- the same
+        as the output of the :func:`fatf.transparency.models.\
+feature_influence.partial_dependence` function, which can be plotted with
+        the :func:`fatf.vis.feature_influence.plot_partial_dependence`
+        function. For a pair of features it is a pair of the Partial
+        Dependence array of (steps_number_1, steps_number_2, n_classes) shape
+        and a tuple of the two feature linespaces. None of the functions in
+        the :mod:`fatf.vis.feature_influence` module can plot these
+        two-dimensional entries; a single class can be plotted, for example,
+        with matplotlib's ``pcolormesh`` function.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+    if not isinstance(features, list) or not features:
+        raise TypeError('The features parameter has to be a non-empty list '
+                        'of feature indices and/or pairs (2-tuples) of '
+                        'feature indices.')
+    feature_indices = []  # type: List[Index]
+    for feature in features:
+        feature_tuple = feature if isinstance(feature, tuple) else (feature, )
+        is_index = all(isinstance(i, (int, str)) for i in feature_tuple)
+        is_unique = is_index and len(set(feature_tuple)) == len(feature_tuple)
+        if not (is_unique and len(feature_tuple) in (1, 2)):
+            raise TypeError('The features parameter has to be a non-empty '
+                            'list of feature indices and/or pairs (2-tuples) '
+                            'of feature indices.')
+        feature_indices.extend(feature_tuple)
+    # Preserve the order of the features
+    feature_indices = list(dict.fromkeys(feature_indices))
+
+    assert _input_is_valid(dataset, model, feature_indices[0], None,
+                           steps_number, batch_size, n_jobs,
+                           grid_strategy), 'Input must be valid.'
+    if not fuat.are_indices_valid(dataset, np.array(feature_indices)):
+        raise IndexError('Some of the feature indices are not valid for the '
+                         'input dataset.')
+    if categorical_indices is None:
+        categorical_indices = []
+    elif not isinstance(categorical_indices, list):
+        raise TypeError('The categorical_indices parameter has to either be '
+                        'None or a list.')
+    is_structured = fuav.is_structured_array(dataset)
+
+    rows_number = dataset.shape[0]
+    include_r = _filter_rows(include_rows, exclude_rows, rows_number)
+    filtered_dataset = dataset[include_r]
+
+    # Generalise the dtype of the data set to accommodate the interpolated
+    # values of all the features
+    linespaces = {}  # type: Dict[Index, np.ndarray]
+    for feature_index in feature_indices:
+        if is_structured:
+            column = dataset[feature_index]
+        else:
+            column = dataset[:, feature_index]
+        is_categorical = (feature_index in categorical_indices
+                          or fuav.is_textual_array(column))
+        treat_as_categorical, feature_steps_number = _get_feature_type(
+            dataset, feature_index, is_categorical,
+            None if is_categorical else steps_number)
+        filtered_dataset, linespaces[feature_index] = (
+            _get_interpolated_values(filtered_dataset, feature_index,
+                                     treat_as_categorical,
+                                     feature_steps_number, grid_strategy))
+
+    grids = []  # type: List[Grid]
+    for feature in features:
+        feature_tuple = feature if isinstance(feature, tuple) else (feature, )
+        grids.append((feature_tuple,
+                      tuple(linespaces[i] for i in feature_tuple)))
+    accumulators = _accumulate_proba_batched(model, filtered_dataset, grids,
+                                             batch_size, n_jobs)
+
+    partial_dependence_dict = dict()  # type: Dict
+    for feature, grid, (sums, _) in zip(features, grids, accumulators):
+        partial_dependence_array = sums / filtered_dataset.shape[0]
+        if isinstance(feature, tuple):
+            feature_linespace = grid[1]
+        else:
+            feature_linespace = grid[1][0]
+        partial_dependence_dict[feature] = (partial_dependence_array,
+                                            feature_linespace)
+
+    return partial_dependence_dict
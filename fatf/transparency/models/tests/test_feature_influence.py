@@ -225,8 +225,37 @@ def test_is_valid_input():
         ftmfi._input_is_valid(BASE_NP_ARRAY, knn_model, 1, 'a', None)
     assert str(exin.value) == msg
 
+    # Batch size
+    msg = 'The batch_size parameter has to either be None or an integer.'
+    with pytest.raises(TypeError) as exin:
+        ftmfi._input_is_valid(BASE_NP_ARRAY, knn_model, 1, None, 2, 'a')
+    assert str(exin.value) == msg
+    msg = 'The batch_size parameter has to be a positive integer.'
+    with pytest.raises(ValueError) as exin:
+        ftmfi._input_is_valid(BASE_NP_ARRAY, knn_model, 1, None, 2, 0)
+    assert str(exin.value) == msg
+
+    # Number of jobs
+    msg = 'The n_jobs parameter has to be an integer.'
+    with pytest.raises(TypeError) as exin:
+        ftmfi._input_is_valid(BASE_NP_ARRAY, knn_model, 1, None, 2, 1, 'a')
+    assert str(exin.value) == msg
+
+    # Grid strategy
+    msg = 'The grid_strategy parameter has to be a string.'
+    with pytest.raises(TypeError) as exin:
+        ftmfi._input_is_valid(BASE_NP_ARRAY, knn_model, 1, None, 2, 1, 1, 4)
+    assert str(exin.value) == msg
+    msg = ('The grid_strategy parameter has to be one of: uniform, quantile, '
+           'unique.')
+    with pytest.raises(ValueError) as exin:
+        ftmfi._input_is_valid(BASE_NP_ARRAY, knn_model, 1, None, 2, 1, 1,
+                              'log')
+    assert str(exin.value) == msg
+
     # Functional
     assert ftmfi._input_is_valid(BASE_NP_ARRAY, knn_model, 1, None, 2)
+    assert ftmfi._input_is_valid(BASE_NP_ARRAY, knn_model, 1, None, 2, 7, -1)
     assert ftmfi._input_is_valid(BASE_NP_ARRAY, knn_model, 1, False, 5)
     # Steps number will be ignored anyway
     assert ftmfi._input_is_valid(BASE_NP_ARRAY, knn_model, 1, True, 2)
@@ -389,6 +418,86 @@ def test_interpolate_array():
                               numerical_interpolation_num[:, :][column])
 
 
+def test_interpolate_chunks():
+    """
+    Tests :func:`fatf.transparency.models.feature_influence.\
+_interpolate_chunks`.
+    """
+    experiments = [(NUMERICAL_NP_ARRAY, 2, False, 5),
+                   (NUMERICAL_STRUCT_ARRAY, 'a', False, 3),
+                   (MIXED_ARRAY, 'd', True, None),
+                   (CATEGORICAL_NP_ARRAY, 1, True, None)]  # yapf: disable
+    for dataset, feature_index, as_categorical, steps in experiments:
+        interpolated_data, values = ftmfi._interpolate_array(
+            dataset, feature_index, as_categorical, steps)
+        flat_shape = (-1, ) + interpolated_data.shape[2:]
+        flat_data = interpolated_data.reshape(flat_shape)
+
+        dataset_, values_ = ftmfi._get_interpolated_values(
+            dataset, feature_index, as_categorical, steps)
+        assert np.array_equal(values, values_)
+        assert dataset_.dtype == interpolated_data.dtype
+
+        for batch_size in (1, 4, 100):
+            chunks = list(
+                ftmfi._interpolate_chunks(dataset_, feature_index, values,
+                                          batch_size))
+            assert len(chunks) == -(-flat_data.shape[0] // batch_size)
+            # All the chunks are views of the same buffer
+            assert all(np.shares_memory(chunk, chunks[0]) for chunk in chunks)
+
+            chunks = [
+                chunk.copy() for chunk in ftmfi._interpolate_chunks(
+                    dataset_, feature_index, values, batch_size)
+            ]
+            assert np.array_equal(np.concatenate(chunks), flat_data)
+
+            chunks = [
+                chunk.copy() for chunk in ftmfi._interpolate_chunks(
+                    dataset_, feature_index, values, batch_size, 2, 7)
+            ]
+            assert np.array_equal(np.concatenate(chunks), flat_data[2:7])
+
+    assert not list(
+        ftmfi._interpolate_chunks(NUMERICAL_NP_ARRAY, 0, np.array([0, 1]), 3,
+                                  4, 4))
+
+
+def test_get_interpolated_values():
+    """
+    Tests the grid strategies of the interpolated values.
+
+    Tests :func:`fatf.transparency.models.feature_influence.
+    _get_interpolated_values` function.
+    """
+    dataset = np.array([[0, 1], [1, 1], [2, 1], [3, 1], [10, 1]])
+
+    dataset_, values = ftmfi._get_interpolated_values(dataset, 0, False, 3)
+    assert np.array_equal(values, [0, 5, 10])
+    assert dataset_.dtype == np.float64
+
+    dataset_, values = ftmfi._get_interpolated_values(dataset, 0, False, 3,
+                                                      'quantile')
+    assert np.array_equal(values, [0, 2, 10])
+    assert dataset_.dtype == np.float64
+    # Repeated quantiles are merged
+    _, values = ftmfi._get_interpolated_values(dataset, 1, False, 3,
+                                               'quantile')
+    assert np.array_equal(values, [1])
+
+    dataset_, values = ftmfi._get_interpolated_values(dataset, 0, False, 10,
+                                                      'unique')
+    assert np.array_equal(values, [0, 1, 2, 3, 10])
+    assert np.array_equal(dataset_, dataset)
+    _, values = ftmfi._get_interpolated_values(dataset, 0, False, 3, 'unique')
+    assert np.array_equal(values, [0, 2, 10])
+
+    # Categorical features ignore the grid strategy
+    _, values = ftmfi._get_interpolated_values(dataset, 0, True, None,
+                                               'quantile')
+    assert np.array_equal(values, [0, 1, 2, 3, 10])
+
+
 def test_filter_rows():
     """
     Tests :func:`fatf.transparency.models.feature_influence._filter_rows`.
@@ -738,6 +847,73 @@ def test_individual_conditional_expectation():
     assert np.array_equal(linespace, MIXED_LINESPACE_CATEGORICAL)
 
 
+def test_individual_conditional_expectation_batched():
+    """
+    Tests batched Individual Conditional Expectation calculations.
+
+    Tests the ``batch_size`` and ``n_jobs`` parameters of the
+    :func:`fatf.transparency.models.feature_influence.
+    individual_conditional_expectation` function.
+    """
+
+    class CountingKNN(fum.KNN):
+        """
+        A k-nearest neighbours classifier counting its predictions.
+        """
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.calls = []
+
+        def predict_proba(self, X):
+            self.calls.append(X.shape[0])
+            return super().predict_proba(X)
+
+    clf = CountingKNN(k=2)
+    clf.fit(NUMERICAL_NP_ARRAY, NUMERICAL_NP_ARRAY_TARGET)
+    clf_struct = CountingKNN(k=2)
+    clf_struct.fit(NUMERICAL_STRUCT_ARRAY, NUMERICAL_NP_ARRAY_TARGET)
+    clf_mixed = CountingKNN(k=1)
+    clf_mixed.fit(MIXED_ARRAY, NUMERICAL_NP_ARRAY_TARGET)
+
+    experiments = [(clf, NUMERICAL_NP_ARRAY, 2, 10),
+                   (clf_struct, NUMERICAL_STRUCT_ARRAY, 'c', 10),
+                   (clf_mixed, MIXED_ARRAY, 'b', None)]  # yapf: disable
+    for model, dataset, feature_index, steps_number in experiments:
+        ice, linespace = ftmfi.individual_conditional_expectation(
+            dataset,
+            model,
+            feature_index,
+            steps_number=steps_number,
+            exclude_rows=1)
+        assert len(model.calls) == 5
+        for batch_size, n_jobs in ((7, 1), (1000, 1), (4, 3)):
+            model.calls = []
+            ice_, linespace_ = ftmfi.individual_conditional_expectation(
+                dataset,
+                model,
+                feature_index,
+                steps_number=steps_number,
+                exclude_rows=1,
+                batch_size=batch_size,
+                n_jobs=n_jobs)
+            data_points_number = 5 * linespace.shape[0]
+            assert len(model.calls) == -(-data_points_number // batch_size)
+            assert sum(model.calls) == data_points_number
+            assert np.array_equal(ice, ice_)
+            assert np.array_equal(linespace, linespace_)
+        model.calls = []
+
+    pd, linespace = ftmfi.partial_dependence(
+        NUMERICAL_NP_ARRAY, clf, 3, steps_number=10)
+    clf.calls = []
+    pd_, linespace_ = ftmfi.partial_dependence(
+        NUMERICAL_NP_ARRAY, clf, 3, steps_number=10, batch_size=60)
+    assert clf.calls == [60]
+    assert np.array_equal(pd, pd_)
+    assert np.array_equal(linespace, linespace_)
+
+
 def test_partial_dependence_ice():
     """
     Tests Partial Dependence calculations from an ICE array.
@@ -874,3 +1050,251 @@ def test_partial_dependence():
         MIXED_ARRAY_TEST, clf, 'b', exclude_rows=1)
     assert np.allclose(pd, MIXED_PD_CATEGORICAL)
     assert np.array_equal(linespace, MIXED_LINESPACE_CATEGORICAL)
+
+
+def test_partial_dependence_streaming():
+    """
+    Tests streaming Partial Dependence calculations.
+
+    Tests :func:`fatf.transparency.models.feature_influence.
+    partial_dependence` function with the ``streaming`` and
+    ``return_variance`` parameters.
+    """
+    type_error_streaming = 'The streaming parameter has to be a boolean.'
+    type_error_variance = 'The return_variance parameter has to be a boolean.'
+
+    clf = fum.KNN(k=2)
+    clf.fit(NUMERICAL_NP_ARRAY, NUMERICAL_NP_ARRAY_TARGET)
+
+    with pytest.raises(TypeError) as exin:
+        ftmfi.partial_dependence(NUMERICAL_NP_ARRAY_TEST, clf, 3, streaming=1)
+    assert str(exin.value) == type_error_streaming
+    with pytest.raises(TypeError) as exin:
+        ftmfi.partial_dependence(
+            NUMERICAL_NP_ARRAY_TEST, clf, 3, return_variance='yes')
+    assert str(exin.value) == type_error_variance
+
+    ice, _ = ftmfi.individual_conditional_expectation(
+        NUMERICAL_NP_ARRAY_TEST, clf, 3, steps_number=3)
+    variance = ice.var(axis=0)
+
+    for batch_size, n_jobs in ((None, 1), (1, 1), (2, 2), (5, -1)):
+        pd, linespace = ftmfi.partial_dependence(
+            NUMERICAL_NP_ARRAY_TEST,
+            clf,
+            3,
+            steps_number=3,
+            batch_size=batch_size,
+            n_jobs=n_jobs,
+            streaming=True)
+        assert np.allclose(pd, NUMERICAL_NP_PD)
+        assert np.allclose(linespace, NUMERICAL_NP_LINESPACE)
+
+        pd, linespace, var = ftmfi.partial_dependence(
+            NUMERICAL_NP_ARRAY_TEST,
+            clf,
+            3,
+            steps_number=3,
+            batch_size=batch_size,
+            n_jobs=n_jobs,
+            streaming=True,
+            return_variance=True)
+        assert np.allclose(pd, NUMERICAL_NP_PD)
+        assert np.allclose(var, variance)
+
+    pd, linespace, var = ftmfi.partial_dependence(
+        NUMERICAL_NP_ARRAY_TEST, clf, 3, steps_number=3, return_variance=True)
+    assert np.allclose(pd, NUMERICAL_NP_PD)
+    assert np.allclose(var, variance)
+
+    # Categorical features and row filtering
+    clf = fum.KNN(k=2)
+    clf.fit(MIXED_ARRAY, MIXED_ARRAY_TARGET)
+    pd, linespace = ftmfi.partial_dependence(
+        MIXED_ARRAY_TEST, clf, 'b', exclude_rows=1, streaming=True)
+    assert np.allclose(pd, MIXED_PD_CATEGORICAL)
+    assert np.array_equal(linespace, MIXED_LINESPACE_CATEGORICAL)
+
+
+def test_partial_dependence_subsample():
+    """
+    Tests Partial Dependence estimated from a subsample of rows.
+
+    Tests :func:`fatf.transparency.models.feature_influence.
+    partial_dependence` function with the ``grid_strategy``,
+    ``subsample_size`` and ``return_error`` parameters.
+    """
+    type_error_error = 'The return_error parameter has to be a boolean.'
+    type_error_size = ('The subsample_size parameter has to either be None or '
+                       'an integer.')
+    value_error_size = ('The subsample_size parameter has to be a positive '
+                        'integer.')
+
+    clf = fum.KNN(k=2)
+    clf.fit(NUMERICAL_NP_ARRAY, NUMERICAL_NP_ARRAY_TARGET)
+
+    with pytest.raises(TypeError) as exin:
+        ftmfi.partial_dependence(
+            NUMERICAL_NP_ARRAY_TEST, clf, 3, return_error=1)
+    assert str(exin.value) == type_error_error
+    with pytest.raises(TypeError) as exin:
+        ftmfi.partial_dependence(
+            NUMERICAL_NP_ARRAY_TEST, clf, 3, subsample_size=1.5)
+    assert str(exin.value) == type_error_size
+    with pytest.raises(ValueError) as exin:
+        ftmfi.partial_dependence(
+            NUMERICAL_NP_ARRAY_TEST, clf, 3, subsample_size=0)
+    assert str(exin.value) == value_error_size
+
+    # All of the rows -- exact
+    pd, linespace, error = ftmfi.partial_dependence(
+        NUMERICAL_NP_ARRAY_TEST,
+        clf,
+        3,
+        steps_number=3,
+        subsample_size=100,
+        return_error=True)
+    assert np.allclose(pd, NUMERICAL_NP_PD)
+    assert np.allclose(linespace, NUMERICAL_NP_LINESPACE)
+    assert np.array_equal(error, np.zeros_like(pd))
+    pd, linespace, variance, error = ftmfi.partial_dependence(
+        NUMERICAL_NP_ARRAY_TEST,
+        clf,
+        3,
+        steps_number=3,
+        return_variance=True,
+        return_error=True)
+    assert np.allclose(pd, NUMERICAL_NP_PD)
+    assert np.array_equal(error, np.zeros_like(pd))
+
+    # Subsample
+    dataset = np.tile(NUMERICAL_NP_ARRAY_TEST, (20, 1))
+    pd_full, _, variance_full = ftmfi.partial_dependence(
+        dataset, clf, 3, steps_number=3, return_variance=True)
+    assert np.allclose(pd_full, NUMERICAL_NP_PD)
+    pd, linespace, variance, error = ftmfi.partial_dependence(
+        dataset,
+        clf,
+        3,
+        steps_number=3,
+        batch_size=4,
+        subsample_size=20,
+        return_variance=True,
+        return_error=True)
+    assert np.allclose(linespace, NUMERICAL_NP_LINESPACE)
+    assert pd.shape == error.shape == variance.shape == pd_full.shape
+    assert np.all(error >= 0)
+    assert np.all(np.abs(pd - pd_full) <= 5 * error + 1e-8)
+    # The standard error shrinks as the sample grows
+    _, _, error_larger = ftmfi.partial_dependence(
+        dataset, clf, 3, steps_number=3, subsample_size=60, return_error=True)
+    assert np.all(error_larger <= error + 1e-8)
+    # Every stratum of more than one row is sampled at least twice
+    strata = ftmfi._stratified_subsample(dataset, clf, 2, None)
+    assert len(strata) > 1
+    assert all(sample.shape[0] == 2 for sample, _ in strata)
+    _, _, error = ftmfi.partial_dependence(
+        dataset, clf, 3, steps_number=3, subsample_size=2, return_error=True)
+    assert np.all(np.isfinite(error))
+
+    # Grid strategies
+    pd, linespace = ftmfi.partial_dependence(
+        NUMERICAL_NP_ARRAY_TEST,
+        clf,
+        3,
+        steps_number=3,
+        grid_strategy='unique')
+    assert np.array_equal(linespace, np.unique(NUMERICAL_NP_ARRAY_TEST[:, 3]))
+    ice, _ = ftmfi.individual_conditional_expectation(
+        NUMERICAL_NP_ARRAY_TEST,
+        clf,
+        3,
+        steps_number=3,
+        grid_strategy='unique')
+    assert np.allclose(pd, ice.mean(axis=0))
+
+
+def test_partial_dependence_features():
+    """
+    Tests :func:`fatf.transparency.models.feature_influence.\
+partial_dependence_features` function.
+    """
+    type_error = ('The features parameter has to be a non-empty list of '
+                  'feature indices and/or pairs (2-tuples) of feature '
+                  'indices.')
+    index_error = ('Some of the feature indices are not valid for the input '
+                   'dataset.')
+    type_error_cat = ('The categorical_indices parameter has to either be '
+                      'None or a list.')
+
+    clf = fum.KNN(k=2)
+    clf.fit(NUMERICAL_NP_ARRAY, NUMERICAL_NP_ARRAY_TARGET)
+    clf_mixed = fum.KNN(k=2)
+    clf_mixed.fit(MIXED_ARRAY, NUMERICAL_NP_ARRAY_TARGET)
+
+    for features in ([], 0, [(0, 1, 2)], [(1, 1)], [[0, 1]], [None]):
+        with pytest.raises(TypeError) as exin:
+            ftmfi.partial_dependence_features(NUMERICAL_NP_ARRAY, clf,
+                                              features)
+        assert str(exin.value) == type_error
+    with pytest.raises(IndexError) as exin:
+        ftmfi.partial_dependence_features(NUMERICAL_NP_ARRAY, clf, [0, (1, 4)])
+    assert str(exin.value) == index_error
+    with pytest.raises(TypeError) as exin:
+        ftmfi.partial_dependence_features(
+            NUMERICAL_NP_ARRAY, clf, [0], categorical_indices=0)
+    assert str(exin.value) == type_error_cat
+
+    # Single features match partial_dependence
+    features = [0, 2, (1, 3), (3, 0)]
+    for batch_size, n_jobs in ((10000, 1), (7, 1), (5, 2)):
+        pds = ftmfi.partial_dependence_features(
+            NUMERICAL_NP_ARRAY,
+            clf,
+            features,
+            categorical_indices=[1],
+            steps_number=4,
+            exclude_rows=[2],
+            batch_size=batch_size,
+            n_jobs=n_jobs)
+        assert list(pds.keys()) == features
+        for feature in (0, 2):
+            pd, linespace = ftmfi.partial_dependence(
+                NUMERICAL_NP_ARRAY,
+                clf,
+                feature,
+                steps_number=4,
+                exclude_rows=[2])
+            assert np.allclose(pds[feature][0], pd)
+            assert np.array_equal(pds[feature][1], linespace)
+
+        # Pairs of features
+        for feature in ((1, 3), (3, 0)):
+            pd, (linespace_a, linespace_b) = pds[feature]
+            for index, linespace in zip(feature, (linespace_a, linespace_b)):
+                column = NUMERICAL_NP_ARRAY[:, index]
+                if index == 1:
+                    assert np.array_equal(linespace, [0, 1])
+                else:
+                    assert np.allclose(
+                        linespace, np.linspace(column.min(), column.max(), 4))
+            assert pd.shape == (linespace_a.shape[0], linespace_b.shape[0], 3)
+            for i, value_a in enumerate(linespace_a):
+                for j, value_b in enumerate(linespace_b):
+                    data = NUMERICAL_NP_ARRAY[[0, 1, 3, 4, 5]].copy()
+                    data[:, feature[0]] = value_a
+                    data[:, feature[1]] = value_b
+                    assert np.allclose(pd[i, j],
+                                       clf.predict_proba(data).mean(axis=0))
+
+    # Structured data with a categorical feature
+    pds = ftmfi.partial_dependence_features(
+        MIXED_ARRAY, clf_mixed, ['b', ('a', 'd')], steps_number=3)
+    pd, linespace = ftmfi.partial_dependence(MIXED_ARRAY, clf_mixed, 'b')
+    assert np.allclose(pds['b'][0], pd)
+    assert np.array_equal(pds['b'][1], linespace)
+    pd, (linespace_a, linespace_d) = pds[('a', 'd')]
+    assert np.allclose(linespace_a, [0, 0.5, 1])
+    assert np.array_equal(linespace_d, ['a', 'aa', 'b', 'bb'])
+    assert pd.shape == (3, 4, 3)
+    assert np.allclose(pd.sum(axis=2), 1)
@@ -8,31 +8,208 @@ counterfactual explainers for predictions.
 
 # pylint: disable=too-many-lines
 
+import collections
+import copy
 import inspect
 import itertools
+import multiprocessing.pool
+import threading
 import warnings
 
 from numbers import Number
-from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import (Any, Callable, Dict, Generator, List, Optional, Set, Tuple,
+                    Union)
 
 import numpy as np
 
 import fatf.utils.models.validation as fumv
 import fatf.utils.array.tools as fuat
 import fatf.utils.array.validation as fuav
+import fatf.utils.distances as fud
 import fatf.utils.tools as fut
 
 from fatf.exceptions import IncorrectShapeError
 
 FeatureRange = Union[Tuple[float, float], List[Union[float, str]]]
 Index = Union[int, str]
+SearchResult = Tuple[np.ndarray, np.ndarray, np.ndarray]
+SearchResults = List[SearchResult]
+Search = Generator[np.ndarray, np.ndarray, SearchResults]
 
-__all__ = ['CounterfactualExplainer', 'textualise_counterfactuals']
+__all__ = ['PredictionCache',
+           'CounterfactualExplainer',
+           'textualise_counterfactuals']  # yapf: disable
 
 _NUMPY_VERSION = [int(i) for i in np.version.version.split('.')]
 _NUMPY_1_13 = fut.at_least_verion([1, 13], _NUMPY_VERSION)
 
 
+class PredictionCache(object):
+    """
+    A bounded, least-recently-used cache of predictions of data points.
+
+    .. versionadded:: 0.1.1
+
+    The counterfactual search often predicts the same data points many times
+    -- across feature combinations, explained instances and explainers. This
+    cache memorises the prediction of every data point (row) that it has seen
+    and only calls the predictive function for the rows that are not cached.
+    The rows are identified by their raw bytes and the dtype of the array
+    they come from, and the predictions are stored separately for every
+    predictive function, hence one cache can be shared by explainers of
+    different models. When the cache is full, the least recently used
+    predictions are discarded. The cache is thread-safe.
+
+    Data points that are equal but stored with different dtypes (e.g.,
+    integers and floats) are cached separately.
+
+    Parameters
+    ----------
+    max_size : integer, optional (default=100000)
+        The maximum number of predictions held in the cache.
+
+    Raises
+    ------
+    TypeError
+        The ``max_size`` parameter is not an integer.
+    ValueError
+        The ``max_size`` parameter is not a positive integer.
+
+    Attributes
+    ----------
+    max_size : integer
+        The maximum number of predictions held in the cache.
+    hits : integer
+        The number of rows whose predictions were retrieved from the cache.
+    misses : integer
+        The number of rows that had to be predicted.
+    _store : collections.OrderedDict
+        The cached predictions ordered from the least to the most recently
+        used.
+    _lock : threading.Lock
+        A lock guarding the cache.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    def __init__(self, max_size: int = 100000) -> None:
+        """
+        Initialises the prediction cache.
+        """
+        if not isinstance(max_size, int) or isinstance(max_size, bool):
+            raise TypeError('The max_size parameter has to be an integer.')
+        if max_size < 1:
+            raise ValueError('The max_size parameter has to be a positive '
+                             'integer.')
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._store = collections.OrderedDict(
+        )  # type: collections.OrderedDict[Any, Any]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached predictions.
+        """
+        return len(self._store)
+
+    def clear(self) -> None:
+        """
+        Empties the cache and resets its counters.
+        """
+        with self._lock:
+            self._store.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def predict(self, predictive_function: Callable,
+                X: np.ndarray) -> np.ndarray:
+        """
+        Predicts the rows of ``X`` with the cache.
+
+        Only the rows that are not in the cache are predicted (each unique row
+        once) with a single call of the ``predictive_function``.
+
+        Parameters
+        ----------
+        predictive_function : Callable
+            A function that takes in a 2-dimensional data array and returns
+            its predictions.
+        X : numpy.ndarray
+            A 2-dimensional data array to be predicted.
+
+        Returns
+        -------
+        predictions : numpy.ndarray
+            The predictions of ``X``.
+        """
+        # pylint: disable=invalid-name
+        assert fuav.is_2d_array(X), 'X must be a 2-dimensional array.'
+        if not X.shape[0]:
+            return predictive_function(X)
+
+        if fuav.is_structured_array(X):
+            dtype_key = str(X.dtype.descr)
+        else:
+            dtype_key = X.dtype.str
+        keys = [(predictive_function, dtype_key, row.tobytes()) for row in X]
+
+        predictions = X.shape[0] * [None]  # type: List[Any]
+        missing = collections.OrderedDict(
+        )  # type: collections.OrderedDict[Any, List[int]]
+        with self._lock:
+            for i, key in enumerate(keys):
+                if key in self._store:
+                    self._store.move_to_end(key)
+                    predictions[i] = self._store[key]
+                else:
+                    missing.setdefault(key, []).append(i)
+            self.hits += X.shape[0] - sum(len(i) for i in missing.values())
+            self.misses += sum(len(i) for i in missing.values())
+
+        if missing:
+            missing_rows = [i[0] for i in missing.values()]
+            missing_predictions = predictive_function(X[missing_rows])
+            assert len(missing_predictions) == len(missing_rows), \
+                'Every row needs a prediction.'
+
+            with self._lock:
+                for (key, rows), prediction in zip(missing.items(),
+                                                   missing_predictions):
+                    for i in rows:
+                        predictions[i] = prediction
+                    self._store[key] = prediction
+                    self._store.move_to_end(key)
+                while len(self._store) > self.max_size:
+                    self._store.popitem(last=False)
+
+        return np.array(predictions)
+
+    def wrap(self, predictive_function: Callable) -> Callable:
+        """
+        Wraps a predictive function with the cache.
+
+        Parameters
+        ----------
+        predictive_function : Callable
+            A function that takes in a 2-dimensional data array and returns
+            its predictions.
+
+        Returns
+        -------
+        cached_predictive_function : Callable
+            The ``predictive_function`` whose predictions are cached.
+        """
+
+        def cached_predictive_function(X: np.ndarray) -> np.ndarray:
+            # pylint: disable=invalid-name
+            return self.predict(predictive_function, X)
+
+        return cached_predictive_function
+
+
 class CounterfactualExplainer(object):
     """
     Generates counterfactual explanations of black-box classifier predictions.
@@ -138,6 +315,26 @@ optional (default=None)
     default_numerical_step_size : Number, optional (default=1)
         The default step size used with the grid search of numerical features
         when generating counterfactuals.
+    distance : fatf.utils.distances.MixedDistance, optional (default=None)
+        A mixed distance object used to compute the distances between the
+        explained instance and all of its counterfactual candidates at once
+        (instead of the per-feature ``distance_functions``). Its ``metric``
+        replaces the ``normalise_distance`` parameter of the
+        ``explain_instance`` method -- ``'manhattan'`` is equivalent to the
+        default distance and ``'joint_euclidean'`` to the normalised one. If
+        the object is not fitted, a copy of it is fitted with the categorical
+        indices of this explainer (unless it specifies its own) to the
+        ``dataset`` or, in its absence, to the first explained instance --
+        the object passed in is never modified.
+
+        .. versionadded:: 0.1.1
+    prediction_cache : fatf.transparency.predictions.counterfactuals.\
+PredictionCache, optional (default=None)
+        A prediction cache wrapped around the ``predictive_function`` (or the
+        ``predict`` method of the ``model``), which allows to avoid predicting
+        the same data points repeatedly. It can be shared between explainers.
+
+        .. versionadded:: 0.1.1
 
     Warns
     -----
@@ -192,7 +389,11 @@ optional (default=None)
         not a Python callable. The ``step_sizes`` parameter is not dictionary.
         One of the step sizes defined via the ``step_sizes`` parameter is not
         a number. The ``default_numerical_step_size`` parameter is not a
-        number.
+        number. The ``distance`` parameter is neither ``None`` nor a
+        :class:`fatf.utils.distances.MixedDistance` object. The
+        ``prediction_cache`` parameter is neither ``None`` nor a
+        :class:`fatf.transparency.predictions.counterfactuals.PredictionCache`
+        object.
     ValueError
         Some of the categorical (textual) features in the ``dataset`` array
         (when given) are not indicated by the user -- given via the
@@ -218,12 +419,14 @@ optional (default=None)
         numbers. The ``default_numerical_step_size`` parameter is not a
         strictly positive number. When discovering feature ranges from the
         ``dataset`` there is only one value for a numerical feature meaning
-        that a range cannot be created.
+        that a range cannot be created. Both the ``distance_functions`` and
+        the ``distance`` parameters are given.
 
     Attributes
     ----------
     predict : Callable
-        A function used to predict the class of counterfactuals.
+        A function used to predict the class of counterfactuals (wrapped with
+        the ``prediction_cache``, if given).
     all_indices : Set[column indices]
         A set of all the column (feature) indices in the data set from which
         counterfactuals are generated.
@@ -246,11 +449,16 @@ optional (default=None)
     step_sizes : Dictionary[column indices, Numbers]
         A dictionary with step sizes for all of the numerical features in the
         ``cf_feature_indices``.
+    distance : Union[None, fatf.utils.distances.MixedDistance]
+        A mixed distance object used instead of the ``distance_functions``.
+    prediction_cache : Union[None, fatf.transparency.predictions.\
+counterfactuals.PredictionCache]
+        The prediction cache used by the ``predict`` function.
     """
     # pylint: disable=useless-object-inheritance,too-many-instance-attributes
     # pylint: disable=too-few-public-methods
 
-    __all__ = ['explain_instance']
+    __all__ = ['explain_instance', 'explain_instances']
 
     # Whether out-of-range warning has been issued for a particular feature.
     # Used to avoid duplicated feature warnings.
@@ -267,7 +475,9 @@ optional (default=None)
                  feature_ranges: Optional[Dict[Index, FeatureRange]] = None,
                  distance_functions: Optional[Dict[Index, Callable]] = None,
                  step_sizes: Optional[Dict[Index, float]] = None,
-                 default_numerical_step_size: float = 1.0) -> None:
+                 default_numerical_step_size: float = 1.0,
+                 distance: Optional[fud.MixedDistance] = None,
+                 prediction_cache: Optional[PredictionCache] = None) -> None:
         """
         Initialises a counterfactual explainer.
         """
@@ -284,6 +494,14 @@ optional (default=None)
             self.predict = model.predict  # type: ignore
         else:
             self.predict = predictive_function
+        if prediction_cache is not None:
+            if not isinstance(prediction_cache, PredictionCache):
+                raise TypeError('The prediction_cache parameter has to be '
+                                'either None or a fatf.transparency.'
+                                'predictions.counterfactuals.PredictionCache '
+                                'object.')
+            self.predict = prediction_cache.wrap(self.predict)
+        self.prediction_cache = prediction_cache
 
         # Choose categorical and numerical indices
         if dataset is not None:
@@ -422,6 +640,7 @@ optional (default=None)
         self.step_sizes = step_sizes
 
         # Sort out distance functions
+        distance_functions_given = distance_functions is not None
         if distance_functions is None:
             distance_functions = dict()
             for idx in self.all_indices:
@@ -440,6 +659,25 @@ optional (default=None)
                     distance_functions[idx] = _numerical_distance
         self.distance_functions = distance_functions
 
+        # Sort out the (vectorised) mixed distance
+        if distance is not None:
+            if not isinstance(distance, fud.MixedDistance):
+                raise TypeError('The distance parameter has to be either '
+                                'None or a fatf.utils.distances.MixedDistance '
+                                'object.')
+            if distance_functions_given:
+                raise ValueError('The distance_functions and the distance '
+                                 'parameters cannot be used together.')
+            if not distance.is_fitted:
+                # Configure and fit a copy to leave the user's object intact
+                distance = copy.deepcopy(distance)
+                if distance.categorical_indices is None:
+                    distance.categorical_indices = sorted(
+                        self.categorical_indices)
+                if dataset is not None:
+                    distance.fit(dataset)
+        self.distance = distance
+
     def _get_feature_ranges(self,
                             dataset: Union[None, np.ndarray],
                             column_indices: Optional[Set[Index]] = None
@@ -609,73 +847,93 @@ optional (default=None)
             distance = np.sum(distances)
         return distance
 
-    def _get_neighbouring_instances(
-            self, instance: Union[np.ndarray, np.void],
-            features_combination: Tuple[Union[str, int], ...]) -> np.ndarray:
+    def _get_feature_values(self, instance: Union[np.ndarray, np.void],
+                            feature: Index) -> np.ndarray:
         """
-        Generates all neighbouring instances with ranges of selected features.
+        Gets all the values of a feature that a counterfactual can take.
 
-        Generates instances with all possible value combinations for selected
-        feature indices. The possible values are taken from the feature ranges
-        calculated when the object was created.
+        The possible values are taken from the feature ranges calculated when
+        the object was created. For categorical features, the value of the
+        ``instance`` is excluded. A warning is issued (once per feature) if
+        the value of the ``instance`` is outside of the feature range.
 
         Parameters
         ----------
         instance : numpy.ndarray or numpy.void
             A 1-dimensional numpy array representing a data point for which
-            neighbouring instances are desired.
-        features_combination : Tuple(column indices)
-            A tuple with feature indices for which possible value combinations
-            will be generated.
+            counterfactual values are desired.
+        feature : column index
+            The feature for which the values are generated.
+
+        Warns
+        -----
+        UserWarning
+            The value of the ``feature`` for this ``instance`` is outside of
+            the specified range for this feature.
 
         Returns
         -------
-        cf_instances : numpy.ndarray
-            A 2-dimensional numpy array with neighbouring data points or an
-            empty array if none could be generated.
+        feature_values : numpy.ndarray
+            A 1-dimensional numpy array with the possible values.
         """
-        # pylint: disable=too-many-locals,too-many-branches
-        assert features_combination, 'Must be at least one feature.'
         warning_msg = ('The value ({}) of *{}* feature for this instance is '
                        'out of the specified {}.')
-        possible_features_ranges = []
-        for feature in features_combination:
-            if feature in self.categorical_indices:
-                feature_value = instance[feature]
-                feature_ranges = self.feature_ranges[feature]
-                # Get all other possible categorical values
-                feature_range = np.array(
-                    [i for i in feature_ranges if i != feature_value])
-                possible_features_ranges.append(feature_range)
-
-                if (feature_value not in feature_ranges
-                        and not self._feature_warned[feature]):
-                    self._feature_warned[feature] = True
-                    complement = 'values: {}'.format(feature_ranges)
-                    warning_msg = warning_msg.format(feature_value, feature,
-                                                     complement)
-                    warnings.warn(warning_msg, UserWarning)
+        feature_value = instance[feature]
+        if feature in self.categorical_indices:
+            feature_ranges = self.feature_ranges[feature]
+            # Get all other possible categorical values
+            feature_values = np.array(
+                [i for i in feature_ranges if i != feature_value])
+
+            if (feature_value not in feature_ranges
+                    and not self._feature_warned[feature]):
+                self._feature_warned[feature] = True
+                complement = 'values: {}'.format(feature_ranges)
+                warnings.warn(
+                    warning_msg.format(feature_value, feature, complement),
+                    UserWarning)
+        else:
+            feature_range_min = self.feature_ranges[feature][0]
+            feature_range_max = self.feature_ranges[feature][1]
+
+            if ((feature_value < feature_range_min
+                 or feature_value > feature_range_max)
+                    and not self._feature_warned[feature]):
+                self._feature_warned[feature] = True
+                complement = 'min-max range: {}-{}'.format(
+                    feature_range_min, feature_range_max)
+                warnings.warn(
+                    warning_msg.format(feature_value, feature, complement),
+                    UserWarning)
 
-            else:
-                feature_range_min = self.feature_ranges[feature][0]
-                feature_range_max = self.feature_ranges[feature][1]
-                feature_value = instance[feature]
-
-                if ((feature_value < feature_range_min
-                     or feature_value > feature_range_max)
-                        and not self._feature_warned[feature]):
-                    self._feature_warned[feature] = True
-                    complement = 'min-max range: {}-{}'.format(
-                        feature_range_min, feature_range_max)
-                    warning_msg = warning_msg.format(feature_value, feature,
-                                                     complement)
-                    warnings.warn(warning_msg, UserWarning)
-
-                feature_range = np.arange(feature_range_min, feature_range_max,
-                                          self.step_sizes[feature])
-                possible_features_ranges.append(feature_range)
-
-        # Generalise the type if necessary
+            feature_values = np.arange(feature_range_min, feature_range_max,
+                                       self.step_sizes[feature])
+        return feature_values
+
+    @staticmethod
+    def _generalise_instance(instance: Union[np.ndarray, np.void],
+                             features_combination: Tuple[Index, ...],
+                             possible_features_ranges: List[np.ndarray]
+                             ) -> Union[np.ndarray, np.void]:
+        """
+        Generalises the type of an instance to hold the counterfactual values.
+
+        Parameters
+        ----------
+        instance : numpy.ndarray or numpy.void
+            A 1-dimensional numpy array representing a data point.
+        features_combination : Tuple(column indices)
+            A tuple with feature indices that will be altered.
+        possible_features_ranges : List[numpy.ndarray]
+            The possible values of every feature in the
+            ``features_combination``.
+
+        Returns
+        -------
+        generalised_instance : numpy.ndarray or numpy.void
+            The ``instance`` with a (generalised) type that can hold all of
+            the counterfactual values.
+        """
         if fuav.is_structured_array(np.array([instance])):
             new_types = []
             for name in instance.dtype.names:
@@ -687,35 +945,367 @@ optional (default=None)
                     new_types.append((name, dtype))
                 else:
                     new_types.append((name, instance.dtype[name]))
-            instance = instance.astype(new_types)
+            generalised_instance = instance.astype(new_types)
         else:
             dtype = possible_features_ranges[0].dtype
             for i in possible_features_ranges:
                 dtype = fuat.generalise_dtype(dtype, i.dtype)
             dtype = fuat.generalise_dtype(dtype, instance.dtype)
-            instance = instance.astype(dtype)
+            generalised_instance = instance.astype(dtype)
+        return generalised_instance
+
+    @staticmethod
+    def _get_candidates(instance: Union[np.ndarray, np.void],
+                        features_combination: Tuple[Index, ...],
+                        possible_features_ranges: List[np.ndarray],
+                        grid: np.ndarray) -> np.ndarray:
+        """
+        Builds counterfactual candidates for (a part of) a value grid.
+
+        Parameters
+        ----------
+        instance : numpy.ndarray or numpy.void
+            A 1-dimensional numpy array representing a data point with a type
+            generalised to hold all of the counterfactual values.
+        features_combination : Tuple(column indices)
+            A tuple with feature indices that are altered.
+        possible_features_ranges : List[numpy.ndarray]
+            The possible values of every feature in the
+            ``features_combination``.
+        grid : numpy.ndarray
+            A 2-dimensional integer array whose rows hold the indices of the
+            values (in the ``possible_features_ranges``) taken by every
+            feature of a candidate.
+
+        Returns
+        -------
+        cf_instances : numpy.ndarray
+            A 2-dimensional numpy array with one candidate per ``grid`` row.
+        """
+        is_structured = fuav.is_structured_array(np.array([instance]))
+        cf_instances = np.repeat(np.array([instance]), grid.shape[0], axis=0)
+        for cf_index, feature in enumerate(features_combination):
+            values = possible_features_ranges[cf_index][grid[:, cf_index]]
+            if is_structured:
+                cf_instances[feature] = values
+            else:
+                cf_instances[:, feature] = values
+        return cf_instances
+
+    def _get_neighbouring_instances(
+            self, instance: Union[np.ndarray, np.void],
+            features_combination: Tuple[Union[str, int], ...]) -> np.ndarray:
+        """
+        Generates all neighbouring instances with ranges of selected features.
+
+        Generates instances with all possible value combinations for selected
+        feature indices. The possible values are taken from the feature ranges
+        calculated when the object was created.
+
+        .. versionchanged:: 0.1.1
+           The instances are generated with vectorised numpy indexing rather
+           than one at a time.
+
+        Parameters
+        ----------
+        instance : numpy.ndarray or numpy.void
+            A 1-dimensional numpy array representing a data point for which
+            neighbouring instances are desired.
+        features_combination : Tuple(column indices)
+            A tuple with feature indices for which possible value combinations
+            will be generated.
+
+        Returns
+        -------
+        cf_instances : numpy.ndarray
+            A 2-dimensional numpy array with neighbouring data points or an
+            empty array if none could be generated.
+        """
+        assert features_combination, 'Must be at least one feature.'
+        possible_features_ranges = [
+            self._get_feature_values(instance, feature)
+            for feature in features_combination
+        ]
+        instance = self._generalise_instance(instance, features_combination,
+                                             possible_features_ranges)
 
         # Create alternative data points
-        cf_instances = []
-        for value_combination in itertools.product(*possible_features_ranges):
-            cf_instance = instance.copy()
-            for cf_index, feature in enumerate(features_combination):
-                cf_instance[feature] = value_combination[cf_index]
-            cf_instances.append(cf_instance)
-
-        # Combine alternative data points into a single numpy array
-        if cf_instances:
-            cf_instances = np.stack(cf_instances)
+        grid = _get_grid([i.shape[0] for i in possible_features_ranges])
+        if grid.shape[0]:
+            cf_instances = self._get_candidates(instance, features_combination,
+                                                possible_features_ranges, grid)
         else:
             cf_instances = np.array([])
 
         return cf_instances
 
+    def _get_candidates_distances(
+            self, instance: Union[np.ndarray, np.void],
+            cf_instances: np.ndarray, features_combination: Tuple[Index, ...],
+            grid: np.ndarray, features_distances: Dict[Index, np.ndarray],
+            self_distances: Dict[Index, Number],
+            normalise: bool) -> np.ndarray:
+        """
+        Computes the distances between an instance and its candidates.
+
+        If the explainer uses a :class:`fatf.utils.distances.MixedDistance`
+        object, it computes the distances. Otherwise, the distances are
+        composed -- as in the ``_get_distance`` method -- from the
+        (pre-computed) per-feature distances of the possible values of every
+        altered feature and the distances of every unaltered feature to
+        itself.
+
+        Parameters
+        ----------
+        instance : numpy.ndarray or numpy.void
+            The explained data point.
+        cf_instances : numpy.ndarray
+            A 2-dimensional array with the counterfactual candidates.
+        features_combination : Tuple(column indices)
+            A tuple with feature indices that are altered.
+        grid : numpy.ndarray
+            The value indices of the candidates, cf. the ``_get_candidates``
+            method.
+        features_distances : Dictionary[column indices, numpy.ndarray]
+            The distances between the value of the ``instance`` and every
+            possible value of each counterfactual feature.
+        self_distances : Dictionary[column indices, Number]
+            The distance between the value of every feature and itself.
+        normalise : boolean
+            Whether to normalise the distance.
+
+        Returns
+        -------
+        distances : numpy.ndarray
+            A 1-dimensional array with the distance to every candidate.
+        """
+        # pylint: disable=too-many-arguments,too-many-locals
+        if self.distance is not None:
+            distances = self.distance.point_distance(instance, cf_instances)
+        else:
+            samples_number = grid.shape[0]
+            columns = []
+            for feature in self.all_indices:
+                if feature in features_combination:
+                    cf_index = features_combination.index(feature)
+                    column = features_distances[feature][grid[:, cf_index]]
+                else:
+                    column = np.full((samples_number, ),
+                                     self_distances[feature])
+                columns.append(column)
+            distances_matrix = np.stack(columns, axis=1)
+            if normalise:
+                distances = np.sqrt(np.power(distances_matrix, 2).sum(axis=1))
+            else:
+                distances = np.sum(distances_matrix, axis=1)
+        return distances
+
+    def _search_counterfactuals(
+            self, instance: Union[np.ndarray, np.void],
+            current_class: Optional[Union[int, str]],
+            counterfactual_class: Optional[Union[int, str]],
+            normalise_distance: bool, batch_size: int,
+            early_stopping: bool) -> Search:
+        """
+        Searches for the closest counterfactuals of every feature combination.
+
+        The feature combinations are enumerated by their length and the
+        counterfactual candidates of consecutive combinations are predicted
+        together in batches of ``batch_size`` data points. This method is a
+        generator that yields every batch of candidates and expects to be
+        sent their predictions, hence the predictions can be computed by the
+        caller -- e.g., together with the candidates of other instances, cf.
+        the ``explain_instances`` method.
+
+        With ``early_stopping``, a lower bound of the distance achievable by
+        every feature combination -- the distance to the candidate composed of
+        the closest possible value of each altered feature -- is compared
+        with the distance of the closest counterfactual found so far;
+        combinations that cannot match it are skipped. If none of the
+        combinations of a given length is searched, the search stops as their
+        extensions cannot be any closer. (This assumes that the per-feature
+        distances are non-negative.) Only the closest counterfactuals are
+        returned in this case.
+
+        For the description of the parameters please see the documentation
+        of the ``explain_instance`` method; the ``current_class`` is the
+        predicted class of the ``instance`` if the ``counterfactual_class`` is
+        not given.
+
+        Yields
+        ------
+        cf_instances : numpy.ndarray
+            A 2-dimensional array with (at most ``batch_size``) counterfactual
+            candidates whose predictions -- a 1-dimensional numpy array --
+            have to be sent back to the generator.
+
+        Returns
+        -------
+        counterfactuals : List[Tuple[numpy.ndarray, numpy.ndarray, \
+numpy.ndarray]]
+            A list with a triplet of the closest counterfactuals, their
+            distances and their predictions for every feature combination
+            that yielded counterfactuals.
+        """
+        # pylint: disable=too-many-arguments,too-many-locals
+        # pylint: disable=too-many-branches,too-many-statements
+        features_values = {}  # type: Dict[Index, np.ndarray]
+        features_distances = {}  # type: Dict[Index, np.ndarray]
+        closest_values = {}  # type: Dict[Index, int]
+        for feature in self.cf_feature_indices:
+            feature_values = self._get_feature_values(instance, feature)
+            features_values[feature] = feature_values
+
+            if self.distance is None:
+                distances = np.array([
+                    self.distance_functions[feature](instance[feature], value)
+                    for value in feature_values
+                ])
+            elif feature_values.dtype.kind in 'biuf':
+                distances = np.abs(feature_values - instance[feature])
+            else:
+                distances = np.ones(feature_values.shape)
+            features_distances[feature] = distances
+            closest_values[feature] = (int(np.argmin(distances))
+                                       if distances.size else -1)
+
+        self_distances = {}  # type: Dict[Index, Number]
+        is_monotone = True
+        if self.distance is None:
+            for feature in self.all_indices:
+                self_distances[feature] = self.distance_functions[feature](
+                    instance[feature], instance[feature])
+                if feature in features_distances:
+                    distances = features_distances[feature]
+                    if distances.size:
+                        is_monotone &= bool(
+                            distances.min() >= self_distances[feature])
+
+        results = dict()  # type: Dict[int, SearchResult]
+        best_distance = np.inf
+        pending = []  # type: List[Tuple[int, np.ndarray, np.ndarray]]
+        pending_rows = 0
+
+        def process_pending():
+            nonlocal best_distance
+            cf_instances = _concatenate([i[1] for i in pending])
+            cf_predictions_all = yield cf_instances
+            assert cf_predictions_all.shape[0] == cf_instances.shape[0], \
+                'Every candidate needs a prediction.'
+
+            offset = 0
+            for combination_id, combination_instances, values_grid in pending:
+                rows = combination_instances.shape[0]
+                cf_predictions = cf_predictions_all[offset:offset + rows]
+                offset += rows
+
+                # Identify counterfactuals based on the cf class
+                if current_class is None:
+                    is_cf = cf_predictions == counterfactual_class
+                else:
+                    is_cf = cf_predictions != current_class
+                if not is_cf.any():
+                    continue
+
+                # Filter the counterfactuals
+                cf_found = combination_instances[is_cf]
+                cf_predictions = cf_predictions[is_cf]
+                dists = self._get_candidates_distances(
+                    instance, cf_found, combinations[combination_id],
+                    values_grid[is_cf], features_distances, self_distances,
+                    normalise_distance)
+
+                dists_min = dists.min()
+                dists_min_mask = dists == dists_min
+                best_distance = min(best_distance, dists_min)
+                found = (cf_found[dists_min_mask], dists[dists_min_mask],
+                         cf_predictions[dists_min_mask])
+                if combination_id not in results:
+                    results[combination_id] = found
+                else:
+                    combination_min = results[combination_id][1][0]
+                    if dists_min < combination_min:
+                        results[combination_id] = found
+                    elif dists_min == combination_min:
+                        stored = results[combination_id]
+                        merged = (_concatenate([stored[0], found[0]]),
+                                  np.concatenate([stored[1], found[1]]),
+                                  np.concatenate([stored[2], found[2]]))
+                        results[combination_id] = merged
+
+        combinations = []  # type: List[Tuple[Index, ...]]
+        for cf_length in range(self.max_counterfactual_length):
+            is_length_searched = False
+            cf_features_combinations = itertools.combinations(
+                self.cf_feature_indices, cf_length + 1)  # +1 as counts from 0
+            for cf_features_combination in cf_features_combinations:
+                possible_features_ranges = [
+                    features_values[feature]
+                    for feature in cf_features_combination
+                ]
+                sizes = [i.shape[0] for i in possible_features_ranges]
+                if not all(sizes):
+                    continue
+                generalised_instance = self._generalise_instance(
+                    instance, cf_features_combination,
+                    possible_features_ranges)
+
+                if early_stopping:
+                    closest_grid = np.array([[
+                        closest_values[feature]
+                        for feature in cf_features_combination
+                    ]])
+                    closest_instance = self._get_candidates(
+                        generalised_instance, cf_features_combination,
+                        possible_features_ranges, closest_grid)
+                    lower_bound = self._get_candidates_distances(
+                        instance, closest_instance, cf_features_combination,
+                        closest_grid, features_distances, self_distances,
+                        normalise_distance)[0]
+                    if (lower_bound > best_distance
+                            and not np.isclose(lower_bound, best_distance)):
+                        continue
+                is_length_searched = True
+
+                combination_id = len(combinations)
+                combinations.append(cf_features_combination)
+                grid = _get_grid(sizes)
+                start = 0
+                while start < grid.shape[0]:
+                    end = min(grid.shape[0], start + batch_size - pending_rows)
+                    cf_instances = self._get_candidates(
+                        generalised_instance, cf_features_combination,
+                        possible_features_ranges, grid[start:end])
+                    pending.append((combination_id, cf_instances,
+                                    grid[start:end]))
+                    pending_rows += end - start
+                    start = end
+
+                    if pending_rows >= batch_size:
+                        yield from process_pending()
+                        pending = []
+                        pending_rows = 0
+
+            if early_stopping and is_monotone and not is_length_searched:
+                break
+
+        if pending:
+            yield from process_pending()
+
+        counterfactuals = [results[i] for i in sorted(results)]
+        if early_stopping:
+            counterfactuals = [
+                i for i in counterfactuals if i[1][0] == best_distance
+            ]
+        return counterfactuals
+
     def explain_instance(
             self,
             instance: Union[np.ndarray, np.void],
             counterfactual_class: Optional[Union[int, str]] = None,
-            normalise_distance: bool = False
+            normalise_distance: bool = False,
+            batch_size: int = 1000,
+            early_stopping: bool = False
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Finds counterfactual data points, their class and distance.
@@ -736,7 +1326,22 @@ optional (default=None)
             ``instance`` will be returned.
         normalise_distance : boolean, optional (default=False)
             Whether to normalise the distance, cf. the ``_get_distance`` method
-            for more details.
+            for more details. (Ignored when the explainer uses a
+            :class:`fatf.utils.distances.MixedDistance` object.)
+        batch_size : integer, optional (default=1000)
+            The number of counterfactual candidates -- possibly spanning many
+            feature combinations -- predicted with a single call of the model.
+
+            .. versionadded:: 0.1.1
+        early_stopping : boolean, optional (default=False)
+            If ``True``, only the closest counterfactuals (across all of the
+            feature combinations) are returned. This allows to skip feature
+            combinations that cannot yield counterfactuals as close as the
+            ones already found and to stop the search once none of the
+            combinations of a given length can -- cf. the
+            ``_search_counterfactuals`` method for more details.
+
+            .. versionadded:: 0.1.1
 
         Raises
         ------
@@ -748,16 +1353,20 @@ optional (default=None)
         TypeError
             The ``counterfactual_class`` parameter is neither string not
             integer. The ``normalise_distance`` parameter is not a boolean.
+            The ``batch_size`` parameter is not an integer. The
+            ``early_stopping`` parameter is not a boolean.
         ValueError
             The input ``instance`` is not of a base type (string and/or
-            integer).
+            integer). The ``batch_size`` parameter is not a positive integer.
 
         Warns
         -----
         UserWarning
             When generating counterfactuals the value of one of the features
             for the specified input ``instance`` is outside of the specified
-            range for this feature.
+            range for this feature. The ``normalise_distance`` parameter is
+            set to ``True`` when the explainer uses a
+            :class:`fatf.utils.distances.MixedDistance` object.
 
         Returns
         -------
@@ -771,6 +1380,7 @@ optional (default=None)
             counterfactual data point.
         """
         # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+        # pylint: disable=too-many-arguments
         if not fuav.is_1d_like(instance):
             raise IncorrectShapeError('The instance to be explained should be '
                                       'a 1-dimensional numpy array or a row '
@@ -783,13 +1393,10 @@ optional (default=None)
                                       np.array(list(self.all_indices))):
             raise IndexError('The indices used to initialise this class are '
                              'not valid for this data point.')
-        if counterfactual_class is not None:
-            if not isinstance(counterfactual_class, (int, str)):
-                raise TypeError('The counterfactual class should be either an '
-                                'integer or a string.')
-        if not isinstance(normalise_distance, bool):
-            raise TypeError('The normalise_distance parameter should be a '
-                            'boolean.')
+        assert _validate_explain_parameters(
+            counterfactual_class, normalise_distance, batch_size,
+            early_stopping), 'Invalid explanation parameters.'
+        self._prepare_distance(instance_2d, normalise_distance)
 
         # Prepare out-of-range warnings
         self._feature_warned = {key: False for key in self.cf_feature_indices}
@@ -803,102 +1410,308 @@ optional (default=None)
             # The counterfactual class is defined
             current_class = None
 
-        counterfactuals = []
-        counterfactuals_distances = []
-        counterfactuals_predictions = []
-        for cf_length in range(self.max_counterfactual_length):
-            cf_features_combinations = itertools.combinations(
-                self.cf_feature_indices, cf_length + 1)  # +1 as counts from 0
-            for cf_features_combination in cf_features_combinations:
-                cf_instances = self._get_neighbouring_instances(
-                    instance, cf_features_combination)
-
-                if cf_instances.size:
-                    cf_predictions = self.predict(cf_instances)
-
-                    # Identify counterfactuals based on the cf class
-                    if current_class is None:
-                        is_cf = cf_predictions == counterfactual_class
-                    else:
-                        is_cf = cf_predictions != current_class
-
-                    # Filter the counterfactuals
-                    cf_instances = cf_instances[is_cf]
-                    cf_predictions = cf_predictions[is_cf]
-                    distances = []
-                    for cf_instance in cf_instances:
-                        distance = self._get_distance(
-                            instance,
-                            cf_instance,
-                            normalise=normalise_distance)
-                        distances.append(distance)
-
-                    if distances:
-                        dists = np.array(distances)
-                        dists_min = dists.min()
-                        dists_min_mask = dists == dists_min
-
-                        counterfactuals.append(cf_instances[dists_min_mask])
-                        counterfactuals_distances.append(dists[dists_min_mask])
-                        counterfactuals_predictions.append(
-                            cf_predictions[dists_min_mask])
-
-        if counterfactuals:
-            # Make sure that all of the structured arrays share the same type.
-            # Otherwise it is impossible to concatenate.
-            if fuav.is_structured_array(counterfactuals[0]):
-                new_types = []
-                for name in counterfactuals[0].dtype.names:
-                    dtype = counterfactuals[0].dtype[name]
-                    for i in counterfactuals:
-                        dtype = fuat.generalise_dtype(dtype, i.dtype[name])
-                    new_types.append((name, dtype))
-                for i, cfs in enumerate(counterfactuals):
-                    counterfactuals[i] = cfs.astype(new_types)
-
-            # Put counterfactuals together
-            counterfactuals = np.concatenate(counterfactuals)
-            counterfactuals_distances = np.concatenate(
-                counterfactuals_distances)
-            counterfactuals_predictions = np.concatenate(
-                counterfactuals_predictions)
-
-            # Remove duplicates
-            if _NUMPY_1_13:  # pragma: nocover
-                counterfactuals, uidx = np.unique(
-                    counterfactuals, return_index=True, axis=0)
-            else:  # pragma: nocover
-                is_structured = fuav.is_structured_array(counterfactuals)
-                uidx = []
-                for i, row in enumerate(counterfactuals):
-                    if is_structured:
-                        same_rows = counterfactuals == row
-                    else:
-                        same_rows = (counterfactuals == row).all(axis=1)
-                    if same_rows.sum() > 1:
-                        duplicates = set(np.where(same_rows)[0].tolist())
-                        if not duplicates.intersection(uidx):
-                            uidx.append(i)
-                    else:
+        search = self._search_counterfactuals(
+            instance, current_class, counterfactual_class, normalise_distance,
+            batch_size, early_stopping)
+        search_results = []  # type: SearchResults
+        try:
+            cf_instances = next(search)
+            while True:
+                cf_instances = search.send(self.predict(cf_instances))
+        except StopIteration as search_stop:
+            search_results = search_stop.value
+
+        return _combine_counterfactuals(search_results)
+
+    def explain_instances(
+            self,
+            X: np.ndarray,
+            counterfactual_class: Optional[Union[int, str]] = None,
+            normalise_distance: bool = False,
+            batch_size: int = 1000,
+            early_stopping: bool = False,
+            n_jobs: int = 1
+    ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Finds counterfactual data points for every row of a data array.
+
+        .. versionadded:: 0.1.1
+
+        The counterfactual search of all the instances progresses together.
+        In every round, the counterfactual candidates of all the instances are
+        concatenated and predicted in batches of ``batch_size`` data points,
+        which are distributed across a pool of ``n_jobs`` worker threads. The
+        counterfactuals of every instance are the same as the ones returned
+        by the ``explain_instance`` method.
+
+        For the description of the ``counterfactual_class``,
+        ``normalise_distance``, ``batch_size`` and ``early_stopping``
+        parameters, and the warnings please see the documentation of the
+        ``explain_instance`` method.
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            A 2-dimensional numpy array with data points for which
+            counterfactuals are desired.
+        n_jobs : integer, optional (default=1)
+            The number of worker threads used to compute the predictions -- a
+            positive integer or -1 (to use all of the available CPUs).
+
+        Raises
+        ------
+        IncorrectShapeError
+            The input ``X`` is not a 2-dimensional numpy array.
+        IndexError
+            The indices that were used to initialise this class are not valid
+            for the given input ``X``.
+        TypeError
+            The ``counterfactual_class`` parameter is neither string not
+            integer. The ``normalise_distance`` parameter is not a boolean.
+            The ``batch_size`` parameter is not an integer. The
+            ``early_stopping`` parameter is not a boolean. The ``n_jobs``
+            parameter is not an integer.
+        ValueError
+            The input ``X`` is not of a base type (string and/or integer).
+            The ``batch_size`` parameter is not a positive integer. The
+            ``n_jobs`` parameter is neither a positive integer nor -1.
+
+        Returns
+        -------
+        explanations : List[Tuple[numpy.ndarray, numpy.ndarray, \
+numpy.ndarray]]
+            A list with a triplet of counterfactuals, their distances and
+            their predictions -- cf. the ``explain_instance`` method -- for
+            every row of ``X``.
+        """
+        # pylint: disable=invalid-name,too-many-arguments,too-many-locals
+        if not fuav.is_2d_array(X):
+            raise IncorrectShapeError('The instances to be explained should '
+                                      'be a 2-dimensional numpy array.')
+        if not fuav.is_base_array(X):
+            raise ValueError('The instances should be of a base type -- a '
+                             'mixture of numerical and textual types.')
+        if not fuat.are_indices_valid(X, np.array(list(self.all_indices))):
+            raise IndexError('The indices used to initialise this class are '
+                             'not valid for these data points.')
+        assert _validate_explain_parameters(
+            counterfactual_class, normalise_distance, batch_size,
+            early_stopping), 'Invalid explanation parameters.'
+        # pylint: disable=protected-access
+        assert fud._validate_n_jobs(n_jobs), 'Invalid n_jobs parameter.'
+        if not X.shape[0]:
+            return []
+        self._prepare_distance(X, normalise_distance)
+
+        with multiprocessing.pool.ThreadPool(
+                fud._get_processes_number(n_jobs)) as pool:
+
+            def predict(data):
+                chunks = [
+                    data[i:i + batch_size]
+                    for i in range(0, data.shape[0], batch_size)
+                ]
+                return np.concatenate(pool.map(self.predict, chunks))
+
+            if counterfactual_class is None:
+                # Counterfactuals will be of any class different than the
+                # predicted one
+                current_classes = predict(X)
+                assert current_classes.shape[0] == X.shape[0], \
+                    'One prediction per instance.'
+            else:
+                current_classes = X.shape[0] * [None]
+
+            # Start the searches -- the out-of-range warnings are issued
+            # (per instance) before the first batch is yielded
+            search_results = {}  # type: Dict[int, SearchResults]
+            searches = []
+            for i, instance in enumerate(X):
+                self._feature_warned = {
+                    key: False
+                    for key in self.cf_feature_indices
+                }
+                search = self._search_counterfactuals(
+                    instance, current_classes[i], counterfactual_class,
+                    normalise_distance, batch_size, early_stopping)
+                try:
+                    searches.append((i, search, next(search)))
+                except StopIteration as search_stop:
+                    search_results[i] = search_stop.value
+
+            # Predict the candidates of all the searches together
+            while searches:
+                predictions = predict(_concatenate([i[2] for i in searches]))
+                active_searches = []
+                offset = 0
+                for i, search, cf_instances in searches:
+                    rows = cf_instances.shape[0]
+                    try:
+                        active_searches.append(
+                            (i, search,
+                             search.send(predictions[offset:offset + rows])))
+                    except StopIteration as search_stop:
+                        search_results[i] = search_stop.value
+                    offset += rows
+                searches = active_searches
+
+        explanations = [
+            _combine_counterfactuals(search_results[i])
+            for i in range(X.shape[0])
+        ]
+        return explanations
+
+    def _prepare_distance(self, X: np.ndarray,
+                          normalise_distance: bool) -> None:
+        """
+        Prepares the mixed distance object (if used) for an explanation.
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            A 2-dimensional array with the explained instances; used to fit
+            the mixed distance if it has not been fitted yet.
+        normalise_distance : boolean
+            Whether the distance was requested to be normalised.
+
+        Warns
+        -----
+        UserWarning
+            The ``normalise_distance`` parameter is set to ``True`` when the
+            explainer uses a :class:`fatf.utils.distances.MixedDistance`
+            object.
+        """
+        # pylint: disable=invalid-name
+        if self.distance is not None:
+            if normalise_distance:
+                warnings.warn(
+                    'The normalise_distance parameter is ignored when a '
+                    'MixedDistance object is used. Please choose its metric '
+                    'instead.', UserWarning)
+            if not self.distance.is_fitted:
+                self.distance.fit(X)
+
+
+def _combine_counterfactuals(search_results: SearchResults) -> SearchResult:
+    """
+    Combines the counterfactuals found for all of the feature combinations.
+
+    The counterfactuals are deduplicated and sorted by their distance.
+
+    Parameters
+    ----------
+    search_results : List[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]
+        A list with a triplet of counterfactuals, their distances and their
+        predictions for every feature combination.
+
+    Returns
+    -------
+    counterfactuals : numpy.ndarray
+        A 2-dimensional numpy array with counterfactual data points.
+    counterfactuals_distances : numpy.ndarray
+        A 1-dimensional numpy array with distances to every counterfactual
+        data point.
+    counterfactuals_predictions : numpy.ndarray
+        A 1-dimensional numpy array with predictions for every counterfactual
+        data point.
+    """
+    counterfactuals = [i[0] for i in search_results]
+    counterfactuals_distances = [i[1] for i in search_results]
+    counterfactuals_predictions = [i[2] for i in search_results]
+
+    if counterfactuals:
+        # Put counterfactuals together
+        counterfactuals = _concatenate(counterfactuals)
+        counterfactuals_distances = np.concatenate(counterfactuals_distances)
+        counterfactuals_predictions = np.concatenate(
+            counterfactuals_predictions)
+
+        # Remove duplicates
+        if _NUMPY_1_13:  # pragma: nocover
+            counterfactuals, uidx = np.unique(
+                counterfactuals, return_index=True, axis=0)
+        else:  # pragma: nocover
+            is_structured = fuav.is_structured_array(counterfactuals)
+            uidx = []
+            for i, row in enumerate(counterfactuals):
+                if is_structured:
+                    same_rows = counterfactuals == row
+                else:
+                    same_rows = (counterfactuals == row).all(axis=1)
+                if same_rows.sum() > 1:
+                    duplicates = set(np.where(same_rows)[0].tolist())
+                    if not duplicates.intersection(uidx):
                         uidx.append(i)
-                counterfactuals = counterfactuals[uidx]
-            counterfactuals_distances = counterfactuals_distances[uidx]
-            counterfactuals_predictions = counterfactuals_predictions[uidx]
-
-            # Sort them to get the closest ones first
-            sorting = np.argsort(counterfactuals_distances)
-            counterfactuals = counterfactuals[sorting]
-            counterfactuals_distances = counterfactuals_distances[sorting]
-            counterfactuals_predictions = counterfactuals_predictions[sorting]
-        else:
-            assert not counterfactuals_distances, 'Should be an empty list.'
-            assert not counterfactuals_predictions, 'Should be an empty list.'
-            counterfactuals = np.ndarray((0, 0))
-            counterfactuals_distances = np.ndarray((0, ))
-            counterfactuals_predictions = np.ndarray((0, ))
+                else:
+                    uidx.append(i)
+            counterfactuals = counterfactuals[uidx]
+        counterfactuals_distances = counterfactuals_distances[uidx]
+        counterfactuals_predictions = counterfactuals_predictions[uidx]
+
+        # Sort them to get the closest ones first
+        sorting = np.argsort(counterfactuals_distances)
+        counterfactuals = counterfactuals[sorting]
+        counterfactuals_distances = counterfactuals_distances[sorting]
+        counterfactuals_predictions = counterfactuals_predictions[sorting]
+    else:
+        assert not counterfactuals_distances, 'Should be an empty list.'
+        assert not counterfactuals_predictions, 'Should be an empty list.'
+        counterfactuals = np.ndarray((0, 0))
+        counterfactuals_distances = np.ndarray((0, ))
+        counterfactuals_predictions = np.ndarray((0, ))
+
+    return (counterfactuals, counterfactuals_distances,
+            counterfactuals_predictions)
+
+
+def _get_grid(sizes: List[int]) -> np.ndarray:
+    """
+    Enumerates all the combinations of value indices of a few features.
+
+    The combinations are ordered in the same way as the output of
+    :func:`itertools.product` for value ranges of the given ``sizes``.
+
+    Parameters
+    ----------
+    sizes : List[integer]
+        The number of values of every feature.
+
+    Returns
+    -------
+    grid : numpy.ndarray
+        A 2-dimensional integer array with one combination of value indices
+        per row.
+    """
+    grid = np.indices(sizes).reshape(len(sizes), -1).T
+    return grid
+
 
-        return (counterfactuals, counterfactuals_distances,
-                counterfactuals_predictions)
+def _concatenate(arrays: List[np.ndarray]) -> np.ndarray:
+    """
+    Concatenates (structured) arrays generalising the type of their fields.
+
+    Parameters
+    ----------
+    arrays : List[numpy.ndarray]
+        A non-empty list of 2-dimensional arrays to be concatenated.
+
+    Returns
+    -------
+    concatenated : numpy.ndarray
+        The concatenated arrays.
+    """
+    # Make sure that all of the structured arrays share the same type.
+    # Otherwise it is impossible to concatenate.
+    if fuav.is_structured_array(arrays[0]):
+        new_types = []
+        for name in arrays[0].dtype.names:
+            dtype = arrays[0].dtype[name]
+            for i in arrays:
+                dtype = fuat.generalise_dtype(dtype, i.dtype[name])
+            new_types.append((name, dtype))
+        arrays = [i.astype(new_types) for i in arrays]
+    concatenated = np.concatenate(arrays)
+    return concatenated
 
 
 def _categorical_distance(first_value: Union[float, str],
@@ -1226,6 +2039,43 @@ def _validate_input_two(
     return input_is_valid
 
 
+def _validate_explain_parameters(counterfactual_class: Union[None, int, str],
+                                 normalise_distance: bool, batch_size: int,
+                                 early_stopping: bool) -> bool:
+    """
+    Validates the parameters of the counterfactual explanation methods.
+
+    For the description of the parameters and the exceptions please see the
+    documentation of the
+    :func:`fatf.transparency.predictions.counterfactuals.\
+CounterfactualExplainer.explain_instance` method.
+
+    Returns
+    -------
+    is_valid : boolean
+        ``True`` if the parameters are valid, ``False`` otherwise.
+    """
+    is_valid = False
+
+    if counterfactual_class is not None:
+        if not isinstance(counterfactual_class, (int, str)):
+            raise TypeError('The counterfactual class should be either an '
+                            'integer or a string.')
+    if not isinstance(normalise_distance, bool):
+        raise TypeError('The normalise_distance parameter should be a '
+                        'boolean.')
+    if not isinstance(batch_size, int) or isinstance(batch_size, bool):
+        raise TypeError('The batch_size parameter should be an integer.')
+    if batch_size < 1:
+        raise ValueError('The batch_size parameter should be a positive '
+                         'integer.')
+    if not isinstance(early_stopping, bool):
+        raise TypeError('The early_stopping parameter should be a boolean.')
+
+    is_valid = True
+    return is_valid
+
+
 def textualise_counterfactuals(
         instance: Union[np.ndarray, np.void],
         counterfactuals: np.ndarray,
@@ -247,6 +247,66 @@ surrogate_explainers.SurrogateTabularExplainer` class.
     return is_input_ok
 
 
+def _weighted_ridge(data: np.ndarray,
+                    targets: np.ndarray,
+                    weights: np.ndarray,
+                    alpha: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fits a batch of weighted ridge regressions in closed form.
+
+    .. versionadded:: 0.1.1
+
+    Every ridge regression (with an intercept) is equivalent to the
+    ``sklearn.linear_model.Ridge(alpha=alpha)`` model fitted with the
+    ``sample_weight`` parameter -- the data and the targets are centred with
+    their weighted means and the regularised normal equations are solved for
+    all of the regressions at once.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        A 3-dimensional numerical array of (regressions_number, samples_number,
+        features_number) shape with the training data of every regression.
+    targets : numpy.ndarray
+        A 3-dimensional numerical array of (regressions_number, samples_number,
+        targets_number) shape with the targets of every regression. (Each
+        target is fitted independently.)
+    weights : numpy.ndarray
+        A 2-dimensional numerical array of (regressions_number, samples_number)
+        shape with the positive sample weights of every regression.
+    alpha : float, optional (default=1.0)
+        The regularisation strength.
+
+    Returns
+    -------
+    coefficients : numpy.ndarray
+        A 3-dimensional array of (regressions_number, targets_number,
+        features_number) shape with the coefficients of every regression.
+    intercepts : numpy.ndarray
+        A 2-dimensional array of (regressions_number, targets_number) shape
+        with the intercepts of every regression.
+    """
+    assert data.ndim == targets.ndim == 3 and weights.ndim == 2, 'Shapes.'
+    shapes_agree = data.shape[:2] == targets.shape[:2] == weights.shape
+    assert shapes_agree, 'The number of regressions and samples must agree.'
+
+    weights_sum = weights.sum(axis=1)[:, np.newaxis]
+    data_mean = np.einsum('rs,rsf->rf', weights, data) / weights_sum
+    targets_mean = np.einsum('rs,rst->rt', weights, targets) / weights_sum
+    data_centred = data - data_mean[:, np.newaxis, :]
+    targets_centred = targets - targets_mean[:, np.newaxis, :]
+
+    gram = np.einsum('rsf,rs,rsg->rfg', data_centred, weights, data_centred)
+    gram += alpha * np.eye(data.shape[2])
+    moments = np.einsum('rsf,rs,rst->rft', data_centred, weights,
+                        targets_centred)
+
+    coefficients = np.linalg.solve(gram, moments)
+    intercepts = targets_mean - np.einsum('rf,rft->rt', data_mean,
+                                          coefficients)
+    return coefficients.transpose(0, 2, 1), intercepts
+
+
 class SurrogateTabularExplainer(abc.ABC):
     """
     An abstract parent class for implementing surrogate explainers.
@@ -892,6 +952,17 @@ class TabularBlimeyLime(SurrogateTabularExplainer):
     as categorical features (via the ``categorical_indices`` parameter) will
     not be discretised.
 
+    Since all of the features are categorical after the discretisation, the
+    distribution of the sampled (discretised) data does not depend on the
+    explained ``data_row`` -- only their binarisation does. Therefore, a pool
+    of sampled data together with their black-box predictions can be created
+    once with the ``refresh_sampling_pool`` method and reused by many
+    explanations by setting the ``use_sampling_pool`` parameter of the
+    ``explain_instance`` (or ``explain_instances``) method to ``True``. Each
+    explanation then draws its ``samples_number`` data points from the pool
+    (without replacement) instead of sampling, undiscretising and predicting
+    new data.
+
     For detailed instructions on how to build a custom surrogate explainer
     (to avoid tinkering with this class) please see the
     :ref:`how_to_tabular_surrogates` *how-to guide*.
@@ -996,6 +1067,7 @@ Dictionary[discretised bin id, Tuple(float, float, float, float)]]
         Constructs a ``TabularBlimeyLime`` class.
         """
         # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+        # pylint: disable=too-many-statements
 
         if SKLEARN_MISSING:
             raise ImportError('The scikit-learn package is required to use '
@@ -1090,11 +1162,36 @@ Dictionary[discretised bin id, Tuple(float, float, float, float)]]
                                                       mean_val, std_val)
         self.bin_sampling_values = bin_sampling_values
 
+        # Lookup tables of the truncated normal distribution parameters of
+        # every bin for vectorised undiscretisation -- the sorted bin ids, the
+        # standardised lower and upper bounds, the mean and the standard
+        # deviation.
+        bin_sampling_tables = {}  # type: Dict[Index, Tuple[np.ndarray, ...]]
+        for index, index_values in bin_sampling_values.items():
+            bin_ids = np.array(sorted(index_values.keys()))
+            min_, max_, mean_, std_ = np.array(
+                [index_values[bin_id] for bin_id in bin_ids],
+                dtype=np.float64).T
+            with np.errstate(divide='ignore', invalid='ignore'):
+                lower_bound = (min_ - mean_) / std_
+                upper_bound = (max_ - mean_) / std_
+            bin_sampling_tables[index] = (bin_ids, lower_bound, upper_bound,
+                                          mean_, std_)
+        self._bin_sampling_tables = bin_sampling_tables
+
+        # The pool of discretised sampled data and their predictions (see the
+        # refresh_sampling_pool method)
+        self._sampling_pool = None  # type: Optional[Tuple[np.ndarray, ...]]
+
     def _explain_instance_input_is_valid(  # type: ignore
-            self, data_row: Union[np.ndarray, np.void],
-            explained_class: Union[None, int, str], samples_number: int,
+            self,
+            data_row: Union[np.ndarray, np.void],
+            explained_class: Union[None, int, str],
+            samples_number: int,
             features_number: Union[None, int],
-            kernel_width: Union[None, float], return_models: bool) -> bool:
+            kernel_width: Union[None, float],
+            return_models: bool,
+            use_sampling_pool: bool = False) -> bool:
         """
         Validates the input parameters of the ``explain_instance`` method.
 
@@ -1145,13 +1242,133 @@ predictions.surrogate_explainers.TabularBlimeyLime.explain_instance` method.
         if not isinstance(return_models, bool):
             raise TypeError('The return_models parameter must be a boolean.')
 
+        if not isinstance(use_sampling_pool, bool):
+            raise TypeError('The use_sampling_pool parameter must be a '
+                            'boolean.')
+        if use_sampling_pool:
+            if self._sampling_pool is None:
+                raise RuntimeError('The sampling pool has not been created. '
+                                   'Please call the refresh_sampling_pool '
+                                   'method first.')
+            pool_size = self._sampling_pool[0].shape[0]
+            if samples_number > pool_size:
+                raise ValueError('The samples_number parameter cannot be '
+                                 'larger than the size of the sampling pool '
+                                 '({}).'.format(pool_size))
+
         is_valid = True
         return is_valid
 
-    def _undiscretise_data(self, discretised_data: np.ndarray) -> np.ndarray:
+    def refresh_sampling_pool(self,
+                              pool_size: int = 1000,
+                              batch_size: Optional[int] = None) -> None:
+        """
+        Creates (or replaces) the pool of sampled data and their predictions.
+
+        .. versionadded:: 0.1.1
+
+        The ``pool_size`` data points are sampled in the discretised domain,
+        reverted back into the original domain and predicted with the
+        black-box model. The discretised data and their predictions are stored
+        and can be reused by the ``explain_instance`` and ``explain_instances``
+        methods (with their ``use_sampling_pool`` parameter set to ``True``).
+        The undiscretised data are discarded.
+
+        Parameters
+        ----------
+        pool_size : integer, optional (default=1000)
+            The number of data points in the pool.
+        batch_size : integer, optional (default=None)
+            The number of data points predicted in a single call of the
+            black-box model. If ``None``, all of the pool is predicted in one
+            call.
+
+        Raises
+        ------
+        TypeError
+            The ``pool_size`` parameter is not an integer. The ``batch_size``
+            parameter is neither ``None`` nor an integer.
+        ValueError
+            The ``pool_size`` or the ``batch_size`` parameter is a
+            non-positive integer (smaller than 1).
+        """
+        if isinstance(pool_size, int) and not isinstance(pool_size, bool):
+            if pool_size < 1:
+                raise ValueError('The pool_size parameter must be a positive '
+                                 'integer (larger than 0).')
+        else:
+            raise TypeError('The pool_size parameter must be an integer.')
+        if batch_size is not None:
+            if isinstance(batch_size, bool) or not isinstance(batch_size, int):
+                raise TypeError('The batch_size parameter must either be '
+                                'None or an integer.')
+            if batch_size < 1:
+                raise ValueError('The batch_size parameter must be a '
+                                 'positive integer (larger than 0).')
+        if batch_size is None:
+            batch_size = pool_size
+
+        # The sampling of discretised data does not depend on the data row
+        pool_discretised = self.augmenter.sample(samples_number=pool_size)
+        pool_data = self._undiscretise_data(pool_discretised)
+        pool_predictions = [
+            self.predictive_function(pool_data[i:i + batch_size])
+            for i in range(0, pool_size, batch_size)
+        ]
+        pool_predictions = np.concatenate(pool_predictions, axis=0)
+
+        self._sampling_pool = (pool_discretised, pool_predictions)
+
+    def _sample_pool(self,
+                     samples_number: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Draws data points and their predictions from the sampling pool.
+
+        .. versionadded:: 0.1.1
+
+        The data points are drawn without replacement. If ``samples_number``
+        is equal to the size of the pool, the whole pool is returned.
+
+        Parameters
+        ----------
+        samples_number : integer
+            The number of data points to be drawn.
+
+        Returns
+        -------
+        sampled_data_discretised : numpy.ndarray
+            The drawn discretised data points.
+        sampled_data_predictions : numpy.ndarray
+            The black-box predictions of the drawn data points.
+        """
+        assert self._sampling_pool is not None, 'The pool must exist.'
+        pool_discretised, pool_predictions = self._sampling_pool
+        pool_size = pool_discretised.shape[0]
+        assert samples_number <= pool_size, 'Too many samples.'
+
+        if samples_number == pool_size:
+            sampled_data_discretised = pool_discretised
+            sampled_data_predictions = pool_predictions
+        else:
+            pool_indices = np.random.choice(
+                pool_size, size=samples_number, replace=False)
+            sampled_data_discretised = pool_discretised[pool_indices]
+            sampled_data_predictions = pool_predictions[pool_indices]
+        return sampled_data_discretised, sampled_data_predictions
+
+    def _undiscretise_data(
+            self,
+            discretised_data: np.ndarray,
+            random_generator: Optional['np.random.Generator'] = None
+    ) -> np.ndarray:
         """
         Transforms discretised data set into its original representation.
 
+        .. versionchanged:: 0.1.1
+           The values of each feature are sampled in a single vectorised
+           call (with inverse-CDF sampling) instead of one call per bin.
+           Added the ``random_generator`` parameter.
+
         The ``discretised_data`` are reverted back to their original domain by
         sampling each (numerical) feature value from the corresponding bin
         using the truncated normal distribution for which minimum (lower
@@ -1160,6 +1377,15 @@ predictions.surrogate_explainers.TabularBlimeyLime.explain_instance` method.
         (used to initialise this class) for which feature values fall into that
         bin. The categorical features are left unchanged.
 
+        The parameters of the truncated normal distribution of every bin are
+        looked up (via fancy indexing) in tables precomputed when this class
+        is initialised, and the values of a feature are drawn with the inverse
+        cumulative distribution function of the truncated normal distribution
+        applied to uniform random numbers. The uniform random numbers are
+        assigned to the data points bin after bin, hence the samples are
+        identical to those drawn one bin at a time with
+        ``scipy.stats.truncnorm.rvs``.
+
         This method mimics the "un-discretisation" procedure done by the
         `official LIME implementation`_.
 
@@ -1171,6 +1397,12 @@ predictions.surrogate_explainers.TabularBlimeyLime.explain_instance` method.
         discretised_data : numpy.ndarray
             A discretised data set to be reverted back to the original
             representation (domain).
+        random_generator : numpy.random.Generator, optional (default=None)
+            A random number generator used to draw the uniform random numbers
+            -- any object with a numpy-like ``uniform`` method, e.g., a
+            ``numpy.random.RandomState`` for numpy older than 1.17. If
+            ``None``, the global numpy random state is used (which can be
+            seeded with :func:`fatf.setup_random_seed`).
 
         Returns
         -------
@@ -1180,6 +1412,9 @@ predictions.surrogate_explainers.TabularBlimeyLime.explain_instance` method.
         """
         # pylint: disable=too-many-locals
         assert fuav.is_2d_array(discretised_data), 'Not a 2-D array.'
+        assert (random_generator is None
+                or hasattr(random_generator, 'uniform')), \
+            'The random generator has to have a uniform method.'
 
         # Create a placeholder for undiscretised data. We copy the discretised
         # array instead of creating an empty one to preserve the values of
@@ -1196,39 +1431,44 @@ predictions.surrogate_explainers.TabularBlimeyLime.explain_instance` method.
                 discretised_column = discretised_data[:, index]
                 undiscretised_column = undiscretised_data[:, index]
 
-            unique_column_values = np.unique(discretised_column)
-            for bin_id, bin_values in self.bin_sampling_values[index].items():
-                if bin_id in unique_column_values:
-                    # Since sampling values must have been found in this bin,
-                    # there should be an empirical mean (2) and
-                    # standard deviation (3).
-                    # yapf: disable
-                    assert (self.bin_sampling_values[index][bin_id][2]
-                            is not np.nan), ('No empirical mean for a bin '
-                                             'without data points.')
-                    assert (self.bin_sampling_values[index][bin_id][3]
-                            is not np.nan), ('No empirical standard deviation '
-                                             'for a bin without data points.')
-                    # yapf: enable
-
-                    bin_indices = np.where(discretised_column == bin_id)[0]
-                    samples_number = bin_indices.shape[0]
-
-                    min_, max_, mean_, std_ = bin_values
-                    if std_:
-                        lower_bound = (min_ - mean_) / std_
-                        upper_bound = (max_ - mean_) / std_
-
-                        unsampled = scipy.stats.truncnorm.rvs(
-                            lower_bound,
-                            upper_bound,
-                            loc=mean_,
-                            scale=std_,
-                            size=samples_number)
-                    else:
-                        unsampled = np.array(samples_number * [mean_])
-
-                    undiscretised_column[bin_indices] = unsampled
+            bin_ids, lower_bound, upper_bound, mean_, std_ = (
+                self._bin_sampling_tables[index])
+            bin_positions = np.searchsorted(bin_ids, discretised_column)
+            assert np.array_equal(
+                bin_ids[np.clip(bin_positions, 0, bin_ids.shape[0] - 1)],
+                discretised_column), 'Unknown bin id.'
+
+            # Since sampling values must have been found in these bins, there
+            # should be an empirical mean and standard deviation.
+            assert not np.isnan(mean_[bin_positions]).any(), (
+                'No empirical mean for a bin without data points.')
+            assert not np.isnan(std_[bin_positions]).any(), (
+                'No empirical standard deviation for a bin without data '
+                'points.')
+
+            # Bins with a single value (zero standard deviation) are not
+            # sampled.
+            is_constant = std_[bin_positions] == 0
+            undiscretised_column[is_constant] = mean_[
+                bin_positions[is_constant]]
+
+            # Order the remaining data points bin after bin
+            sampled_indices = np.where(~is_constant)[0]
+            sampled_indices = sampled_indices[np.argsort(
+                bin_positions[sampled_indices], kind='mergesort')]
+            sampled_positions = bin_positions[sampled_indices]
+
+            if random_generator is None:
+                uniform = np.random.uniform(size=sampled_indices.shape[0])
+            else:
+                uniform = random_generator.uniform(
+                    size=sampled_indices.shape[0])
+            undiscretised_column[sampled_indices] = scipy.stats.truncnorm.ppf(
+                uniform,
+                lower_bound[sampled_positions],
+                upper_bound[sampled_positions],
+                loc=mean_[sampled_positions],
+                scale=std_[sampled_positions])
 
         return undiscretised_data
 
@@ -1238,10 +1478,14 @@ predictions.surrogate_explainers.TabularBlimeyLime.explain_instance` method.
                          samples_number: int = 50,
                          features_number: Optional[int] = None,
                          kernel_width: Optional[float] = None,
-                         return_models: bool = False) -> ExplanationTuple:
+                         return_models: bool = False,
+                         use_sampling_pool: bool = False) -> ExplanationTuple:
         """
         Explains the ``data_row`` with linear regression feature importance.
 
+        .. versionchanged:: 0.1.1
+           Added the ``use_sampling_pool`` parameter.
+
         .. versionchanged:: 0.1.0
            Changed the feature selection mechanism from k-LASSO to
            :func:`~fatf.utils.data.feature_selection.sklearn.forward_selection`
@@ -1304,20 +1548,31 @@ surrogate_explainers.SurrogateTabularExplainer.explain_instance`.
             If ``True``, this method will return both the feature importance
             explanation dictionary and a dictionary holding the local models.
             Otherwise, only the first dictionary will be returned.
+        use_sampling_pool : boolean, optional (default=False)
+            If ``True``, the ``samples_number`` data points (and their
+            predictions) are drawn from the sampling pool created with the
+            ``refresh_sampling_pool`` method instead of being sampled and
+            predicted anew.
 
         Raises
         ------
+        RuntimeError
+            The ``use_sampling_pool`` parameter is ``True`` but the sampling
+            pool has not been created.
         TypeError
             The ``explained_class`` parameter is neither ``None``, an integer
             or a string. The ``samples_number`` parameter is not an integer.
             The ``features_number`` parameter is neither ``None`` nor an
             integer. The ``kernel_width`` parameter is neither ``None`` nor
-            a number. The ``return_models`` parameter is not a boolean.
+            a number. The ``return_models`` or ``use_sampling_pool`` parameter
+            is not a boolean.
         ValueError
             The ``samples_number`` parameter is a non-positive integer (smaller
-            than 1). The ``features_number`` parameter is a non-positive
-            integer (smaller than 1). The ``kernel_width`` parameter is a
-            non-positive number (smaller or equal to 0).
+            than 1) or it is larger than the size of the sampling pool (when
+            ``use_sampling_pool`` is ``True``). The ``features_number``
+            parameter is a non-positive integer (smaller than 1). The
+            ``kernel_width`` parameter is a non-positive number (smaller or
+            equal to 0).
             The ``explained_class`` specified by the user could neither be
             recognised as one of the allowed class names (``self.class_names``)
             nor an index of a class name.
@@ -1341,7 +1596,7 @@ surrogate_explainers.SurrogateTabularExplainer.explain_instance`.
         # pylint: disable=arguments-differ,too-many-statements
         assert self._explain_instance_input_is_valid(
             data_row, explained_class, samples_number, features_number,
-            kernel_width, return_models), 'Invalid input.'
+            kernel_width, return_models, use_sampling_pool), 'Invalid input.'
 
         dataset_features_number = len(self.column_indices)
 
@@ -1350,15 +1605,21 @@ surrogate_explainers.SurrogateTabularExplainer.explain_instance`.
 
         # Discretise data row
         data_row_discretised = self.discretiser.discretise(data_row)
-        # Sample around the discretised data row (in the discretised domain)
-        sampled_data_discretised = self.augmenter.sample(
-            data_row_discretised, samples_number=samples_number)
+        if use_sampling_pool:
+            # Draw the sampled data and their predictions from the pool
+            sampled_data_discretised, sampled_data_predictions = (
+                self._sample_pool(samples_number))
+        else:
+            # Sample around the discretised data row (in the discretised
+            # domain)
+            sampled_data_discretised = self.augmenter.sample(
+                data_row_discretised, samples_number=samples_number)
 
-        # Revert back the sampled data into the original domain
-        sampled_data = self._undiscretise_data(sampled_data_discretised)
+            # Revert back the sampled data into the original domain
+            sampled_data = self._undiscretise_data(sampled_data_discretised)
 
-        # Get predictions of the sampled data
-        sampled_data_predictions = self.predictive_function(sampled_data)
+            # Get predictions of the sampled data
+            sampled_data_predictions = self.predictive_function(sampled_data)
 
         # Binarise the sampled data, i.e., XNOR (in the discretised domain)
         # The value will be 1 if the same as in the data_row and 0 if different
@@ -1377,46 +1638,11 @@ surrogate_explainers.SurrogateTabularExplainer.explain_instance`.
             distances, width=kernel_width)
 
         # Get feature names for the binarised domain
-        binarised_data_feature_names = []
-        for i, index in enumerate(self.column_indices):
-            feature_value = data_row_discretised[index]
-
-            if index in self.discretiser.numerical_indices:
-                feature_value = feature_value.astype(int)
-                binarised_data_feature_names.append(
-                    self.discretiser.feature_value_names[index][feature_value])
-            else:
-                binarised_data_feature_names.append('*{}* = {}'.format(
-                    self.feature_names[i], feature_value))
+        binarised_data_feature_names = self._get_binarised_feature_names(
+            data_row_discretised)
 
         # Get classes to be explained
-        if self.as_regressor:
-            classes_to_explain = [None]  # type: List[Union[None, int]]
-        else:
-            assert (self.classes_number is not None
-                    and self.class_names is not None)
-            if explained_class is None:
-                classes_to_explain = list(range(self.classes_number))
-            elif isinstance(explained_class, str):
-                if explained_class not in self.class_names:
-                    raise ValueError('The *{}* explained class name was not '
-                                     'recognised. The following class names '
-                                     'are allowed: {}.'.format(
-                                         explained_class, self.class_names))
-                # Translate the class name into a probability index
-                classes_to_explain = [self.class_names.index(explained_class)]
-            elif isinstance(explained_class, int):
-                if (explained_class < 0  # yapf: disable
-                        or explained_class >= self.classes_number):
-                    raise ValueError('The explained class index is out of the '
-                                     'allowed range: 0 to {} (there are {} '
-                                     'classes altogether).'.format(
-                                         self.classes_number - 1,
-                                         self.classes_number))
-                classes_to_explain = [explained_class]
-            else:
-                assert False, (  # pragma: nocover
-                    'Cannot be anything else but None, string or int.')
+        classes_to_explain = self._get_classes_to_explain(explained_class)
 
         # Filter features
         if features_number is None:
@@ -1502,6 +1728,361 @@ surrogate_explainers.SurrogateTabularExplainer.explain_instance`.
             return_ = explanations
         return return_
 
+    def _get_binarised_feature_names(
+            self,
+            data_row_discretised: Union[np.ndarray, np.void]) -> List[str]:
+        """
+        Gets the names of the binarised features of a discretised data row.
+
+        .. versionadded:: 0.1.1
+
+        Parameters
+        ----------
+        data_row_discretised : Union[numpy.ndarray, numpy.void]
+            A discretised data row.
+
+        Returns
+        -------
+        binarised_data_feature_names : List[string]
+            The names of the features in the binarised domain -- the bin
+            description for numerical features and the feature value for
+            categorical features.
+        """
+        binarised_data_feature_names = []
+        for i, index in enumerate(self.column_indices):
+            feature_value = data_row_discretised[index]
+
+            if index in self.discretiser.numerical_indices:
+                feature_value = feature_value.astype(int)
+                binarised_data_feature_names.append(
+                    self.discretiser.feature_value_names[index][feature_value])
+            else:
+                binarised_data_feature_names.append('*{}* = {}'.format(
+                    self.feature_names[i], feature_value))
+        return binarised_data_feature_names
+
+    def _get_classes_to_explain(self, explained_class: Union[None, int, str]
+                                ) -> List[Union[None, int]]:
+        """
+        Translates the ``explained_class`` into a list of class indices.
+
+        .. versionadded:: 0.1.1
+
+        For the description of the ``explained_class`` parameter and the
+        exceptions please see the documentation of the
+        :func:`fatf.transparency.predictions.surrogate_explainers.\
+TabularBlimeyLime.explain_instance` method.
+
+        Returns
+        -------
+        classes_to_explain : List[Union[None, integer]]
+            The indices of the classes to be explained -- ``[None]`` for
+            regressors.
+        """
+        if self.as_regressor:
+            classes_to_explain = [None]  # type: List[Union[None, int]]
+        else:
+            assert (self.classes_number is not None
+                    and self.class_names is not None)
+            if explained_class is None:
+                classes_to_explain = list(range(self.classes_number))
+            elif isinstance(explained_class, str):
+                if explained_class not in self.class_names:
+                    raise ValueError('The *{}* explained class name was not '
+                                     'recognised. The following class names '
+                                     'are allowed: {}.'.format(
+                                         explained_class, self.class_names))
+                # Translate the class name into a probability index
+                classes_to_explain = [self.class_names.index(explained_class)]
+            elif isinstance(explained_class, int):
+                if (explained_class < 0  # yapf: disable
+                        or explained_class >= self.classes_number):
+                    raise ValueError('The explained class index is out of the '
+                                     'allowed range: 0 to {} (there are {} '
+                                     'classes altogether).'.format(
+                                         self.classes_number - 1,
+                                         self.classes_number))
+                classes_to_explain = [explained_class]
+            else:
+                assert False, (  # pragma: nocover
+                    'Cannot be anything else but None, string or int.')
+        return classes_to_explain
+
+    def explain_instances(
+            self,
+            X: np.ndarray,
+            explained_class: Optional[Union[int, str]] = None,
+            samples_number: int = 50,
+            features_number: Optional[int] = None,
+            kernel_width: Optional[float] = None,
+            return_models: bool = False,
+            batch_size: Optional[int] = None,
+            use_sampling_pool: bool = False
+    ) -> Union[List[Explanation],
+               Tuple[List[Explanation], List[ExplanationSurrogate]]]:
+        """
+        Explains every row of ``X`` with linear regression feature importance.
+
+        .. versionadded:: 0.1.1
+
+        This method produces the same kind of explanations as the
+        :func:`fatf.transparency.predictions.surrogate_explainers.\
+TabularBlimeyLime.explain_instance` method for many data points at once:
+
+        * all of the rows are discretised together, and the data sampled
+          around all of them are reverted back into the original domain
+          together;
+        * the sampled data of all the rows are predicted with the black-box
+          model in a few large calls -- one call for all of them by default,
+          or one call per ``batch_size`` sampled data points;
+        * the binarisation of the sampled data and the kernel weights are
+          computed for all of the rows with array operations; and
+        * the local (weighted) ridge regressions of all the rows and classes
+          are fitted in closed form with batched linear algebra instead of one
+          ``sklearn.linear_model.Ridge`` fit per row and class.
+
+        The feature selection -- which is only performed when the
+        ``features_number`` parameter is smaller than the number of features
+        -- happens one row at a time, with all of the explained classes of a
+        row selected together since they share the weighted sampled data (see
+        :func:`~fatf.utils.data.feature_selection.sklearn.\
+multi_target_forward_selection` and
+        :func:`~fatf.utils.data.feature_selection.sklearn.\
+multi_target_highest_weights`).
+
+        The explanations are not identical to those produced by
+        ``explain_instance`` for the same random seed since the random samples
+        are drawn in a different order. (Moreover, the multi-target feature
+        selection may break ties between exactly collinear features
+        differently than the single-target feature selection used by
+        ``explain_instance``.)
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            A 2-dimensional numpy array with the data points to be explained.
+        explained_class, samples_number, features_number, kernel_width, \
+return_models and use_sampling_pool
+            See the documentation of the :func:`fatf.transparency.\
+predictions.surrogate_explainers.TabularBlimeyLime.explain_instance` method.
+        batch_size : integer, optional (default=None)
+            The number of sampled data points predicted in a single call of
+            the black-box model. If ``None``, the sampled data of all the rows
+            are predicted in one call. (This parameter is ignored when
+            ``use_sampling_pool`` is ``True``.)
+
+        Raises
+        ------
+        IncorrectShapeError
+            The ``X`` array is not a 2-dimensional numpy array.
+        TypeError
+            The ``batch_size`` parameter is neither ``None`` nor an integer.
+        ValueError
+            The ``batch_size`` parameter is a non-positive integer (smaller
+            than 1).
+
+        For the other exceptions please see the documentation of the
+        :func:`fatf.transparency.predictions.surrogate_explainers.\
+TabularBlimeyLime.explain_instance` method.
+
+        Returns
+        -------
+        explanations : List[Dictionary[string, Dictionary[string, float]]]
+            A list with the explanation -- cf. the ``explain_instance`` method
+            -- of every row of ``X``.
+        models : List[Union[Dictionary[string, sklearn.linear_model.Ridge], \
+sklearn.linear_model.Ridge]], optional
+            A list with the local surrogate models of every row of ``X``.
+            This list is only returned when the ``return_models`` parameter is
+            set to ``True``.
+        """
+        # pylint: disable=invalid-name,too-many-arguments,too-many-locals
+        # pylint: disable=too-many-branches,too-many-statements
+        if not fuav.is_2d_array(X):
+            raise IncorrectShapeError('The X array must be a 2-dimensional '
+                                      'numpy array.')
+        if batch_size is not None:
+            if isinstance(batch_size, bool) or not isinstance(batch_size, int):
+                raise TypeError('The batch_size parameter must either be '
+                                'None or an integer.')
+            if batch_size < 1:
+                raise ValueError('The batch_size parameter must be a '
+                                 'positive integer (larger than 0).')
+        rows_number = X.shape[0]
+        if rows_number:
+            assert self._explain_instance_input_is_valid(
+                X[0], explained_class, samples_number, features_number,
+                kernel_width, return_models,
+                use_sampling_pool), 'Invalid input.'
+        classes_to_explain = self._get_classes_to_explain(explained_class)
+
+        dataset_features_number = len(self.column_indices)
+        if kernel_width is None:
+            kernel_width = np.sqrt(dataset_features_number) * 0.75
+        if features_number is None:
+            features_number = dataset_features_number
+
+        # Discretise all of the rows and sample around each of them
+        X_discretised = self.discretiser.discretise(X)
+        if use_sampling_pool:
+            # Draw the sampled data and their predictions from the pool
+            pool_samples = [
+                self._sample_pool(samples_number) for _ in range(rows_number)
+            ]
+            sampled_data_discretised = np.concatenate(
+                [sample[0] for sample in pool_samples],
+                axis=0) if rows_number else X_discretised[:0]
+            sampled_data_predictions = [sample[1] for sample in pool_samples]
+        else:
+            sampled_data_discretised = np.concatenate(
+                [
+                    self.augmenter.sample(row, samples_number=samples_number)
+                    for row in X_discretised
+                ],
+                axis=0) if rows_number else X_discretised[:0]
+
+            # Revert back the sampled data into the original domain and
+            # predict them in chunks of batch_size data points
+            sampled_data = self._undiscretise_data(sampled_data_discretised)
+            if batch_size is None:
+                batch_size = max(sampled_data.shape[0], 1)
+            sampled_data_predictions = [
+                self.predictive_function(sampled_data[i:i + batch_size])
+                for i in range(0, sampled_data.shape[0], batch_size)
+            ]
+
+        explanations = []  # type: List[Explanation]
+        surrogates = []  # type: List[ExplanationSurrogate]
+        if not rows_number:
+            if return_models:
+                return explanations, surrogates
+            return explanations
+
+        predictions = np.concatenate(sampled_data_predictions, axis=0)
+        if self.as_regressor:
+            predictions = predictions.reshape(rows_number, samples_number, 1)
+        else:
+            predictions = predictions.reshape(rows_number, samples_number, -1)
+
+        # Binarise the sampled data of every row, i.e., XNOR (in the
+        # discretised domain)
+        if self.is_structured:
+            sampled_data_discretised = sampled_data_discretised.reshape(
+                rows_number, samples_number)
+        else:
+            sampled_data_discretised = sampled_data_discretised.reshape(
+                rows_number, samples_number, -1)
+        binarised_data = np.zeros(
+            (rows_number, samples_number, dataset_features_number),
+            dtype=np.int8)
+        for i, index in enumerate(self.column_indices):
+            if self.is_structured:
+                sampled_column = sampled_data_discretised[index]
+                column = X_discretised[index]
+            else:
+                sampled_column = sampled_data_discretised[:, :, index]
+                column = X_discretised[:, index]
+            binarised_data[:, :, i] = sampled_column == column[:, np.newaxis]
+
+        # Get the similarity (weights) of the sampled data and their rows --
+        # the rows are all-1 vectors in the binarised domain
+        distances = np.sqrt(
+            (1 - binarised_data).sum(axis=2, dtype=np.float64).flatten())
+        weights = fatf_kernels.exponential_kernel(
+            distances, width=kernel_width).reshape(rows_number, samples_number)
+
+        # Select the features of every row and class -- a list of
+        # (row, class position, class index, selected features) tasks
+        if features_number < 7:
+            _feature_selection_algo = 'forward selection'
+            feature_selection = fudfs.multi_target_forward_selection
+        else:
+            _feature_selection_algo = 'highest weights'
+            feature_selection = fudfs.multi_target_highest_weights
+        logger.info('Selecting %d features with %s.', features_number,
+                    _feature_selection_algo)
+        class_columns = [
+            0 if class_index is None else class_index
+            for class_index in classes_to_explain
+        ]
+        tasks = []
+        for row_i in range(rows_number):
+            if features_number == dataset_features_number:
+                selected_indices_list = [
+                    np.arange(dataset_features_number) for _ in class_columns
+                ]
+            else:
+                # All the classes of a row share the weighted Gram matrix
+                row_predictions = predictions[row_i][:, class_columns]
+                selected_indices_list = feature_selection(
+                    binarised_data[row_i], row_predictions, weights[row_i],
+                    features_number)
+            for class_i, (class_column, selected_indices) in enumerate(
+                    zip(class_columns, selected_indices_list)):
+                tasks.append((row_i, class_i, class_column, selected_indices))
+
+        # Fit the local (weighted) ridge regressions of the tasks with the
+        # same number of selected features together
+        coefficients = [None] * len(tasks)  # type: List[Any]
+        intercepts = [None] * len(tasks)  # type: List[Any]
+        selected_numbers = {task[3].shape[0] for task in tasks}
+        for selected_number in selected_numbers:
+            group = [
+                i for i, task in enumerate(tasks)
+                if task[3].shape[0] == selected_number
+            ]
+            group_data = np.stack([
+                binarised_data[tasks[i][0]][:, tasks[i][3]] for i in group
+            ]).astype(np.float64)
+            group_targets = np.stack([
+                predictions[tasks[i][0], :, tasks[i][2]][:, np.newaxis]
+                for i in group
+            ])
+            group_weights = weights[[tasks[i][0] for i in group]]
+            group_coefficients, group_intercepts = _weighted_ridge(
+                group_data, group_targets, group_weights)
+            for j, i in enumerate(group):
+                coefficients[i] = group_coefficients[j, 0]
+                intercepts[i] = group_intercepts[j, 0]
+
+        # Generate the explanations
+        task_i = 0
+        for row_i in range(rows_number):
+            binarised_data_feature_names = self._get_binarised_feature_names(
+                X_discretised[row_i])
+
+            explanation = {}  # type: Dict[str, Any]
+            models = {}  # type: Dict[str, Any]
+            for class_index in classes_to_explain:
+                selected_indices = tasks[task_i][3]
+                selected_feature_names = [
+                    binarised_data_feature_names[i] for i in selected_indices
+                ]
+
+                local_model = sklearn.linear_model.Ridge()
+                local_model.coef_ = coefficients[task_i]
+                local_model.intercept_ = intercepts[task_i]
+                local_model.n_features_in_ = selected_indices.shape[0]
+                task_i += 1
+
+                feature_importance = dict(
+                    zip(selected_feature_names, local_model.coef_))
+                if self.as_regressor:
+                    explanation = feature_importance
+                    models = local_model
+                else:
+                    assert self.class_names is not None, 'Classifier.'
+                    assert class_index is not None, 'Classifier.'
+                    class_name = self.class_names[class_index]
+                    explanation[class_name] = feature_importance
+                    models[class_name] = local_model
+            explanations.append(explanation)
+            surrogates.append(models)
+
+        if return_models:
+            return explanations, surrogates
+        return explanations
+
 
 class TabularBlimeyTree(SurrogateTabularExplainer):
     """
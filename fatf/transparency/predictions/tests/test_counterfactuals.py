@@ -8,12 +8,72 @@ import pytest
 
 import numpy as np
 
+import fatf.utils.distances as fud
 import fatf.utils.models as fum
 import fatf.transparency.predictions.counterfactuals as ftpc
 
 from fatf.exceptions import IncorrectShapeError
 
 
+def test_prediction_cache():
+    """
+    Tests the :class:`fatf.transparency.predictions.counterfactuals.\
+PredictionCache` class.
+    """
+    type_error = 'The max_size parameter has to be an integer.'
+    value_error = 'The max_size parameter has to be a positive integer.'
+    with pytest.raises(TypeError) as exin:
+        ftpc.PredictionCache(max_size=2.0)
+    assert str(exin.value) == type_error
+    with pytest.raises(ValueError) as exin:
+        ftpc.PredictionCache(max_size=0)
+    assert str(exin.value) == value_error
+
+    calls = []
+
+    def predict(data):
+        calls.append(data.copy())
+        return data.sum(axis=1)
+
+    def predict_negative(data):
+        return -data.sum(axis=1)
+
+    cache = ftpc.PredictionCache(max_size=3)
+    cached_predict = cache.wrap(predict)
+    assert np.array_equal(
+        cached_predict(np.array([[1, 2], [3, 4], [1, 2]])), [3, 7, 3])
+    assert len(calls) == 1
+    assert np.array_equal(calls[0], [[1, 2], [3, 4]])
+    assert (cache.hits, cache.misses, len(cache)) == (0, 3, 2)
+
+    assert np.array_equal(cached_predict(np.array([[3, 4], [5, 6]])), [7, 11])
+    assert np.array_equal(calls[1], [[5, 6]])
+    assert (cache.hits, cache.misses, len(cache)) == (1, 4, 3)
+
+    # The least recently used row -- [1, 2] -- is evicted
+    assert np.array_equal(cached_predict(np.array([[0, 0]])), [0])
+    assert len(cache) == 3
+    assert np.array_equal(cached_predict(np.array([[3, 4], [1, 2]])), [7, 3])
+    assert np.array_equal(calls[3], [[1, 2]])
+    assert (cache.hits, cache.misses) == (2, 6)
+
+    # Different dtypes and predictive functions are cached separately
+    assert np.array_equal(cached_predict(np.array([[3., 4.]])), [7])
+    assert np.array_equal(calls[4], [[3., 4.]])
+    assert np.array_equal(
+        cache.predict(predict_negative, np.array([[3, 4]])), [-7])
+
+    # Structured arrays and textual predictions
+    struct = np.array([('a', 1.), ('b', 2.), ('a', 1.)],
+                      dtype=[('x', 'U1'), ('y', float)])
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+    assert np.array_equal(
+        cache.predict(lambda x: x['x'], struct), ['a', 'b', 'a'])
+    assert (cache.hits, cache.misses, len(cache)) == (0, 3, 2)
+    assert cache.predict(predict, np.ones((0, 2))).shape == (0, )
+
+
 def test_textualise_counterfactuals_errors():
     """
     Tests the ``textualise_counterfactuals`` function for errors.
@@ -788,6 +848,21 @@ class TestCounterfactualExplainer(object):
             cfe.explain_instance(np.array([0, 7, 4, 2]), normalise_distance=1)
         assert str(exin.value) == type_error_normalise
 
+        type_error_batch = 'The batch_size parameter should be an integer.'
+        value_error_batch = ('The batch_size parameter should be a positive '
+                             'integer.')
+        type_error_early = ('The early_stopping parameter should be a '
+                            'boolean.')
+        with pytest.raises(TypeError) as exin:
+            cfe.explain_instance(np.array([0, 7, 4, 2]), batch_size=2.0)
+        assert str(exin.value) == type_error_batch
+        with pytest.raises(ValueError) as exin:
+            cfe.explain_instance(np.array([0, 7, 4, 2]), batch_size=0)
+        assert str(exin.value) == value_error_batch
+        with pytest.raises(TypeError) as exin:
+            cfe.explain_instance(np.array([0, 7, 4, 2]), early_stopping=1)
+        assert str(exin.value) == type_error_early
+
     def test_counterfactuals_automatic(self):
         """
         Tests counterfactuals generation with the ``CounterfactualExplainer``.
@@ -850,6 +925,300 @@ class TestCounterfactualExplainer(object):
         assert np.allclose(cfs_dist, t_dist)
         assert np.array_equal(cfs_pred, t_pred)
 
+    def test_counterfactuals_batched_search(self):
+        """
+        Tests batched and early-stopping ``CounterfactualExplainer`` search.
+        """
+        batch_sizes = []
+
+        def predict(data):
+            batch_sizes.append(data.shape[0])
+            return self.KNN_NUM.predict(data)
+
+        cfe = ftpc.CounterfactualExplainer(
+            predictive_function=predict,
+            dataset=self.DATASET_NUM,
+            categorical_indices=[0, 1, 3])
+        instance = self.DATASET_NUM[2]
+        cfs, cfs_dist, cfs_pred = cfe.explain_instance(instance)
+        candidates_number = sum(batch_sizes) - 1
+        for normalise in (False, True):
+            cfs, cfs_dist, cfs_pred = cfe.explain_instance(
+                instance, normalise_distance=normalise)
+            for batch_size in (1, 7, 10**6):
+                batch_sizes = []
+                cfs_, cfs_dist_, cfs_pred_ = cfe.explain_instance(
+                    instance,
+                    normalise_distance=normalise,
+                    batch_size=batch_size)
+                # The first prediction is the class of the instance
+                assert sum(batch_sizes) - 1 == candidates_number
+                assert max(batch_sizes[1:]) == min(batch_size,
+                                                   candidates_number)
+                assert np.array_equal(np.sort(cfs_dist_), np.sort(cfs_dist))
+                assert np.array_equal(np.sort(cfs_pred_), np.sort(cfs_pred))
+                assert np.array_equal(
+                    np.unique(cfs_, axis=0), np.unique(cfs, axis=0))
+
+            # Early stopping only returns the closest counterfactuals
+            min_mask = cfs_dist == cfs_dist.min()
+            for batch_size in (1000, 1):
+                batch_sizes = []
+                cfs_, cfs_dist_, cfs_pred_ = cfe.explain_instance(
+                    instance,
+                    normalise_distance=normalise,
+                    batch_size=batch_size,
+                    early_stopping=True)
+                assert sum(batch_sizes) - 1 <= candidates_number
+                assert np.array_equal(cfs_dist_, cfs_dist[min_mask])
+                assert np.array_equal(cfs_pred_, cfs_pred[min_mask])
+                assert np.array_equal(
+                    np.unique(cfs_, axis=0), np.unique(cfs[min_mask], axis=0))
+            # Combinations that cannot yield a closer counterfactual are
+            # skipped with small batches
+            assert sum(batch_sizes) - 1 < candidates_number
+
+        # Early stopping with a mixed distance and structured data
+        cfe = ftpc.CounterfactualExplainer(
+            model=self.KNN_STRUCT,
+            dataset=self.DATASET_STRUCT,
+            distance=fud.MixedDistance(metric='manhattan'))
+        cfs, cfs_dist, cfs_pred = cfe.explain_instance(self.DATASET_STRUCT[2])
+        cfs_, cfs_dist_, cfs_pred_ = cfe.explain_instance(
+            self.DATASET_STRUCT[2], batch_size=5, early_stopping=True)
+        min_mask = cfs_dist == cfs_dist.min()
+        assert np.array_equal(cfs_, cfs[min_mask])
+        assert np.array_equal(cfs_dist_, cfs_dist[min_mask])
+        assert np.array_equal(cfs_pred_, cfs_pred[min_mask])
+
+    def test_explain_instances(self):
+        """
+        Tests explaining many instances with the ``CounterfactualExplainer``.
+        """
+        incorrect_shape_error = ('The instances to be explained should be a '
+                                 '2-dimensional numpy array.')
+        value_error_type = ('The instances should be of a base type -- a '
+                            'mixture of numerical and textual types.')
+        index_error = ('The indices used to initialise this class are not '
+                       'valid for these data points.')
+        type_error_jobs = 'The n_jobs parameter has to be an integer.'
+        type_error_cf_class = ('The counterfactual class should be either an '
+                               'integer or a string.')
+
+        batch_sizes = []
+
+        def predict(data):
+            batch_sizes.append(data.shape[0])
+            return self.KNN_NUM.predict(data)
+
+        cfe = ftpc.CounterfactualExplainer(
+            predictive_function=predict,
+            dataset=self.DATASET_NUM,
+            categorical_indices=[0, 1, 3])
+
+        with pytest.raises(IncorrectShapeError) as exin:
+            cfe.explain_instances(self.DATASET_NUM[0])
+        assert str(exin.value) == incorrect_shape_error
+        with pytest.raises(ValueError) as exin:
+            cfe.explain_instances(np.array([[None, 42]]))
+        assert str(exin.value) == value_error_type
+        with pytest.raises(IndexError) as exin:
+            cfe.explain_instances(np.array([[0, 1]]))
+        assert str(exin.value) == index_error
+        with pytest.raises(TypeError) as exin:
+            cfe.explain_instances(self.DATASET_NUM, counterfactual_class=7.0)
+        assert str(exin.value) == type_error_cf_class
+        with pytest.raises(TypeError) as exin:
+            cfe.explain_instances(self.DATASET_NUM, n_jobs='1')
+        assert str(exin.value) == type_error_jobs
+
+        assert cfe.explain_instances(self.DATASET_NUM[:0]) == []
+
+        kwargs_list = [
+            dict(),
+            dict(normalise_distance=True),
+            dict(counterfactual_class='good'),
+            dict(early_stopping=True, batch_size=20)
+        ]
+        for kwargs in kwargs_list:
+            batch_sizes = []
+            explanations = [
+                cfe.explain_instance(i, **kwargs) for i in self.DATASET_NUM
+            ]
+            calls_number = len(batch_sizes)
+            for n_jobs in (1, 2):
+                batch_sizes = []
+                explanations_ = cfe.explain_instances(
+                    self.DATASET_NUM, n_jobs=n_jobs, **kwargs)
+                assert len(batch_sizes) < calls_number
+                assert len(explanations_) == len(explanations)
+                for explanation, explanation_ in zip(explanations,
+                                                     explanations_):
+                    for array, array_ in zip(explanation, explanation_):
+                        assert np.array_equal(array, array_)
+
+        # Structured data with a mixed distance
+        cfe = ftpc.CounterfactualExplainer(
+            model=self.KNN_STRUCT,
+            dataset=self.DATASET_STRUCT,
+            counterfactual_feature_indices=['q', 'postcode'],
+            distance=fud.MixedDistance(metric='manhattan'))
+        explanations = cfe.explain_instances(
+            self.DATASET_STRUCT[1:4], batch_size=3)
+        for instance, explanation in zip(self.DATASET_STRUCT[1:4],
+                                         explanations):
+            explanation_ = cfe.explain_instance(instance)
+            for array, array_ in zip(explanation, explanation_):
+                assert np.array_equal(array, array_)
+
+    def test_prediction_cache(self):
+        """
+        Tests the ``CounterfactualExplainer`` with a ``PredictionCache``.
+        """
+        type_error = ('The prediction_cache parameter has to be either None '
+                      'or a fatf.transparency.predictions.counterfactuals.'
+                      'PredictionCache object.')
+        with pytest.raises(TypeError) as exin:
+            ftpc.CounterfactualExplainer(
+                model=self.KNN_NUM,
+                dataset=self.DATASET_NUM,
+                prediction_cache=dict())
+        assert str(exin.value) == type_error
+
+        predicted = []
+
+        def predict(data):
+            predicted.append(data.shape[0])
+            return self.KNN_NUM.predict(data)
+
+        cfe = ftpc.CounterfactualExplainer(
+            predictive_function=predict,
+            dataset=self.DATASET_NUM,
+            categorical_indices=[0, 1, 3])
+        explanation = cfe.explain_instance(self.DATASET_NUM[2])
+        predicted_number = sum(predicted)
+
+        cache = ftpc.PredictionCache(max_size=10000)
+        cfe = ftpc.CounterfactualExplainer(
+            predictive_function=predict,
+            dataset=self.DATASET_NUM,
+            categorical_indices=[0, 1, 3],
+            prediction_cache=cache)
+        assert cfe.prediction_cache is cache
+        predicted = []
+        explanation_ = cfe.explain_instance(self.DATASET_NUM[2])
+        for array, array_ in zip(explanation, explanation_):
+            assert np.array_equal(array, array_)
+        assert cache.misses == sum(predicted) == predicted_number
+        assert len(cache) == cache.misses
+        # Explaining an instance again does not call the model
+        predicted = []
+        explanation_ = cfe.explain_instance(self.DATASET_NUM[2])
+        for array, array_ in zip(explanation, explanation_):
+            assert np.array_equal(array, array_)
+        assert not predicted
+        assert cache.hits == predicted_number
+
+        # The cache is shared between explainers
+        cfe_ = ftpc.CounterfactualExplainer(
+            predictive_function=predict,
+            dataset=self.DATASET_NUM,
+            categorical_indices=[0, 1, 3],
+            prediction_cache=cache)
+        predicted = []
+        explanation_ = cfe_.explain_instance(self.DATASET_NUM[2])
+        for array, array_ in zip(explanation, explanation_):
+            assert np.array_equal(array, array_)
+        assert not predicted
+        assert cache.hits == 2 * predicted_number
+
+    def test_counterfactuals_mixed_distance(self):
+        """
+        Tests the ``CounterfactualExplainer`` with a ``MixedDistance`` object.
+        """
+        type_error = ('The distance parameter has to be either None or a '
+                      'fatf.utils.distances.MixedDistance object.')
+        value_error = ('The distance_functions and the distance parameters '
+                       'cannot be used together.')
+        user_warning = ('The normalise_distance parameter is ignored when a '
+                        'MixedDistance object is used. Please choose its '
+                        'metric instead.')
+
+        with pytest.raises(TypeError) as exin:
+            ftpc.CounterfactualExplainer(
+                model=self.KNN_NUM,
+                dataset=self.DATASET_NUM,
+                distance=fud.euclidean_distance)
+        assert str(exin.value) == type_error
+        with pytest.raises(ValueError) as exin:
+            ftpc.CounterfactualExplainer(
+                model=self.KNN_NUM,
+                dataset=self.DATASET_NUM,
+                distance_functions={
+                    0: lambda x, y: abs(x - y)
+                },
+                distance=fud.MixedDistance())
+        assert str(exin.value) == value_error
+
+        def as_sorted(explanation):
+            cfs, cfs_dist, cfs_pred = explanation
+            return sorted(
+                zip(
+                    np.round(cfs_dist, 6).tolist(), [str(i) for i in cfs],
+                    cfs_pred.tolist()))
+
+        configurations = [
+            dict(model=self.KNN_NUM, dataset=self.DATASET_NUM,
+                 categorical_indices=[0, 1, 3]),
+            dict(predictive_function=self.KNN_STR.predict,
+                 dataset=self.DATASET_STR),
+            dict(model=self.KNN_STRUCT, dataset=self.DATASET_STRUCT,
+                 counterfactual_feature_indices=['q', 'postcode'])
+        ]  # yapf: disable
+        instances = [
+            self.DATASET_NUM[2], self.DATASET_STR[2], self.DATASET_STRUCT[2]
+        ]
+        metrics = [('manhattan', False), ('joint_euclidean', True)]
+        for configuration, instance in zip(configurations, instances):
+            for metric, normalise in metrics:
+                cfe = ftpc.CounterfactualExplainer(**configuration)
+                cfe_mixed = ftpc.CounterfactualExplainer(
+                    distance=fud.MixedDistance(metric=metric), **configuration)
+                assert cfe_mixed.distance.is_fitted
+                explanation = cfe.explain_instance(
+                    instance, normalise_distance=normalise)
+                explanation_mixed = cfe_mixed.explain_instance(instance)
+                assert as_sorted(explanation) == as_sorted(explanation_mixed)
+
+        # The distance is fitted to the explained instance without a dataset
+        distance = fud.MixedDistance(metric='manhattan')
+        cfe = ftpc.CounterfactualExplainer(
+            model=self.KNN_NUM,
+            categorical_indices=[0, 1, 3],
+            numerical_indices=[2],
+            feature_ranges={
+                0: [0, 2, 3],
+                1: [0, 13],
+                2: (10., 20.),
+                3: [3, 12]
+            },
+            distance=distance)
+        assert not distance.is_fitted
+        with pytest.warns(UserWarning) as warning:
+            cfs, cfs_dist, _ = cfe.explain_instance(
+                self.DATASET_NUM[2], normalise_distance=True)
+        assert len(warning) == 1
+        assert str(warning[0].message) == user_warning
+        assert cfe.distance is not distance
+        assert cfe.distance.is_fitted
+        assert cfe.distance.categorical_indices == [0, 1, 3]
+        # The user's distance object is not modified
+        assert not distance.is_fitted
+        assert distance.categorical_indices is None
+        cfs_distance = np.abs(cfs - self.DATASET_NUM[2])
+        cfs_distance[:, [0, 1, 3]] = cfs_distance[:, [0, 1, 3]] > 0
+        assert np.allclose(cfs_dist, cfs_distance.sum(axis=1))
+
     def test_counterfactuals_manual(self):
         """
         Tests counterfactuals generation with the ``CounterfactualExplainer``.
@@ -29,6 +29,7 @@ import importlib
 import sys
 
 import numpy as np
+import scipy.stats
 
 from fatf.exceptions import IncompatibleModelError, IncorrectShapeError
 
@@ -41,6 +42,10 @@ import fatf.utils.data.discretisation as fudd
 import fatf.utils.models as fum
 import fatf.utils.testing.transparency as futt
 import fatf.utils.testing.imports as futi
+import fatf.utils.tools as fut
+
+_NUMPY_VERSION = [int(i) for i in np.version.version.split('.')]
+_NUMPY_1_17 = fut.at_least_verion([1, 17], _NUMPY_VERSION)
 
 IRIS_DATASET = fatf_datasets.load_iris()
 
@@ -1112,6 +1117,65 @@ TabularBlimeyLime._undiscretise_data` method.
         assert np.allclose(
             fuat.as_unstructured(udata), [[0, 0, 0.059, 0.266]], atol=1e-3)
 
+        # Random number generator
+        discretised_data = np.array(
+            [[0, 0, 0, 0], [0, 0, 1, 2], [0, 0, 0, 1]] * 5)
+        with pytest.raises(AssertionError) as exin:
+            self.numerical_np_tabular_lime._undiscretise_data(
+                discretised_data, random_generator=42)
+        assert str(exin.value) == ('The random generator has to have a '
+                                   'uniform method.')
+        udata = self.numerical_np_tabular_lime._undiscretise_data(
+            discretised_data, random_generator=np.random.RandomState(42))
+        udata_ = self.numerical_np_tabular_lime._undiscretise_data(
+            discretised_data, random_generator=np.random.RandomState(42))
+        assert np.array_equal(udata, udata_)
+        assert np.array_equal(
+            self.numerical_np_tabular_lime.discretiser.discretise(udata),
+            discretised_data)
+
+        # The samples match drawing them one bin at a time
+        fatf.setup_random_seed(42)
+        udata = self.numerical_np_tabular_lime._undiscretise_data(
+            discretised_data)
+        fatf.setup_random_seed(42)
+        lime = self.numerical_np_tabular_lime
+        for index in lime.numerical_indices:
+            for bin_id, bin_values in lime.bin_sampling_values[index].items():
+                bin_indices = np.where(discretised_data[:, index] == bin_id)[0]
+                min_, max_, mean_, std_ = bin_values
+                if not bin_indices.size:
+                    continue
+                if std_:
+                    unsampled = scipy.stats.truncnorm.rvs(
+                        (min_ - mean_) / std_, (max_ - mean_) / std_,
+                        loc=mean_,
+                        scale=std_,
+                        size=bin_indices.shape[0])
+                else:
+                    unsampled = bin_indices.shape[0] * [mean_]
+                assert np.allclose(udata[bin_indices, index], unsampled)
+
+    @pytest.mark.skipif(
+        not _NUMPY_1_17, reason='numpy.random.Generator requires numpy 1.17.')
+    def test_undiscretise_data_generator(self):
+        """
+        Tests the ``_undiscretise_data`` method with a numpy ``Generator``.
+
+        Tests :func:`fatf.transparency.predictions.surrogate_explainers.\
+TabularBlimeyLime._undiscretise_data` method.
+        """
+        discretised_data = np.array(
+            [[0, 0, 0, 0], [0, 0, 1, 2], [0, 0, 0, 1]] * 5)
+        udata = self.numerical_np_tabular_lime._undiscretise_data(
+            discretised_data, random_generator=np.random.default_rng(42))
+        udata_ = self.numerical_np_tabular_lime._undiscretise_data(
+            discretised_data, random_generator=np.random.default_rng(42))
+        assert np.array_equal(udata, udata_)
+        assert np.array_equal(
+            self.numerical_np_tabular_lime.discretiser.discretise(udata),
+            discretised_data)
+
     def test_explain_instance_errors(self):
         """
         Tests errors and exceptions in the ``explain_instance`` method.
@@ -1364,6 +1428,275 @@ TabularBlimeyLime.explain_instance` method.
         assert (caplog.records[10].getMessage()  # yapf: disable
                 == log_info_highest_weights.format(8))
 
+    def test_explain_instance_collinear(self):
+        """
+        Tests the ``explain_instance`` method with collinear features.
+
+        The features are selected separately for every class, hence the ties
+        between exactly collinear (duplicated) features are broken as in the
+        single-target feature selection functions.
+        """
+        collinear_data = np.concatenate(
+            [futt.NUMERICAL_NP_ARRAY, self.wide_data[:, :6]], axis=1)
+        classifier = fum.KNN(k=3)
+        classifier.fit(collinear_data, futt.LABELS)
+        lime = ftps.TabularBlimeyLime(collinear_data, classifier)
+
+        selected_features = [
+            '*feature 0* <= 0.00', '*feature 4* <= 0.00',
+            '*feature 8* <= 0.00', '0.50 < *feature 1* <= 1.00',
+            '0.50 < *feature 5* <= 1.00', '0.50 < *feature 9* <= 1.00',
+            '0.64 < *feature 2*'
+        ]
+        fatf.setup_random_seed(42)
+        explanation = lime.explain_instance(
+            collinear_data[2], samples_number=6, features_number=7)
+        assert sorted(explanation.keys()) == ['class 0', 'class 1', 'class 2']
+        for class_explanation in explanation.values():
+            assert sorted(class_explanation.keys()) == selected_features
+
+    def test_explain_instances(self):
+        """
+        Tests the ``explain_instances`` method.
+
+        Tests :func:`fatf.transparency.predictions.surrogate_explainers.\
+TabularBlimeyLime.explain_instances` method.
+        """
+        shape_error = 'The X array must be a 2-dimensional numpy array.'
+        type_error = ('The batch_size parameter must either be None or an '
+                      'integer.')
+        value_error = ('The batch_size parameter must be a positive integer '
+                       '(larger than 0).')
+        explain_class_value_error = ('The explained class index is out of '
+                                     'the allowed range: 0 to 2 (there are '
+                                     '3 classes altogether).')
+
+        lime = self.numerical_np_tabular_lime
+        with pytest.raises(IncorrectShapeError) as exin:
+            lime.explain_instances(futt.NUMERICAL_NP_ARRAY[0])
+        assert str(exin.value) == shape_error
+        with pytest.raises(TypeError) as exin:
+            lime.explain_instances(futt.NUMERICAL_NP_ARRAY, batch_size='1')
+        assert str(exin.value) == type_error
+        with pytest.raises(ValueError) as exin:
+            lime.explain_instances(futt.NUMERICAL_NP_ARRAY, batch_size=0)
+        assert str(exin.value) == value_error
+        with pytest.raises(ValueError) as exin:
+            lime.explain_instances(futt.NUMERICAL_NP_ARRAY, explained_class=3)
+        assert str(exin.value) == explain_class_value_error
+
+        assert lime.explain_instances(futt.NUMERICAL_NP_ARRAY[:0]) == []
+
+        # A single row is explained exactly as with explain_instance
+        lime_cases = [(lime, futt.NUMERICAL_NP_ARRAY, None),
+                      (self.numerical_np_tabular_lime_reg,
+                       futt.NUMERICAL_NP_ARRAY, None),
+                      (self.numerical_struct_cat_tabular_lime,
+                       futt.NUMERICAL_STRUCT_ARRAY, 2),
+                      (self.categorical_np_lime, futt.CATEGORICAL_NP_ARRAY, 2)]
+        for lime_, data, features_number in lime_cases:
+            fatf.setup_random_seed(42)
+            explanation, models = lime_.explain_instance(
+                data[1], features_number=features_number, return_models=True)
+            fatf.setup_random_seed(42)
+            explanations, models_ = lime_.explain_instances(
+                data[1:2],
+                features_number=features_number,
+                return_models=True,
+                batch_size=7)
+            assert len(explanations) == len(models_) == 1
+            if lime_.as_regressor:
+                explanation, explanations[0] = ({
+                    '': explanation
+                }, {
+                    '': explanations[0]
+                })
+                models, models_[0] = {'': models}, {'': models_[0]}
+            assert futt.is_explanation_equal_dict(
+                explanation, explanations[0], atol=1e-6)
+            for key, model in models.items():
+                assert np.allclose(model.coef_, models_[0][key].coef_)
+                assert np.allclose(model.intercept_,
+                                   models_[0][key].intercept_)
+
+        # Many rows
+        explanations, models = self.iris_lime.explain_instances(
+            IRIS_DATASET['data'][::30],
+            samples_number=100,
+            features_number=2,
+            explained_class='setosa',
+            return_models=True)
+        assert len(explanations) == len(models) == 5
+        for explanation, model in zip(explanations, models):
+            assert list(explanation.keys()) == ['setosa']
+            assert len(explanation['setosa']) == 2
+            assert np.allclose(
+                list(explanation['setosa'].values()), model['setosa'].coef_)
+            assert model['setosa'].predict(np.ones((3, 2))).shape == (3, )
+
+        explanations = self.iris_lime.explain_instances(
+            IRIS_DATASET['data'][::30], samples_number=100)
+        assert len(explanations) == 5
+        for explanation in explanations:
+            assert sorted(explanation.keys()) == sorted(
+                IRIS_DATASET['target_names'].tolist())
+            for class_explanation in explanation.values():
+                assert len(class_explanation) == 4
+
+    def test_sampling_pool(self):
+        """
+        Tests the sampling pool of the ``TabularBlimeyLime`` class.
+
+        Tests :func:`fatf.transparency.predictions.surrogate_explainers.\
+TabularBlimeyLime.refresh_sampling_pool` method and the
+        ``use_sampling_pool`` parameter of the ``explain_instance`` and
+        ``explain_instances`` methods.
+        """
+        pool_type_error = 'The pool_size parameter must be an integer.'
+        pool_value_error = ('The pool_size parameter must be a positive '
+                            'integer (larger than 0).')
+        batch_type_error = ('The batch_size parameter must either be None or '
+                            'an integer.')
+        use_type_error = 'The use_sampling_pool parameter must be a boolean.'
+        runtime_error = ('The sampling pool has not been created. Please call '
+                         'the refresh_sampling_pool method first.')
+        samples_value_error = ('The samples_number parameter cannot be larger '
+                               'than the size of the sampling pool (20).')
+
+        import sklearn.linear_model
+
+        class CountingKNN(fum.KNN):
+            """
+            Counts the data points predicted by the model.
+            """
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.predicted_points = 0
+
+            def predict_proba(self, X):
+                self.predicted_points += X.shape[0]
+                return super().predict_proba(X)
+
+        clf = CountingKNN(k=3)
+        clf.fit(futt.NUMERICAL_NP_ARRAY, futt.LABELS)
+        lime = ftps.TabularBlimeyLime(futt.NUMERICAL_NP_ARRAY, clf)
+        data_row = futt.NUMERICAL_NP_ARRAY[0]
+        clf.predicted_points = 0
+
+        with pytest.raises(TypeError) as exin:
+            lime.refresh_sampling_pool(pool_size='20')
+        assert str(exin.value) == pool_type_error
+        with pytest.raises(ValueError) as exin:
+            lime.refresh_sampling_pool(pool_size=0)
+        assert str(exin.value) == pool_value_error
+        with pytest.raises(TypeError) as exin:
+            lime.refresh_sampling_pool(batch_size=2.0)
+        assert str(exin.value) == batch_type_error
+
+        with pytest.raises(TypeError) as exin:
+            lime.explain_instance(data_row, use_sampling_pool=1)
+        assert str(exin.value) == use_type_error
+        with pytest.raises(RuntimeError) as exin:
+            lime.explain_instance(data_row, use_sampling_pool=True)
+        assert str(exin.value) == runtime_error
+        with pytest.raises(RuntimeError) as exin:
+            lime.explain_instances(
+                futt.NUMERICAL_NP_ARRAY, use_sampling_pool=True)
+        assert str(exin.value) == runtime_error
+
+        fatf.setup_random_seed(42)
+        lime.refresh_sampling_pool(pool_size=20, batch_size=6)
+        assert clf.predicted_points == 20
+        pool_discretised, pool_predictions = lime._sampling_pool
+        assert pool_discretised.shape == (20, 4)
+        assert pool_predictions.shape == (20, 3)
+        assert np.allclose(
+            pool_predictions,
+            clf.predict_proba(lime._undiscretise_data(pool_discretised)))
+        clf.predicted_points = 0
+
+        with pytest.raises(ValueError) as exin:
+            lime.explain_instance(
+                data_row, samples_number=21, use_sampling_pool=True)
+        assert str(exin.value) == samples_value_error
+
+        # The whole pool is used -- equivalent to sampling the pool data
+        explanation, models = lime.explain_instance(
+            data_row,
+            samples_number=20,
+            return_models=True,
+            use_sampling_pool=True)
+        assert clf.predicted_points == 0
+        data_row_discretised = lime.discretiser.discretise(data_row)
+        binarised_data = (pool_discretised == data_row_discretised).astype(
+            np.int8)
+        weights = np.sqrt(
+            np.exp(-(4 - binarised_data.sum(axis=1)) / (0.75**2 * 4)))
+        for i, class_name in enumerate(lime.class_names):
+            ridge = sklearn.linear_model.Ridge()
+            ridge.fit(
+                binarised_data, pool_predictions[:, i], sample_weight=weights)
+            assert np.allclose(ridge.coef_, models[class_name].coef_)
+            assert np.allclose(
+                sorted(explanation[class_name].values()), sorted(ridge.coef_))
+
+        explanations = lime.explain_instances(
+            futt.NUMERICAL_NP_ARRAY[:3],
+            samples_number=20,
+            use_sampling_pool=True)
+        assert clf.predicted_points == 0
+        assert futt.is_explanation_equal_dict(explanation, explanations[0])
+
+        # A subset of the pool
+        explanations = lime.explain_instances(
+            futt.NUMERICAL_NP_ARRAY, samples_number=10, use_sampling_pool=True)
+        assert clf.predicted_points == 0
+        assert len(explanations) == futt.NUMERICAL_NP_ARRAY.shape[0]
+
+        # Refreshing the pool
+        lime.refresh_sampling_pool(pool_size=30)
+        assert clf.predicted_points == 30
+        assert lime._sampling_pool[0].shape == (30, 4)
+        lime.explain_instance(
+            data_row, samples_number=30, use_sampling_pool=True)
+        assert clf.predicted_points == 30
+
+        # Without the pool
+        lime.explain_instance(data_row, samples_number=10)
+        assert clf.predicted_points == 40
+
+
+@pytest.mark.skipif(SKLEARN_MISSING, reason='scikit-learn is not installed.')
+def test_weighted_ridge():
+    """
+    Tests the :func:`fatf.transparency.predictions.surrogate_explainers.\
+_weighted_ridge` function.
+    """
+    import sklearn.linear_model
+
+    fatf.setup_random_seed(42)
+    data = np.random.random((3, 20, 4))
+    targets = np.random.random((3, 20, 2))
+    weights = np.random.random((3, 20))
+
+    coefficients, intercepts = ftps._weighted_ridge(data, targets, weights)
+    assert coefficients.shape == (3, 2, 4)
+    assert intercepts.shape == (3, 2)
+    for i in range(3):
+        for j in range(2):
+            ridge = sklearn.linear_model.Ridge()
+            ridge.fit(data[i], targets[i, :, j], sample_weight=weights[i])
+            assert np.allclose(ridge.coef_, coefficients[i, j])
+            assert np.isclose(ridge.intercept_, intercepts[i, j])
+
+    coefficients, intercepts = ftps._weighted_ridge(
+        data, targets, weights, alpha=0.5)
+    ridge = sklearn.linear_model.Ridge(alpha=0.5)
+    ridge.fit(data[1], targets[1, :, 0], sample_weight=weights[1])
+    assert np.allclose(ridge.coef_, coefficients[1, 0])
+    assert np.isclose(ridge.intercept_, intercepts[1, 0])
+
 
 def map_target(target):
     """
@@ -5,6 +5,9 @@ The :mod:`fatf.utils.data.density` module implements data density estimators.
 #         Rafael Poyiadzi <rp13102@bristol.ac.uk>
 # License: new BSD
 
+# pylint: disable=too-many-lines
+
+import copy
 import inspect
 import warnings
 
@@ -18,9 +21,10 @@ from fatf.exceptions import IncorrectShapeError
 import fatf.utils.array.tools as fuat
 import fatf.utils.array.validation as fuav
 import fatf.utils.distances as fud
+import fatf.utils.models.neighbours as fumn
 import fatf.utils.tools as fut
 
-__all__ = ['DensityCheck']
+__all__ = ['DensityCheck', 'StreamingDensityCheck']
 
 _NUMPY_VERSION = [int(i) for i in np.version.version.split('.')]
 _NUMPY_1_14 = fut.at_least_verion([1, 14], _NUMPY_VERSION)
@@ -31,9 +35,12 @@ Index = Union[int, str]
 
 
 def _validate_input_dc(
-        data_set: np.ndarray, categorical_indices: Union[None, List[Index]],
-        neighbours: int, distance_function: Union[None, DistanceFunction],
-        normalise_scores: bool) -> bool:
+        data_set: np.ndarray,
+        categorical_indices: Union[None, List[Index]],
+        neighbours: int,
+        distance_function: Union[None, DistanceFunction],
+        normalise_scores: bool,
+        neighbour_index: Optional[fumn.NeighbourIndex] = None) -> bool:
     """
     Validates ``DensityCheck`` class initialiser's input parameters.
 
@@ -58,6 +65,11 @@ def _validate_input_dc(
     normalise_scores : boolean
         A boolean parameter indicating whether to normalise the scores
         (``True``) or not (``False``).
+    neighbour_index : fatf.utils.models.neighbours.NeighbourIndex, \
+optional (default=None)
+        Either ``None`` or a neighbour index used to compute the scores.
+
+        .. versionadded:: 0.1.1
 
     Raises
     ------
@@ -74,17 +86,23 @@ def _validate_input_dc(
         The ``neighbours`` parameter is not an integer. The
         ``distance_function`` is neither ``None`` nor Python callable (a
         function). The ``normalise_scores`` parameter is not a boolean. The
-        ``categorical_indices`` parameter is not a Python list.
+        ``categorical_indices`` parameter is not a Python list. The
+        ``neighbour_index`` parameter is neither ``None`` nor a
+        :class:`fatf.utils.models.neighbours.NeighbourIndex` object.
     ValueError
         The ``neighbours`` parameter is smaller than 1 or larger than the
-        number of instances (rows) in the ``data_set`` array.
+        number of instances (rows) in the ``data_set`` array. The
+        ``neighbours`` parameter is not smaller than the number of instances
+        (rows) in the ``data_set`` array minus 1 when the ``neighbour_index``
+        is given. Both the ``distance_function`` and the ``neighbour_index``
+        parameters are given.
 
     Returns
     -------
     is_valid : boolean
         ``True`` if the input is valid, ``False`` otherwise.
     """
-    # pylint: disable=too-many-branches
+    # pylint: disable=too-many-arguments,too-many-branches
     is_valid = False
 
     if not fuav.is_2d_array(data_set):
@@ -133,6 +151,21 @@ def _validate_input_dc(
     if not isinstance(normalise_scores, bool):
         raise TypeError('The normalise scores parameter should be a boolean.')
 
+    if neighbour_index is not None:
+        if not isinstance(neighbour_index, fumn.NeighbourIndex):
+            raise TypeError('The neighbour_index parameter has to be either '
+                            'None or a fatf.utils.models.neighbours.'
+                            'NeighbourIndex object.')
+        if distance_function is not None:
+            raise ValueError('The distance_function and neighbour_index '
+                             'parameters cannot be used together -- the '
+                             'neighbour index defines its own distance.')
+        if neighbours >= data_set.shape[0] - 1:
+            raise ValueError('The neighbours number parameter has to be '
+                             'smaller than the number of data points (rows) '
+                             'in the data set array minus 1 when a neighbour '
+                             'index is used.')
+
     is_valid = True
     return is_valid
 
@@ -176,12 +209,47 @@ optional (default=None)
         numpy voids (fro structured numpy arrays) of equal length and outputs a
         number representing a distance between them. **The distance function is
         assumed to return the same distance regardless of the order in which
-        the input parameters are given.**
+        the input parameters are given.** A
+        :class:`fatf.utils.distances.MixedDistance` object can be used as well,
+        in which case the distances are computed in a vectorised fashion. If
+        it is not fitted, a copy of it will be fitted to the ``data_set`` (with
+        the ``categorical_indices`` of this class unless the object specifies
+        its own), leaving the user's object intact.
+
+        .. versionchanged:: 0.1.1
+           Accepts :class:`fatf.utils.distances.MixedDistance` objects.
     normalise_scores : boolean, optional (default=True)
         A boolean parameter indicating whether to normalise the density scores
         (``True``) or not (``False``). The scores are normalised by subtracting
         the minimum value and dividing by the new (after subtracting the
         minimum) maximum value.
+    memory_budget : integer, optional (default=None)
+        The maximum number of bytes that a single block of the distance matrix
+        may occupy while it is being computed. If ``None``, the distance matrix
+        is computed in one go. (See the
+        :func:`fatf.utils.distances.get_distance_matrix` function for more
+        details.)
+    distance_matrix_buffer : numpy.ndarray, optional (default=None)
+        A square numerical numpy array -- e.g., a ``numpy.memmap`` -- with as
+        many rows as the ``data_set`` into which the distance matrix will be
+        written. This allows to check density of data sets whose distance
+        matrix does not fit in memory. If ``None``, a new array is allocated.
+    neighbour_index : fatf.utils.models.neighbours.NeighbourIndex, \
+optional (default=None)
+        A neighbour index -- e.g., a
+        :class:`fatf.utils.models.neighbours.KDTreeIndex` -- used to find the
+        n-th neighbour of every data point. The index is fitted to the
+        ``data_set`` and the distance matrix is never computed, which allows
+        to check density of large data sets. The index defines its own
+        distance, therefore it cannot be used together with the
+        ``distance_function`` parameter. Since the index returns every data
+        point as its own closest neighbour, ``neighbours + 1`` neighbours are
+        queried for each data point; since this number has to be smaller than
+        the number of indexed data points, the ``neighbours`` parameter has to
+        be smaller than the number of rows in the ``data_set`` minus 1. If
+        ``None``, the scores are computed from the distance matrix.
+
+        .. versionadded:: 0.1.1
 
     Warns
     -----
@@ -197,7 +265,9 @@ optional (default=None)
         The distance function does not require exactly 2 non-optional
         parameters.
     IncorrectShapeError
-        The ``data_set`` array is not 2-dimensional.
+        The ``data_set`` array is not 2-dimensional. The
+        ``distance_matrix_buffer`` array is not square or its size does not
+        agree with the number of rows in the ``data_set`` array.
     IndexError
         Some of the provided categorical column indices are invalid for the
         ``data_set`` array.
@@ -206,10 +276,20 @@ optional (default=None)
         The ``neighbours`` parameter is not an integer. The
         ``distance_function`` is neither ``None`` nor Python callable (a
         function). The ``normalise_scores`` parameter is not a boolean. The
-        ``categorical_indices`` parameter is not a Python list.
+        ``categorical_indices`` parameter is not a Python list. The
+        ``memory_budget`` parameter is neither ``None`` nor an integer. The
+        ``distance_matrix_buffer`` parameter is neither ``None`` nor a
+        numerical numpy array. The ``neighbour_index`` parameter is neither
+        ``None`` nor a :class:`fatf.utils.models.neighbours.NeighbourIndex`
+        object.
     ValueError
         The ``neighbours`` parameter is smaller than 1 or larger than the
-        number of instances (rows) in the ``data_set`` array.
+        number of instances (rows) in the ``data_set`` array. The
+        ``memory_budget`` parameter is not a positive integer. The
+        ``neighbours`` parameter is not smaller than the number of instances
+        (rows) in the ``data_set`` array minus 1 when the ``neighbour_index``
+        is given. Both the ``distance_function`` and the ``neighbour_index``
+        parameters are given.
 
     Attributes
     ----------
@@ -221,7 +301,9 @@ optional (default=None)
         Indicates whether the scores should be normalised to a [0, 1] range.
     distance_matrix : numpy.ndarray
         An 2-dimensional, square and diagonally symmetric array with distances
-        between every pair of rows in the ``data_set``.
+        between every pair of rows in the ``data_set``. This is the
+        ``distance_matrix_buffer`` array if one was provided and ``None`` if a
+        neighbour index is used.
     scores : numpy.ndarray
         A 1-dimensional array with a density score for every row in the
         ``data_set``.
@@ -243,24 +325,38 @@ optional (default=None)
         Indicates whether the input ``data_set`` is a structured array
         (``True``) or a classic numpy array (``False``).
     _distance_function : Callable[[data row, data row], number]
-        A Python function used to calculate distances between data points.
+        A Python function (or a :class:`fatf.utils.distances.MixedDistance`
+        object) used to calculate distances between data points.
+    _is_distance_fitted_here : boolean
+        Whether the :class:`fatf.utils.distances.MixedDistance` object used as
+        the distance function has been fitted to the ``data_set`` by this
+        class, in which case its cached features of the ``data_set`` are used.
+    _memory_budget : Union[None, integer]
+        The maximum number of bytes used by a block of the distance matrix.
+    _neighbour_index : Union[None, fatf.utils.models.neighbours.NeighbourIndex]
+        The neighbour index fitted to the ``data_set`` (if one is used).
     """
 
     # pylint: disable=useless-object-inheritance,too-many-instance-attributes
 
-    def __init__(self,
-                 data_set: np.ndarray,
-                 categorical_indices: Optional[List[Index]] = None,
-                 neighbours: int = 7,
-                 distance_function: Optional[DistanceFunction] = None,
-                 normalise_scores: bool = True) -> None:
+    def __init__(
+            self,
+            data_set: np.ndarray,
+            categorical_indices: Optional[List[Index]] = None,
+            neighbours: int = 7,
+            distance_function: Optional[DistanceFunction] = None,
+            normalise_scores: bool = True,
+            memory_budget: Optional[int] = None,
+            distance_matrix_buffer: Optional[np.ndarray] = None,
+            neighbour_index: Optional[fumn.NeighbourIndex] = None) -> None:
         """
         Initialises the ``DensityCheck`` class.
         """
-        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+        # pylint: disable=too-many-statements
         assert _validate_input_dc(data_set, categorical_indices, neighbours,
-                                  distance_function,
-                                  normalise_scores), 'Invalid input.'
+                                  distance_function, normalise_scores,
+                                  neighbour_index), 'Invalid input.'
 
         self.data_set = data_set
         self._is_structured = fuav.is_structured_array(self.data_set)
@@ -300,15 +396,59 @@ optional (default=None)
         self._categorical_indices = sorted(list(_categorical_indices))
         self._numerical_indices = sorted(list(_numerical_indices))
 
+        # Whether the (mixed) distance caches the features of the data set
+        self._is_distance_fitted_here = False
+        if isinstance(distance_function, fud.MixedDistance):
+            if not distance_function.is_fitted:
+                # Configure and fit a copy to leave the user's object intact
+                distance_function = copy.deepcopy(distance_function)
+                if distance_function.categorical_indices is None:
+                    distance_function.categorical_indices = (
+                        self._categorical_indices)
+                distance_function.fit(self.data_set)
+                self._distance_function = distance_function
+                self._is_distance_fitted_here = True
+
         self._samples_number = self.data_set.shape[0]
+        self._memory_budget = memory_budget
+        self._neighbour_index = neighbour_index
+
+        if self._neighbour_index is not None:
+            self._neighbour_index.fit(self.data_set)
+            self.distance_matrix = None
+        elif isinstance(self._distance_function, fud.MixedDistance):
+            self.distance_matrix = fud.get_array_distance_matrix(
+                self.data_set,
+                self._distance_function.array_distance,
+                memory_budget=memory_budget,
+                out=distance_matrix_buffer)
+        else:
+            self.distance_matrix = fud.get_distance_matrix(
+                self.data_set,
+                self._distance_function,
+                memory_budget=memory_budget,
+                out=distance_matrix_buffer)
+        if self.distance_matrix is not None:
+            assert (self._samples_number
+                    == self.distance_matrix.shape[0]
+                    == self.distance_matrix.shape[1])  # yapf: disable
+
+        self._set_scores(self._compute_scores())
+
+    def _set_scores(self, scores: np.ndarray) -> None:
+        """
+        Sets the (normalised) density scores of the ``data_set``.
 
-        self.distance_matrix = fud.get_distance_matrix(self.data_set,
-                                                       self._distance_function)
-        assert self._samples_number == self.distance_matrix.shape[0]
-        assert self.distance_matrix.shape[0] == self.distance_matrix.shape[1]
+        .. versionadded:: 0.1.1
 
-        self.scores = self._compute_scores()
-        assert self._samples_number == self.scores.shape[0]
+        Parameters
+        ----------
+        scores : numpy.ndarray
+            A 1-dimensional numpy array with an unnormalised density score for
+            every data point (row) in the ``data_set``.
+        """
+        assert self._samples_number == scores.shape[0]
+        self.scores = scores
         self.scores_min = self.scores.min()
         self.scores_max = self.scores.max()
         if self.normalise_scores:
@@ -411,20 +551,41 @@ optional (default=None)
         """
         Computes density scores for all data points (rows) in the ``data_set``.
 
+        .. versionchanged:: 0.1.1
+           The n-th neighbour distances are found with ``numpy.partition``
+           for blocks of the distance matrix rows (whose size is limited by
+           the ``memory_budget``) or, if one is given, with the neighbour
+           index.
+
         Returns
         -------
         scores : numpy.ndarray
             A 1-dimensional numpy array with a density score for every data
             point (row) in the ``data_set``.
         """
-        scores = np.zeros(self._samples_number)
-        # Find the distance of the furthest neighbour
-        for i, row in enumerate(self.distance_matrix):
-            # We do not add 1 to the neighbours number because the closest
-            # neighbour will be the data point itself (+1) but the indexing
-            # starts from 0 (-1)
-            furthest_neighbour = np.argsort(row)[self.neighbours]
-            scores[i] = row[furthest_neighbour]
+        # We do not subtract 1 from the neighbours number because the closest
+        # neighbour will be the data point itself (+1) but the indexing
+        # starts from 0 (-1)
+        if self._neighbour_index is not None:
+            distances, _ = self._neighbour_index.query(self.data_set,
+                                                       self.neighbours + 1)
+            scores = distances.max(axis=1)
+        else:
+            assert self.distance_matrix is not None, \
+                'The distance matrix has to be computed.'
+            if self._memory_budget is None:
+                block_size = self._samples_number
+            else:
+                block_size = self._memory_budget // (8 * self._samples_number)
+                block_size = max(1, min(block_size, self._samples_number))
+
+            scores = np.zeros(self._samples_number)
+            # Find the distance of the furthest neighbour
+            for start in range(0, self._samples_number, block_size):
+                end = min(start + block_size, self._samples_number)
+                block = np.partition(
+                    self.distance_matrix[start:end], self.neighbours, axis=1)
+                scores[start:end] = block[:, self.neighbours]
 
         return scores
 
@@ -588,27 +749,554 @@ optional (default=None)
         assert self._validate_data_point(data_point,
                                          clip), 'Invalid data point.'
 
-        distance_array = fud.get_point_distance(self.data_set, data_point,
-                                                self._distance_function)
+        score = self._score(np.asarray([data_point]), clip)[0]
+        return score
+
+    def _validate_data_points(self, X: np.ndarray, clip: bool) -> bool:
+        """
+        Validates input parameters of the ``score_data_points`` method.
+
+        .. versionadded:: 0.1.1
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            A 2-dimensional numpy array (either classic or structured) with
+            data points.
+
+        Raises
+        ------
+        IncorrectShapeError
+            The ``X`` array is not 2-dimensional. It does not have the same
+            number of columns (features) as the data set used to initialise
+            this class.
+        TypeError
+            The ``X`` array is not of a base type (strings and/or numbers). Its
+            dtype is too different from the dtype of the data set used to
+            initialise this class. The ``clip`` parameter is not a boolean.
+
+        Returns
+        -------
+        is_valid : boolean
+            ``True`` if the input parameters are valid, ``False`` otherwise.
+        """
+        # pylint: disable=invalid-name
+        is_valid = False
+
+        if not fuav.is_2d_array(X):
+            raise IncorrectShapeError('The data points have to be a '
+                                      '2-dimensional numpy array.')
+        if not fuav.is_base_array(X):
+            raise TypeError('The data points have to be of a base type '
+                            '(strings and/or numbers).')
+        if not fuav.are_similar_dtype_arrays(self.data_set, X):
+            raise TypeError('The dtypes of the data set used to initialise '
+                            'this class and the provided data points are too '
+                            'different.')
+        # Testing only for unstructured as the dtype comparison picks up on a
+        # different number of columns in a structured array
+        if not self._is_structured:
+            if self.data_set.shape[1] != X.shape[1]:
+                raise IncorrectShapeError('The data points have different '
+                                          'number of columns (features) than '
+                                          'the data set used to initialise '
+                                          'this class.')
+
+        if not isinstance(clip, bool):
+            raise TypeError('The clip parameter has to be a boolean.')
+
+        is_valid = True
+        return is_valid
+
+    def score_data_points(self, X: np.ndarray,
+                          clip: bool = True) -> np.ndarray:
+        """
+        Calculates a density score for every data point (row) in ``X``.
+
+        .. versionadded:: 0.1.1
+
+        This is a batch version of the ``score_data_point`` method: the input
+        is validated once and the distances between the data points and the
+        ``data_set`` are computed for blocks of rows of ``X`` (whose size is
+        limited by the ``memory_budget`` given when initialising this class)
+        or with the neighbour index (if one is used).
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            A 2-dimensional numpy array (either classic or structured) with
+            data points.
+        clip : boolean, optional (default=True)
+            If ``True`` and the scores are normalised (this class was
+            initialised with the ``normalise_scores`` parameter set to
+            ``True``, which is the default option) the scores of the provided
+            data points will be clipped to fit the [0, 1] range. If the scores
+            are not normalised this parameter is ignored.
+
+        Warns
+        -----
+        UserWarning
+            The minimum and maximum score values for this class are the same,
+            therefore the score normalisation cannot be performed. In this case
+            the scores will be 0 if they are below the min/max, 1 if they are
+            above the min/max and otherwise they stay the same.
+
+        Raises
+        ------
+        IncorrectShapeError
+            The ``X`` array is not 2-dimensional. It does not have the same
+            number of columns (features) as the data set used to initialise
+            this class.
+        TypeError
+            The ``X`` array is not of a base type (strings and/or numbers). Its
+            dtype is too different from the dtype of the data set used to
+            initialise this class. The ``clip`` parameter is not a boolean.
+
+        Returns
+        -------
+        scores : numpy.ndarray
+            A 1-dimensional numpy array with a density score for every row of
+            ``X``.
+        """
+        # pylint: disable=invalid-name
+        assert self._validate_data_points(X, clip), 'Invalid data points.'
+
+        scores = self._score(X, clip)
+        return scores
+
+    def _score(self, X: np.ndarray, clip: bool) -> np.ndarray:
+        """
+        Calculates (normalised) density scores for the rows of ``X``.
+
+        .. versionadded:: 0.1.1
 
+        Parameters
+        ----------
+        X : numpy.ndarray
+            A 2-dimensional, valid numpy array with data points.
+        clip : boolean
+            Whether to clip the normalised scores to the [0, 1] range.
+
+        Warns
+        -----
+        UserWarning
+            The minimum and maximum score values for this class are the same.
+
+        Returns
+        -------
+        scores : numpy.ndarray
+            A 1-dimensional numpy array with a density score for every row of
+            ``X``.
+        """
+        # pylint: disable=invalid-name
         # Find the distance of the furthest neighbour: we subtract 1 from the
         # neighbours number because the indexing starts from 0
-        furthest_neighbour = np.argsort(distance_array)[self.neighbours - 1]
-        score = distance_array[furthest_neighbour]
+        if self._neighbour_index is not None:
+            distances, _ = self._neighbour_index.query(X, self.neighbours)
+            scores = distances.max(axis=1)
+        else:
+            samples_number = X.shape[0]
+            if self._memory_budget is None:
+                block_size = samples_number
+            else:
+                block_size = self._memory_budget // (8 * self._samples_number)
+            block_size = max(1, min(block_size, samples_number))
+
+            scores = np.zeros(samples_number, dtype=np.float64)
+            for start in range(0, samples_number, block_size):
+                end = min(start + block_size, samples_number)
+                block = self._get_distances(X[start:end])
+                block = np.partition(block, self.neighbours - 1, axis=1)
+                scores[start:end] = block[:, self.neighbours - 1]
 
         if self.normalise_scores:
             if self.scores_min == self.scores_max:
                 warnings.warn(
                     'The minimum and maximum scores are the same, therefore '
                     'the score normalisation is ill-defined.', UserWarning)
-                if score <= self.scores_min:
-                    score = 0
-                else:
-                    score = 1
+                scores = (scores > self.scores_min).astype(np.float64)
             else:
-                score -= self.scores_min
-                score /= self.scores_max - self.scores_min
+                scores -= self.scores_min
+                scores /= self.scores_max - self.scores_min
                 if clip:
-                    score = max(min(1, score), 0)
+                    np.clip(scores, 0, 1, out=scores)
 
-        return score
+        return scores
+
+    def _get_distances(self,
+                       X: np.ndarray,
+                       data_array: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Computes distances between the rows of ``X`` and the ``data_set``.
+
+        .. versionadded:: 0.1.1
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            A 2-dimensional, valid numpy array with data points.
+        data_array : numpy.ndarray, optional (default=None)
+            A 2-dimensional, valid numpy array to which rows the distances are
+            computed. If ``None``, the ``data_set`` is used.
+
+        Returns
+        -------
+        distances : numpy.ndarray
+            A 2-dimensional numpy array with the distances between the rows of
+            ``X`` (rows) and the rows of the ``data_set`` or the
+            ``data_array`` (columns).
+        """
+        # pylint: disable=invalid-name,protected-access
+        is_data_set = data_array is None
+        if data_array is None:
+            data_array = self.data_set
+
+        if isinstance(self._distance_function, fud.MixedDistance):
+            if is_data_set and self._is_distance_fitted_here:
+                distances = self._distance_function.array_distance(X)
+            else:
+                distances = self._distance_function.array_distance(
+                    X, data_array)
+        else:
+            samples_number = data_array.shape[0]
+            distances = np.zeros((X.shape[0], samples_number),
+                                 dtype=np.float64)
+            if samples_number:
+                for i, data_point in enumerate(X):
+                    distances[i] = fud._point_chunk_distance(
+                        self._distance_function, data_point, data_array,
+                        (0, samples_number))
+        return distances
+
+
+class StreamingDensityCheck(DensityCheck):
+    """
+    Checks and scores density of data points in a sliding window.
+
+    .. versionadded:: 0.1.1
+
+    This is an online version of the :class:`fatf.utils.data.density.\
+DensityCheck` class, which maintains a bounded reference window of data
+    points. New data points are added to the window with the ``add`` method
+    and the oldest data points are removed from it with the ``evict`` method
+    (or automatically, when the window grows beyond ``window_size``). Instead
+    of recomputing the distance matrix and the scores from scratch, only the
+    distances to the new data points are computed and only the scores of the
+    data points whose n-th neighbour may have changed -- i.e., the ones with
+    an evicted data point in their neighbourhood or a new data point closer
+    than their n-th neighbour -- are updated. The ``scores_min`` and
+    ``scores_max`` attributes, which are used to normalise the scores, always
+    reflect the current window.
+
+    The window is held in ring buffers (for the data points, their distance
+    matrix and their unnormalised scores) preallocated to ``window_size``
+    data points -- the new data points overwrite the slots of the evicted
+    ones in place. (An unbounded window doubles its buffers whenever they are
+    full.) The ``data_set``, ``distance_matrix``, ``scores``, ``scores_min``
+    and ``scores_max`` attributes (see the :class:`fatf.utils.data.density.\
+DensityCheck` class) describe the current window, however its data points
+    are ordered by their slot in the buffers; the ``window_order`` attribute
+    holds their order from the oldest to the newest.
+
+    Parameters
+    ----------
+    data_set : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured) of a base
+        type (strings and/or numbers) with the initial window. If it has more
+        than ``window_size`` rows, only the last ``window_size`` of them are
+        used.
+    window_size : integer, optional (default=None)
+        The maximum number of data points in the window; it has to be larger
+        than the ``neighbours`` parameter. If ``None``, the window is only
+        bounded by the ``evict`` method.
+    categorical_indices, neighbours, distance_function, normalise_scores \
+and memory_budget
+        See the documentation of the :class:`fatf.utils.data.density.\
+DensityCheck` class.
+
+    Raises
+    ------
+    TypeError
+        The ``window_size`` parameter is neither ``None`` nor an integer.
+    ValueError
+        The ``window_size`` parameter is not larger than the ``neighbours``
+        parameter.
+
+    For all the other errors and warnings please see the documentation of the
+    :class:`fatf.utils.data.density.DensityCheck` class.
+
+    Attributes
+    ----------
+    window_size : Union[None, integer]
+        The maximum number of data points in the window.
+    window_order : numpy.ndarray
+        The indices of the ``data_set`` rows ordered from the oldest to the
+        newest data point.
+    _raw_scores : numpy.ndarray
+        The unnormalised density scores of the data points in the window.
+    _data_buffer : numpy.ndarray
+        The ring buffer holding the data points in the window.
+    _distance_buffer : numpy.ndarray
+        The ring buffer holding the distance matrix of the window.
+    _raw_scores_buffer : numpy.ndarray
+        The ring buffer holding the unnormalised density scores of the window.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self,
+                 data_set: np.ndarray,
+                 window_size: Optional[int] = None,
+                 categorical_indices: Optional[List[Index]] = None,
+                 neighbours: int = 7,
+                 distance_function: Optional[DistanceFunction] = None,
+                 normalise_scores: bool = True,
+                 memory_budget: Optional[int] = None) -> None:
+        """
+        Initialises the ``StreamingDensityCheck`` class.
+        """
+        # pylint: disable=too-many-arguments
+        if window_size is not None:
+            if not isinstance(window_size, int):
+                raise TypeError('The window_size parameter has to be either '
+                                'None or an integer.')
+            if isinstance(neighbours, int) and window_size <= neighbours:
+                raise ValueError('The window_size parameter has to be larger '
+                                 'than the neighbours number.')
+            if fuav.is_2d_array(data_set):
+                window_length = int(window_size)
+                data_set = data_set[-window_length:]
+        self.window_size = window_size
+        self._raw_scores = np.ndarray((0, ))
+        self._data_buffer = np.ndarray((0, ))
+        self._distance_buffer = np.ndarray((0, 0))
+        self._raw_scores_buffer = np.ndarray((0, ))
+
+        super().__init__(
+            data_set,
+            categorical_indices=categorical_indices,
+            neighbours=neighbours,
+            distance_function=distance_function,
+            normalise_scores=normalise_scores,
+            memory_budget=memory_budget)
+
+        self.window_order = np.arange(self._samples_number)
+        capacity = (self._samples_number
+                    if window_size is None else int(window_size))
+        self._allocate_buffers(capacity)
+
+    def _allocate_buffers(self, capacity: int) -> None:
+        """
+        Allocates the ring buffers and copies the current window into them.
+
+        The data points keep their slots in the buffers.
+
+        Parameters
+        ----------
+        capacity : integer
+            The number of data points that the buffers can hold.
+        """
+        assert self.distance_matrix is not None, \
+            'The distance matrix has to be computed.'
+        samples_number = self._samples_number
+        assert capacity >= samples_number, 'The window has to fit.'
+
+        window = slice(samples_number)
+        data_buffer = np.empty(
+            (capacity, ) + self.data_set.shape[1:], dtype=self.data_set.dtype)
+        data_buffer[window] = self.data_set
+        distance_buffer = np.zeros((capacity, capacity), dtype=np.float64)
+        distance_buffer[window, window] = self.distance_matrix
+        raw_scores_buffer = np.zeros(capacity, dtype=np.float64)
+        raw_scores_buffer[window] = self._raw_scores
+
+        self._data_buffer = data_buffer
+        self._distance_buffer = distance_buffer
+        self._raw_scores_buffer = raw_scores_buffer
+        self.data_set = data_buffer[window]
+        self.distance_matrix = distance_buffer[window, window]
+        self._raw_scores = raw_scores_buffer[window]
+
+    def _generalise_data_buffer(self, points: np.ndarray) -> None:
+        """
+        Generalises the dtype of the data buffer to hold the new data points.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            A 2-dimensional, valid numpy array with the data points to be
+            added to the window.
+        """
+        buffer_dtype = self._data_buffer.dtype
+        if self._is_structured:
+            dtype = np.dtype([(name,
+                               fuat.generalise_dtype(buffer_dtype[name],
+                                                     points.dtype[name]))
+                              for name in buffer_dtype.names])
+        else:
+            dtype = fuat.generalise_dtype(buffer_dtype, points.dtype)
+
+        if dtype != buffer_dtype:
+            self._data_buffer = self._data_buffer.astype(dtype)
+            self.data_set = self._data_buffer[:self._samples_number]
+
+    def _set_scores(self, scores: np.ndarray) -> None:
+        """
+        Sets the (normalised) density scores of the data points in the window.
+
+        The unnormalised scores are memorised to allow updating them
+        incrementally.
+        """
+        self._raw_scores = scores
+        super()._set_scores(scores.copy())
+
+    def add(self, points: np.ndarray) -> None:
+        """
+        Adds data points to the window.
+
+        If the window grows beyond ``window_size``, the oldest data points are
+        evicted from it.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            A 2-dimensional numpy array (either classic or structured) with
+            the data points to be added.
+
+        Raises
+        ------
+        IncorrectShapeError
+            The ``points`` array is not 2-dimensional. It does not have the
+            same number of columns (features) as the window.
+        TypeError
+            The ``points`` array is not of a base type (strings and/or
+            numbers). Its dtype is too different from the dtype of the window.
+        """
+        assert self._validate_data_points(points, True), 'Invalid points.'
+
+        if self.window_size is None:
+            evict_number = 0
+        else:
+            window_size = int(self.window_size)
+            points = points[-window_size:]
+            evict_number = max(
+                0, self._samples_number + points.shape[0] - window_size)
+        self._update(points, evict_number)
+
+    def evict(self, n: int) -> None:
+        """
+        Evicts the ``n`` oldest data points from the window.
+
+        Parameters
+        ----------
+        n : integer
+            The number of data points to be evicted.
+
+        Raises
+        ------
+        TypeError
+            The ``n`` parameter is not an integer.
+        ValueError
+            The ``n`` parameter is negative or it would leave the window with
+            not more data points than the ``neighbours`` number.
+        """
+        # pylint: disable=invalid-name
+        if not isinstance(n, int):
+            raise TypeError('The number of data points to evict has to be an '
+                            'integer.')
+        if n < 0 or self._samples_number - n <= self.neighbours:
+            raise ValueError('The number of data points to evict has to be '
+                             'between 0 and the number of data points in the '
+                             'window minus the neighbours number minus 1.')
+
+        self._update(self.data_set[:0], n)
+
+    def _update(self, points: np.ndarray, evict_number: int) -> None:
+        """
+        Updates the window and the scores of the affected data points.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            A 2-dimensional, valid numpy array with the data points to be
+            added to the window.
+        evict_number : integer
+            The number of the oldest data points to be evicted from the window.
+        """
+        # pylint: disable=too-many-locals,too-many-statements
+        samples_number = self._samples_number
+        points_number = points.shape[0]
+        new_samples_number = samples_number + points_number - evict_number
+        assert new_samples_number > self.neighbours, \
+            'Too few data points would remain.'
+        # The distances are computed to the window from now on, therefore the
+        # features of the initial data set cached by the distance are stale
+        self._is_distance_fitted_here = False
+
+        if points_number:
+            self._generalise_data_buffer(points)
+        capacity = self._raw_scores_buffer.shape[0]
+        if new_samples_number > capacity:
+            self._allocate_buffers(max(new_samples_number, 2 * capacity))
+            capacity = self._raw_scores_buffer.shape[0]
+        data_buffer = self._data_buffer
+        distance_buffer = self._distance_buffer
+        raw_scores = self._raw_scores_buffer
+
+        evicted = self.window_order[:evict_number]
+        remaining = self.window_order[evict_number:]
+
+        # The n-th neighbour of a data point may change if an evicted data
+        # point is within its neighbourhood...
+        evicted_distances = distance_buffer[np.ix_(evicted, remaining)]
+        is_affected = (evicted_distances <= raw_scores[remaining]).any(axis=0)
+
+        # The new data points overwrite the evicted slots first
+        free_slots = np.concatenate(
+            [evicted, np.arange(samples_number, new_samples_number)])
+        new_slots = free_slots[:points_number]
+        if points_number:
+            cross_distances = self._get_distances(points,
+                                                  data_buffer[remaining])
+            points_distances = self._get_distances(points, points)
+            # ...or a new data point is closer than its n-th neighbour
+            is_affected |= (cross_distances < raw_scores[remaining]).any(
+                axis=0)
+
+            data_buffer[new_slots] = points
+            distance_buffer[np.ix_(new_slots, remaining)] = cross_distances
+            distance_buffer[np.ix_(remaining, new_slots)] = cross_distances.T
+            distance_buffer[np.ix_(new_slots, new_slots)] = points_distances
+        window_order = np.concatenate([remaining, new_slots])
+        affected = np.concatenate([remaining[is_affected], new_slots])
+
+        # The window is kept in the first rows of the buffers, therefore the
+        # evicted slots that are not overwritten are filled with the data
+        # points from beyond the window
+        holes = free_slots[points_number:]
+        holes = holes[holes < new_samples_number]
+        movers = window_order[window_order >= new_samples_number]
+        assert holes.shape == movers.shape, 'Every data point needs a slot.'
+        if movers.size:
+            data_buffer[holes] = data_buffer[movers]
+            distance_buffer[holes] = distance_buffer[movers]
+            distance_buffer[:, holes] = distance_buffer[:, movers]
+            raw_scores[holes] = raw_scores[movers]
+
+            relocation = np.arange(capacity)
+            relocation[movers] = holes
+            window_order = relocation[window_order]
+            affected = relocation[affected]
+
+        window = slice(new_samples_number)
+        self.window_order = window_order
+        self._samples_number = new_samples_number
+        self.data_set = data_buffer[window]
+        self.distance_matrix = distance_buffer[window, window]
+
+        if affected.size:
+            # The data point itself is its closest neighbour
+            affected_distances = np.partition(
+                self.distance_matrix[affected], self.neighbours, axis=1)
+            raw_scores[affected] = affected_distances[:, self.neighbours]
+        self._set_scores(raw_scores[window])
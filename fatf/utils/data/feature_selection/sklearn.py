@@ -8,7 +8,7 @@ scikit-learn-based feature selection approaches.
 #         Kacper Sokol <k.sokol@bristol.ac.uk>
 # License: new BSD
 
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import logging
 import warnings
@@ -31,7 +31,12 @@ import fatf.utils.array.validation as fuav
 
 from fatf.exceptions import IncorrectShapeError
 
-__all__ = ['lasso_path', 'forward_selection', 'highest_weights']
+__all__ = ['lasso_path',
+           'forward_selection',
+           'highest_weights',
+           'multi_target_lasso_path',
+           'multi_target_forward_selection',
+           'multi_target_highest_weights']  # yapf: disable
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
@@ -127,6 +132,172 @@ def _get_feature_proportion(features_percentage: int,
     return features_number
 
 
+def _validate_input_multi_target(dataset: np.ndarray, target: np.ndarray,
+                                 weights: Union[np.ndarray, None],
+                                 features_number: Union[int, None],
+                                 features_percentage: int) -> bool:
+    """
+    Validates the input parameters of the multi-target feature selection.
+
+    .. versionadded:: 0.1.1
+
+    For the input parameter description, warnings and exceptions please see
+    the documentation of the :func:`fatf.utils.data.feature_selection.\
+sklearn.multi_target_lasso_path` function.
+
+    Returns
+    -------
+    input_is_valid : boolean
+        ``True`` if the input is valid, ``False`` otherwise.
+    """
+    input_is_valid = False
+
+    if fuav.is_structured_array(target):
+        raise TypeError('The target array must not be a structured array.')
+    if not fuav.is_2d_array(target) or not target.shape[1]:
+        raise IncorrectShapeError('The target array must be a 2-dimensional '
+                                  'array with at least one column.')
+
+    # Validate the rest of the input with the first target column
+    input_is_valid = _validate_input_lasso_path(
+        dataset, target[:, 0], weights, features_number, features_percentage)
+    if not fuav.is_numerical_array(target):
+        raise TypeError('The target array must be numerical since this '
+                        'feature selection method is based on Lasso '
+                        'regression.')
+
+    return input_is_valid
+
+
+def _get_indices(dataset: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the feature indices and an unstructured version of a data set.
+
+    .. versionadded:: 0.1.1
+
+    Parameters
+    ----------
+    dataset : numpy.ndarray
+        A 2-dimensional numpy array holding a data set.
+
+    Returns
+    -------
+    indices : numpy.ndarray
+        The column names for structured arrays or the column indices
+        otherwise.
+    dataset_array : numpy.ndarray
+        The ``dataset`` as an unstructured numpy array.
+    """
+    if fuav.is_structured_array(dataset):
+        indices = np.array(dataset.dtype.names)
+        dataset_array = fuat.as_unstructured(dataset)
+    else:
+        indices = np.array(range(0, dataset.shape[1]))
+        dataset_array = dataset
+    return indices, dataset_array
+
+
+def _weighted_centred(
+        dataset: np.ndarray, target: np.ndarray,
+        weights: Union[np.ndarray, None]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Centres and scales a data set and its target(s) with data point weights.
+
+    .. versionadded:: 0.1.1
+
+    The ``dataset`` and the ``target`` are centred around their weighted
+    average (if no weights are provided, the average is simply not weighted)
+    and scaled by the square root of the ``weights``. With this
+    transformation a weighted linear regression (with an intercept) of the
+    original data is equivalent to an unweighted linear regression (without
+    an intercept) of the transformed data.
+
+    Parameters
+    ----------
+    dataset : numpy.ndarray
+        A 2-dimensional, numerical, unstructured numpy array.
+    target : numpy.ndarray
+        A 1-dimensional (one target) or 2-dimensional (one target per column)
+        numerical array.
+    weights : Union[numpy.ndarray, None]
+        A 1-dimensional numerical array with the data point weights or
+        ``None``.
+
+    Returns
+    -------
+    weighted_data : numpy.ndarray
+        The centred and scaled ``dataset``.
+    weighted_target : numpy.ndarray
+        The centred and scaled ``target``.
+    """
+    if weights is None:
+        weights_scaled = np.ones(dataset.shape[0])
+    else:
+        weights_scaled = np.sqrt(weights)
+
+    dataset_avg = np.average(dataset, axis=0, weights=weights)
+    weighted_data = (dataset - dataset_avg) * weights_scaled[:, np.newaxis]
+
+    target_avg = np.average(target, axis=0, weights=weights)
+    weighted_target = (target - target_avg) * (
+        weights_scaled if target.ndim == 1 else weights_scaled[:, np.newaxis])
+
+    return weighted_data, weighted_target
+
+
+def _get_lasso_path_features(coefs: np.ndarray, indices: np.ndarray,
+                             features_number: int) -> np.ndarray:
+    """
+    Selects the features of the biggest matching Lasso path.
+
+    .. versionadded:: 0.1.1
+
+    For the description of the selection and the logged messages please see
+    the documentation of the
+    :func:`fatf.utils.data.feature_selection.sklearn.lasso_path` function.
+
+    Parameters
+    ----------
+    coefs : numpy.ndarray
+        The coefficients along the Lasso path -- as returned by the
+        ``sklearn.linear_model.lars_path`` function.
+    indices : numpy.ndarray
+        The indices of the features.
+    features_number : integer
+        The number of features to be selected.
+
+    Returns
+    -------
+    feature_indices : numpy.ndarray
+        Array with indices of features selected by the Lasso path.
+    """
+    # numpy.count_nonzero returns a scalar (despite specifying the axis)
+    # in early versions of numpy, hence the workaround of:
+    # np.count_nonzero(coefs, axis=0).
+    nonzero_count = (coefs != 0).sum(axis=0)
+
+    matching_paths_user = (nonzero_count <= features_number)
+    matching_paths_nonzero = (nonzero_count > 0)
+    matching_paths = np.where(
+        np.logical_and(matching_paths_user, matching_paths_nonzero))[0]
+
+    if matching_paths.size:
+        biggest_path = matching_paths[-1]
+        nonzero_indices = coefs[:, biggest_path].nonzero()[0]
+        feature_indices = indices[nonzero_indices]
+        if nonzero_indices.shape[0] != features_number:
+            logger.warning(
+                'The lasso path feature selection could not pick %d '
+                'features. Only %d were selected.', features_number,
+                nonzero_indices.shape[0])
+    else:
+        feature_indices = indices
+        logger.warning('The lasso path feature selection could not pick '
+                       'any feature subset. All of the features were '
+                       'selected.')
+    return feature_indices
+
+
 def lasso_path(dataset: np.ndarray,
                target: np.ndarray,
                weights: Optional[np.ndarray] = None,
@@ -212,17 +383,11 @@ def lasso_path(dataset: np.ndarray,
     feature_indices : numpy.ndarray
         Array with indices of features selected by the Lasso path.
     """
-    # pylint: disable=too-many-branches,too-many-locals
     assert _validate_input_lasso_path(dataset, target, weights,
                                       features_number,
                                       features_percentage), 'Input is invalid.'
 
-    if fuav.is_structured_array(dataset):
-        indices = np.array(dataset.dtype.names)
-        dataset_array = fuat.as_unstructured(dataset)
-    else:
-        indices = np.array(range(0, dataset.shape[1]))
-        dataset_array = dataset
+    indices, dataset_array = _get_indices(dataset)
 
     indices_number = indices.shape[0]
     if features_number is None:
@@ -238,46 +403,15 @@ def lasso_path(dataset: np.ndarray,
             'of features in the dataset array. All of the features are being '
             'selected.', UserWarning)
     else:
-        if weights is None:
-            weights_scaled = np.ones_like(target)
-        else:
-            weights_scaled = np.sqrt(weights)
-
-        dataset_avg = np.average(dataset_array, axis=0, weights=weights)
-        weighted_data = (
-            (dataset_array - dataset_avg) * weights_scaled[:, np.newaxis])
-
-        target_avg = np.average(target, weights=weights)
-        weighted_target = (target - target_avg) * weights_scaled
+        weighted_data, weighted_target = _weighted_centred(
+            dataset_array, target, weights)
 
         fitted_lars_path = sklearn.linear_model.lars_path(
             weighted_data, weighted_target, method='lasso', verbose=False)
         coefs = fitted_lars_path[2]
 
-        # numpy.count_nonzero returns a scalar (despite specifying the axis)
-        # in early versions of numpy, hence the workaround of:
-        # np.count_nonzero(coefs, axis=0).
-        nonzero_count = (coefs != 0).sum(axis=0)
-
-        matching_paths_user = (nonzero_count <= features_number)
-        matching_paths_nonzero = (nonzero_count > 0)
-        matching_paths = np.where(
-            np.logical_and(matching_paths_user, matching_paths_nonzero))[0]
-
-        if matching_paths.size:
-            biggest_path = matching_paths[-1]
-            nonzero_indices = coefs[:, biggest_path].nonzero()[0]
-            feature_indices = indices[nonzero_indices]
-            if nonzero_indices.shape[0] != features_number:
-                logger.warning(
-                    'The lasso path feature selection could not pick %d '
-                    'features. Only %d were selected.', features_number,
-                    nonzero_indices.shape[0])
-        else:
-            feature_indices = indices
-            logger.warning('The lasso path feature selection could not pick '
-                           'any feature subset. All of the features were '
-                           'selected.')
+        feature_indices = _get_lasso_path_features(coefs, indices,
+                                                   features_number)
     return feature_indices
 
 
@@ -291,15 +425,24 @@ def forward_selection(dataset: np.ndarray,
 
     .. versionadded:: 0.1.0
 
+    .. versionchanged:: 0.1.1
+       The candidate features are scored with incremental (weighted) least
+       squares instead of fitting a ``sklearn.linear_model.Ridge(alpha=0)``
+       model for every candidate feature at every step.
+
     The ``weights`` provided as the input parameter are incorporated into the
-    feature selection via the ridge regression training procedure.
+    feature selection via the (weighted) linear regression training procedure.
     If the value of ``feature_percentage`` results in selecting
     0 features, 1 feature will be selected and a warning will be logged.
 
-    .. note::
-
-       This feature selection procedure is computationally expensive when
-       the number of features to be selected is large.
+    At every step the feature that -- together with the already selected
+    features -- gives the linear regression (with an intercept) with the
+    highest weighted coefficient of determination (R^2) is selected. Instead
+    of refitting the regression for every candidate, the (weighted and
+    centred) candidate features are kept orthogonalised against the selected
+    features -- a Gram-Schmidt (QR) factorisation updated with a rank-one
+    deflation whenever a feature is selected -- hence the increase of the
+    explained sum of squares of all the candidates is computed at once.
 
     This feature selection method is based on LIME_ (Local Interpretable
     Model-agnostic Explanations). The original implementation can be found in
@@ -357,17 +500,11 @@ def forward_selection(dataset: np.ndarray,
     feature_indices : numpy.ndarray
         Array with indices of features chosen with forward selection.
     """
-    # pylint: disable=too-many-locals
     assert _validate_input_lasso_path(dataset, target, weights,
                                       features_number,
                                       features_percentage), 'Input is invalid.'
 
-    if fuav.is_structured_array(dataset):
-        indices = np.array(dataset.dtype.names)
-        dataset_array = fuat.as_unstructured(dataset)
-    else:
-        indices = np.array(range(0, dataset.shape[1]))
-        dataset_array = dataset
+    indices, dataset_array = _get_indices(dataset)
 
     indices_number = indices.shape[0]
     if features_number is None:
@@ -383,38 +520,134 @@ def forward_selection(dataset: np.ndarray,
             'of features in the dataset array. All of the features are being '
             'selected.', UserWarning)
     else:
-        if weights is None:
-            weights_ = np.ones_like(target)
-        else:
-            weights_ = weights
+        feature_indices_i = _forward_selection_indices(
+            dataset_array, target, weights, features_number)
+
+        feature_indices_sorting = np.sort(feature_indices_i)
+        feature_indices = indices[feature_indices_sorting]
 
-        clf = sklearn.linear_model.Ridge(alpha=0, fit_intercept=True)
-        feature_indices_i = []  # type: List[int]
+    return feature_indices
 
-        for _ in range(features_number):
-            max_score = -np.inf
-            selected_feature_i = None
 
-            for feature_i in range(indices_number):
-                if feature_i in feature_indices_i:
-                    continue
+def _forward_selection_indices(dataset: np.ndarray, target: np.ndarray,
+                               weights: Union[np.ndarray, None],
+                               features_number: int) -> List[int]:
+    """
+    Selects features with forward selection using incremental least squares.
 
-                feature_subset = feature_indices_i + [feature_i]
-                dataset_subset = dataset_array[:, feature_subset]
+    .. versionadded:: 0.1.1
 
-                clf.fit(dataset_subset, target, sample_weight=weights_)
-                score = clf.score(
-                    dataset_subset, target, sample_weight=weights_)
+    The features and the target are centred with their weighted means and
+    scaled by the square root of the weights, after which maximising the
+    weighted R^2 of a linear regression is equivalent to maximising the sum
+    of squares of the target explained by the (unweighted) projection onto
+    the selected features. The selection itself is performed by the
+    :func:`fatf.utils.data.feature_selection.sklearn._forward_selection_gram`
+    function.
 
-                if score > max_score:
-                    max_score = score
-                    selected_feature_i = feature_i
+    Parameters
+    ----------
+    dataset : numpy.ndarray
+        A 2-dimensional, numerical, unstructured numpy array.
+    target : numpy.ndarray
+        A 1-dimensional numerical array with the target.
+    weights : Union[numpy.ndarray, None]
+        A 1-dimensional numerical array with the data point weights or
+        ``None``.
+    features_number : integer
+        The number of features to be selected (smaller than the number of
+        features in the ``dataset``).
 
-            assert selected_feature_i is not None
-            feature_indices_i.append(selected_feature_i)
+    Returns
+    -------
+    feature_indices : List[integer]
+        The column indices of the selected features in the order of their
+        selection.
+    """
+    assert dataset.shape[1] > features_number, 'Too many features.'
+    weighted_data, weighted_target = _weighted_centred(dataset, target,
+                                                       weights)
 
-        feature_indices_sorting = np.sort(feature_indices_i)
-        feature_indices = indices[feature_indices_sorting]
+    gram = weighted_data.T.dot(weighted_data)
+    moments = weighted_data.T.dot(weighted_target)
+    target_sum_of_squares = weighted_target.dot(weighted_target)
+
+    feature_indices = _forward_selection_gram(
+        gram, moments, target_sum_of_squares, features_number)
+    return feature_indices
+
+
+def _forward_selection_gram(gram: np.ndarray, moments: np.ndarray,
+                            target_sum_of_squares: float,
+                            features_number: int) -> List[int]:
+    """
+    Selects features with forward selection given their Gram matrix.
+
+    .. versionadded:: 0.1.1
+
+    The Gram matrix of the residuals of all the features orthogonalised
+    against the selected ones -- and the inner products of these residuals
+    with the target -- are kept. The explained sum of squares gained by each
+    candidate ``c`` -- ``(r_c . y)^2 / (r_c . r_c)`` -- is computed for all
+    of them at once, and selecting a feature deflates the residual Gram
+    matrix and inner products with the residual of that feature (a rank-one
+    update of the Gram-Schmidt (QR) factorisation). Since only the Gram
+    matrix of the features is needed, it can be shared by many targets.
+
+    Candidates that are (numerically) linearly dependent on the selected
+    features gain nothing; ties are resolved in favour of the lowest feature
+    index.
+
+    Parameters
+    ----------
+    gram : numpy.ndarray
+        A 2-dimensional array with the Gram matrix of the (weighted and
+        centred) features.
+    moments : numpy.ndarray
+        A 1-dimensional array with the inner products of the (weighted and
+        centred) features and the target.
+    target_sum_of_squares : float
+        The sum of squares of the (weighted and centred) target.
+    features_number : integer
+        The number of features to be selected.
+
+    Returns
+    -------
+    feature_indices : List[integer]
+        The column indices of the selected features in the order of their
+        selection.
+    """
+    # pylint: disable=too-many-locals
+    residual_gram = np.array(gram, dtype=np.float64)
+    residual_moments = np.array(moments, dtype=np.float64)
+
+    # The norms below this threshold indicate features that are linearly
+    # dependent on the selected features (or constant)
+    norms_threshold = 1e-10 * np.diag(residual_gram)
+    gains_tolerance = 1e-10 * target_sum_of_squares
+
+    feature_indices = []  # type: List[int]
+    for _ in range(features_number):
+        norms = np.diag(residual_gram)
+
+        is_independent = norms > norms_threshold
+        gains = np.square(residual_moments)
+        gains[is_independent] /= norms[is_independent]
+        gains[~is_independent] = 0
+        gains[feature_indices] = -np.inf
+
+        # Resolve (numerical) ties in favour of the lowest index
+        selected_feature_i = int(
+            np.argmax(gains >= gains.max() - gains_tolerance))
+        feature_indices.append(selected_feature_i)
+
+        # Orthogonalise the residuals against the selected feature
+        if is_independent[selected_feature_i]:
+            norm = norms[selected_feature_i]
+            column = residual_gram[:, selected_feature_i].copy()
+            residual_moments -= column * (
+                residual_moments[selected_feature_i] / norm)
+            residual_gram -= np.outer(column, column) / norm
 
     return feature_indices
 
@@ -498,12 +731,7 @@ def highest_weights(dataset: np.ndarray,
                                       features_number,
                                       features_percentage), 'Input is invalid.'
 
-    if fuav.is_structured_array(dataset):
-        indices = np.array(dataset.dtype.names)
-        dataset_array = fuat.as_unstructured(dataset)
-    else:
-        indices = np.array(range(0, dataset.shape[1]))
-        dataset_array = dataset
+    indices, dataset_array = _get_indices(dataset)
 
     indices_number = indices.shape[0]
     if features_number is None:
@@ -533,3 +761,227 @@ def highest_weights(dataset: np.ndarray,
         feature_indices = indices[selected_indices_sorted]
 
     return feature_indices
+
+
+def _multi_target_prelude(
+        dataset: np.ndarray, target: np.ndarray,
+        weights: Union[np.ndarray, None], features_number: Union[int, None],
+        features_percentage: int
+) -> Tuple[np.ndarray, Union[None, Tuple[np.ndarray, np.ndarray]], int]:
+    """
+    Prepares the shared computations of the multi-target feature selection.
+
+    .. versionadded:: 0.1.1
+
+    For the description of the parameters and the warnings please see the
+    documentation of the :func:`fatf.utils.data.feature_selection.sklearn.\
+multi_target_lasso_path` function.
+
+    Returns
+    -------
+    indices : numpy.ndarray
+        The indices of the features.
+    weighted : Union[None, Tuple[numpy.ndarray, numpy.ndarray]]
+        The weighted and centred data set and targets, or ``None`` if all of
+        the features are to be selected.
+    features_number : integer
+        The number of features to be selected.
+    """
+    assert _validate_input_multi_target(
+        dataset, target, weights, features_number,
+        features_percentage), 'Input is invalid.'
+
+    indices, dataset_array = _get_indices(dataset)
+
+    indices_number = indices.shape[0]
+    if features_number is None:
+        features_number = _get_feature_proportion(features_percentage,
+                                                  indices_number)
+
+    if features_number >= indices_number:
+        if features_number > indices_number:
+            warnings.warn(
+                'The selected number of features is larger than the total '
+                'number of features in the dataset array. All of the features '
+                'are being selected.', UserWarning)
+        weighted = None
+    else:
+        weighted = _weighted_centred(dataset_array, target, weights)
+    return indices, weighted, features_number
+
+
+def multi_target_lasso_path(
+        dataset: np.ndarray,
+        target: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+        features_number: Optional[int] = None,
+        features_percentage: int = 100) -> List[np.ndarray]:
+    """
+    Selects features based on Lasso path coefficients for many targets.
+
+    .. versionadded:: 0.1.1
+
+    This is a multi-target version of the
+    :func:`fatf.utils.data.feature_selection.sklearn.lasso_path` function --
+    the ``target`` is a 2-dimensional array with one target per column (e.g.,
+    the probabilities of every class) and the features are selected for each
+    one of them. The data set is centred, weighted and its Gram matrix is
+    computed only once, and shared by the Lasso paths of all the targets.
+
+    For the description of the warnings, the logged messages and the other
+    parameters please see the documentation of the
+    :func:`fatf.utils.data.feature_selection.sklearn.lasso_path` function.
+
+    Parameters
+    ----------
+    target : numpy.ndarray
+        A 2-dimensional numerical array with the targets -- one per column --
+        of each row in the input data set.
+
+    Raises
+    ------
+    IncorrectShapeError
+        The ``target`` array is not 2-dimensional or it has no columns.
+    TypeError
+        The ``target`` array is a structured array or it is not purely
+        numerical.
+
+    For the other exceptions please see the documentation of the
+    :func:`fatf.utils.data.feature_selection.sklearn.lasso_path` function.
+
+    Returns
+    -------
+    feature_indices : List[numpy.ndarray]
+        A list with an array of indices of the features selected by the Lasso
+        path for every target (column of the ``target`` array).
+    """
+    indices, weighted, features_number = _multi_target_prelude(
+        dataset, target, weights, features_number, features_percentage)
+
+    if weighted is None:
+        feature_indices = [indices for _ in range(target.shape[1])]
+    else:
+        weighted_data, weighted_target = weighted
+        gram = weighted_data.T.dot(weighted_data)
+        moments = weighted_data.T.dot(weighted_target)
+
+        feature_indices = []
+        for target_i in range(target.shape[1]):
+            fitted_lars_path = sklearn.linear_model.lars_path(
+                weighted_data,
+                weighted_target[:, target_i],
+                Xy=moments[:, target_i],
+                Gram=gram,
+                method='lasso',
+                verbose=False)
+            coefs = fitted_lars_path[2]
+            feature_indices.append(
+                _get_lasso_path_features(coefs, indices, features_number))
+    return feature_indices
+
+
+def multi_target_forward_selection(
+        dataset: np.ndarray,
+        target: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+        features_number: Optional[int] = None,
+        features_percentage: int = 100) -> List[np.ndarray]:
+    """
+    Selects features based on iterative importance for many targets.
+
+    .. versionadded:: 0.1.1
+
+    This is a multi-target version of the
+    :func:`fatf.utils.data.feature_selection.sklearn.forward_selection`
+    function -- the ``target`` is a 2-dimensional array with one target per
+    column (e.g., the probabilities of every class) and the features are
+    selected for each one of them. The data set is centred, weighted and its
+    Gram matrix is computed only once, after which the forward selection of
+    every target only depends on the number of features (and not on the
+    number of data points).
+
+    For the description of the warnings, the exceptions and the other
+    parameters please see the documentation of the
+    :func:`fatf.utils.data.feature_selection.sklearn.forward_selection` and
+    :func:`fatf.utils.data.feature_selection.sklearn.multi_target_lasso_path`
+    functions.
+
+    Returns
+    -------
+    feature_indices : List[numpy.ndarray]
+        A list with an array of indices of the features chosen with forward
+        selection for every target (column of the ``target`` array).
+    """
+    indices, weighted, features_number = _multi_target_prelude(
+        dataset, target, weights, features_number, features_percentage)
+
+    if weighted is None:
+        feature_indices = [indices for _ in range(target.shape[1])]
+    else:
+        weighted_data, weighted_target = weighted
+        gram = weighted_data.T.dot(weighted_data)
+        moments = weighted_data.T.dot(weighted_target)
+        targets_sum_of_squares = np.square(weighted_target).sum(axis=0)
+
+        feature_indices = []
+        for target_i in range(target.shape[1]):
+            feature_indices_i = _forward_selection_gram(
+                gram, moments[:, target_i], targets_sum_of_squares[target_i],
+                features_number)
+            feature_indices.append(indices[np.sort(feature_indices_i)])
+    return feature_indices
+
+
+def multi_target_highest_weights(
+        dataset: np.ndarray,
+        target: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+        features_number: Optional[int] = None,
+        features_percentage: int = 100) -> List[np.ndarray]:
+    """
+    Selects features based on their absolute weight for many targets.
+
+    .. versionadded:: 0.1.1
+
+    This is a multi-target version of the
+    :func:`fatf.utils.data.feature_selection.sklearn.highest_weights`
+    function -- the ``target`` is a 2-dimensional array with one target per
+    column (e.g., the probabilities of every class) and the features are
+    selected for each one of them. The data set is centred, weighted and its
+    Gram matrix is computed only once, and the ridge regression
+    (``alpha=0.01``) coefficients of all the targets are computed in closed
+    form with a single linear solve.
+
+    For the description of the warnings, the exceptions and the other
+    parameters please see the documentation of the
+    :func:`fatf.utils.data.feature_selection.sklearn.highest_weights` and
+    :func:`fatf.utils.data.feature_selection.sklearn.multi_target_lasso_path`
+    functions.
+
+    Returns
+    -------
+    feature_indices : List[numpy.ndarray]
+        A list with an array of indices of the features with the highest
+        coefficients for every target (column of the ``target`` array).
+    """
+    # pylint: disable=too-many-locals
+    indices, weighted, features_number = _multi_target_prelude(
+        dataset, target, weights, features_number, features_percentage)
+
+    if weighted is None:
+        feature_indices = [indices for _ in range(target.shape[1])]
+    else:
+        weighted_data, weighted_target = weighted
+        gram = weighted_data.T.dot(weighted_data)
+        moments = weighted_data.T.dot(weighted_target)
+
+        coefficients = np.linalg.solve(gram + 0.01 * np.eye(gram.shape[0]),
+                                       moments)
+
+        feature_indices = []
+        for target_i in range(target.shape[1]):
+            importance_ordering = np.flipud(
+                np.argsort(np.abs(coefficients[:, target_i])))
+            selected_indices = importance_ordering[:features_number]
+            feature_indices.append(indices[np.sort(selected_indices)])
+    return feature_indices
@@ -402,6 +402,71 @@ def test_forward_selection(caplog):
     assert len(caplog.records) == 3
 
 
+def _forward_selection_sklearn(dataset, target, weights, features_number):
+    """
+    Selects features by refitting a linear regression for every candidate.
+    """
+    import sklearn.linear_model
+
+    clf = sklearn.linear_model.Ridge(alpha=0, fit_intercept=True)
+    feature_indices = []
+    for _ in range(features_number):
+        max_score = -np.inf
+        selected_feature_i = None
+        for feature_i in range(dataset.shape[1]):
+            if feature_i in feature_indices:
+                continue
+            feature_subset = feature_indices + [feature_i]
+            clf.fit(dataset[:, feature_subset], target, sample_weight=weights)
+            score = clf.score(
+                dataset[:, feature_subset], target, sample_weight=weights)
+            if score > max_score:
+                max_score = score
+                selected_feature_i = feature_i
+        feature_indices.append(selected_feature_i)
+    return feature_indices
+
+
+def test_forward_selection_indices():
+    """
+    Tests :func:`fatf.utils.data.feature_selection.sklearn.\
+_forward_selection_indices` function.
+    """
+    fatf.setup_random_seed(42)
+    for _ in range(10):
+        dataset = np.random.normal(size=(40, 8))
+        noise = np.random.normal(scale=0.3, size=40)
+        target = dataset[:, 2] - 2 * dataset[:, 5] + 0.5 * dataset[:, 0]
+        target += noise
+        weights = np.random.uniform(0.1, 1, size=40)
+        for features_number in range(1, 8):
+            indices = fudfs._forward_selection_indices(
+                dataset, target, weights, features_number)
+            assert indices == _forward_selection_sklearn(
+                dataset, target, weights, features_number)
+
+    # Linearly dependent and constant features
+    dataset = np.random.normal(size=(30, 5))
+    dataset[:, 1] = 2 * dataset[:, 3] - dataset[:, 0]
+    dataset[:, 4] = 1
+    target = dataset[:, 3] + np.random.normal(scale=0.1, size=30)
+    weights = np.ones(30)
+    indices = fudfs._forward_selection_indices(dataset, target, weights, 4)
+    sklearn_indices = _forward_selection_sklearn(dataset, target, weights, 3)
+    assert indices[:3] == sklearn_indices
+    assert sorted(indices) == [0, 1, 2, 3]
+
+    # Binary (LIME-like) data
+    dataset = np.random.randint(0, 2, size=(50, 6))
+    target = np.random.uniform(size=50)
+    weights = np.random.uniform(size=50)
+    for features_number in range(1, 6):
+        indices = fudfs._forward_selection_indices(dataset, target, weights,
+                                                   features_number)
+        assert indices == _forward_selection_sklearn(dataset, target, weights,
+                                                     features_number)
+
+
 def test_highest_weights(caplog):
     """
     Tests :func:`fatf.utils.data.feature_choice.sklearn.highest_weights`.
@@ -482,3 +547,119 @@ def test_highest_weights(caplog):
     assert fuav.is_1d_array(features)
     assert np.array_equal(features, np.array([0, 2]))
     assert len(caplog.records) == 3
+
+
+def test_validate_input_multi_target():
+    """
+    Tests :func:`fatf.utils.data.feature_selection.sklearn.\
+_validate_input_multi_target` function.
+    """
+    shape_msg = ('The target array must be a 2-dimensional array with at '
+                 'least one column.')
+    struct_msg = 'The target array must not be a structured array.'
+    type_msg = ('The target array must be numerical since this feature '
+                'selection method is based on Lasso regression.')
+
+    with pytest.raises(IncorrectShapeError) as exin:
+        fudfs._validate_input_multi_target(
+            NUMERICAL_NP_ARRAY, NUMERICAL_NP_ARRAY_TARGET, None, None, 100)
+    assert str(exin.value) == shape_msg
+    with pytest.raises(IncorrectShapeError) as exin:
+        fudfs._validate_input_multi_target(NUMERICAL_NP_ARRAY, np.ones((6, 0)),
+                                           None, None, 100)
+    assert str(exin.value) == shape_msg
+
+    with pytest.raises(TypeError) as exin:
+        fudfs._validate_input_multi_target(NUMERICAL_NP_ARRAY,
+                                           NUMERICAL_STRUCT_ARRAY[['a', 'b']],
+                                           None, None, 100)
+    assert str(exin.value) == struct_msg
+
+    with pytest.raises(TypeError) as exin:
+        fudfs._validate_input_multi_target(
+            NUMERICAL_NP_ARRAY, CATEGORICAL_NP_ARRAY[:, :2], None, None, 100)
+    assert str(exin.value) == type_msg
+
+    # The rest is validated with the single-target validation
+    with pytest.raises(IncorrectShapeError) as exin:
+        fudfs._validate_input_multi_target(NUMERICAL_NP_ARRAY, np.ones((5, 2)),
+                                           None, None, 100)
+    assert str(exin.value) == ('The number of labels in the target array '
+                               'must agree with the number of samples in the '
+                               'data set.')
+
+    target = np.stack([NUMERICAL_NP_ARRAY_TARGET] * 3, axis=1)
+    assert fudfs._validate_input_multi_target(NUMERICAL_NP_ARRAY, target,
+                                              np.ones(6), 2, 100)
+
+
+def test_multi_target():
+    """
+    Tests multi-target feature selection functions.
+
+    Tests :func:`fatf.utils.data.feature_selection.sklearn.\
+multi_target_lasso_path`, :func:`fatf.utils.data.feature_selection.sklearn.\
+multi_target_forward_selection` and :func:`fatf.utils.data.\
+feature_selection.sklearn.multi_target_highest_weights` functions.
+    """
+    functions = [(fudfs.multi_target_lasso_path, fudfs.lasso_path),
+                 (fudfs.multi_target_forward_selection,
+                  fudfs.forward_selection),
+                 (fudfs.multi_target_highest_weights, fudfs.highest_weights)]
+
+    fatf.setup_random_seed(42)
+    for _ in range(5):
+        dataset = np.random.normal(size=(40, 8))
+        targets = [
+            dataset[:, 2] - 2 * dataset[:, 5],
+            dataset[:, 0] + 0.5 * dataset[:, 7],
+            np.random.uniform(size=40)
+        ]
+        target = np.stack(targets, axis=1)
+        target += np.random.normal(scale=0.3, size=target.shape)
+        weights = np.random.uniform(0.1, 1, size=40)
+        for multi_function, function in functions:
+            for features_number in [1, 3, 7, 8]:
+                features = multi_function(dataset, target, weights,
+                                          features_number)
+                assert isinstance(features, list)
+                assert len(features) == 3
+                for i, features_ in enumerate(features):
+                    assert np.array_equal(
+                        features_,
+                        function(dataset, target[:, i], weights,
+                                 features_number))
+
+    # Binary (LIME-like) data
+    dataset = np.random.randint(0, 2, size=(50, 6))
+    target = np.random.uniform(size=(50, 2))
+    for multi_function, function in functions:
+        for weights in [None, np.random.uniform(size=50)]:
+            features = multi_function(dataset, target, weights, 3)
+            for i, features_ in enumerate(features):
+                assert np.array_equal(
+                    features_, function(dataset, target[:, i], weights, 3))
+
+    # Structured array and percentage
+    target = np.stack(
+        [NUMERICAL_NP_ARRAY_TARGET, NUMERICAL_NP_ARRAY_TARGET[::-1]], axis=1)
+    for multi_function, function in functions:
+        features = multi_function(
+            NUMERICAL_STRUCT_ARRAY, target, features_percentage=50)
+        for i, features_ in enumerate(features):
+            assert np.array_equal(
+                features_,
+                function(
+                    NUMERICAL_STRUCT_ARRAY,
+                    target[:, i],
+                    features_percentage=50))
+
+        # Selecting more than 4 features
+        with pytest.warns(UserWarning) as warning:
+            features = multi_function(
+                NUMERICAL_STRUCT_ARRAY, target, features_number=5)
+        assert len(warning) == 1
+        assert str(warning[0].message) == FEATURE_INDICES_WARNING
+        assert len(features) == 2
+        for features_ in features:
+            assert np.array_equal(features_, np.array(['a', 'b', 'c', 'd']))
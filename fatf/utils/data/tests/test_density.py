@@ -12,6 +12,8 @@ import numpy as np
 from fatf.exceptions import IncorrectShapeError
 
 import fatf.utils.data.density as fudd
+import fatf.utils.distances as fud
+import fatf.utils.models.neighbours as fumn
 import fatf.utils.tools as fut
 
 _NUMPY_VERSION = [int(i) for i in np.version.version.split('.')]
@@ -210,6 +212,28 @@ def test_validate_input_dc():
 
     assert fudd._validate_input_dc(NUMERICAL_NP_ARRAY, None, 20, None, False)
 
+    with pytest.raises(TypeError) as exin:
+        fudd._validate_input_dc(NUMERICAL_NP_ARRAY, None, 20, None, False,
+                                '42')
+    assert str(exin.value) == ('The neighbour_index parameter has to be '
+                               'either None or a fatf.utils.models.neighbours.'
+                               'NeighbourIndex object.')
+    with pytest.raises(ValueError) as exin:
+        fudd._validate_input_dc(NUMERICAL_NP_ARRAY, None, 20, mix_dist, False,
+                                fumn.KDTreeIndex())
+    assert str(exin.value) == ('The distance_function and neighbour_index '
+                               'parameters cannot be used together -- the '
+                               'neighbour index defines its own distance.')
+    with pytest.raises(ValueError) as exin:
+        fudd._validate_input_dc(NUMERICAL_NP_ARRAY, None, 19, None, False,
+                                fumn.BruteForceIndex())
+    assert str(exin.value) == ('The neighbours number parameter has to be '
+                               'smaller than the number of data points (rows) '
+                               'in the data set array minus 1 when a '
+                               'neighbour index is used.')
+    assert fudd._validate_input_dc(NUMERICAL_NP_ARRAY, None, 18, None, False,
+                                   fumn.BruteForceIndex())
+
 
 def cat_dist(x, y):
     """
@@ -338,6 +362,122 @@ class TestDensityCheck(object):
         assert self.mix_sc_dc._is_structured is True
         assert self.mix_sc_dc._distance_function == mix_dist
 
+    def test_density_check_tiled(self, tmpdir):
+        """
+        Tests the ``DensityCheck`` class with a tiled distance matrix.
+        """
+        memmap_file = tmpdir.join('distances.dat').strpath
+        buffer = np.memmap(
+            memmap_file, dtype=np.float64, mode='w+', shape=(10, 10))
+        mix_sc_dc = fudd.DensityCheck(
+            MIXED_ARRAY,
+            neighbours=5,
+            distance_function=mix_dist,
+            memory_budget=8 * 9,
+            distance_matrix_buffer=buffer)
+        assert mix_sc_dc.distance_matrix is buffer
+        assert np.allclose(buffer, MIXED_DISTS, atol=1e-3)
+        assert np.allclose(mix_sc_dc.scores, MIXED_SCORES, atol=1e-3)
+
+        num_np_dc = fudd.DensityCheck(
+            NUMERICAL_NP_ARRAY, normalise_scores=False, memory_budget=8)
+        assert np.allclose(num_np_dc.distance_matrix,
+                           self.num_np_dc.distance_matrix)
+        assert np.allclose(num_np_dc.scores, self.num_np_dc.scores)
+
+        with pytest.raises(IncorrectShapeError) as exin:
+            fudd.DensityCheck(
+                NUMERICAL_NP_ARRAY, distance_matrix_buffer=np.zeros((10, 10)))
+        assert str(exin.value) == ('The out array has to be a square array '
+                                   'with the same number of rows as the '
+                                   'data_array.')
+
+    def test_density_check_mixed_distance(self):
+        """
+        Tests the ``DensityCheck`` class with a ``MixedDistance`` object.
+        """
+        distance = fud.MixedDistance()
+        mix_sc_dc = fudd.DensityCheck(
+            MIXED_ARRAY, neighbours=5, distance_function=distance)
+        assert not distance.is_fitted
+        assert mix_sc_dc._distance_function.is_fitted
+        assert mix_sc_dc._is_distance_fitted_here
+        assert np.allclose(mix_sc_dc.distance_matrix, MIXED_DISTS, atol=1e-3)
+        assert np.allclose(mix_sc_dc.scores, MIXED_SCORES, atol=1e-3)
+
+        # A prefitted distance is used without its cached data
+        distance = fud.MixedDistance(categorical_indices=['x'])
+        distance.fit(MIXED_ARRAY[:3])
+        mix_sc_dc_pre = fudd.DensityCheck(
+            MIXED_ARRAY, neighbours=5, distance_function=distance)
+        assert not mix_sc_dc_pre._is_distance_fitted_here
+        assert np.allclose(mix_sc_dc_pre.scores, MIXED_SCORES, atol=1e-3)
+
+        for i in range(MIXED_ARRAY.shape[0]):
+            score = mix_sc_dc.score_data_point(MIXED_ARRAY[i])
+            assert pytest.approx(score, abs=1e-3) == \
+                self.mix_sc_dc.score_data_point(MIXED_ARRAY[i])
+            score = mix_sc_dc_pre.score_data_point(MIXED_ARRAY[i])
+            assert pytest.approx(score, abs=1e-3) == \
+                self.mix_sc_dc.score_data_point(MIXED_ARRAY[i])
+
+        num_np_dc = fudd.DensityCheck(
+            NUMERICAL_NP_ARRAY,
+            normalise_scores=False,
+            distance_function=fud.MixedDistance())
+        assert np.allclose(num_np_dc.distance_matrix,
+                           self.num_np_dc.distance_matrix)
+        assert np.allclose(num_np_dc.scores, self.num_np_dc.scores)
+
+        # The categorical indices of the class configure an unfitted distance
+        distance = fud.MixedDistance()
+        num_np_dc = fudd.DensityCheck(
+            NUMERICAL_NP_ARRAY,
+            categorical_indices=[0],
+            distance_function=distance)
+        assert distance.categorical_indices is None
+        assert num_np_dc._distance_function.categorical_indices == [0]
+        num_np_dc_default = fudd.DensityCheck(
+            NUMERICAL_NP_ARRAY, categorical_indices=[0])
+        assert np.allclose(num_np_dc.distance_matrix,
+                           num_np_dc_default.distance_matrix)
+        assert np.allclose(num_np_dc.scores, num_np_dc_default.scores)
+
+    def test_density_check_neighbour_index(self):
+        """
+        Tests the ``DensityCheck`` class with a neighbour index.
+        """
+        for index in [fumn.KDTreeIndex(leaf_size=2), fumn.BruteForceIndex()]:
+            num_np_dc = fudd.DensityCheck(
+                NUMERICAL_NP_ARRAY,
+                normalise_scores=False,
+                neighbour_index=index)
+            assert index.is_fitted
+            assert num_np_dc.distance_matrix is None
+            assert np.allclose(num_np_dc.scores, NUMERICAL_SCORES, atol=1e-3)
+            assert num_np_dc.scores_min == self.num_np_dc.scores_min
+            assert num_np_dc.scores_max == self.num_np_dc.scores_max
+
+            for point in [np.array([0, 0]), NUMERICAL_NP_ARRAY[3]]:
+                score = num_np_dc.score_data_point(point)
+                assert pytest.approx(score, abs=1e-3) == \
+                    self.num_np_dc.score_data_point(point)
+
+        num_sc_dc = fudd.DensityCheck(
+            NUMERICAL_STRUCT_ARRAY,
+            normalise_scores=False,
+            neighbour_index=fumn.KDTreeIndex())
+        assert np.allclose(num_sc_dc.scores, NUMERICAL_SCORES, atol=1e-3)
+        score = num_sc_dc.score_data_point(NUMERICAL_STRUCT_ARRAY[0])
+        assert pytest.approx(score, abs=1e-3) == \
+            self.num_sc_dc.score_data_point(NUMERICAL_STRUCT_ARRAY[0])
+
+        with pytest.raises(TypeError) as exin:
+            fudd.DensityCheck(
+                CATEGORICAL_NP_ARRAY, neighbour_index=fumn.KDTreeIndex())
+        assert str(exin.value) == ('The KD-tree neighbour index only '
+                                   'supports purely numerical data.')
+
     def test_mixed_distance_o(self):
         """
         Tests :func:`~fatf.utils.data.density.DensityCheck._mixed_distance_o`.
@@ -566,3 +706,190 @@ class TestDensityCheck(object):
         assert pytest.approx(score, abs=1e-3) == true_score
         score = self.num_np_dc.score_data_point(np.array([42, 42]), False)
         assert pytest.approx(score, abs=1e-3) == true_score
+
+    def test_validate_data_points(self):
+        """
+        Tests :func:`~fatf.utils.data.density.DensityCheck.\
+_validate_data_points`.
+        """
+        shape_error_points = ('The data points have to be a 2-dimensional '
+                              'numpy array.')
+        shape_error_columns = ('The data points have different number of '
+                               'columns (features) than the data set used to '
+                               'initialise this class.')
+        type_error_base = ('The data points have to be of a base type '
+                           '(strings and/or numbers).')
+        type_error_dtype = ('The dtypes of the data set used to initialise '
+                            'this class and the provided data points are too '
+                            'different.')
+        type_error_clip = 'The clip parameter has to be a boolean.'
+
+        with pytest.raises(IncorrectShapeError) as exin:
+            self.num_np_dc._validate_data_points(np.array([4, 2]), None)
+        assert str(exin.value) == shape_error_points
+
+        with pytest.raises(TypeError) as exin:
+            self.num_np_dc._validate_data_points(
+                np.array([[4, None, 2]]), None)
+        assert str(exin.value) == type_error_base
+
+        with pytest.raises(TypeError) as exin:
+            self.num_np_dc._validate_data_points(np.array([['4', '2']]), None)
+        assert str(exin.value) == type_error_dtype
+        array = np.array([(4, 2)], dtype=[('a', int), ('B', np.int16)])
+        with pytest.raises(TypeError) as exin:
+            self.num_sc_dc._validate_data_points(array, None)
+        assert str(exin.value) == type_error_dtype
+
+        with pytest.raises(IncorrectShapeError) as exin:
+            self.num_np_dc._validate_data_points(np.array([[1, 2, 3]]), None)
+        assert str(exin.value) == shape_error_columns
+
+        with pytest.raises(TypeError) as exin:
+            self.num_np_dc._validate_data_points(np.array([[4, 2]]), None)
+        assert str(exin.value) == type_error_clip
+
+        assert self.num_np_dc._validate_data_points(np.array([[4, 2]]), True)
+
+    def test_score_data_points(self):
+        """
+        Tests :func:`~fatf.utils.data.density.DensityCheck.score_data_points`.
+        """
+        user_warning = ('The minimum and maximum scores are the same, '
+                        'therefore the score normalisation is ill-defined.')
+        dc = fudd.DensityCheck(np.array([[0, 1], [1, 0]]), neighbours=1)
+        with pytest.warns(UserWarning) as w:
+            scores = dc.score_data_points(
+                np.array([[4, 2], [0.5, 0.5], [0, -1]]))
+        assert len(w) == 1
+        assert str(w[0].message) == user_warning
+        assert np.array_equal(scores, [1, 0, 0])
+
+        numerical = np.array([[42, 42], [0, 0], [74, 52], [100, 100]])
+        distance = fud.MixedDistance()
+        density_checks = [
+            (self.num_np_dc, numerical),
+            (self.num_sc_dc, NUMERICAL_STRUCT_ARRAY[::3]),
+            (self.cat_np_dc, CATEGORICAL_NP_ARRAY[::2]),
+            (self.mix_sc_dc, MIXED_ARRAY),
+            (fudd.DensityCheck(MIXED_ARRAY, distance_function=distance),
+             MIXED_ARRAY[::-1]),
+            (fudd.DensityCheck(NUMERICAL_NP_ARRAY, memory_budget=8 * 20 * 3),
+             numerical),
+            (fudd.DensityCheck(
+                NUMERICAL_NP_ARRAY, neighbour_index=fumn.KDTreeIndex()),
+             numerical)
+        ]  # yapf: disable
+        for density_check, data in density_checks:
+            for clip in [True, False]:
+                scores = density_check.score_data_points(data, clip)
+                assert scores.shape == (data.shape[0], )
+                scores_ = [
+                    density_check.score_data_point(i, clip) for i in data
+                ]
+                assert np.allclose(scores, scores_)
+        assert self.num_np_dc.score_data_points(numerical[:0]).shape == (0, )
+
+
+def _assert_window(streaming_dc, window, **kwargs):
+    """
+    Checks a ``StreamingDensityCheck`` against a ``DensityCheck``.
+    """
+    density_check = fudd.DensityCheck(window, **kwargs)
+    order = streaming_dc.window_order
+    assert sorted(order) == list(range(window.shape[0]))
+    assert np.array_equal(streaming_dc.data_set[order], window)
+    assert np.allclose(streaming_dc.distance_matrix[np.ix_(order, order)],
+                       density_check.distance_matrix)
+    assert np.allclose(streaming_dc.scores[order], density_check.scores)
+    assert np.allclose(streaming_dc._raw_scores[order],
+                       density_check._compute_scores())
+    assert streaming_dc.scores_min == pytest.approx(density_check.scores_min)
+    assert streaming_dc.scores_max == pytest.approx(density_check.scores_max)
+    assert streaming_dc._samples_number == window.shape[0]
+
+
+def test_streaming_density_check():
+    """
+    Tests the :class:`fatf.utils.data.density.StreamingDensityCheck` class.
+    """
+    with pytest.raises(TypeError) as exin:
+        fudd.StreamingDensityCheck(NUMERICAL_NP_ARRAY, window_size='42')
+    assert str(exin.value) == ('The window_size parameter has to be either '
+                               'None or an integer.')
+    with pytest.raises(ValueError) as exin:
+        fudd.StreamingDensityCheck(
+            NUMERICAL_NP_ARRAY, window_size=3, neighbours=3)
+    assert str(exin.value) == ('The window_size parameter has to be larger '
+                               'than the neighbours number.')
+
+    sdc = fudd.StreamingDensityCheck(
+        NUMERICAL_NP_ARRAY[:8], neighbours=3, normalise_scores=False)
+    assert sdc.window_size is None
+    _assert_window(
+        sdc, NUMERICAL_NP_ARRAY[:8], neighbours=3, normalise_scores=False)
+    sdc.add(NUMERICAL_NP_ARRAY[8:15])
+    _assert_window(
+        sdc, NUMERICAL_NP_ARRAY[:15], neighbours=3, normalise_scores=False)
+    sdc.evict(6)
+    _assert_window(
+        sdc, NUMERICAL_NP_ARRAY[6:15], neighbours=3, normalise_scores=False)
+    sdc.evict(0)
+    _assert_window(
+        sdc, NUMERICAL_NP_ARRAY[6:15], neighbours=3, normalise_scores=False)
+
+    with pytest.raises(TypeError) as exin:
+        sdc.evict('1')
+    assert str(exin.value) == ('The number of data points to evict has to be '
+                               'an integer.')
+    value_error = ('The number of data points to evict has to be between 0 '
+                   'and the number of data points in the window minus the '
+                   'neighbours number minus 1.')
+    for n in [-1, 6]:
+        with pytest.raises(ValueError) as exin:
+            sdc.evict(n)
+        assert str(exin.value) == value_error
+    with pytest.raises(IncorrectShapeError) as exin:
+        sdc.add(NUMERICAL_NP_ARRAY[0])
+    assert str(exin.value) == ('The data points have to be a 2-dimensional '
+                               'numpy array.')
+
+    # A bounded window
+    sdc = fudd.StreamingDensityCheck(
+        NUMERICAL_NP_ARRAY[:8], window_size=6, neighbours=2)
+    assert sdc.window_size == 6
+    _assert_window(sdc, NUMERICAL_NP_ARRAY[2:8], neighbours=2)
+    for i in range(8, 20, 3):
+        sdc.add(NUMERICAL_NP_ARRAY[i:i + 3])
+        window = NUMERICAL_NP_ARRAY[max(0, i + 3 - 6):i + 3]
+        _assert_window(sdc, window, neighbours=2)
+        scores = sdc.score_data_points(NUMERICAL_NP_ARRAY)
+        density_check = fudd.DensityCheck(window, neighbours=2)
+        assert np.allclose(scores,
+                           density_check.score_data_points(NUMERICAL_NP_ARRAY))
+    sdc.add(NUMERICAL_NP_ARRAY)
+    _assert_window(sdc, NUMERICAL_NP_ARRAY[-6:], neighbours=2)
+
+    # The bounded window is updated in place
+    distance_buffer = sdc._distance_buffer
+    sdc.add(NUMERICAL_NP_ARRAY[:2])
+    assert sdc._distance_buffer is distance_buffer
+    assert np.shares_memory(sdc.distance_matrix, distance_buffer)
+    assert np.shares_memory(sdc.data_set, sdc._data_buffer)
+    window = np.concatenate([NUMERICAL_NP_ARRAY[-4:], NUMERICAL_NP_ARRAY[:2]])
+    _assert_window(sdc, window, neighbours=2)
+
+    # Structured data and a mixed distance fitted to the initial window
+    distance = fud.MixedDistance()
+    sdc = fudd.StreamingDensityCheck(
+        MIXED_ARRAY[:6], neighbours=2, distance_function=distance)
+    sdc.add(MIXED_ARRAY[6:])
+    assert not sdc._is_distance_fitted_here
+    _assert_window(sdc, MIXED_ARRAY, neighbours=2, distance_function=mix_dist)
+    sdc.evict(3)
+    _assert_window(
+        sdc, MIXED_ARRAY[3:], neighbours=2, distance_function=mix_dist)
+    score = sdc.score_data_point(MIXED_ARRAY[0])
+    assert pytest.approx(score) == fudd.DensityCheck(
+        MIXED_ARRAY[3:], neighbours=2,
+        distance_function=mix_dist).score_data_point(MIXED_ARRAY[0])
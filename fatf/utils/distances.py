@@ -9,11 +9,18 @@ as well as for documentation examples and testing.
 # Author: Kacper Sokol <k.sokol@bristol.ac.uk>
 # License: new BSD
 
+# pylint: disable=too-many-lines
+
+import functools
 import inspect
 import logging
+import multiprocessing
+import os
+import tempfile
 import warnings
 
-from typing import Callable, Union
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Tuple,
+                    Union)
 
 import numpy as np
 
@@ -21,9 +28,10 @@ import fatf.utils.array.tools as fuat
 import fatf.utils.array.validation as fuav
 import fatf.utils.validation as fuv
 
-from fatf.exceptions import IncorrectShapeError
+from fatf.exceptions import IncorrectShapeError, UnfittedModelError
 
 __all__ = ['get_distance_matrix',
+           'get_array_distance_matrix',
            'get_point_distance',
            'euclidean_distance',
            'euclidean_point_distance',
@@ -35,14 +43,16 @@ __all__ = ['get_distance_matrix',
            'binary_distance',
            'binary_point_distance',
            'binary_array_distance',
-           'check_distance_functionality']  # yapf: disable
+           'check_distance_functionality',
+           'MixedDistance']  # yapf: disable
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 
 def _validate_get_distance(
         data_array: np.ndarray,
-        distance_function: Callable[[np.ndarray, np.ndarray], float]) -> bool:
+        distance_function: Callable[[np.ndarray, np.ndarray], float],
+        optional_second_parameter: bool = False) -> bool:
     """
     Validates ``data_array`` and ``distance_function`` parameters.
 
@@ -54,6 +64,10 @@ def _validate_get_distance(
         A Python function that takes as an input two 1-dimensional numpy arrays
         of equal length and outputs a number representing a distance between
         them.
+    optional_second_parameter : boolean, optional (default=False)
+        Whether the second parameter of the distance function may be optional,
+        e.g., the :func:`fatf.utils.distances.MixedDistance.array_distance`
+        method.
 
     Raises
     ------
@@ -81,11 +95,18 @@ def _validate_get_distance(
 
     if callable(distance_function):
         required_param_n = 0
+        positional_param_n = 0
         params = inspect.signature(distance_function).parameters
         for param in params:
             if params[param].default is params[param].empty:
                 required_param_n += 1
-        if required_param_n != 2:
+            if params[param].kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                      inspect.Parameter.POSITIONAL_OR_KEYWORD):
+                positional_param_n += 1
+        is_second_optional = (optional_second_parameter
+                              and required_param_n == 1
+                              and positional_param_n >= 2)
+        if required_param_n != 2 and not is_second_optional:
             raise AttributeError('The distance function must require exactly '
                                  '2 parameters. Given function requires {} '
                                  'parameters.'.format(required_param_n))
@@ -97,13 +118,449 @@ def _validate_get_distance(
     return is_valid
 
 
+def _validate_tiling(data_array: np.ndarray, memory_budget: Union[None, int],
+                     out: Union[None, np.ndarray]) -> bool:
+    """
+    Validates ``memory_budget`` and ``out`` parameters of the tiled engine.
+
+    Parameters
+    ----------
+    data_array : numpy.ndarray
+        A 2-dimensional numpy array for which a distance matrix is computed.
+    memory_budget : Union[None, integer]
+        Either ``None`` or the maximum number of bytes that a single block
+        (tile) of the distance matrix may occupy.
+    out : Union[None, numpy.ndarray]
+        Either ``None`` or a square numerical numpy array (possibly a
+        ``numpy.memmap``) with as many rows as the ``data_array``.
+
+    Raises
+    ------
+    IncorrectShapeError
+        The ``out`` array is not a square 2-dimensional array with the number
+        of rows equal to the number of rows in the ``data_array``.
+    TypeError
+        The ``memory_budget`` parameter is neither ``None`` nor an integer.
+        The ``out`` parameter is neither ``None`` nor a numerical numpy array.
+    ValueError
+        The ``memory_budget`` parameter is not a positive integer.
+
+    Returns
+    -------
+    is_valid : boolean
+        ``True`` if the parameters are valid, ``False`` otherwise.
+    """
+    is_valid = False
+
+    assert fuv.validate_memory_budget(memory_budget), 'Invalid memory budget.'
+
+    if out is not None:
+        if not isinstance(out, np.ndarray):
+            raise TypeError('The out parameter has to be either a numpy array '
+                            '(or a numpy memmap) or None.')
+        if fuav.is_structured_array(out) or not fuav.is_numerical_array(out):
+            raise TypeError('The out array has to be a classic, purely '
+                            'numerical numpy array.')
+        samples_number = data_array.shape[0]
+        if out.shape != (samples_number, samples_number):
+            raise IncorrectShapeError('The out array has to be a square '
+                                      'array with the same number of rows as '
+                                      'the data_array.')
+
+    is_valid = True
+    return is_valid
+
+
+def _get_block_size(samples_number: int, memory_budget: Union[None, int],
+                    itemsize: int) -> int:
+    """
+    Computes the side length of a (square) distance matrix block (tile).
+
+    Parameters
+    ----------
+    samples_number : integer
+        The number of rows in the data array.
+    memory_budget : Union[None, integer]
+        The maximum number of bytes that a single block may occupy. If
+        ``None``, the whole distance matrix is computed as a single block.
+    itemsize : integer
+        The number of bytes needed to store a single distance.
+
+    Returns
+    -------
+    block_size : integer
+        The number of rows (and columns) of a single block -- at least 1.
+    """
+    if memory_budget is None:
+        block_size = samples_number
+    else:
+        block_size = int(np.sqrt(memory_budget // itemsize))
+        block_size = min(max(block_size, 1), samples_number)
+    return block_size
+
+
+def _validate_n_jobs(n_jobs: int) -> bool:
+    """
+    Validates the ``n_jobs`` parameter.
+
+    Parameters
+    ----------
+    n_jobs : integer
+        The number of worker processes -- a positive integer or -1 (all of the
+        available CPUs).
+
+    Raises
+    ------
+    TypeError
+        The ``n_jobs`` parameter is not an integer.
+    ValueError
+        The ``n_jobs`` parameter is neither a positive integer nor -1.
+
+    Returns
+    -------
+    is_valid : boolean
+        ``True`` if the parameter is valid, ``False`` otherwise.
+    """
+    is_valid = False
+
+    if not isinstance(n_jobs, int) or isinstance(n_jobs, bool):
+        raise TypeError('The n_jobs parameter has to be an integer.')
+    if n_jobs < 1 and n_jobs != -1:
+        raise ValueError('The n_jobs parameter has to be a positive integer '
+                         'or -1 (to use all of the available CPUs).')
+
+    is_valid = True
+    return is_valid
+
+
+def _get_processes_number(n_jobs: int) -> int:
+    """
+    Translates the ``n_jobs`` parameter into the number of processes.
+
+    Parameters
+    ----------
+    n_jobs : integer
+        The number of worker processes -- a positive integer or -1 (all of the
+        available CPUs).
+
+    Returns
+    -------
+    processes_number : integer
+        The number of worker processes.
+    """
+    if n_jobs == -1:
+        processes_number = os.cpu_count() or 1
+    else:
+        processes_number = n_jobs
+    return processes_number
+
+
+# The state of a worker process used by the parallel distance computations:
+# the (memory-mapped) data array and the function applied to every task
+_WORKER_STATE = dict()  # type: Dict[str, Any]
+
+
+def _initialise_worker(
+        data_file: str,
+        task_function: Callable[[np.ndarray, Any], Any]) -> None:
+    """
+    Initialises a worker process with a memory-mapped data array.
+
+    Parameters
+    ----------
+    data_file : string
+        A path to a ``.npy`` file holding the data array, which is memory
+        mapped (in a read-only mode) rather than copied into the worker.
+    task_function : Callable[[numpy.ndarray, task], result]
+        A function that computes the result of a single task given the data
+        array and the task description.
+    """
+    _WORKER_STATE['data_array'] = np.load(data_file, mmap_mode='r')
+    _WORKER_STATE['task_function'] = task_function
+
+
+def _run_worker_task(task: Any) -> Any:
+    """
+    Runs a single task in a worker process.
+
+    Parameters
+    ----------
+    task : object
+        A (small) description of the task, e.g., indices of a block of rows.
+
+    Returns
+    -------
+    result : object
+        The result of the task function.
+    """
+    return _WORKER_STATE['task_function'](_WORKER_STATE['data_array'], task)
+
+
+def _parallel_map(data_array: np.ndarray,
+                  task_function: Callable[[np.ndarray, Any], Any],
+                  tasks: List[Any], n_jobs: int) -> Iterator[Any]:
+    """
+    Applies the ``task_function`` to every task using a pool of processes.
+
+    The ``data_array`` is saved to a temporary ``.npy`` file, which every
+    worker process memory maps, therefore the data are not pickled with every
+    task -- only the (small) task descriptions are sent to the workers. The
+    results are yielded in the order of the ``tasks``, regardless of the
+    number of workers, hence the output is deterministic.
+
+    .. note::
+       The ``task_function`` -- and hence the user-provided distance function
+       -- has to be picklable when processes are spawned rather than forked,
+       e.g., on Windows and macOS.
+
+    Parameters
+    ----------
+    data_array : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured) shared with
+        all of the worker processes.
+    task_function : Callable[[numpy.ndarray, task], result]
+        A function that computes the result of a single task given the data
+        array and the task description.
+    tasks : List[task]
+        A list of task descriptions.
+    n_jobs : integer
+        The number of worker processes.
+
+    Yields
+    ------
+    result : object
+        The result of the ``task_function`` for consecutive ``tasks``.
+    """
+    with tempfile.TemporaryDirectory(prefix='fatf_') as temp_dir:
+        data_file = os.path.join(temp_dir, 'data_array.npy')
+        np.save(data_file, data_array)
+        with multiprocessing.Pool(
+                processes=n_jobs,
+                initializer=_initialise_worker,
+                initargs=(data_file, task_function)) as pool:
+            for result in pool.imap(_run_worker_task, tasks):
+                yield result
+
+
+def _pair_block_distance(
+        distance_function: Callable[[np.ndarray, np.ndarray], float],
+        block_x: np.ndarray, block_y: np.ndarray,
+        is_diagonal: bool) -> np.ndarray:
+    """
+    Computes a distance matrix block with a point-to-point distance function.
+
+    Parameters
+    ----------
+    distance_function : Callable[[numpy.ndarray, numpy.ndarray], number]
+        A Python function that takes as an input two 1-dimensional numpy arrays
+        of equal length and outputs a number representing a distance between
+        them.
+    block_x : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured) with the
+        rows of the block.
+    block_y : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured) with the
+        columns of the block.
+    is_diagonal : boolean
+        Whether ``block_x`` and ``block_y`` are the same array, in which case
+        only the upper triangle of the block is computed.
+
+    Returns
+    -------
+    block : numpy.ndarray
+        A ``numpy.float64`` array with distances between the rows of
+        ``block_x`` and ``block_y``.
+    """
+    block = np.zeros((block_x.shape[0], block_y.shape[0]), dtype=np.float64)
+    is_structured = fuav.is_structured_array(block_x)
+    for row_i, row in enumerate(block_x):
+        # Exploit the symmetry of the (diagonal) block
+        row_start = row_i if is_diagonal else 0
+        if is_structured:
+            for row_j in range(row_start, block_y.shape[0]):
+                block[row_i, row_j] = distance_function(row, block_y[row_j])
+        else:
+            block[row_i, row_start:] = np.apply_along_axis(
+                distance_function, 1, block_y[row_start:], row)
+    return block
+
+
+def _array_block_distance(
+        array_distance_function: Callable[[np.ndarray, np.ndarray],
+                                          np.ndarray],
+        block_x: np.ndarray, block_y: np.ndarray,
+        is_diagonal: bool) -> np.ndarray:  # yapf: disable
+    """
+    Computes a distance matrix block with an array distance function.
+
+    Parameters
+    ----------
+    array_distance_function : Callable[[numpy.ndarray, numpy.ndarray], \
+numpy.ndarray]
+        A Python function that takes as an input two 2-dimensional numpy arrays
+        of equal width and outputs a distance matrix between all pairs of
+        their rows.
+    block_x : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured) with the
+        rows of the block.
+    block_y : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured) with the
+        columns of the block.
+    is_diagonal : boolean
+        Whether ``block_x`` and ``block_y`` are the same array. (Ignored as the
+        full block is computed in a vectorised fashion anyway.)
+
+    Returns
+    -------
+    block : numpy.ndarray
+        An array with distances between the rows of ``block_x`` and
+        ``block_y``.
+    """
+    # pylint: disable=unused-argument
+    return array_distance_function(block_x, block_y)
+
+
+def _compute_tile(
+        block_distance_function: Callable[[np.ndarray, np.ndarray, bool],
+                                          np.ndarray],
+        data_array: np.ndarray,
+        tile: Tuple[int, int, int, int]) -> np.ndarray:  # yapf: disable
+    """
+    Computes a single tile (block) of a distance matrix.
+
+    Parameters
+    ----------
+    block_distance_function : Callable[[numpy.ndarray, numpy.ndarray, \
+boolean], numpy.ndarray]
+        A function that computes a distance matrix between rows of its first
+        and second (2-dimensional) arguments. The third argument indicates
+        whether the block lies on the diagonal of the distance matrix.
+    data_array : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured).
+    tile : Tuple[integer, integer, integer, integer]
+        The first and the last (exclusive) row index followed by the first and
+        the last (exclusive) column index of the tile.
+
+    Returns
+    -------
+    block : numpy.ndarray
+        The distance matrix tile. Tiles on the diagonal are symmetrised using
+        their upper triangle.
+    """
+    i_start, i_end, j_start, j_end = tile
+    is_diagonal = i_start == j_start
+
+    block = block_distance_function(data_array[i_start:i_end],
+                                    data_array[j_start:j_end], is_diagonal)
+    if is_diagonal:
+        block = np.triu(block) + np.tril(block.T, -1)
+
+    return block
+
+
+def _get_distance_matrix_tiled(
+        data_array: np.ndarray,
+        block_distance_function: Callable[[np.ndarray, np.ndarray, bool],
+                                          np.ndarray],
+        memory_budget: Union[None, int] = None,
+        out: Union[None, np.ndarray] = None,
+        n_jobs: int = 1) -> np.ndarray:  # yapf: disable
+    """
+    Computes a distance matrix for the ``data_array`` one block at a time.
+
+    The distance matrix is split into square blocks (tiles) whose size is
+    bound by the ``memory_budget``. Since the distance matrix is symmetric,
+    only the blocks on and above the diagonal are computed -- the blocks below
+    the diagonal are filled in by transposing their mirror images. The blocks
+    are written directly into the ``out`` array, which may be a
+    ``numpy.memmap``, therefore the full distance matrix never has to be held
+    in memory. The blocks can be computed in parallel by a pool of processes
+    (see the ``n_jobs`` parameter).
+
+    Parameters
+    ----------
+    data_array : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured).
+    block_distance_function : Callable[[numpy.ndarray, numpy.ndarray, \
+boolean], numpy.ndarray]
+        A function that computes a distance matrix between rows of its first
+        and second (2-dimensional) arguments. The third argument indicates
+        whether the block lies on the diagonal of the distance matrix, i.e.,
+        the two arrays are the same, in which case only the upper triangle of
+        the returned block has to be valid.
+    memory_budget : integer, optional (default=None)
+        The maximum number of bytes that a single block may occupy. If
+        ``None``, the distance matrix is computed as a single block (or as
+        many blocks as needed to keep all of the worker processes busy).
+    out : numpy.ndarray, optional (default=None)
+        A square numerical array to be filled with the distances. If ``None``,
+        a new ``numpy.float64`` array is allocated.
+    n_jobs : integer, optional (default=1)
+        The number of worker processes used to compute the blocks (-1 uses
+        all of the available CPUs).
+
+    Returns
+    -------
+    distances : numpy.ndarray
+        A square numerical numpy array with distances between all pairs of data
+        points (rows) in the ``data_array`` -- the ``out`` array if one was
+        given.
+    """
+    # pylint: disable=too-many-locals
+    samples_number = data_array.shape[0]
+    if out is None:
+        distances = np.zeros((samples_number, samples_number),
+                             dtype=np.float64)
+    else:
+        distances = out
+
+    processes_number = _get_processes_number(n_jobs)
+    block_size = _get_block_size(samples_number, memory_budget,
+                                 distances.dtype.itemsize)
+    if processes_number > 1:
+        # Split the rows such that all of the workers have something to do
+        balanced_block_size = -(-samples_number // (2 * processes_number))
+        block_size = max(1, min(block_size, balanced_block_size))
+    logger.debug('Computing the distance matrix in blocks of size %d.',
+                 block_size)
+
+    tiles = []
+    for i_start in range(0, samples_number, block_size):
+        i_end = min(i_start + block_size, samples_number)
+        for j_start in range(i_start, samples_number, block_size):
+            j_end = min(j_start + block_size, samples_number)
+            tiles.append((i_start, i_end, j_start, j_end))
+
+    task_function = functools.partial(_compute_tile, block_distance_function)
+    if processes_number > 1 and len(tiles) > 1:
+        blocks = _parallel_map(data_array, task_function, tiles,
+                               processes_number)
+    else:
+        blocks = (task_function(data_array, tile) for tile in tiles)
+
+    for (i_start, i_end, j_start, j_end), block in zip(tiles, blocks):
+        distances[i_start:i_end, j_start:j_end] = block
+        if i_start != j_start:
+            distances[j_start:j_end, i_start:i_end] = block.T
+
+    return distances
+
+
 def get_distance_matrix(
         data_array: np.ndarray,
-        distance_function: Callable[[np.ndarray, np.ndarray], float]
-) -> np.ndarray:
+        distance_function: Callable[[np.ndarray, np.ndarray], float],
+        memory_budget: Optional[int] = None,
+        out: Optional[np.ndarray] = None,
+        n_jobs: int = 1) -> np.ndarray:
     """
     Computes a distance matrix (2-D) between all rows of the ``data_array``.
 
+    .. versionchanged:: 0.1.1
+       The distance matrix is computed block by block and only its upper
+       triangle is evaluated. The blocks can be computed by a pool of
+       processes. The ``memory_budget``, ``out`` and ``n_jobs`` parameters
+       have been added.
+
     Parameters
     ----------
     data_array : numpy.ndarray
@@ -114,54 +571,154 @@ def get_distance_matrix(
         of equal length and outputs a number representing a distance between
         them. **The distance function is assumed to return the same distance
         regardless of the order in which parameters are given.**
+    memory_budget : integer, optional (default=None)
+        The maximum number of bytes that a single block (tile) of the distance
+        matrix may occupy. If ``None``, the distance matrix is computed as a
+        single block.
+    out : numpy.ndarray, optional (default=None)
+        A square numerical numpy array -- e.g., a ``numpy.memmap`` -- with as
+        many rows as the ``data_array``, into which the distances will be
+        written. If ``None``, a new ``numpy.float64`` array is allocated.
+    n_jobs : integer, optional (default=1)
+        The number of processes used to compute the distance matrix (-1 uses
+        all of the available CPUs). The ``data_array`` is shared with the
+        worker processes via a memory-mapped file and the result does not
+        depend on the number of workers. When processes are spawned rather
+        than forked (e.g., on Windows and macOS) the ``distance_function``
+        has to be picklable, i.e., defined at the top level of a module.
 
     Raises
     ------
     AttributeError
         The distance function does not require exactly two parameters.
     IncorrectShapeError
-        The data array is not a 2-dimensional numpy array.
+        The data array is not a 2-dimensional numpy array. The ``out`` array is
+        not square or its size does not agree with the number of rows in the
+        data array.
     TypeError
         The data array is not of a base type (numbers and/or strings). The
-        distance function is not a Python callable (function).
+        distance function is not a Python callable (function). The
+        ``memory_budget`` parameter is neither ``None`` nor an integer. The
+        ``out`` parameter is neither ``None`` nor a numerical numpy array. The
+        ``n_jobs`` parameter is not an integer.
+    ValueError
+        The ``memory_budget`` parameter is not a positive integer. The
+        ``n_jobs`` parameter is neither a positive integer nor -1.
 
     Returns
     -------
     distances : numpy.ndarray
         A square numerical numpy array with distances between all pairs of data
-        points (rows) in the ``data_array``.
+        points (rows) in the ``data_array``. If the ``out`` array is given, it
+        is filled in and returned.
     """
     assert _validate_get_distance(data_array,
                                   distance_function), 'Invalid input.'
+    assert _validate_tiling(data_array, memory_budget, out), 'Invalid input.'
+    assert _validate_n_jobs(n_jobs), 'Invalid input.'
 
-    if fuav.is_structured_array(data_array):
-        distances = np.zeros((data_array.shape[0], data_array.shape[0]),
-                             dtype=np.float64)
-        for row_i in range(data_array.shape[0]):
-            for row_j in range(row_i, data_array.shape[0]):
-                dist = distance_function(data_array[row_i], data_array[row_j])
-                distances[row_i, row_j] = dist
-                distances[row_j, row_i] = dist
-    else:
+    block_distance_function = functools.partial(_pair_block_distance,
+                                                distance_function)
+    distances = _get_distance_matrix_tiled(data_array, block_distance_function,
+                                           memory_budget, out, n_jobs)
+
+    return distances
 
-        def ddf(one_d, two_d):
-            return np.apply_along_axis(distance_function, 1, two_d, one_d)
 
-        distances = np.apply_along_axis(ddf, 1, data_array, data_array)
+def get_array_distance_matrix(
+        data_array: np.ndarray,
+        array_distance_function: Callable[[np.ndarray, np.ndarray],
+                                          np.ndarray],
+        memory_budget: Optional[int] = None,
+        out: Optional[np.ndarray] = None) -> np.ndarray:  # yapf: disable
+    """
+    Computes a distance matrix with a vectorised (array) distance function.
+
+    .. versionadded:: 0.1.1
+
+    This function is the counterpart of the
+    :func:`fatf.utils.distances.get_distance_matrix` function for distance
+    functions that operate on whole arrays, e.g.,
+    :func:`fatf.utils.distances.euclidean_array_distance` or
+    :func:`fatf.utils.distances.binary_array_distance`. The distance matrix
+    is computed block by block (with the block size bound by the
+    ``memory_budget``) and only the blocks on and above its diagonal are
+    evaluated -- the rest is filled in by symmetry. Passing a
+    ``numpy.memmap`` via the ``out`` parameter allows to compute distance
+    matrices that do not fit in memory.
+
+    Parameters
+    ----------
+    data_array : numpy.ndarray
+        A 2-dimensional numpy array for which row-to-row distances will be
+        computed.
+    array_distance_function : Callable[[numpy.ndarray, numpy.ndarray], \
+numpy.ndarray]
+        A Python function that takes as an input two 2-dimensional numpy arrays
+        of equal width and outputs a distance matrix between all pairs of
+        their rows. Its second parameter may be optional, e.g., the
+        :func:`fatf.utils.distances.MixedDistance.array_distance` method.
+        **The distance function is assumed to return the same distance
+        regardless of the order in which parameters are given.**
+    memory_budget : integer, optional (default=None)
+        The maximum number of bytes that a single block (tile) of the distance
+        matrix may occupy. If ``None``, the distance matrix is computed as a
+        single block.
+    out : numpy.ndarray, optional (default=None)
+        A square numerical numpy array -- e.g., a ``numpy.memmap`` -- with as
+        many rows as the ``data_array``, into which the distances will be
+        written. If ``None``, a new ``numpy.float64`` array is allocated.
+
+    Raises
+    ------
+    AttributeError
+        The distance function does not require exactly two parameters.
+    IncorrectShapeError
+        The data array is not a 2-dimensional numpy array. The ``out`` array is
+        not square or its size does not agree with the number of rows in the
+        data array.
+    TypeError
+        The data array is not of a base type (numbers and/or strings). The
+        distance function is not a Python callable (function). The
+        ``memory_budget`` parameter is neither ``None`` nor an integer. The
+        ``out`` parameter is neither ``None`` nor a numerical numpy array.
+    ValueError
+        The ``memory_budget`` parameter is not a positive integer.
+
+    Returns
+    -------
+    distances : numpy.ndarray
+        A square numerical numpy array with distances between all pairs of data
+        points (rows) in the ``data_array``. If the ``out`` array is given, it
+        is filled in and returned.
+    """
+    assert _validate_get_distance(
+        data_array, array_distance_function,
+        optional_second_parameter=True), 'Invalid input.'
+    assert _validate_tiling(data_array, memory_budget, out), 'Invalid input.'
+
+    block_distance_function = functools.partial(_array_block_distance,
+                                                array_distance_function)
+    distances = _get_distance_matrix_tiled(data_array, block_distance_function,
+                                           memory_budget, out)
 
     return distances
 
 
 def get_point_distance(
-        data_array: np.ndarray, data_point: Union[np.ndarray, np.void],
-        distance_function: Callable[[np.ndarray, np.ndarray], float]
-) -> np.ndarray:
+        data_array: np.ndarray,
+        data_point: Union[np.ndarray, np.void],
+        distance_function: Callable[[np.ndarray, np.ndarray], float],
+        n_jobs: int = 1) -> np.ndarray:
     """
     Computes the distance between a data point and an array of data.
 
     This function computes the distances between the ``data_point`` and all
     rows of the ``data_array``.
 
+    .. versionchanged:: 0.1.1
+       The ``n_jobs`` parameter has been added.
+
     Parameters
     ----------
     data_array : numpy.ndarray
@@ -175,6 +732,13 @@ def get_point_distance(
         of equal length and outputs a number representing a distance between
         them. **The distance function is assumed to return the same distance
         regardless of the order in which parameters are given.**
+    n_jobs : integer, optional (default=1)
+        The number of processes used to compute the distances (-1 uses all of
+        the available CPUs). The rows of the ``data_array`` are split into
+        contiguous chunks, which are shared with the worker processes via a
+        memory-mapped file. When processes are spawned rather than forked
+        (e.g., on Windows and macOS) the ``distance_function`` has to be
+        picklable, i.e., defined at the top level of a module.
 
     Raises
     ------
@@ -187,7 +751,10 @@ def get_point_distance(
     TypeError
         The data array or the data point is not of a base type (numbers and/or
         strings). The data point and the data array have incomparable dtypes.
-        The distance function is not a Python callable (function).
+        The distance function is not a Python callable (function). The
+        ``n_jobs`` parameter is not an integer.
+    ValueError
+        The ``n_jobs`` parameter is neither a positive integer nor -1.
 
     Returns
     -------
@@ -197,6 +764,7 @@ def get_point_distance(
     """
     assert _validate_get_distance(data_array,
                                   distance_function), 'Invalid input.'
+    assert _validate_n_jobs(n_jobs), 'Invalid input.'
 
     is_structured = fuav.is_structured_array(data_array)
 
@@ -218,12 +786,60 @@ def get_point_distance(
             raise IncorrectShapeError('The data point has different number of '
                                       'columns (features) than the data set.')
 
-    if is_structured:
-        distances = np.zeros((data_array.shape[0], ), dtype=np.float64)
-        for row_i in range(data_array.shape[0]):
-            distances[row_i] = distance_function(data_array[row_i], data_point)
+    samples_number = data_array.shape[0]
+    processes_number = min(_get_processes_number(n_jobs), samples_number)
+    if processes_number > 1:
+        chunk_size = -(-samples_number // processes_number)
+        chunks = [(i, min(i + chunk_size, samples_number))
+                  for i in range(0, samples_number, chunk_size)]
+        task_function = functools.partial(_point_chunk_distance,
+                                          distance_function, data_point)
+        distances = np.concatenate(
+            list(
+                _parallel_map(data_array, task_function, chunks,
+                              processes_number)))
+    else:
+        distances = _point_chunk_distance(distance_function, data_point,
+                                          data_array, (0, samples_number))
+
+    return distances
+
+
+def _point_chunk_distance(
+        distance_function: Callable[[np.ndarray, np.ndarray], float],
+        data_point: Union[np.ndarray, np.void], data_array: np.ndarray,
+        chunk: Tuple[int, int]) -> np.ndarray:
+    """
+    Computes distances between a data point and a chunk of rows of an array.
+
+    Parameters
+    ----------
+    distance_function : Callable[[numpy.ndarray, numpy.ndarray], number]
+        A Python function that takes as an input two 1-dimensional numpy arrays
+        of equal length and outputs a number representing a distance between
+        them.
+    data_point : Union[numpy.ndarray, numpy.void]
+        A 1-dimensional numpy array or numpy void (for structured data points).
+    data_array : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured).
+    chunk : Tuple[integer, integer]
+        The first and the last (exclusive) index of the rows of the
+        ``data_array`` for which the distances are computed.
+
+    Returns
+    -------
+    distances : numpy.ndarray
+        A 1-dimensional numerical numpy array with distances between
+        ``data_point`` and the selected rows of the ``data_array``.
+    """
+    chunk_array = data_array[chunk[0]:chunk[1]]
+    if fuav.is_structured_array(chunk_array):
+        distances = np.zeros((chunk_array.shape[0], ), dtype=np.float64)
+        for row_i in range(chunk_array.shape[0]):
+            distances[row_i] = distance_function(chunk_array[row_i],
+                                                 data_point)
     else:
-        distances = np.apply_along_axis(distance_function, 1, data_array,
+        distances = np.apply_along_axis(distance_function, 1, chunk_array,
                                         data_point)
 
     return distances
@@ -337,19 +953,147 @@ def euclidean_point_distance(y: Union[np.ndarray, np.void],
     return distances
 
 
-def euclidean_array_distance(X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+def _squared_euclidean_array_distance(
+        X: np.ndarray,
+        Y: np.ndarray,
+        float32: bool = False,
+        X_squared: Optional[np.ndarray] = None,
+        Y_squared: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Computes the squared Euclidean distance matrix between ``X`` and ``Y``.
+
+    The distances are calculated with the
+    :math:`||x||^2 + ||y||^2 - 2x \\cdot y` identity, therefore the dominant
+    cost -- the dot product of the two arrays -- is delegated to BLAS.
+    Numerical errors may cause the squared distances to be slightly negative,
+    hence they are clamped at 0. The identity suffers from catastrophic
+    cancellation for pairs of points that are very close to each other
+    (relative to their norms), e.g., duplicates, therefore these distances are
+    recomputed directly -- in chunks whose size is bound by the size of the
+    distance matrix, hence the ``memory_budget`` of a tiled computation is
+    respected even for data with many duplicates.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        A 2-dimensional, unstructured and purely numerical numpy array.
+    Y : numpy.ndarray
+        A 2-dimensional, unstructured and purely numerical numpy array with the
+        same number of columns as ``X``.
+    float32 : boolean, optional (default=False)
+        Whether to carry out the computation (and return the distances) in
+        single (``numpy.float32``) instead of double (``numpy.float64``)
+        precision.
+    X_squared : numpy.ndarray, optional (default=None)
+        Precomputed squared norms of the rows of ``X``. If ``None``, they are
+        computed.
+    Y_squared : numpy.ndarray, optional (default=None)
+        Precomputed squared norms of the rows of ``Y``. If ``None``, they are
+        computed.
+
+    Returns
+    -------
+    distance_matrix : numpy.ndarray
+        A matrix of squared Euclidean distances between rows in ``X`` and
+        ``Y``.
+    """
+    # pylint: disable=invalid-name,too-many-locals
+    assert fuav.is_2d_array(X) and not fuav.is_structured_array(X), \
+        'X has to be a 2-dimensional unstructured array.'
+    assert fuav.is_2d_array(Y) and not fuav.is_structured_array(Y), \
+        'Y has to be a 2-dimensional unstructured array.'
+    assert X.shape[1] == Y.shape[1], 'X and Y must have the same width.'
+
+    dtype = np.float32 if float32 else np.float64
+    X_float = X.astype(dtype, copy=False)  # pylint: disable=invalid-name
+    Y_float = Y.astype(dtype, copy=False)  # pylint: disable=invalid-name
+
+    if X_squared is None:
+        X_squared = np.einsum('ij,ij->i', X_float, X_float)
+    if Y_squared is None:
+        Y_squared = np.einsum('ij,ij->i', Y_float, Y_float)
+
+    distance_matrix = np.dot(X_float, Y_float.T)
+    distance_matrix *= -2
+    distance_matrix += X_squared[:, np.newaxis]
+    distance_matrix += Y_squared[np.newaxis, :]
+
+    # Recompute distances that are dominated by the cancellation error
+    tolerance = np.sqrt(np.finfo(dtype).eps)
+    squared_norms = X_squared[:, np.newaxis] + Y_squared[np.newaxis, :]
+    X_close, Y_close = np.nonzero(distance_matrix <= tolerance * squared_norms)
+    del squared_norms
+    # The differences are computed in chunks that are no larger than the
+    # distance matrix itself, therefore the memory bound of a tile is kept
+    chunk_size = max(1, distance_matrix.size // max(1, X.shape[1]))
+    for chunk_start in range(0, X_close.size, chunk_size):
+        X_chunk = X_close[chunk_start:chunk_start + chunk_size]
+        Y_chunk = Y_close[chunk_start:chunk_start + chunk_size]
+        difference = X_float[X_chunk] - Y_float[Y_chunk]
+        distance_matrix[X_chunk, Y_chunk] = np.einsum('ij,ij->i', difference,
+                                                      difference)
+
+    np.maximum(distance_matrix, 0, out=distance_matrix)
+
+    return distance_matrix
+
+
+def _euclidean_array_distance(X: np.ndarray,
+                              Y: np.ndarray,
+                              float32: bool = False) -> np.ndarray:
+    """
+    Computes the Euclidean distance matrix between rows in ``X`` and ``Y``.
+
+    See the :func:`fatf.utils.distances._squared_euclidean_array_distance`
+    function for the details of the computation.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        A 2-dimensional, unstructured and purely numerical numpy array.
+    Y : numpy.ndarray
+        A 2-dimensional, unstructured and purely numerical numpy array with the
+        same number of columns as ``X``.
+    float32 : boolean, optional (default=False)
+        Whether to carry out the computation (and return the distances) in
+        single (``numpy.float32``) instead of double (``numpy.float64``)
+        precision.
+
+    Returns
+    -------
+    distance_matrix : numpy.ndarray
+        A matrix of Euclidean distances between rows in ``X`` and ``Y``.
+    """
+    # pylint: disable=invalid-name
+    distance_matrix = _squared_euclidean_array_distance(X, Y, float32)
+    np.sqrt(distance_matrix, out=distance_matrix)
+    return distance_matrix
+
+
+def euclidean_array_distance(X: np.ndarray,
+                             Y: np.ndarray,
+                             float32: bool = False) -> np.ndarray:
     """
     Calculates the Euclidean distance matrix between rows in ``X`` and ``Y``.
 
     Both ``X`` and ``Y`` have to be 2-dimensional numerical numpy arrays of the
     same width.
 
+    .. versionchanged:: 0.1.1
+       The distance matrix is computed in a vectorised fashion (with the
+       :math:`||x||^2 + ||y||^2 - 2x \\cdot y` identity) rather than row by
+       row. The ``float32`` parameter has been added.
+
     Parameters
     ----------
     X : numpy.ndarray
         A numpy array -- has to be 2-dimensional and purely numerical.
     Y : numpy.ndarray
         A numpy array -- has to be 2-dimensional and purely numerical.
+    float32 : boolean, optional (default=False)
+        Whether to compute the distances in single (``numpy.float32``) rather
+        than double (``numpy.float64``) precision. This halves the memory
+        footprint of the distance matrix at the expense of accuracy.
 
     Raises
     ------
@@ -385,8 +1129,8 @@ def euclidean_array_distance(X: np.ndarray, Y: np.ndarray) -> np.ndarray:
                                   'should the same as the number of columns '
                                   'in Y array.')
 
-    distance_matrix = np.apply_along_axis(euclidean_point_distance, 1, X_array,
-                                          Y_array)
+    distance_matrix = _euclidean_array_distance(
+        X_array, Y_array, float32=float32)
 
     return distance_matrix
 
@@ -456,12 +1200,142 @@ def hamming_distance_base(x: str,
     return distance
 
 
+def _get_code_points(array: np.ndarray, dtype: np.dtype,
+                     code_dtype: np.dtype) -> np.ndarray:
+    """
+    Views a 2-dimensional fixed-width string array as an array of code points.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        A 2-dimensional, unstructured, textual numpy array.
+    dtype : numpy.dtype
+        The fixed-width string dtype (``U`` or ``S``) to which the ``array`` is
+        cast before being viewed as code points.
+    code_dtype : numpy.dtype
+        The unsigned integer dtype of a single code point (character).
+
+    Returns
+    -------
+    code_points : numpy.ndarray
+        A 3-dimensional array of code points whose last dimension indexes the
+        characters of each string; shorter strings are padded with zeros.
+    """
+    cast_array = np.ascontiguousarray(array.astype(dtype))
+    code_points = cast_array.view(code_dtype).reshape(
+        array.shape + (dtype.itemsize // code_dtype.itemsize, ))
+    return code_points
+
+
+def _hamming_array_distance(X: np.ndarray,
+                            Y: np.ndarray,
+                            normalise: bool = False,
+                            equal_length: bool = False) -> np.ndarray:
+    """
+    Computes the Hamming distance matrix between rows of two string arrays.
+
+    This is a vectorised equivalent of summing
+    :func:`fatf.utils.distances.hamming_distance_base` over all pairs of
+    corresponding cells. Fixed-width strings are viewed as arrays of code
+    points (zero-padded to a common width), hence each character position is
+    compared for all pairs of rows at once. If the strings are of a different
+    length they are compared up to the shorter one's length and the distance
+    between them is increased by their difference in length.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        A 2-dimensional, unstructured, textual numpy array.
+    Y : numpy.ndarray
+        A 2-dimensional, unstructured, textual numpy array of the same width as
+        ``X``.
+    normalise : boolean, optional (default=False)
+        Normalises the distance between every pair of strings by the length of
+        the longer one. (The distance between two empty strings is 0.)
+    equal_length : boolean, optional (default=False)
+        Forces all of the compared strings to be of equal length -- raises
+        exception if they are not.
+
+    Raises
+    ------
+    ValueError
+        Some of the compared strings differ in length when ``equal_length``
+        parameter is set to ``True``.
+
+    Returns
+    -------
+    distance_matrix : numpy.ndarray
+        A matrix of Hamming distances between rows in ``X`` and ``Y`` --
+        integers if ``normalise`` is ``False`` and floats otherwise.
+    """
+    # pylint: disable=invalid-name,too-many-locals
+    assert fuav.is_2d_array(X) and fuav.is_2d_array(Y), 'Must be 2D.'
+    assert X.shape[1] == Y.shape[1], 'The arrays must be of the same width.'
+
+    # Bytes are only compared directly if both arrays hold bytes, otherwise
+    # both arrays are cast to unicode
+    if X.dtype.kind == 'S' and Y.dtype.kind == 'S':
+        kind, code_dtype = 'S', np.dtype(np.uint8)
+    else:
+        kind, code_dtype = 'U', np.dtype(np.uint32)
+
+    def get_width(array):
+        width = array.dtype.itemsize
+        if array.dtype.kind == 'U':
+            width //= 4
+        return width
+
+    width = max(get_width(X), get_width(Y), 1)
+    dtype = np.dtype('{}{}'.format(kind, width))
+
+    X_codes = _get_code_points(X, dtype, code_dtype)
+    Y_codes = _get_code_points(Y, dtype, code_dtype)
+    X_lengths = np.char.str_len(X.astype(dtype))
+    Y_lengths = np.char.str_len(Y.astype(dtype))
+
+    distance_type = np.float64 if normalise else np.int64
+    distance_matrix = np.zeros((X.shape[0], Y.shape[0]), dtype=distance_type)
+    for column in range(X.shape[1]):
+        x_lengths = X_lengths[:, column, np.newaxis]
+        y_lengths = Y_lengths[np.newaxis, :, column]
+        min_lengths = np.minimum(x_lengths, y_lengths)
+
+        distances = np.abs(x_lengths - y_lengths).astype(np.int64)
+        if equal_length and distances.any():
+            raise ValueError('Input strings differ in length and the '
+                             'equal_length parameter forces them to be of '
+                             'equal length.')
+
+        min_length = min_lengths.max() if min_lengths.size else 0
+        for character in range(min_length):
+            mismatch = np.not_equal(X_codes[:, np.newaxis, column, character],
+                                    Y_codes[np.newaxis, :, column, character])
+            # Only the positions present in both strings are compared
+            mismatch &= character < min_lengths
+            distances += mismatch
+
+        if normalise:
+            max_lengths = np.maximum(x_lengths, y_lengths)
+            distances = np.divide(
+                distances,
+                max_lengths,
+                out=np.zeros(distances.shape, dtype=np.float64),
+                where=max_lengths > 0)
+        distance_matrix += distances
+
+    return distance_matrix
+
+
 def hamming_distance(x: Union[np.ndarray, np.void],
                      y: Union[np.ndarray, np.void],
                      **kwargs: bool) -> Union[int, float]:
     """
     Computes the Hamming distance between 1-dimensional non-numerical arrays.
 
+    .. versionchanged:: 0.1.1
+       The distance is computed in a vectorised fashion by viewing the
+       fixed-width strings as arrays of code points.
+
     Each of the input arrays can be either a 1D numpy array or a row of a
     structured numpy array, i.e. numpy's void.
 
@@ -472,9 +1346,9 @@ def hamming_distance(x: Union[np.ndarray, np.void],
     y : Union[numpy.ndarray, numpy.void]
         The second numpy array (has to be 1-dimensional and non-numerical).
     **kwargs : boolean
-        Keyword arguments that are passed to the
-        :func:`fatf.utils.distances.hamming_distance_base` function responsible
-        for calculating the Hamming distance.
+        The ``normalise`` and ``equal_length`` keyword arguments, which have
+        the same meaning as for the
+        :func:`fatf.utils.distances.hamming_distance_base` function.
 
     Raises
     ------
@@ -508,12 +1382,8 @@ def hamming_distance(x: Union[np.ndarray, np.void],
         raise IncorrectShapeError('The x and y arrays should have the same '
                                   'length.')
 
-    def kw_hamming_distance(vec):
-        return hamming_distance_base(vec[0], vec[1], **kwargs)
-
-    distance = np.apply_along_axis(kw_hamming_distance, 0,
-                                   np.vstack((x_array, y_array)))
-    distance = distance.sum()
+    distance = _hamming_array_distance(
+        x_array.reshape(1, -1), y_array.reshape(1, -1), **kwargs)[0, 0]
     return distance
 
 
@@ -522,6 +1392,10 @@ def hamming_point_distance(y: Union[np.ndarray, np.void], X: np.ndarray,
     """
     Calculates the Hamming distance between ``y`` and every row of ``X``.
 
+    .. versionchanged:: 0.1.1
+       The distance is computed in a vectorised fashion by viewing the
+       fixed-width strings as arrays of code points.
+
     ``y`` has to be a 1-dimensional numerical numpy array or a row of a
     structured numpy array (i.e. numpy's void) and ``X`` has to be a
     2-dimensional numerical numpy array. The length of ``y`` has to be the same
@@ -536,9 +1410,9 @@ def hamming_point_distance(y: Union[np.ndarray, np.void], X: np.ndarray,
         A numpy array (has to be 2-dimensional and non-numerical) to which
         rows the distances are calculated.
     **kwargs : boolean
-        Keyword arguments that are passed to the
-        :func:`fatf.utils.distances.hamming_distance_base` function responsible
-        for calculating the Hamming distance.
+        The ``normalise`` and ``equal_length`` keyword arguments, which have
+        the same meaning as for the
+        :func:`fatf.utils.distances.hamming_distance_base` function.
 
     Raises
     ------
@@ -574,8 +1448,8 @@ def hamming_point_distance(y: Union[np.ndarray, np.void], X: np.ndarray,
                                   'should the same as the number of elements '
                                   'in the y array.')
 
-    distances = np.apply_along_axis(hamming_distance, 1, X_array, y_array,
-                                    **kwargs)
+    distances = _hamming_array_distance(X_array, y_array.reshape(1, -1),
+                                        **kwargs)[:, 0]
     return distances
 
 
@@ -584,6 +1458,10 @@ def hamming_array_distance(X: np.ndarray, Y: np.ndarray,
     """
     Calculates the Hamming distance matrix between rows in ``X`` and ``Y``.
 
+    .. versionchanged:: 0.1.1
+       The distance is computed in a vectorised fashion by viewing the
+       fixed-width strings as arrays of code points.
+
     Both ``X`` and ``Y`` have to be 2-dimensional numerical numpy arrays of the
     same width.
 
@@ -594,9 +1472,9 @@ def hamming_array_distance(X: np.ndarray, Y: np.ndarray,
     Y : numpy.ndarray
         A numpy array -- has to be 2-dimensional and non-numerical.
     **kwargs : boolean
-        Keyword arguments that are passed to the
-        :func:`fatf.utils.distances.hamming_distance_base` function responsible
-        for calculating the Hamming distance.
+        The ``normalise`` and ``equal_length`` keyword arguments, which have
+        the same meaning as for the
+        :func:`fatf.utils.distances.hamming_distance_base` function.
 
     Raises
     ------
@@ -632,8 +1510,7 @@ def hamming_array_distance(X: np.ndarray, Y: np.ndarray,
                                   'should the same as the number of columns '
                                   'in Y array.')
 
-    distance_matrix = np.apply_along_axis(hamming_point_distance, 1, X_array,
-                                          Y_array, **kwargs)
+    distance_matrix = _hamming_array_distance(X_array, Y_array, **kwargs)
     return distance_matrix
 
 
@@ -751,8 +1628,84 @@ def binary_point_distance(y: Union[np.ndarray, np.void], X: np.ndarray,
     return distances
 
 
-def binary_array_distance(X: np.ndarray, Y: np.ndarray,
-                          **kwargs: bool) -> np.ndarray:
+def _get_columns(array: np.ndarray) -> List[np.ndarray]:
+    """
+    Splits a 2-dimensional (structured or classic) array into its columns.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured).
+
+    Returns
+    -------
+    columns : List[numpy.ndarray]
+        A list of 1-dimensional numpy arrays -- one per column of the input
+        ``array`` -- ordered as the columns (fields) of the ``array``.
+    """
+    assert fuav.is_2d_array(array), 'The array has to be 2-dimensional.'
+    if fuav.is_structured_array(array):
+        columns = [array[name] for name in array.dtype.names]
+    else:
+        columns = [array[:, i] for i in range(array.shape[1])]
+    return columns
+
+
+def _binary_array_distance(X: np.ndarray,
+                           Y: np.ndarray,
+                           normalise: bool = False,
+                           float32: bool = False) -> np.ndarray:
+    """
+    Computes the binary distance matrix between rows in ``X`` and ``Y``.
+
+    The distance matrix is accumulated column by column -- values in every
+    column of ``X`` are compared against all of the values in the
+    corresponding column of ``Y`` at once with numpy broadcasting. Since the
+    columns are processed independently, structured arrays with mixed column
+    types do not need to be converted into a classic numpy array.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured).
+    Y : numpy.ndarray
+        A 2-dimensional numpy array (either classic or structured) with the
+        same number of columns as ``X``.
+    normalise : boolean, optional (default=False)
+        Whether to normalise the binary distances using the number of columns.
+    float32 : boolean, optional (default=False)
+        Whether to return normalised distances in single (``numpy.float32``)
+        instead of double (``numpy.float64``) precision. Unnormalised distances
+        are always integers.
+
+    Returns
+    -------
+    distance_matrix : numpy.ndarray
+        A matrix of binary distances between rows in ``X`` and ``Y``.
+    """
+    # pylint: disable=invalid-name
+    X_columns = _get_columns(X)
+    Y_columns = _get_columns(Y)
+    assert len(X_columns) == len(Y_columns), \
+        'X and Y must have the same number of columns.'
+
+    distance_matrix = np.zeros((X.shape[0], Y.shape[0]), dtype=np.int64)
+    for X_column, Y_column in zip(X_columns, Y_columns):
+        distance_matrix += (X_column[:, np.newaxis] != Y_column[np.newaxis, :])
+
+    if normalise:
+        logger.debug('Binary distance is being normalised.')
+        dtype = np.float32 if float32 else np.float64
+        distance_matrix = distance_matrix.astype(dtype)
+        distance_matrix /= len(X_columns)
+
+    return distance_matrix
+
+
+def binary_array_distance(X: np.ndarray,
+                          Y: np.ndarray,
+                          normalise: bool = False,
+                          float32: bool = False) -> np.ndarray:
     """
     Calculates the binary distance matrix between rows in ``X`` and ``Y``.
 
@@ -763,16 +1716,25 @@ def binary_array_distance(X: np.ndarray, Y: np.ndarray,
     :func:`fatf.utils.array.validation.is_base_array` function description for
     the explanation of a base dtype.)
 
+    .. versionchanged:: 0.1.1
+       The distance matrix is computed in a vectorised fashion -- one column
+       at a time -- rather than row by row. The ``normalise`` parameter is
+       given explicitly (instead of via ``**kwargs``) and the ``float32``
+       parameter has been added.
+
     Parameters
     ----------
     X : numpy.ndarray
         A numpy array -- has to be 2-dimensional.
     Y : numpy.ndarray
         A numpy array -- has to be 2-dimensional.
-    **kwargs : boolean
-        Keyword arguments that are passed to the
-        :func:`fatf.utils.distances.binary_distance` function responsible for
-        calculating the binary distance.
+    normalise : boolean, optional (default=False)
+        Whether to normalise the binary distance using the input array width.
+        (See :func:`fatf.utils.distances.binary_distance` for more details.)
+    float32 : boolean, optional (default=False)
+        Whether to return the normalised distances in single
+        (``numpy.float32``) rather than double (``numpy.float64``) precision.
+        Unnormalised binary distances are always integers.
 
     Raises
     ------
@@ -791,18 +1753,16 @@ def binary_array_distance(X: np.ndarray, Y: np.ndarray,
     if not fuav.is_2d_array(Y):
         raise IncorrectShapeError('The Y array should be 2-dimensional.')
 
-    # Transform the arrays to unstructured
-    X_array = fuat.as_unstructured(X)
-    Y_array = fuat.as_unstructured(Y)
-
     # Compare shapes
-    if X_array.shape[1] != Y_array.shape[1]:
+    X_width = len(X.dtype.names) if fuav.is_structured_array(X) else X.shape[1]
+    Y_width = len(Y.dtype.names) if fuav.is_structured_array(Y) else Y.shape[1]
+    if X_width != Y_width:
         raise IncorrectShapeError('The number of columns in the X array '
                                   'should the same as the number of columns '
                                   'in Y array.')
 
-    distance_matrix = np.apply_along_axis(binary_point_distance, 1, X_array,
-                                          Y_array, **kwargs)
+    distance_matrix = _binary_array_distance(
+        X, Y, normalise=normalise, float32=float32)
     return distance_matrix
 
 
@@ -863,3 +1823,512 @@ numpy.ndarray]
         warnings.warn(message, category=UserWarning)
 
     return is_functional
+
+
+class MixedDistance(object):
+    """
+    Computes a distance between data points with numerical and categorical
+    features.
+
+    .. versionadded:: 0.1.1
+
+    The distance is composed of a distance between the numerical features and
+    the number of categorical features whose values differ (binary distance).
+    Three ways of combining them are available via the ``metric`` parameter:
+
+    * ``'euclidean'`` -- the Euclidean distance between the numerical features
+      plus the binary distance between the categorical features (the default
+      distance of :class:`fatf.utils.data.density.DensityCheck` and
+      :class:`fatf.utils.models.models.KNN`);
+    * ``'manhattan'`` -- the sum of absolute differences of the numerical
+      features plus the binary distance between the categorical features
+      (the default distance of
+      :class:`fatf.transparency.predictions.counterfactuals.\\
+CounterfactualExplainer`); and
+    * ``'joint_euclidean'`` -- the square root of the sum of squared
+      differences of the numerical features and the binary distance between
+      the categorical features (the normalised distance of
+      :class:`fatf.transparency.predictions.counterfactuals.\\
+CounterfactualExplainer`).
+
+    The object has to be fitted to a data set -- with the ``fit`` method --
+    before it can be used. Fitting splits the columns into numerical and
+    categorical ones (based on the ``categorical_indices`` parameter and the
+    dtype of the data), extracts the numerical features into a floating point
+    array, encodes the categorical features as integer codes and caches the
+    squared norms of the numerical part of every row. These are reused
+    whenever distances to the fitted data are computed with the
+    ``point_distance`` and ``array_distance`` methods. The object is also
+    callable with two data points, hence it can be used wherever a distance
+    function is expected, e.g., with
+    :func:`fatf.utils.distances.get_distance_matrix`.
+
+    Parameters
+    ----------
+    categorical_indices : List[column indices], optional (default=None)
+        A list of column indices that should be treated as categorical
+        features. All of the textual columns are always treated as
+        categorical. If ``None``, only the textual columns are categorical.
+    metric : string, optional (default='euclidean')
+        The way of combining numerical and categorical distances -- one of
+        ``'euclidean'``, ``'manhattan'`` or ``'joint_euclidean'``.
+
+    Raises
+    ------
+    TypeError
+        The ``categorical_indices`` parameter is neither a list nor ``None``.
+        The ``metric`` parameter is not a string.
+    ValueError
+        The ``metric`` parameter is not one of the supported metrics.
+
+    Attributes
+    ----------
+    categorical_indices : Union[None, List[column indices]]
+        The categorical column indices requested by the user.
+    metric : string
+        The way of combining numerical and categorical distances.
+    is_fitted : boolean
+        Whether the object has been fitted to a data set.
+    _is_structured : boolean
+        Whether the fitted data set is a structured array.
+    _fitted_array : numpy.ndarray
+        A single-row array with the dtype of the fitted data set.
+    _numerical_indices : numpy.ndarray
+        An array with numerical column indices of the fitted data set.
+    _categorical_indices : numpy.ndarray
+        An array with categorical column indices of the fitted data set.
+    _vocabularies : List[numpy.ndarray]
+        Sorted unique values of every categorical column of the fitted data
+        set, which define the integer encoding of these columns.
+    _numerical_data : numpy.ndarray
+        A 2-dimensional ``numpy.float64`` array with the numerical features of
+        the fitted data set.
+    _squared_norms : numpy.ndarray
+        The squared norms of the rows of ``_numerical_data``.
+    _categorical_codes : numpy.ndarray
+        A 2-dimensional integer array with the encoded categorical features of
+        the fitted data set.
+    """
+    # pylint: disable=useless-object-inheritance,too-many-instance-attributes
+
+    _METRICS = set(['euclidean', 'manhattan', 'joint_euclidean'])
+
+    def __init__(self,
+                 categorical_indices: Optional[List[Union[int, str]]] = None,
+                 metric: str = 'euclidean') -> None:
+        """
+        Initialises the mixed distance object.
+        """
+        if (categorical_indices is not None
+                and not isinstance(categorical_indices, list)):
+            raise TypeError('The categorical_indices parameter has to be '
+                            'either a list or None.')
+        if not isinstance(metric, str):
+            raise TypeError('The metric parameter has to be a string.')
+        if metric not in self._METRICS:
+            raise ValueError('The metric parameter has to be one of: '
+                             '{}.'.format(sorted(self._METRICS)))
+
+        self.categorical_indices = categorical_indices
+        self.metric = metric
+
+        self.is_fitted = False
+        self._is_structured = False
+        self._fitted_array = np.ndarray((0, 0))
+        self._numerical_indices = np.ndarray((0, ))
+        self._categorical_indices = np.ndarray((0, ))
+        self._vocabularies = []  # type: List[np.ndarray]
+        self._numerical_data = np.ndarray((0, 0))
+        self._squared_norms = np.ndarray((0, ))
+        self._categorical_codes = np.ndarray((0, 0), dtype=np.int64)
+
+    def fit(self, data_array: np.ndarray) -> None:
+        """
+        Fits the distance to a data set.
+
+        Calling this method again refits the distance to the new data set.
+
+        Parameters
+        ----------
+        data_array : numpy.ndarray
+            A 2-dimensional numpy array (either classic or structured) of a
+            base type (strings and/or numbers).
+
+        Raises
+        ------
+        IncorrectShapeError
+            The ``data_array`` is not a 2-dimensional numpy array.
+        IndexError
+            Some of the categorical indices are not valid for the
+            ``data_array``.
+        TypeError
+            The ``data_array`` is not of a base type (strings and/or numbers).
+        """
+        if not fuav.is_2d_array(data_array):
+            raise IncorrectShapeError('The data_array has to be a '
+                                      '2-dimensional numpy array.')
+        if not fuav.is_base_array(data_array):
+            raise TypeError('The data_array has to be of a base type (strings '
+                            'and/or numbers).')
+
+        numerical_indices, categorical_indices = fuat.indices_by_type(
+            data_array)
+        if self.categorical_indices is not None:
+            invalid_indices = fuat.get_invalid_indices(
+                data_array, np.asarray(self.categorical_indices)).tolist()
+            if invalid_indices:
+                raise IndexError('The following categorical indices are '
+                                 'invalid for the data array: '
+                                 '{}.'.format(invalid_indices))
+            # Textual columns are always categorical
+            categorical_set = set(categorical_indices.tolist()).union(
+                self.categorical_indices)
+            if fuav.is_structured_array(data_array):
+                all_indices = list(data_array.dtype.names)
+            else:
+                all_indices = list(range(data_array.shape[1]))
+            numerical_indices = np.array(
+                [i for i in all_indices if i not in categorical_set])
+            categorical_indices = np.array(
+                [i for i in all_indices if i in categorical_set])
+
+        self._is_structured = fuav.is_structured_array(data_array)
+        # Copy the row so that the (possibly memory-mapped) data are not held
+        self._fitted_array = data_array[:1].copy()
+        self._numerical_indices = numerical_indices
+        self._categorical_indices = categorical_indices
+
+        categorical_columns = self._get_categorical_columns(data_array)
+        self._vocabularies = [
+            np.unique(column) for column in categorical_columns
+        ]
+        self._categorical_codes = self._encode(categorical_columns)[0]
+
+        self._numerical_data = self._get_numerical_data(data_array)
+        self._squared_norms = np.einsum('ij,ij->i', self._numerical_data,
+                                        self._numerical_data)
+
+        self.is_fitted = True
+
+    def _get_numerical_data(self, array: np.ndarray) -> np.ndarray:
+        """
+        Extracts the numerical features of an array as ``numpy.float64``.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            A 2-dimensional numpy array (either classic or structured).
+
+        Returns
+        -------
+        numerical_data : numpy.ndarray
+            A 2-dimensional ``numpy.float64`` array with the numerical
+            features.
+        """
+        if not self._numerical_indices.size:
+            numerical_data = np.zeros((array.shape[0], 0), dtype=np.float64)
+        elif self._is_structured:
+            numerical_data = np.stack(
+                [array[i].astype(np.float64) for i in self._numerical_indices],
+                axis=1)
+        else:
+            numerical_data = array[:, self._numerical_indices].astype(
+                np.float64)
+        return numerical_data
+
+    def _get_categorical_columns(self, array: np.ndarray) -> List[np.ndarray]:
+        """
+        Extracts the categorical columns of an array.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            A 2-dimensional numpy array (either classic or structured).
+
+        Returns
+        -------
+        categorical_columns : List[numpy.ndarray]
+            A list of 1-dimensional arrays -- one per categorical feature.
+        """
+        if self._is_structured:
+            categorical_columns = [array[i] for i in self._categorical_indices]
+        else:
+            categorical_columns = [
+                array[:, i] for i in self._categorical_indices
+            ]
+        return categorical_columns
+
+    def _encode(self, *columns_lists: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        Encodes categorical columns of one or more arrays as integer codes.
+
+        The codes are defined by the vocabularies of the fitted data set.
+        Values that were not seen when fitting are given new codes that are
+        consistent across all of the arrays encoded together.
+
+        Parameters
+        ----------
+        *columns_lists : List[numpy.ndarray]
+            Lists of categorical columns (as returned by the
+            ``_get_categorical_columns`` method) of the arrays to be encoded.
+
+        Returns
+        -------
+        codes : List[numpy.ndarray]
+            A 2-dimensional ``numpy.int64`` array of codes for every input
+            array.
+        """
+        # pylint: disable=too-many-locals
+        codes = [
+            np.zeros((columns[0].shape[0] if columns else 0,
+                      len(self._vocabularies)),
+                     dtype=np.int64) for columns in columns_lists
+        ]
+        for column_i, vocabulary in enumerate(self._vocabularies):
+            unseen = []
+            for array_i, columns in enumerate(columns_lists):
+                column = columns[column_i]
+                positions = np.searchsorted(vocabulary, column)
+                positions = np.minimum(positions, vocabulary.shape[0] - 1)
+                is_seen = vocabulary[positions] == column
+                codes[array_i][:, column_i] = positions
+                unseen.append(~is_seen)
+            # Give consistent codes to the values that were not seen
+            unseen_values = np.concatenate([
+                columns[column_i][mask]
+                for columns, mask in zip(columns_lists, unseen)
+            ])
+            if unseen_values.size:
+                _, unseen_codes = np.unique(unseen_values, return_inverse=True)
+                unseen_codes = unseen_codes.reshape(-1) + vocabulary.shape[0]
+                offset = 0
+                for array_i, mask in enumerate(unseen):
+                    unseen_number = mask.sum()
+                    codes[array_i][mask, column_i] = unseen_codes[
+                        offset:offset + unseen_number]
+                    offset += unseen_number
+        return codes
+
+    def _validate_array(self, array: np.ndarray, name: str) -> bool:
+        """
+        Validates an array whose distances are to be computed.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            A 2-dimensional numpy array to be validated.
+        name : string
+            The name of the array used in the error messages.
+
+        Raises
+        ------
+        IncorrectShapeError
+            The array is not 2-dimensional or it has a different number of
+            columns than the fitted data set.
+        TypeError
+            The dtype of the array is too different from the dtype of the
+            fitted data set.
+        UnfittedModelError
+            The distance has not been fitted.
+
+        Returns
+        -------
+        is_valid : boolean
+            ``True`` if the array is valid, ``False`` otherwise.
+        """
+        is_valid = False
+
+        if not self.is_fitted:
+            raise UnfittedModelError('This MixedDistance object has not been '
+                                     'fitted yet.')
+        if not fuav.is_2d_array(array):
+            raise IncorrectShapeError('The {} array has to be '
+                                      '2-dimensional.'.format(name))
+        if not fuav.are_similar_dtype_arrays(array, self._fitted_array):
+            raise TypeError('The dtype of the {} array is too different from '
+                            'the dtype of the data array used to fit this '
+                            'distance.'.format(name))
+        if not self._is_structured:
+            if array.shape[1] != self._fitted_array.shape[1]:
+                raise IncorrectShapeError('The {} array has a different '
+                                          'number of columns than the data '
+                                          'array used to fit this '
+                                          'distance.'.format(name))
+
+        is_valid = True
+        return is_valid
+
+    def _combine(self, numerical_x: np.ndarray, numerical_y: np.ndarray,
+                 codes_x: np.ndarray, codes_y: np.ndarray,
+                 squared_x: Optional[np.ndarray],
+                 squared_y: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Computes the distance matrix from the extracted features.
+
+        Parameters
+        ----------
+        numerical_x : numpy.ndarray
+            The numerical features of the first array.
+        numerical_y : numpy.ndarray
+            The numerical features of the second array.
+        codes_x : numpy.ndarray
+            The encoded categorical features of the first array.
+        codes_y : numpy.ndarray
+            The encoded categorical features of the second array.
+        squared_x : Union[None, numpy.ndarray]
+            The squared norms of ``numerical_x`` (computed if ``None``).
+        squared_y : Union[None, numpy.ndarray]
+            The squared norms of ``numerical_y`` (computed if ``None``).
+
+        Returns
+        -------
+        distance_matrix : numpy.ndarray
+            A ``numpy.float64`` matrix of distances between the rows of the
+            two arrays.
+        """
+        # pylint: disable=too-many-arguments
+        shape = (numerical_x.shape[0], numerical_y.shape[0])
+
+        categorical_distances = np.zeros(shape, dtype=np.int64)
+        for column_i in range(codes_x.shape[1]):
+            categorical_distances += np.not_equal(
+                codes_x[:, column_i, np.newaxis],
+                codes_y[np.newaxis, :, column_i])
+
+        if not numerical_x.shape[1]:
+            numerical_distances = np.zeros(shape, dtype=np.float64)
+        elif self.metric == 'manhattan':
+            numerical_distances = np.zeros(shape, dtype=np.float64)
+            for column_i in range(numerical_x.shape[1]):
+                column_x = numerical_x[:, column_i, np.newaxis]
+                column_y = numerical_y[np.newaxis, :, column_i]
+                numerical_distances += np.abs(column_x - column_y)
+        else:
+            numerical_distances = _squared_euclidean_array_distance(
+                numerical_x,
+                numerical_y,
+                X_squared=squared_x,
+                Y_squared=squared_y)
+            if self.metric == 'euclidean':
+                np.sqrt(numerical_distances, out=numerical_distances)
+
+        distance_matrix = numerical_distances
+        distance_matrix += categorical_distances
+        if self.metric == 'joint_euclidean':
+            np.sqrt(distance_matrix, out=distance_matrix)
+
+        return distance_matrix
+
+    def array_distance(self, X: np.ndarray,
+                       Y: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Computes the distance matrix between the rows of ``X`` and ``Y``.
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            A 2-dimensional numpy array (either classic or structured) with a
+            dtype similar to the fitted data set.
+        Y : numpy.ndarray, optional (default=None)
+            A 2-dimensional numpy array (either classic or structured) with a
+            dtype similar to the fitted data set. If ``None``, the distances
+            are computed to the fitted data set using its cached features.
+
+        Raises
+        ------
+        IncorrectShapeError
+            Either of the arrays is not 2-dimensional or it has a different
+            number of columns than the fitted data set.
+        TypeError
+            The dtype of either of the arrays is too different from the dtype
+            of the fitted data set.
+        UnfittedModelError
+            The distance has not been fitted.
+
+        Returns
+        -------
+        distance_matrix : numpy.ndarray
+            A ``numpy.float64`` matrix of distances between the rows of ``X``
+            (rows) and ``Y`` or the fitted data set (columns).
+        """
+        # pylint: disable=invalid-name
+        assert self._validate_array(X, 'X'), 'Invalid X array.'
+        numerical_x = self._get_numerical_data(X)
+        if Y is None:
+            codes_x = self._encode(self._get_categorical_columns(X))[0]
+            distance_matrix = self._combine(numerical_x, self._numerical_data,
+                                            codes_x, self._categorical_codes,
+                                            None, self._squared_norms)
+        else:
+            assert self._validate_array(Y, 'Y'), 'Invalid Y array.'
+            codes_x, codes_y = self._encode(
+                self._get_categorical_columns(X),
+                self._get_categorical_columns(Y))
+            distance_matrix = self._combine(numerical_x,
+                                            self._get_numerical_data(Y),
+                                            codes_x, codes_y, None, None)
+        return distance_matrix
+
+    def point_distance(self,
+                       data_point: Union[np.ndarray, np.void],
+                       data_array: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Computes the distances between a data point and rows of an array.
+
+        Parameters
+        ----------
+        data_point : Union[numpy.ndarray, numpy.void]
+            A 1-dimensional numpy array or numpy void (for structured data
+            points).
+        data_array : numpy.ndarray, optional (default=None)
+            A 2-dimensional numpy array (either classic or structured) with a
+            dtype similar to the fitted data set. If ``None``, the distances
+            are computed to the fitted data set using its cached features.
+
+        Raises
+        ------
+        IncorrectShapeError
+            The ``data_point`` is not 1-dimensional. The ``data_array`` is not
+            2-dimensional. Either of them has a different number of columns
+            than the fitted data set.
+        TypeError
+            The dtype of the ``data_point`` or the ``data_array`` is too
+            different from the dtype of the fitted data set.
+        UnfittedModelError
+            The distance has not been fitted.
+
+        Returns
+        -------
+        distances : numpy.ndarray
+            A 1-dimensional ``numpy.float64`` array with distances between the
+            ``data_point`` and every row of the ``data_array`` or the fitted
+            data set.
+        """
+        if not fuav.is_1d_like(data_point):
+            raise IncorrectShapeError('The data point has to be 1-dimensional '
+                                      'numpy array or numpy void (for '
+                                      'structured arrays).')
+        distances = self.array_distance(np.asarray([data_point]),
+                                        data_array)[0]
+        return distances
+
+    def __call__(self, x: Union[np.ndarray, np.void],
+                 y: Union[np.ndarray, np.void]) -> float:
+        """
+        Computes the distance between two data points.
+
+        Parameters
+        ----------
+        x : Union[numpy.ndarray, numpy.void]
+            The first data point.
+        y : Union[numpy.ndarray, numpy.void]
+            The second data point.
+
+        Returns
+        -------
+        distance : float
+            The distance between the two data points.
+        """
+        # pylint: disable=invalid-name
+        distance = self.array_distance(np.asarray([x]), np.asarray([y]))[0, 0]
+        return distance
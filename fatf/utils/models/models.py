@@ -8,14 +8,18 @@ FAT Forensics package testing and the examples in the documentation.
 # License: new BSD
 
 import abc
+import copy
+import os
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import numpy as np
 
 import fatf.utils.array.tools as fuat
 import fatf.utils.array.validation as fuav
 import fatf.utils.distances as fud
+import fatf.utils.models.neighbours as fumn
+import fatf.utils.validation as fuv
 
 from fatf.exceptions import (IncorrectShapeError, PrefittedModelError,
                              UnfittedModelError)
@@ -109,6 +113,11 @@ class KNN(Model):
     method, which returns the average of the target value of the ``k``
     neighbours for the queried data point.
 
+    .. versionchanged:: 0.1.1
+       The neighbours are found with a neighbour index chosen with the
+       ``index`` parameter. The default brute-force index preserves the
+       predictions of the previous versions.
+
     Parameters
     ----------
     k : integer, optional (default=3)
@@ -117,6 +126,46 @@ class KNN(Model):
         The mode in which the model will operate. Either ``'classifier'``
         (``'c'``) or ``'regressor'`` (``'r'``). In the latter case
         ``predict_proba`` method is disabled.
+    distance : fatf.utils.distances.MixedDistance, optional (default=None)
+        A mixed distance object used to find the neighbours. A copy of this
+        object is (re)fitted to the training data when the model is fitted,
+        hence the features of the training data are extracted (and cached)
+        only once and the user's object is left intact. If ``None``,
+        the Euclidean distance is used for numerical features and the binary
+        distance for categorical features.
+
+        .. versionadded:: 0.1.1
+    index : string, optional (default='brute')
+        The neighbour index used to find the nearest neighbours, chosen when
+        the model is fitted: ``'brute'`` (a blocked brute-force search --
+        :class:`fatf.utils.models.neighbours.BruteForceIndex`), ``'kd_tree'``
+        (an exact KD-tree search --
+        :class:`fatf.utils.models.neighbours.KDTreeIndex`), which is only
+        available for purely numerical data and the default distance, or
+        ``'approximate'`` (an approximate KD-tree search whose k-th neighbour
+        is at most twice as far as the true k-th nearest neighbour). The
+        ``'auto'`` option uses the KD-tree whenever possible and the
+        brute-force search otherwise. The KD-tree indices are opt-in since
+        they may break ties between equally distant neighbours differently
+        than the brute-force search, hence change the predictions.
+
+        .. versionadded:: 0.1.1
+    memory_budget : integer, optional (default=None)
+        The maximum number of bytes used by a single block of distances
+        computed by the brute-force neighbour index. If ``None``, the
+        distances to all of the query data points are computed at once.
+
+        .. versionadded:: 0.1.1
+    store_path : string, optional (default=None)
+        A path to a ``.npy`` file used to store the training data. If given,
+        the training data are written to this file when the model is fitted
+        and then accessed through a read-only memory map, hence they are not
+        held in RAM and are not copied when the model is pickled (e.g., when
+        it is sent to worker processes, which reopen the memory map). The file
+        is overwritten by the ``fit`` and ``partial_fit`` methods. If
+        ``None``, the training data are kept in memory.
+
+        .. versionadded:: 0.1.1
 
     Raises
     ------
@@ -125,20 +174,32 @@ class KNN(Model):
         raised when calling the ``fit`` method for the second time. Try using
         the ``clear`` method to reset the model before fitting it again.
     TypeError
-        The ``k`` parameter is not an integer.
+        The ``k`` parameter is not an integer. The ``distance`` parameter is
+        neither ``None`` nor a :class:`fatf.utils.distances.MixedDistance`
+        object. The ``index`` parameter is not a string. The
+        ``memory_budget`` parameter is neither ``None`` nor an integer. The
+        ``'kd_tree'`` or ``'approximate'`` index is requested for data with
+        categorical features or with a custom ``distance``. The
+        ``store_path`` parameter is neither ``None`` nor a string.
     UnfittedModelError
         Raised when trying to predict data with a model that has not been
         fitted yet. Try using the ``fit`` method to fit the model first.
     ValueError
         The ``k`` parameter is a negative number or the ``mode`` parameter does
         not have one of the allowed values: ``'c'``, ``'classifier'``, ``'r'``
-        or ``'regressor'``.
+        or ``'regressor'``. The ``index`` parameter does not have one of the
+        allowed values: ``'auto'``, ``'brute'``, ``'kd_tree'`` or
+        ``'approximate'``. The ``memory_budget`` parameter is not a positive
+        integer.
 
     Attributes
     ----------
     _MODES : Set[string]
         Possible modes of the KNN model: ``'classifier'`` (``'c'``) or
         ``'regressor'`` (``'r'``).
+    _INDICES : Set[string]
+        Possible neighbour indices of the KNN model: ``'auto'``, ``'brute'``,
+        ``'kd_tree'`` or ``'approximate'``.
     _k : integer
         The number of neighbours used to make a prediction.
     _is_classifier : boolean
@@ -160,6 +221,9 @@ class KNN(Model):
     _unique_y_probabilities : numpy.ndarray
         Probabilities of labels calculated using their frequencies in the
         training data.
+    _y_codes : numpy.ndarray
+        The training labels encoded as indices of the ``_unique_y`` array
+        (only used in the classifier mode).
     _majority_label : Union[string, integer, float]
         The most common label in the training set.
     _is_structured : boolean
@@ -169,19 +233,60 @@ class KNN(Model):
         An array with categorical indices in the training array.
     _numerical_indices : numpy.ndarray
         An array with numerical indices in the training array.
+    _distance : Union[None, fatf.utils.distances.MixedDistance]
+        A copy of the mixed distance object used to find the neighbours.
+    _index_type : string
+        The type of the neighbour index requested for this model.
+    _memory_budget : Union[None, integer]
+        The memory budget of the brute-force neighbour index.
+    _index : Union[None, fatf.utils.models.neighbours.NeighbourIndex]
+        The neighbour index built for the training data.
+    _store_path : Union[None, string]
+        The path to the memory-mapped training data file.
     """
     # pylint: disable=too-many-instance-attributes
     _MODES = set(['classifier', 'c', 'regressor', 'r'])
-
-    def __init__(self, k: int = 3, mode: Optional[str] = None) -> None:
+    _INDICES = set(['auto', 'brute', 'kd_tree', 'approximate'])
+    # The approximation factor of the 'approximate' neighbour index
+    _APPROXIMATION = 1.0
+
+    def __init__(self,
+                 k: int = 3,
+                 mode: Optional[str] = None,
+                 distance: Optional[fud.MixedDistance] = None,
+                 index: str = 'brute',
+                 memory_budget: Optional[int] = None,
+                 store_path: Optional[str] = None) -> None:
         """
         Initialises the KNN model with the selected ``k`` parameter.
         """
+        # pylint: disable=too-many-arguments
         super().__init__()
         if not isinstance(k, int):
             raise TypeError('The k parameter has to be an integer.')
         if k < 0:
             raise ValueError('The k parameter has to be a positive integer.')
+        if distance is not None and not isinstance(distance,
+                                                   fud.MixedDistance):
+            raise TypeError('The distance parameter has to be either None or '
+                            'a fatf.utils.distances.MixedDistance object.')
+        # Fit a copy to leave the user's object (and its cache) intact
+        self._distance = copy.deepcopy(distance)
+
+        if not isinstance(index, str):
+            raise TypeError('The index parameter has to be a string.')
+        if index not in self._INDICES:
+            raise ValueError(('The index parameter has to have one of the '
+                              'following values {}.').format(self._INDICES))
+        self._index_type = index
+        assert fuv.validate_memory_budget(memory_budget), \
+            'Invalid memory budget.'
+        self._memory_budget = memory_budget
+        self._index = None  # type: Optional[fumn.NeighbourIndex]
+        if store_path is not None and not isinstance(store_path, str):
+            raise TypeError('The store_path parameter has to be either None '
+                            'or a string.')
+        self._store_path = store_path
 
         if mode is None:
             self._is_classifier = True
@@ -201,6 +306,7 @@ class KNN(Model):
         self._unique_y = np.ndarray((0, ))
         self._unique_y_counts = np.ndarray((0, ))
         self._unique_y_probabilities = np.ndarray((0, ))
+        self._y_codes = np.ndarray((0, ), dtype=np.int64)
         self._majority_label = None
         self._is_structured = False
         self._categorical_indices = np.ndarray((0, ))
@@ -230,10 +336,169 @@ class KNN(Model):
             clearing the model first.
         TypeError
             Trying to fit a KNN predictor in a regressor mode with
-            non-numerical target variable.
+            non-numerical target variable. Trying to use a KD-tree neighbour
+            index for data with categorical features or with a custom
+            distance.
         """
         if self._is_fitted:
             raise PrefittedModelError('This model has already been fitted.')
+        assert self._validate_training_data(X, y), 'Invalid training data.'
+
+        numerical_indices, categorical_indices = fuat.indices_by_type(X)
+        self._numerical_indices = numerical_indices
+        self._categorical_indices = categorical_indices
+
+        self._is_structured = fuav.is_structured_array(X)
+        self._X = self._store(X)
+        self._y = y
+
+        if self._is_classifier:
+            # Order labels lexicographically and encode them as integers.
+            unique_y, y_codes, unique_y_counts = np.unique(
+                self._y, return_inverse=True, return_counts=True)
+            self._unique_y = unique_y
+            self._unique_y_counts = unique_y_counts
+            self._y_codes = y_codes.astype(np.int64).reshape(-1)
+            self._update_label_statistics()
+        else:
+            self._majority_label = self._y.mean()
+            self._unique_y = np.ndarray((0, ))
+            self._unique_y_counts = np.ndarray((0, ))
+            self._unique_y_probabilities = np.ndarray((0, ))
+            self._y_codes = np.ndarray((0, ), dtype=np.int64)
+
+        if self._distance is not None:
+            self._distance.fit(self._X)
+        self._index = self._get_index()
+        self._index.fit(self._X)
+
+        self._X_n = self._X.shape[0]
+        self._is_fitted = True
+
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Appends new training data to the (fitted) model.
+
+        .. versionadded:: 0.1.1
+
+        The label counts, the majority label (or the mean target for a
+        regressor) and the neighbour index are updated incrementally -- the
+        KD-tree index buffers the new data points and is only rebuilt once
+        the buffer becomes large. If the model uses a
+        :class:`fatf.utils.distances.MixedDistance` object, it is refitted to
+        all of the training data. If the model is not fitted, this method
+        fits it.
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            The new KNN training data.
+        y : numpy.ndarray
+            The new KNN training labels.
+
+        Raises
+        ------
+        IncorrectShapeError
+            Either the ``X`` array is not 2-dimensional, the ``y`` array is not
+            1-dimensional, the number of rows in ``X`` is not the same as the
+            number of elements in ``y``, the ``X`` array has 0 rows or 0
+            columns or it has a different number of columns than the training
+            data.
+        TypeError
+            Trying to fit a KNN predictor in a regressor mode with
+            non-numerical target variable.
+        ValueError
+            X has a different dtype than the data used to fit the model. y has
+            a different dtype than the labels used to fit the model.
+        """
+        # pylint: disable=invalid-name
+        if not self._is_fitted:
+            self.fit(X, y)
+            return
+
+        assert self._validate_training_data(X, y), 'Invalid training data.'
+        if not fuav.are_similar_dtype_arrays(X, self._X):
+            raise ValueError('X must have the same dtype as the training '
+                             'data.')
+        if not fuav.are_similar_dtype_arrays(y, self._y):
+            raise ValueError('y must have the same dtype as the training '
+                             'labels.')
+        if not fuav.is_structured_array(X):
+            if X.shape[1] != self._X.shape[1]:
+                raise IncorrectShapeError(('X must have the same number of '
+                                           'columns as the training data '
+                                           '({}).').format(self._X.shape[1]))
+
+        self._X = self._append_to_store(X)
+        self._y = np.concatenate([self._y, y])
+        X_n = self._X.shape[0]
+
+        if self._is_classifier:
+            # Merge the new labels into the lexicographically ordered ones and
+            # re-encode the label codes accordingly.
+            new_y, new_y_codes, new_y_counts = np.unique(
+                y, return_inverse=True, return_counts=True)
+            unique_y = np.union1d(self._unique_y, new_y)
+            old_y_map = np.searchsorted(unique_y, self._unique_y)
+            new_y_map = np.searchsorted(unique_y, new_y)
+
+            unique_y_counts = np.zeros(unique_y.shape, dtype=np.int64)
+            unique_y_counts[old_y_map] += self._unique_y_counts
+            unique_y_counts[new_y_map] += new_y_counts
+
+            self._y_codes = np.concatenate([
+                old_y_map[self._y_codes],
+                new_y_map[new_y_codes.astype(np.int64).reshape(-1)]
+            ])
+            self._unique_y = unique_y
+            self._unique_y_counts = unique_y_counts
+            self._update_label_statistics()
+        else:
+            assert self._majority_label is not None, 'The model is fitted.'
+            self._majority_label = (
+                self._majority_label * self._X_n + y.sum()) / X_n
+
+        if self._distance is not None:
+            self._distance.fit(self._X)
+        if isinstance(self._index, fumn.KDTreeIndex):
+            self._index.partial_fit(X)
+        else:
+            # The brute-force index only holds a reference to the data and
+            # the index of memory-mapped data is released by the store update
+            self._index = self._get_index()
+            self._index.fit(self._X)
+
+        self._X_n = X_n
+
+    def _update_label_statistics(self) -> None:
+        """
+        Computes the majority label and the label probabilities.
+
+        The statistics are computed from the unique labels and their counts.
+        """
+        assert self._is_classifier, 'Only classifiers have label statistics.'
+        # If more labels have the same count, np.argmax takes the
+        # lexicographically first one.
+        self._majority_label = self._unique_y[np.argmax(self._unique_y_counts)]
+        self._unique_y_probabilities = (
+            self._unique_y_counts / self._y.shape[0])
+
+    def _validate_training_data(self, X: np.ndarray, y: np.ndarray) -> bool:
+        """
+        Validates the training data.
+
+        For the description of the parameters and the exceptions please
+        see the documentation of the
+        :func:`fatf.utils.models.models.KNN.fit` method.
+
+        Returns
+        -------
+        is_valid : boolean
+            ``True`` if the training data are valid, ``False`` otherwise.
+        """
+        # pylint: disable=invalid-name
+        is_valid = False
+
         if not fuav.is_2d_array(X):
             raise IncorrectShapeError('The training data must be a 2-'
                                       'dimensional array.')
@@ -255,37 +520,167 @@ class KNN(Model):
             raise TypeError('Regressor can only be fitted for a numerical '
                             'target vector.')
 
-        numerical_indices, categorical_indices = fuat.indices_by_type(X)
-        self._numerical_indices = numerical_indices
-        self._categorical_indices = categorical_indices
+        is_valid = True
+        return is_valid
 
-        self._is_structured = fuav.is_structured_array(X)
-        self._X = X
-        self._y = y
+    def _store(self, X: np.ndarray) -> np.ndarray:
+        """
+        Stores the training data.
 
-        if self._is_classifier:
-            unique_y, unique_y_counts = np.unique(self._y, return_counts=True)
-            # Order labels lexicographically.
-            unique_y_sort_index = np.argsort(unique_y)
-            self._unique_y = unique_y[unique_y_sort_index]
-            self._unique_y_counts = unique_y_counts[unique_y_sort_index]
-
-            # How many other labels have the same count.
-            top_y_index = self._unique_y_counts == np.max(
-                self._unique_y_counts)
-            top_y_unique_sorted = np.sort(self._unique_y[top_y_index])
-            self._majority_label = top_y_unique_sorted[0]
-
-            self._unique_y_probabilities = (
-                self._unique_y_counts / self._y.shape[0])
+        If the model has a ``store_path``, the data are written to this file
+        and returned as a read-only memory map; otherwise they are returned
+        unchanged.
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            The training data.
+
+        Returns
+        -------
+        stored_X : numpy.ndarray
+            The stored training data.
+        """
+        # pylint: disable=invalid-name
+        if self._store_path is None:
+            stored_X = X
         else:
-            self._majority_label = self._y.mean()
-            self._unique_y = np.ndarray((0, ))
-            self._unique_y_counts = np.ndarray((0, ))
-            self._unique_y_probabilities = np.ndarray((0, ))
+            with open(self._store_path, 'wb') as store_file:
+                np.save(store_file, X)
+            stored_X = np.load(self._store_path, mmap_mode='r')
+        return stored_X
 
-        self._X_n = self._X.shape[0]
-        self._is_fitted = True
+    def _append_to_store(self, X: np.ndarray) -> np.ndarray:
+        """
+        Appends new training data to the stored training data.
+
+        The dtype of the stored data -- the dtype of every field for
+        structured arrays -- is generalised if necessary. When the training
+        data are memory-mapped, the combined data are written to a temporary
+        file (copying the stored data on disk rather than loading them into
+        memory), which then replaces the ``store_path`` file. Since a file
+        cannot be replaced while it is memory-mapped (on Windows), the
+        references to the stored data held by the model and its neighbour
+        index are released beforehand -- the neighbour index has to be
+        rebuilt afterwards.
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            The new training data.
+
+        Returns
+        -------
+        stored_X : numpy.ndarray
+            The combined stored training data.
+        """
+        # pylint: disable=invalid-name
+        if fuav.is_structured_array(X):
+            dtype = np.dtype([(name,
+                               fuat.generalise_dtype(self._X.dtype[name],
+                                                     X.dtype[name]))
+                              for name in self._X.dtype.names])
+        else:
+            dtype = fuat.generalise_dtype(self._X.dtype, X.dtype)
+
+        if self._store_path is None:
+            stored_X = np.concatenate(
+                [self._X.astype(dtype, copy=False),
+                 X.astype(dtype, copy=False)])  # yapf: disable
+        else:
+            samples_number = self._X.shape[0]
+            shape = (samples_number + X.shape[0], ) + self._X.shape[1:]
+            temporary_path = '{}.partial'.format(self._store_path)
+
+            store = np.lib.format.open_memmap(
+                temporary_path, mode='w+', dtype=dtype, shape=shape)
+            store[:samples_number] = self._X
+            store[samples_number:] = X
+            store.flush()
+            del store
+
+            self._X = np.ndarray((0, 0))
+            self._index = None
+            os.replace(temporary_path, self._store_path)
+            stored_X = np.load(self._store_path, mmap_mode='r')
+        return stored_X
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Gets the state of the model for pickling.
+
+        Memory-mapped training data and the neighbour index built for them
+        (which refers to or copies them) are not pickled; they are restored
+        from the ``store_path`` file when the model is unpickled.
+
+        Returns
+        -------
+        state : Dictionary[string, Any]
+            The state of the model.
+        """
+        state = self.__dict__.copy()
+        if self._store_path is not None and self._is_fitted:
+            state['_X'] = None
+            state['_index'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores the state of the model when unpickling.
+
+        Parameters
+        ----------
+        state : Dictionary[string, Any]
+            The state of the model.
+        """
+        self.__dict__.update(state)
+        if self._X is None:
+            self._X = np.load(self._store_path, mmap_mode='r')
+            self._index = self._get_index()
+            self._index.fit(self._X)
+
+    def _get_index(self) -> fumn.NeighbourIndex:
+        """
+        Creates the neighbour index for the (training) data.
+
+        The KD-tree index is used by the ``'auto'`` option for purely
+        numerical data (measured with the default distance) and the
+        brute-force index otherwise.
+
+        Raises
+        ------
+        TypeError
+            A KD-tree index is requested for data with categorical features or
+            with a custom distance.
+
+        Returns
+        -------
+        index : fatf.utils.models.neighbours.NeighbourIndex
+            An unfitted neighbour index.
+        """
+        is_numerical = (self._distance is None
+                        and not self._categorical_indices.size)
+
+        index_type = self._index_type
+        if index_type == 'auto':
+            index_type = 'kd_tree' if is_numerical else 'brute'
+
+        index = None  # type: Optional[fumn.NeighbourIndex]
+        if index_type == 'brute':
+            index = fumn.BruteForceIndex(
+                distance_function=self._get_array_distances,
+                memory_budget=self._memory_budget)
+        else:
+            if not is_numerical:
+                raise TypeError('The {} neighbour index can only be used with '
+                                'purely numerical data and the default '
+                                'distance.'.format(index_type))
+            approximation = (self._APPROXIMATION
+                             if index_type == 'approximate' else 0)
+            index = fumn.KDTreeIndex(approximation=approximation)
+        assert index is not None, 'Unknown index type.'
+
+        return index
 
     def clear(self) -> None:
         """
@@ -307,10 +702,12 @@ class KNN(Model):
         self._unique_y = np.ndarray((0, ))
         self._unique_y_counts = np.ndarray((0, ))
         self._unique_y_probabilities = np.ndarray((0, ))
+        self._y_codes = np.ndarray((0, ), dtype=np.int64)
         self._majority_label = None
         self._is_structured = False
         self._categorical_indices = np.ndarray((0, ))
         self._numerical_indices = np.ndarray((0, ))
+        self._index = None
 
     def _get_distances(self, X: np.ndarray) -> np.ndarray:
         """
@@ -318,7 +715,9 @@ class KNN(Model):
 
         For numerical columns the distance is calculated as the Euclidean
         distance. For categorical columns (i.e. non-numerical, e.g. strings)
-        the distance is 0 when the value matches and 1 otherwise.
+        the distance is 0 when the value matches and 1 otherwise. If a
+        :class:`fatf.utils.distances.MixedDistance` object was given, it is
+        used instead.
 
         Parameters
         ----------
@@ -344,36 +743,102 @@ class KNN(Model):
         assert fuav.are_similar_dtype_arrays(X, self._X), \
             'X must have the same dtype as the training data.'
 
-        distances_shape = (self._X.shape[0], X.shape[0])
-        categorical_distances = np.zeros(distances_shape)
-        numerical_distances = np.zeros(distances_shape)
-
-        if self._is_structured:
-            if self._categorical_indices.size:
-                categorical_distances = fud.binary_array_distance(
-                    self._X[self._categorical_indices],
-                    X[self._categorical_indices])
-            if self._numerical_indices.size:
-                numerical_distances = fud.euclidean_array_distance(
-                    self._X[self._numerical_indices],
-                    X[self._numerical_indices])
-        else:
-            if self._categorical_indices.size:
-                categorical_distances = fud.binary_array_distance(
-                    self._X[:, self._categorical_indices],
-                    X[:, self._categorical_indices])
-            if self._numerical_indices.size:
-                numerical_distances = fud.euclidean_array_distance(
-                    self._X[:, self._numerical_indices],
-                    X[:, self._numerical_indices])
-
-        assert categorical_distances.shape == numerical_distances.shape, \
-            'Different number of point-wise distances for these feature types.'
-        distances = categorical_distances + numerical_distances
+        distances = self._get_array_distances(self._X, X)
         assert fuav.is_2d_array(distances), 'Distances matrix must be 2D.'
 
         return distances
 
+    def _get_array_distances(self, X_train: np.ndarray,
+                             X: np.ndarray) -> np.ndarray:
+        """
+        Computes the distance matrix between the ``X_train`` and ``X`` arrays.
+
+        This method is the distance function of the brute-force neighbour
+        index, cf. the ``_get_distances`` method for more details.
+
+        Parameters
+        ----------
+        X_train : numpy.ndarray
+            A (subset of) training data array.
+        X : numpy.ndarray
+            A data array for which distances to the ``X_train`` data will be
+            calculated.
+
+        Returns
+        -------
+        distances : numpy.ndarray
+            An array of distances between ``X_train`` (rows) and ``X``
+            (columns).
+        """
+        # pylint: disable=invalid-name
+        if self._distance is not None:
+            if X_train is self._X:
+                # The features of the training data are cached by the distance
+                distances = self._distance.array_distance(X).T
+            else:
+                distances = self._distance.array_distance(X, X_train).T
+        else:
+            distances_shape = (X_train.shape[0], X.shape[0])
+            categorical_distances = np.zeros(distances_shape)
+            numerical_distances = np.zeros(distances_shape)
+
+            if self._is_structured:
+                if self._categorical_indices.size:
+                    categorical_distances = fud.binary_array_distance(
+                        X_train[self._categorical_indices],
+                        X[self._categorical_indices])
+                if self._numerical_indices.size:
+                    numerical_distances = fud.euclidean_array_distance(
+                        X_train[self._numerical_indices],
+                        X[self._numerical_indices])
+            else:
+                if self._categorical_indices.size:
+                    categorical_distances = fud.binary_array_distance(
+                        X_train[:, self._categorical_indices],
+                        X[:, self._categorical_indices])
+                if self._numerical_indices.size:
+                    numerical_distances = fud.euclidean_array_distance(
+                        X_train[:, self._numerical_indices],
+                        X[:, self._numerical_indices])
+
+            assert categorical_distances.shape == numerical_distances.shape, \
+                ('Different number of point-wise distances for these feature '
+                 'types.')
+            distances = categorical_distances + numerical_distances
+
+        return distances
+
+    def _get_votes(self, knn: np.ndarray) -> np.ndarray:
+        """
+        Counts the labels of the nearest neighbours of every query.
+
+        Parameters
+        ----------
+        knn : numpy.ndarray
+            A 2-dimensional array with the indices of the nearest neighbours
+            (columns) of every query data point (rows).
+
+        Returns
+        -------
+        votes : numpy.ndarray
+            A 2-dimensional array with the number of neighbours of every query
+            data point (rows) for every unique label (columns) ordered
+            lexicographically.
+        """
+        assert self._is_classifier, 'Only classifiers count votes.'
+        queries_number = knn.shape[0]
+        labels_number = self._unique_y.shape[0]
+
+        # Offset the label codes of every query so that all of the votes can
+        # be counted at once.
+        offsets = labels_number * np.arange(queries_number, dtype=np.int64)
+        codes = self._y_codes[knn] + offsets[:, np.newaxis]
+        votes = np.bincount(
+            codes.ravel(), minlength=queries_number * labels_number)
+        votes = np.reshape(votes, (queries_number, labels_number))
+
+        return votes
+
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
         Predicts labels of new instances with the fitted model.
@@ -399,7 +864,6 @@ class KNN(Model):
         predictions : numpy.ndarray
             Predicted class labels for each data point.
         """
-        # pylint: disable=too-many-locals,too-many-branches
         if not self._is_fitted:
             raise UnfittedModelError('This model has not been fitted yet.')
         if not fuav.is_2d_array(X):
@@ -423,53 +887,23 @@ class KNN(Model):
         predictions = np.empty((X.shape[0], ))
 
         if self._k < self._X_n:
-            distances = self._get_distances(X)
             # If there are 3 nearest neighbours within distances 1, 2 and 2 and
-            # k is set to 2, then argpartition will always take the first
-            # within distance 2.
-            knn = np.argpartition(distances, self._k, axis=0)
-            predictions = []
-            for column in knn.T:
-                close_labels = self._y[column[:self._k]]
-                if self._is_classifier:
-                    values, counts = np.unique(
-                        close_labels, return_counts=True)
-                    # If there is a tie in the counts take into consideration
-                    # the overall label count in the training data to resolve
-                    # it.
-                    top_label_index = counts == counts.max()
-                    top_label_unique_sorted = np.sort(values[top_label_index])
-                    assert len(top_label_unique_sorted.shape) == 1, \
-                        'This should be a flat array.'
-                    if top_label_unique_sorted.shape[0] > 1:
-                        # Resolve the tie.
-                        # Get count of these label for the training data.
-                        labels_filter = np.array(
-                            self._unique_y.shape[0] * [False])
-                        for top_prediction in top_label_unique_sorted:
-                            unique_y_filter = self._unique_y == top_prediction
-                            np.logical_or(
-                                labels_filter,
-                                unique_y_filter,
-                                out=labels_filter)
-                        g_top_label = self._unique_y[labels_filter]
-                        g_top_label_counts = (
-                            self._unique_y_counts[labels_filter])
-
-                        # What if any of the global labels have the same count?
-                        g_top_label_index = g_top_label_counts == np.max(
-                            g_top_label_counts)
-                        g_top_label_sorted = np.sort(
-                            g_top_label[g_top_label_index])
-
-                        prediction = g_top_label_sorted[0]
-                    else:
-                        prediction = top_label_unique_sorted[0]
-                else:
-                    prediction = close_labels.mean()
-
-                predictions.append(prediction)
-            predictions = np.array(predictions)
+            # k is set to 2, then the neighbour index will take one of the
+            # two within distance 2.
+            assert self._index is not None, 'The index has to be built.'
+            _, knn = self._index.query(X, self._k)
+            if self._is_classifier:
+                votes = self._get_votes(knn)
+                # If there is a tie in the votes take into consideration the
+                # overall label count in the training data to resolve it. If
+                # these are tied as well, the lexicographically first label is
+                # chosen (np.argmax returns the first maximum).
+                is_top = votes == votes.max(axis=1, keepdims=True)
+                top_counts = np.where(is_top,
+                                      self._unique_y_counts[np.newaxis], -1)
+                predictions = self._unique_y[np.argmax(top_counts, axis=1)]
+            else:
+                predictions = self._y[knn].mean(axis=1)
         else:
             predictions = np.array(X.shape[0] * [self._majority_label])
 
@@ -531,19 +965,9 @@ class KNN(Model):
         probabilities = np.empty((X.shape[0], self._unique_y.shape[0]))
 
         if self._k < self._X_n:
-            distances = self._get_distances(X)
-            knn = np.argpartition(distances, self._k, axis=0)
-            probabilities = []
-            for column in knn.T:
-                close_labels = self._y[column[:self._k]]
-                values, counts = np.unique(close_labels, return_counts=True)
-                total_counts = np.sum(counts)
-                probs = np.zeros((self._unique_y.shape[0], ))
-                for i in range(values.shape[0]):
-                    ind = np.where(self._unique_y == values[i])[0]
-                    probs[ind] = counts[i] / total_counts
-                probabilities.append(probs)
-            probabilities = np.array(probabilities)
+            assert self._index is not None, 'The index has to be built.'
+            _, knn = self._index.query(X, self._k)
+            probabilities = self._get_votes(knn) / self._k
         else:
             probabilities = np.tile(self._unique_y_probabilities,
                                     (X.shape[0], 1))
@@ -0,0 +1,465 @@
+"""
+The :mod:`fatf.utils.models.neighbours` module implements neighbour indices.
+
+.. versionadded:: 0.1.1
+
+Neighbour indices are used by the :class:`fatf.utils.models.models.KNN` model
+to find the nearest neighbours of query data points without necessarily
+computing (and storing) the full distance matrix between the training and the
+query data.
+"""
+# Author: Kacper Sokol <k.sokol@bristol.ac.uk>
+# License: new BSD
+
+import abc
+
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+import scipy.spatial
+
+import fatf.utils.array.tools as fuat
+import fatf.utils.array.validation as fuav
+import fatf.utils.distances as fud
+import fatf.utils.validation as fuv
+
+from fatf.exceptions import IncorrectShapeError, UnfittedModelError
+
+__all__ = ['NeighbourIndex',
+           'BruteForceIndex',
+           'KDTreeIndex']  # yapf: disable
+
+ArrayDistance = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+class NeighbourIndex(abc.ABC):
+    """
+    An abstract class that all neighbour indices should inherit from.
+
+    A neighbour index is built from a (training) data array with the ``fit``
+    method and answers nearest neighbour queries with the ``query`` method.
+
+    Attributes
+    ----------
+    is_fitted : boolean
+        Whether the index has been built.
+    samples_number : integer
+        The number of data points (rows) in the indexed data array.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        """
+        Initialises the neighbour index.
+        """
+        self.is_fitted = False
+        self.samples_number = 0
+
+    @abc.abstractmethod
+    def fit(self, data_array: np.ndarray) -> None:
+        """
+        Builds the index for the ``data_array``.
+
+        Parameters
+        ----------
+        data_array : numpy.ndarray
+            A 2-dimensional numpy array to be indexed.
+        """
+
+    @abc.abstractmethod
+    def query(self, data_array: np.ndarray,
+              k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the ``k`` nearest neighbours of every row in the ``data_array``.
+
+        Parameters
+        ----------
+        data_array : numpy.ndarray
+            A 2-dimensional numpy array with the query data points.
+        k : integer
+            The number of neighbours; it has to be smaller than the number of
+            indexed data points.
+
+        Returns
+        -------
+        distances : numpy.ndarray
+            A 2-dimensional array of shape (number of queries, k) with the
+            distances to the neighbours.
+        indices : numpy.ndarray
+            A 2-dimensional array of shape (number of queries, k) with the
+            indices (rows of the indexed data array) of the neighbours.
+        """
+
+    def _validate_query(self, k: int) -> bool:
+        """
+        Validates a neighbours query.
+
+        Parameters
+        ----------
+        k : integer
+            The number of neighbours.
+
+        Raises
+        ------
+        UnfittedModelError
+            The index has not been fitted.
+        ValueError
+            The number of neighbours is not smaller than the number of indexed
+            data points or it is smaller than 1.
+
+        Returns
+        -------
+        is_valid : boolean
+            ``True`` if the query is valid, ``False`` otherwise.
+        """
+        is_valid = False
+
+        if not self.is_fitted:
+            raise UnfittedModelError('This neighbour index has not been '
+                                     'fitted yet.')
+        if k < 1 or k >= self.samples_number:
+            raise ValueError('The number of neighbours has to be between 1 '
+                             'and the number of indexed data points minus 1.')
+
+        is_valid = True
+        return is_valid
+
+
+class BruteForceIndex(NeighbourIndex):
+    """
+    A blocked brute-force neighbour index.
+
+    The distances between the query data points and all of the indexed data
+    points are computed for a block of queries at a time, hence the memory
+    footprint of a query is bound by the ``memory_budget`` rather than growing
+    with the product of the number of indexed and query data points. The
+    neighbours are selected with :func:`numpy.argpartition`, therefore they
+    are not ordered by their distance. This index works with any data type
+    supported by the ``distance_function`` -- e.g., a mixture of numerical and
+    categorical features.
+
+    Parameters
+    ----------
+    distance_function : Callable[[numpy.ndarray, numpy.ndarray], \
+numpy.ndarray], optional (default=None)
+        A function that computes a distance matrix between the rows of its
+        first (indexed data) and second (query data) arguments. If ``None``,
+        the :func:`fatf.utils.distances.euclidean_array_distance` function is
+        used.
+    memory_budget : integer, optional (default=None)
+        The maximum number of bytes that a single block of distances may
+        occupy. If ``None``, all of the queries are processed at once.
+
+    Raises
+    ------
+    TypeError
+        The ``distance_function`` is neither ``None`` nor a Python callable.
+        The ``memory_budget`` parameter is neither ``None`` nor an integer.
+    ValueError
+        The ``memory_budget`` parameter is not a positive integer.
+
+    Attributes
+    ----------
+    distance_function : Callable[[numpy.ndarray, numpy.ndarray], \
+numpy.ndarray]
+        The function used to compute distance matrices.
+    memory_budget : Union[None, integer]
+        The maximum number of bytes that a single block of distances may
+        occupy.
+    data_array : numpy.ndarray
+        The indexed data array.
+    """
+
+    def __init__(self,
+                 distance_function: Optional[ArrayDistance] = None,
+                 memory_budget: Optional[int] = None) -> None:
+        """
+        Initialises the blocked brute-force neighbour index.
+        """
+        super().__init__()
+        if distance_function is None:
+            distance_function = fud.euclidean_array_distance
+        elif not callable(distance_function):
+            raise TypeError('The distance_function parameter has to be either '
+                            'None or a Python callable.')
+        assert fuv.validate_memory_budget(memory_budget), \
+            'Invalid memory budget.'
+
+        self.distance_function = distance_function
+        self.memory_budget = memory_budget
+        self.data_array = np.ndarray((0, 0))
+
+    def fit(self, data_array: np.ndarray) -> None:
+        """
+        Builds the index for the ``data_array``.
+
+        The brute-force index simply stores a reference to the data array.
+
+        Parameters
+        ----------
+        data_array : numpy.ndarray
+            A 2-dimensional numpy array to be indexed.
+
+        Raises
+        ------
+        IncorrectShapeError
+            The ``data_array`` is not 2-dimensional.
+        """
+        if not fuav.is_2d_array(data_array):
+            raise IncorrectShapeError('The data array has to be '
+                                      '2-dimensional.')
+        self.data_array = data_array
+        self.samples_number = data_array.shape[0]
+        self.is_fitted = True
+
+    def query(self, data_array: np.ndarray,
+              k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the ``k`` nearest neighbours of every row in the ``data_array``.
+
+        See the :func:`fatf.utils.models.neighbours.NeighbourIndex.query`
+        method for the description of the parameters and the return values.
+        The neighbours are not ordered by their distance.
+        """
+        assert self._validate_query(k), 'Invalid query.'
+
+        queries_number = data_array.shape[0]
+        if self.memory_budget is None:
+            block_size = queries_number
+        else:
+            block_size = self.memory_budget // (8 * self.samples_number)
+        block_size = max(1, min(block_size, queries_number))
+
+        distances = np.zeros((queries_number, k), dtype=np.float64)
+        indices = np.zeros((queries_number, k), dtype=np.int64)
+        for start in range(0, queries_number, block_size):
+            end = min(start + block_size, queries_number)
+            block_distances = self.distance_function(self.data_array,
+                                                     data_array[start:end])
+            # Neighbours of every query are in its column
+            block_indices = np.argpartition(block_distances, k, axis=0)[:k]
+            block_columns = np.arange(block_indices.shape[1])[np.newaxis, :]
+            indices[start:end] = block_indices.T
+            distances[start:end] = block_distances[block_indices,
+                                                   block_columns].T
+
+        return distances, indices
+
+
+class KDTreeIndex(NeighbourIndex):
+    """
+    A KD-tree neighbour index based on :class:`scipy.spatial.cKDTree`.
+
+    This index finds neighbours with respect to the Euclidean distance and
+    only supports purely numerical data. The neighbours are ordered by their
+    distance. By setting the ``approximation`` parameter to a positive number
+    the search becomes approximate -- the k-th returned neighbour is
+    guaranteed to be no further than ``(1 + approximation)`` times the
+    distance to the true k-th nearest neighbour -- which can be considerably
+    faster for high-dimensional data.
+
+    Data points can be appended to the index with the ``partial_fit`` method.
+    They are kept in a buffer (searched exhaustively) until it grows beyond
+    ``rebuild_fraction`` of the tree size, at which point the tree is rebuilt.
+
+    Parameters
+    ----------
+    leaf_size : integer, optional (default=16)
+        The number of data points at which the tree switches to brute force.
+    approximation : number, optional (default=0)
+        The approximation factor of the neighbour search; 0 means exact.
+    rebuild_fraction : number, optional (default=0.1)
+        The size of the buffer of appended data points -- relative to the
+        number of data points in the tree -- that triggers rebuilding the
+        tree.
+
+    Raises
+    ------
+    TypeError
+        The ``leaf_size`` parameter is not an integer or the ``approximation``
+        or ``rebuild_fraction`` parameter is not a number.
+    ValueError
+        The ``leaf_size`` parameter is not a positive integer or the
+        ``approximation`` or ``rebuild_fraction`` parameter is negative.
+
+    Attributes
+    ----------
+    leaf_size : integer
+        The number of data points at which the tree switches to brute force.
+    approximation : number
+        The approximation factor of the neighbour search.
+    rebuild_fraction : number
+        The relative size of the buffer that triggers rebuilding the tree.
+    tree : scipy.spatial.cKDTree
+        The KD-tree built for the indexed data.
+    _buffer : numpy.ndarray
+        The data points appended to the index since the tree was built.
+    """
+
+    def __init__(self,
+                 leaf_size: int = 16,
+                 approximation: float = 0,
+                 rebuild_fraction: float = 0.1) -> None:
+        """
+        Initialises the KD-tree neighbour index.
+        """
+        super().__init__()
+        if not isinstance(leaf_size, int) or isinstance(leaf_size, bool):
+            raise TypeError('The leaf_size parameter has to be an integer.')
+        if leaf_size < 1:
+            raise ValueError('The leaf_size parameter has to be a positive '
+                             'integer.')
+        if (not isinstance(approximation, (int, float))
+                or isinstance(approximation, bool)):
+            raise TypeError('The approximation parameter has to be a number.')
+        if approximation < 0:
+            raise ValueError('The approximation parameter has to be a '
+                             'non-negative number.')
+        if (not isinstance(rebuild_fraction, (int, float))
+                or isinstance(rebuild_fraction, bool)):
+            raise TypeError('The rebuild_fraction parameter has to be a '
+                            'number.')
+        if rebuild_fraction < 0:
+            raise ValueError('The rebuild_fraction parameter has to be a '
+                             'non-negative number.')
+
+        self.leaf_size = leaf_size
+        self.approximation = approximation
+        self.rebuild_fraction = rebuild_fraction
+        self.tree = None  # type: Optional[scipy.spatial.cKDTree]
+        self._buffer = np.zeros((0, 0), dtype=np.float64)
+
+    @staticmethod
+    def _as_numerical(data_array: np.ndarray) -> np.ndarray:
+        """
+        Converts a numerical (possibly structured) array into a float array.
+
+        Parameters
+        ----------
+        data_array : numpy.ndarray
+            A 2-dimensional, purely numerical numpy array.
+
+        Raises
+        ------
+        IncorrectShapeError
+            The ``data_array`` is not 2-dimensional.
+        TypeError
+            The ``data_array`` is not purely numerical.
+
+        Returns
+        -------
+        numerical_array : numpy.ndarray
+            A 2-dimensional ``numpy.float64`` (classic) numpy array.
+        """
+        if not fuav.is_2d_array(data_array):
+            raise IncorrectShapeError('The data array has to be '
+                                      '2-dimensional.')
+        if not fuav.is_numerical_array(data_array):
+            raise TypeError('The KD-tree neighbour index only supports purely '
+                            'numerical data.')
+        numerical_array = fuat.as_unstructured(data_array).astype(
+            np.float64, copy=False)
+        return numerical_array
+
+    def fit(self, data_array: np.ndarray) -> None:
+        """
+        Builds the KD-tree for the ``data_array``.
+
+        Parameters
+        ----------
+        data_array : numpy.ndarray
+            A 2-dimensional, purely numerical numpy array to be indexed.
+
+        Raises
+        ------
+        IncorrectShapeError
+            The ``data_array`` is not 2-dimensional.
+        TypeError
+            The ``data_array`` is not purely numerical.
+        """
+        # pylint: disable=no-member
+        numerical_array = self._as_numerical(data_array)
+        self.tree = scipy.spatial.cKDTree(
+            numerical_array, leafsize=self.leaf_size)
+        self._buffer = np.zeros((0, numerical_array.shape[1]),
+                                dtype=np.float64)
+        self.samples_number = numerical_array.shape[0]
+        self.is_fitted = True
+
+    def partial_fit(self, data_array: np.ndarray) -> None:
+        """
+        Appends the rows of the ``data_array`` to the index.
+
+        The new data points get consecutive indices following the ones
+        already in the index. If the index is not fitted, it is built with
+        the ``fit`` method.
+
+        Parameters
+        ----------
+        data_array : numpy.ndarray
+            A 2-dimensional, purely numerical numpy array to be appended.
+
+        Raises
+        ------
+        IncorrectShapeError
+            The ``data_array`` is not 2-dimensional or it has a different
+            number of columns than the indexed data.
+        TypeError
+            The ``data_array`` is not purely numerical.
+        """
+        if not self.is_fitted:
+            self.fit(data_array)
+        else:
+            numerical_array = self._as_numerical(data_array)
+            if numerical_array.shape[1] != self._buffer.shape[1]:
+                raise IncorrectShapeError('The data array has a different '
+                                          'number of columns than the '
+                                          'indexed data.')
+            self._buffer = np.concatenate([self._buffer, numerical_array])
+            self.samples_number += numerical_array.shape[0]
+
+            assert self.tree is not None, 'The tree has to be built.'
+            if self._buffer.shape[0] > self.rebuild_fraction * self.tree.n:
+                # pylint: disable=no-member
+                self.tree = scipy.spatial.cKDTree(
+                    np.concatenate([self.tree.data, self._buffer]),
+                    leafsize=self.leaf_size)
+                self._buffer = np.zeros((0, self._buffer.shape[1]),
+                                        dtype=np.float64)
+
+    def query(self, data_array: np.ndarray,
+              k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the ``k`` nearest neighbours of every row in the ``data_array``.
+
+        See the :func:`fatf.utils.models.neighbours.NeighbourIndex.query`
+        method for the description of the parameters and the return values.
+        The neighbours are ordered by their distance.
+        """
+        assert self._validate_query(k), 'Invalid query.'
+        assert self.tree is not None, 'The tree has to be built.'
+        numerical_array = self._as_numerical(data_array)
+
+        tree_k = min(k, self.tree.n)
+        distances, indices = self.tree.query(
+            numerical_array, k=tree_k, eps=self.approximation)
+        distances = distances.reshape(-1, tree_k)
+        indices = indices.reshape(-1, tree_k).astype(np.int64)
+
+        # Merge the neighbours found in the tree with the buffered data points
+        if self._buffer.shape[0]:
+            buffer_distances = fud.euclidean_array_distance(
+                numerical_array, self._buffer)
+            buffer_indices = np.broadcast_to(
+                np.arange(self.tree.n, self.samples_number, dtype=np.int64),
+                buffer_distances.shape)
+
+            distances = np.concatenate([distances, buffer_distances], axis=1)
+            indices = np.concatenate([indices, buffer_indices], axis=1)
+            order = np.argsort(distances, axis=1, kind='mergesort')[:, :k]
+            rows = np.arange(order.shape[0])[:, np.newaxis]
+            distances = distances[rows, order]
+            indices = indices[rows, order]
+
+        return distances, indices
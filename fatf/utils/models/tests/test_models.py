@@ -4,10 +4,14 @@ Holds custom distance functions used for FAT Forensics examples and testing.
 # Author: Kacper Sokol <k.sokol@bristol.ac.uk>
 # License: new BSD
 
+import pickle
+
 import numpy as np
 import pytest
 
+import fatf.utils.distances as fud
 import fatf.utils.models.models as fumm
+import fatf.utils.models.neighbours as fumn
 from fatf.exceptions import (IncorrectShapeError, PrefittedModelError,
                              UnfittedModelError)
 
@@ -88,6 +92,8 @@ class TestKNN(object):
     incorrect_shape_error_columns = ('X must have the same number of columns '
                                      'as the training data (')
     runtime_error = 'This functionality is not available for a regressor.'
+    type_error_distance = ('The distance parameter has to be either None or a '
+                           'fatf.utils.distances.MixedDistance object.')
 
     k = 3
 
@@ -536,6 +542,277 @@ class TestKNN(object):
         dist = clf._get_distances(self.X_test_mix)
         assert np.isclose(dist, self.X_mix_distances, atol=1e-3).all()
 
+    def test_get_votes(self):
+        """
+        Tests vote counting (:func:`~fatf.utils.models.models.KNN._get_votes`).
+        """
+        clf = fumm.KNN(k=3)
+        y = np.array(['b', 'a', 'c', 'b', 'a', 'a'])
+        clf.fit(self.X, y)
+        assert np.array_equal(clf._unique_y, ['a', 'b', 'c'])
+        assert np.array_equal(clf._y_codes, [1, 0, 2, 1, 0, 0])
+
+        knn = np.array([[0, 1, 2], [0, 3, 5], [2, 2, 2], [3, 0, 1]])
+        votes = clf._get_votes(knn)
+        assert np.array_equal(votes, [[1, 1, 1], [1, 2, 0], [0, 0, 3],
+                                      [1, 2, 0]])  # yapf: disable
+
+        # Ties are resolved with the global label counts and then
+        # lexicographically
+        X = np.array([[0], [1], [2], [3], [10], [11], [12]])
+        X_test = np.array([[1.5], [11.5]])
+        clf = fumm.KNN(k=2)
+        clf.fit(X, np.array(['b', 'a', 'b', 'c', 'b', 'c', 'd']))
+        assert np.array_equal(clf.predict(X_test), ['b', 'c'])
+        clf = fumm.KNN(k=2)
+        clf.fit(X, np.array(['b', 'a', 'c', 'a', 'c', 'b', 'd']))
+        assert np.array_equal(clf.predict(X_test), ['a', 'b'])
+        assert np.array_equal(
+            clf.predict_proba(X_test), [[.5, 0, .5, 0], [0, .5, 0, .5]])
+
+        clf = fumm.KNN(k=2, mode='r')
+        clf.fit(X, np.array([0, 1, 2, 3, 4, 5, 6]))
+        assert np.array_equal(clf.predict(X_test), [1.5, 5.5])
+
+    def test_partial_fit(self):
+        """
+        Tests incremental KNN fitting and the memory-mapped training store.
+        """
+        type_error_store = ('The store_path parameter has to be either None '
+                            'or a string.')
+        value_error_dtype = 'X must have the same dtype as the training data.'
+        value_error_y_dtype = ('y must have the same dtype as the training '
+                               'labels.')
+        incorrect_shape_error_columns = ('X must have the same number of '
+                                         'columns as the training data (2).')
+        with pytest.raises(TypeError) as exception_info:
+            fumm.KNN(store_path=42)
+        assert str(exception_info.value) == type_error_store
+
+        clf = fumm.KNN(k=2)
+        clf.partial_fit(self.X[:4], self.y[:4])
+        assert clf._is_fitted
+        with pytest.raises(IncorrectShapeError) as exception_info:
+            clf.partial_fit(self.X[:, :1], self.y)
+        assert str(exception_info.value) == incorrect_shape_error_columns
+        with pytest.raises(ValueError) as exception_info:
+            clf.partial_fit(self.X_cat, self.y)
+        assert str(exception_info.value) == value_error_dtype
+        with pytest.raises(IncorrectShapeError) as exception_info:
+            clf.partial_fit(self.X, self.y[:2])
+        assert str(exception_info.value) == self.incorrect_shape_error_Xy
+        with pytest.raises(ValueError) as exception_info:
+            clf.partial_fit(self.X[4:], self.y_categorical[4:])
+        assert str(exception_info.value) == value_error_y_dtype
+
+        # pylint: disable=invalid-name
+        brute_kwargs = dict(index='brute')
+        mixed_kwargs = dict(distance=fud.MixedDistance())
+        test_data = [(self.X, self.X_test, {}),
+                     (self.X, self.X_test, brute_kwargs),
+                     (self.X_struct, self.X_test_struct, mixed_kwargs),
+                     (self.X_mix, self.X_test_mix, {})]
+        for X, X_test, kwargs in test_data:
+            for y in (self.y, self.y_categorical):
+                clf_full = fumm.KNN(k=2, **kwargs)
+                clf_full.fit(X, y)
+                clf = fumm.KNN(k=2, **kwargs)
+                clf.fit(X[:1], y[:1])
+                clf.partial_fit(X[1:4], y[1:4])
+                clf.partial_fit(X[4:], y[4:])
+                assert np.array_equal(clf._unique_y, clf_full._unique_y)
+                assert np.array_equal(clf._unique_y_counts,
+                                      clf_full._unique_y_counts)
+                assert np.array_equal(clf._y_codes, clf_full._y_codes)
+                assert clf._majority_label == clf_full._majority_label
+                assert np.array_equal(
+                    clf.predict(X_test), clf_full.predict(X_test))
+                assert np.array_equal(
+                    clf.predict_proba(X_test), clf_full.predict_proba(X_test))
+                assert np.array_equal(
+                    clf._get_distances(X_test),
+                    clf_full._get_distances(X_test))
+
+        clf = fumm.KNN(k=2, mode='r')
+        clf.fit(self.X[:3], self.y[:3])
+        clf.partial_fit(self.X[3:], self.y[3:])
+        assert np.isclose(clf._majority_label, self.majority_label_regressor)
+
+    def test_store_path(self, tmp_path):
+        """
+        Tests the memory-mapped KNN training data store.
+        """
+        store_path = str(tmp_path / 'knn.npy')
+        # pylint: disable=invalid-name
+        test_data = [(self.X, self.X_test, 'kd_tree'),
+                     (self.X, self.X_test, 'brute'),
+                     (self.X_mix, self.X_test_mix, 'auto')]
+        for X, X_test, index in test_data:
+            clf_full = fumm.KNN(k=2, index=index)
+            clf_full.fit(X, self.y)
+            clf = fumm.KNN(k=2, index=index, store_path=store_path)
+            clf.fit(X[:3], self.y[:3])
+            assert isinstance(clf._X, np.memmap)
+            clf.partial_fit(X[3:], self.y[3:])
+            assert isinstance(clf._X, np.memmap)
+            assert np.array_equal(np.load(store_path), X)
+            assert np.array_equal(
+                clf.predict(X_test), clf_full.predict(X_test))
+
+            clf_copy = pickle.loads(pickle.dumps(clf))
+            assert isinstance(clf_copy._X, np.memmap)
+            assert np.array_equal(
+                clf_copy.predict(X_test), clf_full.predict(X_test))
+            assert np.array_equal(
+                clf_copy.predict_proba(X_test), clf_full.predict_proba(X_test))
+
+            # Neither the data nor the index are pickled
+            state = clf.__getstate__()
+            assert state['_X'] is None and state['_index'] is None
+
+            clf.clear()
+
+        # The string fields of structured data are generalised
+        X_mix_wide = self.X_mix.astype([('x', '<U9'), ('a', 'f'), ('b', 'f')])
+        X_mix_wide['x'][4:] = 'abcdefghi'
+        for path in (None, store_path):
+            clf = fumm.KNN(k=2, store_path=path)
+            clf.fit(self.X_mix[:4], self.y[:4])
+            clf.partial_fit(X_mix_wide[4:], self.y[4:])
+            assert clf._X.dtype == X_mix_wide.dtype
+            assert np.array_equal(
+                clf._X,
+                np.concatenate(
+                    [self.X_mix[:4].astype(X_mix_wide.dtype), X_mix_wide[4:]]))
+
+    def test_mixed_distance(self):
+        """
+        Tests KNN with a :class:`fatf.utils.distances.MixedDistance` object.
+        """
+        with pytest.raises(TypeError) as exception_info:
+            fumm.KNN(distance=fud.euclidean_distance)
+        assert str(exception_info.value) == self.type_error_distance
+
+        test_data = [(self.X, self.X_test, self.X_distances),
+                     (self.X_cat, self.X_cat_test, self.X_cat_distances),
+                     (self.X_struct, self.X_test_struct, self.X_distances),
+                     (self.X_cat_struct, self.X_cat_struct_test,
+                      self.X_cat_distances),
+                     (self.X_mix, self.X_test_mix, self.X_mix_distances)]
+        distance = fud.MixedDistance()
+        clf = fumm.KNN(k=2, distance=distance)
+        clf_default = fumm.KNN(k=2)
+        # pylint: disable=invalid-name
+        for X, X_test, X_distances in test_data:
+            clf.fit(X, self.y)
+            clf_default.fit(X, self.y)
+            assert not distance.is_fitted
+            assert clf._distance.is_fitted
+            assert clf._distance._numerical_data.shape == (
+                X.shape[0], clf._numerical_indices.shape[0])
+
+            dist = clf._get_distances(X_test)
+            assert np.isclose(dist, X_distances, atol=1e-3).all()
+            assert np.array_equal(
+                clf.predict(X_test), clf_default.predict(X_test))
+            assert np.array_equal(
+                clf.predict_proba(X_test), clf_default.predict_proba(X_test))
+
+            clf.clear()
+            clf_default.clear()
+
+        # A distance shared by two models is not refitted by the other one
+        shared_distance = fud.MixedDistance()
+        clf_a = fumm.KNN(k=2, distance=shared_distance)
+        clf_b = fumm.KNN(k=2, distance=shared_distance)
+        clf_a.fit(self.X, self.y)
+        predictions = clf_a.predict(self.X_test)
+        probabilities = clf_a.predict_proba(self.X_test)
+        clf_b.fit(self.X[::-1] + 1, self.y[::-1])
+        assert not shared_distance.is_fitted
+        assert np.array_equal(clf_a.predict(self.X_test), predictions)
+        assert np.array_equal(clf_a.predict_proba(self.X_test), probabilities)
+
+    def test_neighbour_index(self):
+        """
+        Tests KNN neighbour indices.
+        """
+        type_error_index = 'The index parameter has to be a string.'
+        value_error_index = ('The index parameter has to have one of the '
+                             'following values {}.').format(fumm.KNN._INDICES)
+        type_error_budget = ('The memory_budget parameter has to be either an '
+                             'integer or None.')
+        value_error_budget = ('The memory_budget parameter has to be a '
+                              'positive integer.')
+        type_error_kd = ('The {} neighbour index can only be used with '
+                         'purely numerical data and the default distance.')
+
+        with pytest.raises(TypeError) as exception_info:
+            fumm.KNN(index=None)
+        assert str(exception_info.value) == type_error_index
+        with pytest.raises(ValueError) as exception_info:
+            fumm.KNN(index='ball_tree')
+        assert str(exception_info.value) == value_error_index
+        with pytest.raises(TypeError) as exception_info:
+            fumm.KNN(memory_budget=1.5)
+        assert str(exception_info.value) == type_error_budget
+        with pytest.raises(ValueError) as exception_info:
+            fumm.KNN(memory_budget=0)
+        assert str(exception_info.value) == value_error_budget
+
+        for index in ('kd_tree', 'approximate'):
+            clf = fumm.KNN(index=index)
+            with pytest.raises(TypeError) as exception_info:
+                clf.fit(self.X_mix, self.y)
+            assert str(exception_info.value) == type_error_kd.format(index)
+            clf = fumm.KNN(index=index, distance=fud.MixedDistance())
+            with pytest.raises(TypeError) as exception_info:
+                clf.fit(self.X, self.y)
+            assert str(exception_info.value) == type_error_kd.format(index)
+
+        clf = fumm.KNN()
+        clf.fit(self.X, self.y)
+        assert isinstance(clf._index, fumn.BruteForceIndex)
+        clf = fumm.KNN(index='auto')
+        clf.fit(self.X, self.y)
+        assert isinstance(clf._index, fumn.KDTreeIndex)
+        assert clf._index.approximation == 0
+        clf.clear()
+        assert clf._index is None
+        clf.fit(self.X_mix, self.y)
+        assert isinstance(clf._index, fumn.BruteForceIndex)
+        clf = fumm.KNN(index='approximate')
+        clf.fit(self.X_struct, self.y)
+        assert isinstance(clf._index, fumn.KDTreeIndex)
+        assert clf._index.approximation == 1
+
+        # All of the exact indices agree with each other
+        # pylint: disable=invalid-name
+        data = [(self.X, self.X_test), (self.X_struct, self.X_test_struct)]
+        for X, X_test in data:
+            clf_brute = fumm.KNN(k=2, index='brute', memory_budget=8)
+            clf_kd = fumm.KNN(k=2, index='kd_tree')
+            clf_brute.fit(X, self.y)
+            clf_kd.fit(X, self.y)
+            assert np.array_equal(
+                clf_brute.predict(X_test), clf_kd.predict(X_test))
+            assert np.array_equal(
+                clf_brute.predict_proba(X_test), clf_kd.predict_proba(X_test))
+
+        # The default index breaks distance ties like the previous versions
+        X = np.array([[0, 0], [1, 0], [0, 1], [1, 1], [2, 0], [0, 2], [2, 2],
+                      [2, 1], [1, 2]])
+        y = np.array([0, 1, 2, 1, 0, 2, 1, 2, 0])
+        X_test = np.array([[0, 0], [1, 1], [2, 2], [1, 0], [.5, .5], [2, 1],
+                           [1, 3]])
+        predictions = np.array([0, 2, 0, 0, 1, 0, 0])
+        probabilities = np.array([[1, 1, 1], [0, 1, 2], [1, 1, 1], [2, 1, 0],
+                                  [0, 2, 1], [1, 1, 1], [1, 1, 1]]) / 3
+        clf = fumm.KNN(k=3)
+        clf.fit(X, y)
+        assert np.array_equal(clf.predict(X_test), predictions)
+        assert np.allclose(clf.predict_proba(X_test), probabilities)
+
     def test_predict(self):
         """
         Tests KNN predictions (:func:`~fatf.utils.models.models.KNN.predict`).
@@ -0,0 +1,241 @@
+"""
+Tests neighbour indices used by the KNN model.
+"""
+# Author: Kacper Sokol <k.sokol@bristol.ac.uk>
+# License: new BSD
+
+import numpy as np
+import pytest
+
+import fatf.utils.distances as fud
+import fatf.utils.models.neighbours as fumn
+
+from fatf.exceptions import IncorrectShapeError, UnfittedModelError
+
+NUMERICAL_ARRAY = np.array([[0, 0], [1, 1], [-1, 1], [-1, -1], [1, -1],
+                            [2, 2], [5, 5], [-4, 3]])  # yapf: disable
+NUMERICAL_STRUCT_ARRAY = np.array([(0, 0), (1, 1), (-1, 1), (-1, -1), (1, -1),
+                                   (2, 2), (5, 5), (-4, 3)],
+                                  dtype=[('a', int), ('b', 'f')])
+CATEGORICAL_ARRAY = np.array([['a', 'b'], ['a', 'c'], ['b', 'b']])
+QUERY_ARRAY = np.array([[-.3, -.4], [4, 4.5], [.4, 2.4], [-3, 2]])
+QUERY_NEIGHBOURS = np.array([[0, 3], [6, 5], [1, 5], [7, 2]])
+
+
+def test_neighbour_index():
+    """
+    Tests the :class:`fatf.utils.models.neighbours.NeighbourIndex` class.
+    """
+
+    class BrokenIndex(fumn.NeighbourIndex):
+        """
+        A neighbour index without the query method.
+        """
+
+        def fit(self, data_array):
+            pass  # pragma: no cover
+
+    class SimpleIndex(BrokenIndex):
+        """
+        A minimal neighbour index.
+        """
+
+        def query(self, data_array, k):
+            assert self._validate_query(k)
+            return data_array, data_array
+
+    with pytest.raises(TypeError):
+        fumn.NeighbourIndex()  # pylint: disable=abstract-class-instantiated
+    with pytest.raises(TypeError):
+        BrokenIndex()  # pylint: disable=abstract-class-instantiated
+
+    index = SimpleIndex()
+    assert not index.is_fitted
+    assert index.samples_number == 0
+    with pytest.raises(UnfittedModelError) as exception_info:
+        index.query(QUERY_ARRAY, 1)
+    assert str(exception_info.value) == ('This neighbour index has not been '
+                                         'fitted yet.')
+
+    index.is_fitted = True
+    index.samples_number = 3
+    value_error = ('The number of neighbours has to be between 1 and the '
+                   'number of indexed data points minus 1.')
+    for k in (0, 3):
+        with pytest.raises(ValueError) as exception_info:
+            index.query(QUERY_ARRAY, k)
+        assert str(exception_info.value) == value_error
+    assert index._validate_query(2)
+
+
+def _check_neighbours(indices, distances, neighbours, query=QUERY_ARRAY):
+    """
+    Checks neighbour indices and distances (irrespective of their order).
+    """
+    assert indices.shape == neighbours.shape
+    assert distances.shape == neighbours.shape
+    assert np.array_equal(
+        np.sort(indices, axis=1), np.sort(neighbours, axis=1))
+
+    true_distances = fud.euclidean_array_distance(query, NUMERICAL_ARRAY)
+    rows = np.arange(indices.shape[0])[:, np.newaxis]
+    true_distances = true_distances[rows, indices]
+    assert np.allclose(distances, true_distances)
+
+
+def test_brute_force_index():
+    """
+    Tests the :class:`fatf.utils.models.neighbours.BruteForceIndex` class.
+    """
+    type_error_distance = ('The distance_function parameter has to be either '
+                           'None or a Python callable.')
+    type_error_budget = ('The memory_budget parameter has to be either an '
+                         'integer or None.')
+    value_error_budget = ('The memory_budget parameter has to be a positive '
+                          'integer.')
+    shape_error = 'The data array has to be 2-dimensional.'
+
+    with pytest.raises(TypeError) as exception_info:
+        fumn.BruteForceIndex(distance_function='euclidean')
+    assert str(exception_info.value) == type_error_distance
+    with pytest.raises(TypeError) as exception_info:
+        fumn.BruteForceIndex(memory_budget=True)
+    assert str(exception_info.value) == type_error_budget
+    with pytest.raises(ValueError) as exception_info:
+        fumn.BruteForceIndex(memory_budget=-8)
+    assert str(exception_info.value) == value_error_budget
+
+    index = fumn.BruteForceIndex()
+    assert index.distance_function is fud.euclidean_array_distance
+    with pytest.raises(IncorrectShapeError) as exception_info:
+        index.fit(np.array([1, 2, 3]))
+    assert str(exception_info.value) == shape_error
+
+    # Every memory budget (down to a single query per block) gives the same
+    # neighbours
+    for budget in (None, 1, 8 * 8 * 3, 10**6):
+        index = fumn.BruteForceIndex(memory_budget=budget)
+        index.fit(NUMERICAL_ARRAY)
+        assert index.is_fitted
+        assert index.samples_number == 8
+
+        distances, indices = index.query(QUERY_ARRAY, 2)
+        _check_neighbours(indices, distances, QUERY_NEIGHBOURS)
+        distances, indices = index.query(QUERY_ARRAY, 1)
+        _check_neighbours(indices, distances, QUERY_NEIGHBOURS[:, [0]])
+
+    # Categorical data with a custom distance function
+    index = fumn.BruteForceIndex(distance_function=fud.binary_array_distance)
+    index.fit(CATEGORICAL_ARRAY)
+    distances, indices = index.query(np.array([['b', 'c']]), 2)
+    assert np.array_equal(np.sort(distances, axis=1), [[1, 1]])
+    assert np.array_equal(np.sort(indices, axis=1), [[1, 2]])
+
+
+def test_kd_tree_index():
+    """
+    Tests the :class:`fatf.utils.models.neighbours.KDTreeIndex` class.
+    """
+    type_error_leaf = 'The leaf_size parameter has to be an integer.'
+    value_error_leaf = 'The leaf_size parameter has to be a positive integer.'
+    type_error_approx = 'The approximation parameter has to be a number.'
+    value_error_approx = ('The approximation parameter has to be a '
+                          'non-negative number.')
+    type_error_rebuild = 'The rebuild_fraction parameter has to be a number.'
+    value_error_rebuild = ('The rebuild_fraction parameter has to be a '
+                           'non-negative number.')
+    type_error_data = ('The KD-tree neighbour index only supports purely '
+                       'numerical data.')
+    shape_error = 'The data array has to be 2-dimensional.'
+
+    with pytest.raises(TypeError) as exception_info:
+        fumn.KDTreeIndex(leaf_size=2.0)
+    assert str(exception_info.value) == type_error_leaf
+    with pytest.raises(ValueError) as exception_info:
+        fumn.KDTreeIndex(leaf_size=0)
+    assert str(exception_info.value) == value_error_leaf
+    with pytest.raises(TypeError) as exception_info:
+        fumn.KDTreeIndex(approximation='1')
+    assert str(exception_info.value) == type_error_approx
+    with pytest.raises(ValueError) as exception_info:
+        fumn.KDTreeIndex(approximation=-0.5)
+    assert str(exception_info.value) == value_error_approx
+    with pytest.raises(TypeError) as exception_info:
+        fumn.KDTreeIndex(rebuild_fraction=None)
+    assert str(exception_info.value) == type_error_rebuild
+    with pytest.raises(ValueError) as exception_info:
+        fumn.KDTreeIndex(rebuild_fraction=-1)
+    assert str(exception_info.value) == value_error_rebuild
+
+    index = fumn.KDTreeIndex()
+    with pytest.raises(IncorrectShapeError) as exception_info:
+        index.fit(np.array([1, 2, 3]))
+    assert str(exception_info.value) == shape_error
+    with pytest.raises(TypeError) as exception_info:
+        index.fit(CATEGORICAL_ARRAY)
+    assert str(exception_info.value) == type_error_data
+
+    for array in (NUMERICAL_ARRAY, NUMERICAL_STRUCT_ARRAY):
+        for leaf_size in (1, 16):
+            index = fumn.KDTreeIndex(leaf_size=leaf_size)
+            index.fit(array)
+            assert index.is_fitted
+            assert index.samples_number == 8
+
+            distances, indices = index.query(QUERY_ARRAY, 2)
+            _check_neighbours(indices, distances, QUERY_NEIGHBOURS)
+            # The KD-tree orders the neighbours by their distance
+            assert np.array_equal(indices, QUERY_NEIGHBOURS)
+            distances, indices = index.query(QUERY_ARRAY, 1)
+            _check_neighbours(indices, distances, QUERY_NEIGHBOURS[:, [0]])
+
+    # The approximate search is within its guarantee
+    index = fumn.KDTreeIndex(approximation=1)
+    index.fit(NUMERICAL_ARRAY)
+    distances, indices = index.query(QUERY_ARRAY, 2)
+    true_distances = np.sort(
+        fud.euclidean_array_distance(QUERY_ARRAY, NUMERICAL_ARRAY),
+        axis=1)[:, :2]
+    assert indices.shape == (4, 2)
+    assert (distances[:, -1] <= 2 * true_distances[:, -1] + 1e-8).all()
+
+
+def test_kd_tree_index_partial_fit():
+    """
+    Tests the :func:`fatf.utils.models.neighbours.KDTreeIndex.partial_fit`.
+    """
+    shape_error = ('The data array has a different number of columns than '
+                   'the indexed data.')
+
+    index = fumn.KDTreeIndex(rebuild_fraction=0.5)
+    index.partial_fit(NUMERICAL_ARRAY[:4])
+    assert index.is_fitted
+    assert index.tree.n == 4
+    with pytest.raises(IncorrectShapeError) as exception_info:
+        index.partial_fit(np.ones((2, 3)))
+    assert str(exception_info.value) == shape_error
+
+    # The new data points are buffered...
+    index.partial_fit(NUMERICAL_STRUCT_ARRAY[4:6])
+    assert index.tree.n == 4
+    assert index._buffer.shape == (2, 2)
+    assert index.samples_number == 6
+    distances, indices = index.query(QUERY_ARRAY[:3], 2)
+    _check_neighbours(indices, distances, np.array([[0, 3], [5, 1], [1, 5]]),
+                      QUERY_ARRAY[:3])
+
+    # ...until the tree is rebuilt
+    index.partial_fit(NUMERICAL_ARRAY[6:])
+    assert index.tree.n == 8
+    assert index._buffer.shape == (0, 2)
+    distances, indices = index.query(QUERY_ARRAY, 2)
+    _check_neighbours(indices, distances, QUERY_NEIGHBOURS)
+
+    # Fewer data points in the tree than neighbours
+    index = fumn.KDTreeIndex(rebuild_fraction=10)
+    index.fit(NUMERICAL_ARRAY[:2])
+    index.partial_fit(NUMERICAL_ARRAY[2:])
+    assert index.tree.n == 2
+    distances, indices = index.query(QUERY_ARRAY, 3)
+    assert np.array_equal(indices[:, :2], QUERY_NEIGHBOURS)
+    assert np.isfinite(distances).all()
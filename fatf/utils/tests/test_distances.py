@@ -11,7 +11,7 @@ import numpy as np
 import pytest
 
 import fatf.utils.distances as fud
-from fatf.exceptions import IncorrectShapeError
+from fatf.exceptions import IncorrectShapeError, UnfittedModelError
 
 VECTOR_0D = np.array(7, dtype=int)
 
@@ -411,6 +411,33 @@ def test_euclidean_array_distance():
                                         VECTOR_2D_NUMERICAL_STRUCT_A1)
     assert np.isclose(DISTANCES_2D_NUMERICAL_A.T, dist, rtol=1e-3).all()
 
+    # Test single precision
+    dist = fud.euclidean_array_distance(
+        VECTOR_2D_NUMERICAL_A1, VECTOR_2D_NUMERICAL_A2, float32=True)
+    assert dist.dtype == np.float32
+    assert np.isclose(DISTANCES_2D_NUMERICAL_A, dist, rtol=1e-3).all()
+    dist = fud.euclidean_array_distance(VECTOR_2D_NUMERICAL_A1,
+                                        VECTOR_2D_NUMERICAL_A2)
+    assert dist.dtype == np.float64
+
+    # Identical rows are clamped to a non-negative distance
+    array = np.array([[0.1, 0.2, 0.3], [1e8, 1e-8, 7.3], [0.1, 0.2, 0.3]])
+    dist = fud.euclidean_array_distance(array, array)
+    assert (dist >= 0).all()
+    assert not np.isnan(dist).any()
+    assert np.allclose(np.diag(dist), 0, atol=1e-3)
+    assert np.allclose(dist, dist.T)
+    assert np.isclose(dist[0, 2], 0, atol=1e-6)
+
+    # Many duplicates of wide rows are recomputed in multiple chunks
+    array = np.tile(np.array([[1e8, 1e-8, 7.3, 0.5, 2.0]]), (3, 1))
+    array[1, 3] += 1e-3
+    dist = fud.euclidean_array_distance(array, array)
+    assert np.allclose(np.diag(dist), 0)
+    assert np.isclose(dist[0, 2], 0)
+    assert np.isclose(dist[0, 1], 1e-3)
+    assert np.allclose(dist, dist.T)
+
 
 def test_hamming_distance_base():
     """
@@ -971,6 +998,50 @@ def test_hamming_array_distance():
         normalise=True)
     assert np.isclose(DISTANCES_2D_CATEGORICAL_A_NORMALISED.T, dist).all()
 
+    # Agreement with the hamming_distance_base function (unequal lengths,
+    # empty strings and different string widths)
+    array_x = np.array([['ab', ''], ['abcd', 'x'], ['', 'xyz']])
+    array_y = np.array([['abcdefg', 'x'], ['ba', 'xy'], ['b', '']])
+    for normalise in (False, True):
+        true_dist = np.zeros((3, 3), dtype=np.float64)
+        for i, row_x in enumerate(array_x):
+            for j, row_y in enumerate(array_y):
+                for x, y in zip(row_x, row_y):
+                    if x or y:
+                        true_dist[i, j] += fud.hamming_distance_base(
+                            x, y, normalise=normalise)
+        dist = fud.hamming_array_distance(
+            array_x, array_y, normalise=normalise)
+        assert np.array_equal(true_dist, dist)
+        assert dist.dtype == (np.float64 if normalise else np.int64)
+    # Empty strings are 0 apart when normalised
+    dist = fud.hamming_array_distance(
+        np.array([['', 'a']]),
+        np.array([['', 'b'], ['a', 'b']]),
+        normalise=True)
+    assert np.array_equal(dist, [[1, 2]])
+
+    # Equal length
+    value_error_length = ('Input strings differ in length and the '
+                          'equal_length parameter forces them to be of equal '
+                          'length.')
+    with pytest.raises(ValueError) as exin:
+        fud.hamming_array_distance(array_x, array_y, equal_length=True)
+    assert str(exin.value) == value_error_length
+    dist = fud.hamming_array_distance(
+        np.array([['ab', 'c'], ['ba', 'd']]),
+        np.array([['ab', 'd']]),
+        equal_length=True)
+    assert np.array_equal(dist, [[1], [2]])
+
+    # Byte strings are compared as code points as well
+    dist = fud._hamming_array_distance(  # pylint: disable=protected-access
+        np.array([[b'ab', b'c']]), np.array([[b'abc', b'd'], [b'a', b'c']]))
+    assert np.array_equal(dist, [[2, 1]])
+    dist = fud._hamming_array_distance(  # pylint: disable=protected-access
+        np.array([[b'ab', b'c']]), np.array([['abc', 'd'], ['a', 'c']]))
+    assert np.array_equal(dist, [[2, 1]])
+
 
 def test_binary_distance():
     """
@@ -1698,6 +1769,30 @@ def test_binary_array_distance():
         VECTOR_2D_NUMERICAL_A2, VECTOR_2D_NUMERICAL_STRUCT_A1, normalise=True)
     assert np.isclose(DISTANCES_2D_NUMERICAL_A_BINARY_NORMALISED.T, dist).all()
 
+    # Test single precision
+    dist = fud.binary_array_distance(VECTOR_2D_NUMERICAL_A1,
+                                     VECTOR_2D_NUMERICAL_A2)
+    assert np.issubdtype(dist.dtype, np.integer)
+    dist = fud.binary_array_distance(
+        VECTOR_2D_NUMERICAL_A1,
+        VECTOR_2D_NUMERICAL_A2,
+        normalise=True,
+        float32=True)
+    assert dist.dtype == np.float32
+    assert np.isclose(DISTANCES_2D_NUMERICAL_A_BINARY_NORMALISED, dist).all()
+
+    # Test mixed-type structured arrays
+    mixed_array_a = np.array([('a', 5, 1.5), ('b', 3, 0.5)],
+                             dtype=[('a', 'U1'), ('b', int), ('c', float)])
+    mixed_array_b = np.array([('a', 3, 0.5), ('c', 5, 1.5), ('b', 3, 0.5)],
+                             dtype=[('a', 'U1'), ('b', int), ('c', float)])
+    mixed_distances = np.array([[2, 1, 3], [1, 3, 0]])
+    dist = fud.binary_array_distance(mixed_array_a, mixed_array_b)
+    assert np.array_equal(mixed_distances, dist)
+    dist = fud.binary_array_distance(
+        mixed_array_b, mixed_array_a, normalise=True)
+    assert np.allclose(mixed_distances.T / 3, dist)
+
 
 def test_get_distance_matrix():
     """
@@ -1791,6 +1886,213 @@ def test_get_distance_matrix():
     distances = fud.get_distance_matrix(mixed_array, mix_dist)
     assert np.allclose(distances, true_distances, atol=1e-3)
 
+    ###########################################################################
+
+    # Tiled computation
+    for budget in [1, 8, 16, 100, 10**6]:
+        distances = fud.get_distance_matrix(
+            mixed_array, mix_dist, memory_budget=budget)
+        assert np.allclose(distances, true_distances, atol=1e-3)
+
+    out = np.full((3, 3), -1, dtype=np.float32)
+    distances = fud.get_distance_matrix(
+        mixed_array, mix_dist, memory_budget=8, out=out)
+    assert distances is out
+    assert np.allclose(out, true_distances, atol=1e-3)
+
+
+def test_get_distance_matrix_tiling(tmpdir):
+    """
+    Tests tiling of :func:`fatf.utils.distances.get_distance_matrix` function.
+    """
+    type_error_budget = ('The memory_budget parameter has to be either an '
+                         'integer or None.')
+    value_error_budget = ('The memory_budget parameter has to be a positive '
+                          'integer.')
+    type_error_out = ('The out parameter has to be either a numpy array (or a '
+                      'numpy memmap) or None.')
+    type_error_out_num = ('The out array has to be a classic, purely '
+                          'numerical numpy array.')
+    shape_error_out = ('The out array has to be a square array with the same '
+                       'number of rows as the data_array.')
+
+    with pytest.raises(TypeError) as exin:
+        fud.get_distance_matrix(
+            VECTOR_2D_NUMERICAL_A1, fud.euclidean_distance, memory_budget=1.0)
+    assert str(exin.value) == type_error_budget
+    with pytest.raises(TypeError) as exin:
+        fud.get_distance_matrix(
+            VECTOR_2D_NUMERICAL_A1, fud.euclidean_distance, memory_budget=True)
+    assert str(exin.value) == type_error_budget
+    with pytest.raises(ValueError) as exin:
+        fud.get_distance_matrix(
+            VECTOR_2D_NUMERICAL_A1, fud.euclidean_distance, memory_budget=0)
+    assert str(exin.value) == value_error_budget
+    with pytest.raises(TypeError) as exin:
+        fud.get_distance_matrix(
+            VECTOR_2D_NUMERICAL_A1, fud.euclidean_distance, out=[[0]])
+    assert str(exin.value) == type_error_out
+    with pytest.raises(TypeError) as exin:
+        fud.get_distance_matrix(
+            VECTOR_2D_NUMERICAL_A1,
+            fud.euclidean_distance,
+            out=np.zeros((3, 3), dtype='U1'))
+    assert str(exin.value) == type_error_out_num
+    with pytest.raises(IncorrectShapeError) as exin:
+        fud.get_distance_matrix(
+            VECTOR_2D_NUMERICAL_A1,
+            fud.euclidean_distance,
+            out=np.zeros((3, 2)))
+    assert str(exin.value) == shape_error_out
+
+    data = np.random.uniform(size=(23, 4))
+    true_distances = np.sqrt(
+        ((data[:, np.newaxis, :] - data[np.newaxis, :, :])**2).sum(axis=2))
+
+    # Blocks that do and do not divide the number of rows
+    for budget in [8, 8 * 4, 8 * 25, 8 * 23 * 23]:
+        distances = fud.get_distance_matrix(
+            data, fud.euclidean_distance, memory_budget=budget)
+        assert np.allclose(distances, true_distances)
+        assert np.array_equal(distances, distances.T)
+
+    # Memory-mapped output
+    memmap_file = tmpdir.join('distances.dat').strpath
+    out = np.memmap(memmap_file, dtype=np.float64, mode='w+', shape=(23, 23))
+    distances = fud.get_distance_matrix(
+        data, fud.euclidean_distance, memory_budget=8 * 36, out=out)
+    assert distances is out
+    out.flush()
+    loaded = np.memmap(memmap_file, dtype=np.float64, mode='r', shape=(23, 23))
+    assert np.allclose(loaded, true_distances)
+
+
+def test_get_array_distance_matrix(tmpdir):
+    """
+    Tests :func:`fatf.utils.distances.get_array_distance_matrix` function.
+    """
+    shape_error_data = ('The data_array has to be a 2-dimensional (structured '
+                        'or unstructured) numpy array.')
+    attribute_error_func = ('The distance function must require exactly 2 '
+                            'parameters. Given function requires {} '
+                            'parameters.')
+    shape_error_out = ('The out array has to be a square array with the same '
+                       'number of rows as the data_array.')
+
+    with pytest.raises(IncorrectShapeError) as exin:
+        fud.get_array_distance_matrix(VECTOR_0D, fud.euclidean_array_distance)
+    assert str(exin.value) == shape_error_data
+    with pytest.raises(AttributeError) as exin:
+        fud.get_array_distance_matrix(VECTOR_2D_NUMERICAL_A1, len)
+    assert str(exin.value) == attribute_error_func.format(1)
+    with pytest.raises(IncorrectShapeError) as exin:
+        fud.get_array_distance_matrix(
+            VECTOR_2D_NUMERICAL_A1,
+            fud.euclidean_array_distance,
+            out=np.zeros((4, 4)))
+    assert str(exin.value) == shape_error_out
+
+    data = np.random.uniform(size=(31, 3))
+    true_distances = fud.get_distance_matrix(data, fud.euclidean_distance)
+    for budget in [None, 1, 8 * 9, 8 * 100, 8 * 31 * 31]:
+        distances = fud.get_array_distance_matrix(
+            data, fud.euclidean_array_distance, memory_budget=budget)
+        assert np.allclose(distances, true_distances)
+        assert np.array_equal(distances, distances.T)
+
+    # Structured arrays
+    distances = fud.get_array_distance_matrix(
+        VECTOR_2D_CATEGORICAL_STRUCT_A1,
+        fud.binary_array_distance,
+        memory_budget=8 * 4)
+    true_distances = fud.binary_array_distance(
+        VECTOR_2D_CATEGORICAL_STRUCT_A1, VECTOR_2D_CATEGORICAL_STRUCT_A1)
+    assert np.array_equal(distances, true_distances)
+
+    # A distance function with an optional second parameter
+    mixed_distance = fud.MixedDistance()
+    mixed_distance.fit(data)
+    distances = fud.get_array_distance_matrix(
+        data, mixed_distance.array_distance, memory_budget=8 * 100)
+    assert np.allclose(distances, mixed_distance.array_distance(data))
+    with pytest.raises(AttributeError) as exin:
+        fud.get_distance_matrix(data, mixed_distance.array_distance)
+    assert str(exin.value) == attribute_error_func.format(1)
+
+    # Memory-mapped output
+    memmap_file = tmpdir.join('distances.dat').strpath
+    out = np.memmap(memmap_file, dtype=np.float32, mode='w+', shape=(31, 31))
+    distances = fud.get_array_distance_matrix(
+        data, fud.euclidean_array_distance, memory_budget=4 * 64, out=out)
+    assert distances is out
+    assert np.allclose(out, fud.euclidean_array_distance(data, data))
+
+
+def test_parallel_distances():
+    """
+    Tests the ``n_jobs`` parameter of the distance matrix and point functions.
+
+    Tests :func:`fatf.utils.distances.get_distance_matrix` and
+    :func:`fatf.utils.distances.get_point_distance` functions.
+    """
+    type_error = 'The n_jobs parameter has to be an integer.'
+    value_error = ('The n_jobs parameter has to be a positive integer or -1 '
+                   '(to use all of the available CPUs).')
+
+    for n_jobs in (None, 1.0, True):
+        with pytest.raises(TypeError) as exin:
+            fud.get_distance_matrix(
+                VECTOR_2D_NUMERICAL_A1, fud.euclidean_distance, n_jobs=n_jobs)
+        assert str(exin.value) == type_error
+        with pytest.raises(TypeError) as exin:
+            fud.get_point_distance(
+                VECTOR_2D_NUMERICAL_A1,
+                VECTOR_2D_NUMERICAL_A1[0],
+                fud.euclidean_distance,
+                n_jobs=n_jobs)
+        assert str(exin.value) == type_error
+    for n_jobs in (0, -2):
+        with pytest.raises(ValueError) as exin:
+            fud.get_distance_matrix(
+                VECTOR_2D_NUMERICAL_A1, fud.euclidean_distance, n_jobs=n_jobs)
+        assert str(exin.value) == value_error
+        with pytest.raises(ValueError) as exin:
+            fud.get_point_distance(
+                VECTOR_2D_NUMERICAL_A1,
+                VECTOR_2D_NUMERICAL_A1[0],
+                fud.euclidean_distance,
+                n_jobs=n_jobs)
+        assert str(exin.value) == value_error
+
+    # The results do not depend on the number of processes
+    data = np.random.RandomState(42).uniform(size=(23, 3))
+    distances = fud.get_distance_matrix(data, fud.euclidean_distance)
+    for n_jobs, budget in ((2, None), (3, 64), (-1, None)):
+        distances_p = fud.get_distance_matrix(
+            data, fud.euclidean_distance, memory_budget=budget, n_jobs=n_jobs)
+        assert np.array_equal(distances, distances_p)
+
+        point_distances = fud.get_point_distance(
+            data, data[3], fud.euclidean_distance, n_jobs=n_jobs)
+        assert np.array_equal(distances[3], point_distances)
+
+    # Structured array
+    def struct_dist(x, y):
+        return fud.euclidean_distance(
+            np.array([x['a'], x['b']]), np.array([y['a'], y['b']]))
+
+    distances = fud.get_distance_matrix(VECTOR_2D_NUMERICAL_STRUCT_A1,
+                                        struct_dist)
+    distances_p = fud.get_distance_matrix(
+        VECTOR_2D_NUMERICAL_STRUCT_A1, struct_dist, n_jobs=2)
+    assert np.array_equal(distances, distances_p)
+    point_distances = fud.get_point_distance(
+        VECTOR_2D_NUMERICAL_STRUCT_A1,
+        VECTOR_2D_NUMERICAL_STRUCT_A1[1],
+        struct_dist,
+        n_jobs=2)
+    assert np.array_equal(distances[1], point_distances)
+
 
 def test_get_point_distance():
     """
@@ -1980,3 +2282,196 @@ def test_check_distance_functionality():
     assert fud.check_distance_functionality(function3) is True
     assert fud.check_distance_functionality(function4, True) is True
     assert fud.check_distance_functionality(function6, False) is True
+
+
+class TestMixedDistance(object):
+    """
+    Tests the :class:`fatf.utils.distances.MixedDistance` class.
+    """
+    # pylint: disable=protected-access,useless-object-inheritance
+    MIXED = np.array(
+        [(1, 2.0, 'a', 'x'), (3, 1.0, 'b', 'y'), (0, 0.0, 'a', 'y'),
+         (1, 2.0, 'a', 'x')],
+        dtype=[('a', int), ('b', float), ('c', 'U1'), ('d', 'U1')])
+    MIXED_TEST = np.array([(1, 1.0, 'a', 'z'), (2, 2.0, 'c', 'y')],
+                          dtype=[('a', int), ('b', float), ('c', 'U1'),
+                                 ('d', 'U1')])
+    NUMERICAL = np.array([[0, 1, 2], [3, 4, 5.5], [1, 1, 1]])
+    CATEGORICAL = np.array([['a', 'b'], ['a', 'c'], ['d', 'b']])
+
+    @staticmethod
+    def reference_distances(X, Y, categorical, numerical, metric):
+        """
+        Computes the mixed distance matrix with the point-wise functions.
+        """
+        distances = np.zeros((X.shape[0], Y.shape[0]), dtype=np.float64)
+        for i, x in enumerate(X):
+            for j, y in enumerate(Y):
+                cat = sum(int(x[c] != y[c]) for c in categorical)
+                num = np.array([float(x[n]) - float(y[n]) for n in numerical])
+                if metric == 'euclidean':
+                    distances[i, j] = np.sqrt((num**2).sum()) + cat
+                elif metric == 'manhattan':
+                    distances[i, j] = np.abs(num).sum() + cat
+                else:
+                    distances[i, j] = np.sqrt((num**2).sum() + cat)
+        return distances
+
+    def test_init(self):
+        """
+        Tests :class:`fatf.utils.distances.MixedDistance` initialisation.
+        """
+        type_error_indices = ('The categorical_indices parameter has to be '
+                              'either a list or None.')
+        type_error_metric = 'The metric parameter has to be a string.'
+        value_error_metric = ('The metric parameter has to be one of: '
+                              "['euclidean', 'joint_euclidean', "
+                              "'manhattan'].")
+
+        with pytest.raises(TypeError) as exin:
+            fud.MixedDistance(categorical_indices='a')
+        assert str(exin.value) == type_error_indices
+        with pytest.raises(TypeError) as exin:
+            fud.MixedDistance(metric=1)
+        assert str(exin.value) == type_error_metric
+        with pytest.raises(ValueError) as exin:
+            fud.MixedDistance(metric='cosine')
+        assert str(exin.value) == value_error_metric
+
+        distance = fud.MixedDistance()
+        assert distance.categorical_indices is None
+        assert distance.metric == 'euclidean'
+        assert not distance.is_fitted
+        assert fud.check_distance_functionality(distance)
+
+    def test_fit(self):
+        """
+        Tests :func:`fatf.utils.distances.MixedDistance.fit` method.
+        """
+        incorrect_shape_error = ('The data_array has to be a 2-dimensional '
+                                 'numpy array.')
+        type_error = ('The data_array has to be of a base type (strings '
+                      'and/or numbers).')
+        index_error = ('The following categorical indices are invalid for '
+                       "the data array: ['z'].")
+
+        distance = fud.MixedDistance()
+        with pytest.raises(IncorrectShapeError) as exin:
+            distance.fit(np.array([1, 2]))
+        assert str(exin.value) == incorrect_shape_error
+        with pytest.raises(TypeError) as exin:
+            distance.fit(np.array([[None, 1]]))
+        assert str(exin.value) == type_error
+        distance = fud.MixedDistance(categorical_indices=['a', 'z'])
+        with pytest.raises(IndexError) as exin:
+            distance.fit(self.MIXED)
+        assert str(exin.value) == index_error
+
+        distance = fud.MixedDistance()
+        distance.fit(self.MIXED)
+        assert distance.is_fitted
+        assert distance._is_structured
+        assert distance._numerical_indices.tolist() == ['a', 'b']
+        assert distance._categorical_indices.tolist() == ['c', 'd']
+        assert np.array_equal(distance._numerical_data,
+                              [[1, 2], [3, 1], [0, 0], [1, 2]])
+        assert np.array_equal(distance._squared_norms, [5, 10, 0, 5])
+        assert np.array_equal(distance._categorical_codes,
+                              [[0, 0], [1, 1], [0, 1], [0, 0]])
+
+        # Numerical columns can be categorical as well
+        distance = fud.MixedDistance(categorical_indices=['a'])
+        distance.fit(self.MIXED)
+        assert distance._numerical_indices.tolist() == ['b']
+        assert distance._categorical_indices.tolist() == ['a', 'c', 'd']
+
+        distance = fud.MixedDistance(categorical_indices=[1])
+        distance.fit(self.NUMERICAL)
+        assert distance._numerical_indices.tolist() == [0, 2]
+        assert distance._categorical_indices.tolist() == [1]
+
+    def test_distances(self):
+        """
+        Tests the :class:`fatf.utils.distances.MixedDistance` distances.
+        """
+        unfitted_error = 'This MixedDistance object has not been fitted yet.'
+        shape_error_2d = 'The X array has to be 2-dimensional.'
+        shape_error_point = ('The data point has to be 1-dimensional numpy '
+                             'array or numpy void (for structured arrays).')
+        shape_error_columns = ('The Y array has a different number of columns '
+                               'than the data array used to fit this '
+                               'distance.')
+        type_error_dtype = ('The dtype of the X array is too different from '
+                            'the dtype of the data array used to fit this '
+                            'distance.')
+
+        distance = fud.MixedDistance()
+        with pytest.raises(UnfittedModelError) as exin:
+            distance.array_distance(self.MIXED)
+        assert str(exin.value) == unfitted_error
+        distance.fit(self.MIXED)
+        with pytest.raises(IncorrectShapeError) as exin:
+            distance.array_distance(self.MIXED['a'])
+        assert str(exin.value) == shape_error_2d
+        with pytest.raises(IncorrectShapeError) as exin:
+            distance.point_distance(self.MIXED)
+        assert str(exin.value) == shape_error_point
+        with pytest.raises(TypeError) as exin:
+            distance.array_distance(self.NUMERICAL)
+        assert str(exin.value) == type_error_dtype
+        distance_np = fud.MixedDistance()
+        distance_np.fit(self.NUMERICAL)
+        with pytest.raises(IncorrectShapeError) as exin:
+            distance_np.array_distance(self.NUMERICAL, self.NUMERICAL[:, :2])
+        assert str(exin.value) == shape_error_columns
+
+        for metric in ('euclidean', 'manhattan', 'joint_euclidean'):
+            for categorical_indices in (None, ['a']):
+                distance = fud.MixedDistance(
+                    categorical_indices=categorical_indices, metric=metric)
+                distance.fit(self.MIXED)
+                categorical = distance._categorical_indices.tolist()
+                numerical = distance._numerical_indices.tolist()
+
+                # Cached data (with unseen categorical values)
+                true_dist = self.reference_distances(self.MIXED_TEST,
+                                                     self.MIXED, categorical,
+                                                     numerical, metric)
+                dist = distance.array_distance(self.MIXED_TEST)
+                assert np.allclose(dist, true_dist)
+                dist = distance.point_distance(self.MIXED_TEST[1])
+                assert np.allclose(dist, true_dist[1])
+
+                # Explicit data
+                true_dist = self.reference_distances(
+                    self.MIXED_TEST, self.MIXED_TEST, categorical, numerical,
+                    metric)
+                dist = distance.array_distance(self.MIXED_TEST,
+                                               self.MIXED_TEST)
+                assert np.allclose(dist, true_dist)
+                dist = distance.point_distance(self.MIXED_TEST[0],
+                                               self.MIXED_TEST)
+                assert np.allclose(dist, true_dist[0])
+                assert distance(self.MIXED_TEST[0],
+                                self.MIXED_TEST[1]) == pytest.approx(
+                                    true_dist[0, 1])
+
+                # As a distance function
+                true_dist = self.reference_distances(
+                    self.MIXED, self.MIXED, categorical, numerical, metric)
+                dist = fud.get_distance_matrix(self.MIXED, distance)
+                assert np.allclose(dist, true_dist)
+                assert np.array_equal(np.diagonal(dist), np.zeros(4))
+
+        # Classic arrays
+        distance = fud.MixedDistance()
+        distance.fit(self.NUMERICAL)
+        dist = distance.array_distance(self.NUMERICAL)
+        assert np.allclose(
+            dist, fud.euclidean_array_distance(self.NUMERICAL, self.NUMERICAL))
+        distance = fud.MixedDistance()
+        distance.fit(self.CATEGORICAL)
+        dist = distance.array_distance(self.CATEGORICAL[:2], self.CATEGORICAL)
+        assert np.array_equal(
+            dist,
+            fud.binary_array_distance(self.CATEGORICAL[:2], self.CATEGORICAL))
@@ -134,3 +134,24 @@ def test_check_object_functionality():
     assert not is_functional
     assert missing_callable.format('*C* class', 'two') in msg
     assert missing_param.format('zero', '*C* class', 0, 2) in msg
+
+
+def test_validate_memory_budget():
+    """
+    Tests :func:`fatf.utils.validation.validate_memory_budget` function.
+    """
+    type_error = ('The memory_budget parameter has to be either an integer '
+                  'or None.')
+    value_error = 'The memory_budget parameter has to be a positive integer.'
+
+    for memory_budget in ('1', 1.0, True):
+        with pytest.raises(TypeError) as exin:
+            fuv.validate_memory_budget(memory_budget)
+        assert str(exin.value) == type_error
+    for memory_budget in (0, -8):
+        with pytest.raises(ValueError) as exin:
+            fuv.validate_memory_budget(memory_budget)
+        assert str(exin.value) == value_error
+
+    assert fuv.validate_memory_budget(None)
+    assert fuv.validate_memory_budget(1)
@@ -14,7 +14,9 @@ from typing import Callable, Dict, Optional, Tuple, Union
 
 import inspect
 
-__all__ = ['get_required_parameters_number', 'check_object_functionality']
+__all__ = ['get_required_parameters_number',
+           'check_object_functionality',
+           'validate_memory_budget']  # yapf: disable
 
 
 def get_required_parameters_number(callable_object: Callable) -> int:
@@ -174,3 +176,42 @@ def check_object_functionality(
     message = '\n'.join(message_strings)
 
     return is_functional, message
+
+
+def validate_memory_budget(memory_budget: Union[None, int]) -> bool:
+    """
+    Validates a ``memory_budget`` parameter.
+
+    .. versionadded:: 0.1.1
+
+    Parameters
+    ----------
+    memory_budget : Union[None, integer]
+        The maximum number of bytes that a block of computations may occupy or
+        ``None`` for no limit.
+
+    Raises
+    ------
+    TypeError
+        The ``memory_budget`` parameter is neither ``None`` nor an integer.
+    ValueError
+        The ``memory_budget`` parameter is not a positive integer.
+
+    Returns
+    -------
+    is_valid : boolean
+        ``True`` if the parameter is valid, ``False`` otherwise.
+    """
+    is_valid = False
+
+    if memory_budget is not None:
+        if (not isinstance(memory_budget, int)
+                or isinstance(memory_budget, bool)):
+            raise TypeError('The memory_budget parameter has to be either an '
+                            'integer or None.')
+        if memory_budget < 1:
+            raise ValueError('The memory_budget parameter has to be a '
+                             'positive integer.')
+
+    is_valid = True
+    return is_valid